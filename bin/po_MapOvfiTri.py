@@ -26,6 +26,9 @@ Use the family names from a ``.uh3d`` file to determine which family
     -v
         Run verbose version
         
+    -j NPROC
+        Use *NPROC* worker processes for the nearest-tri search {1}
+        
     --grid GRID, --pre GRID
         Name of grid without extensions
         
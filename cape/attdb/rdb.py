@@ -79,6 +79,108 @@ RBF_FUNCS = [
 ]
 # Names of parameters needed to describe an RBF network
 RBF_SUFFIXES = ["method", "rbf", "func", "eps", "smooth", "N", "xcols"]
+# Max number of node-point distances computed at once
+RBF_CHUNK_SIZE = 4194304
+
+
+# Evaluate several RBFs together
+def eval_rbfs(rbfs, x, nmax=RBF_CHUNK_SIZE):
+    r"""Evaluate several radial basis functions at the same points
+
+    RBFs with the same nodes (centers) share the matrix of distances
+    from each node to each test point, and RBFs that also have the same
+    basis function and scale share the kernel matrix, so all of their
+    outputs come from one matrix product.  The test points are processed
+    in chunks so that no more than *nmax* distances are stored at once.
+    RBFs that can't be combined, e.g. with multidimensional outputs, are
+    just called directly.  If the installed :mod:`scipy` does not have
+    the private :class:`Rbf` methods used to share distances, each RBF
+    is called directly for each chunk instead.
+
+    :Call:
+        >>> Y = eval_rbfs(rbfs, x, nmax=RBF_CHUNK_SIZE)
+    :Inputs:
+        *rbfs*: :class:`list`\ [:class:`scirbf.Rbf`]
+            List of radial basis functions with the same number of args
+        *x*: :class:`list`\ [:class:`float` | :class:`np.ndarray`]
+            Test values for each argument, all with the same shape
+        *nmax*: {*RBF_CHUNK_SIZE*} | :class:`int`
+            Maximum number of distances to calculate at once
+    :Outputs:
+        *Y*: :class:`np.ndarray`\ [:class:`float`]
+            Value of each RBF, shape is ``(len(rbfs),) + x[0].shape``
+    :Versions:
+        * 2026-10-19 ``@ddalle``: Version 1.0
+        * 2026-10-19 ``@ddalle``: Version 1.1; no private attrs needed
+    """
+    # Convert args to arrays
+    x = [np.asarray(xi) for xi in x]
+    # Check shapes
+    shp = x[0].shape if len(x) else ()
+    for xi in x:
+        if xi.shape != shp:
+            raise ValueError("Array lengths must be equal")
+    # Test points as 2D array
+    xa = np.asarray([xi.flatten() for xi in x], dtype=np.float64)
+    npt = xa.shape[1] if xa.ndim == 2 else 1
+    # Initialize output
+    Y = np.zeros((len(rbfs), npt))
+    # Group RBFs by nodes, then by kernel
+    groups = {}
+    for (j, rbf) in enumerate(rbfs):
+        # Check for scalar RBF
+        if np.ndim(rbf.nodes) != 1:
+            Y[j] = np.asarray(rbf(*x)).flatten()
+            continue
+        # Nodes
+        xi = np.asarray(rbf.xi, dtype=np.float64)
+        # Key for nodes
+        key = (xi.shape, xi.tobytes(), str(rbf.norm))
+        # Key for kernel
+        fkey = (str(rbf.function), float(rbf.epsilon))
+        # Add to group
+        groups.setdefault(key, {}).setdefault(fkey, []).append(j)
+    # Loop through groups of RBFs with the same nodes
+    for (key, fgroups) in groups.items():
+        # Use first RBF for distances
+        rbf0 = rbfs[next(iter(fgroups.values()))[0]]
+        # Number of nodes
+        nnode = rbf0.xi.shape[-1]
+        # Number of points per chunk
+        nchunk = max(1, nmax // max(1, nnode))
+        # Check for private methods used to share distances and kernels
+        qfast = hasattr(rbf0, "_call_norm") and all(
+            hasattr(rbfs[j], "_function")
+            for J in fgroups.values() for j in J)
+        # Call each RBF directly if not available
+        if not qfast:
+            for ia in range(0, npt, nchunk):
+                # End of chunk
+                ib = min(npt, ia + nchunk)
+                # Evaluate each RBF separately
+                for J in fgroups.values():
+                    for j in J:
+                        Y[j, ia:ib] = rbfs[j](*xa[:, ia:ib])
+            continue
+        # Weights of each RBF in each kernel group, shape (nnode, nrbf)
+        nodes = {
+            fkey: np.array([rbfs[j].nodes for j in J], dtype=np.float64).T
+            for (fkey, J) in fgroups.items()
+        }
+        # Loop through chunks of points
+        for ia in range(0, npt, nchunk):
+            # End of chunk
+            ib = min(npt, ia + nchunk)
+            # Distance from each point to each node
+            r = rbf0._call_norm(xa[:, ia:ib], rbf0.xi)
+            # Loop through kernels
+            for (fkey, J) in fgroups.items():
+                # Evaluate basis function
+                phi = rbfs[J[0]]._function(r)
+                # Apply weights of all RBFs using this kernel
+                Y[J, ia:ib] = np.dot(phi, nodes[fkey]).T
+    # Output
+    return Y.reshape((len(rbfs),) + shp)
 
 
 # Options for RDBNull
@@ -2886,6 +2988,7 @@ class DataKit(ftypes.BaseData):
             * 2019-01-07 ``@ddalle``: Version 1.0
             * 2019-12-30 ``@ddalle``: Version 2.0: map of methods
             * 2020-04-20 ``@ddalle``: Moved meat from :func:`__call__`
+            * 2026-10-19 ``@ddalle``: Version 2.1; RBFs at all points
         """
        # --- Get coefficient name ---
         # Process coefficient
@@ -2951,7 +3054,12 @@ class DataKit(ftypes.BaseData):
         # Combine args (should there be an attribute for this?)
         kw_fn = dict(kw_fn, **kw)
         # Calls
-        if nd == 0:
+        if nd > 0 and ndim_col == 0 and method_col in RBF_METHODS:
+            # Evaluate RBFs at all points together, in chunks
+            V = self._rcall_rbfs([col], method_col, args_col, X, **kw_fn)
+            # Output
+            return V[0].reshape(dims)
+        elif nd == 0:
             # Scalar call
             v = f(col, args_col, *x, **kw_fn)
             # Output
@@ -5246,11 +5354,12 @@ class DataKit(ftypes.BaseData):
         :Versions:
             * 2018-12-31 ``@ddalle``: Version 1.0
             * 2019-12-17 ``@ddalle``: Ported from :mod:`tnakit`
+            * 2026-10-19 ``@ddalle``: Version 1.1; use :func:`eval_rbfs`
         """
         # Get the radial basis function
         f = self.get_rbf(col)
-        # Evaluate
-        return f(*x)
+        # Evaluate in chunks
+        return eval_rbfs([f], x)[0]
 
     # Get an RBF
     def get_rbf(self, col, *I):
@@ -5331,6 +5440,7 @@ class DataKit(ftypes.BaseData):
         :Versions:
             * 2018-12-31 ``@ddalle``: Version 1.0
             * 2019-12-17 ``@ddalle``: Ported from :mod:`tnakit`
+            * 2026-10-19 ``@ddalle``: Version 1.1; use :func:`eval_rbfs`
         """
         # Lookup value for first variable
         i0, i1, f = self.get_bkpt_index(args[0], x[0])
@@ -5338,8 +5448,8 @@ class DataKit(ftypes.BaseData):
         f0 = self.get_rbf(col, i0)
         f1 = self.get_rbf(col, i1)
         # Evaluate both functions
-        y0 = f0(*x[1:])
-        y1 = f1(*x[1:])
+        y0 = eval_rbfs([f0], x[1:])[0]
+        y1 = eval_rbfs([f1], x[1:])[0]
         # Interpolate
         y = (1-f)*y0 + f*y1
         # Output
@@ -5366,6 +5476,7 @@ class DataKit(ftypes.BaseData):
                 Interpolated value from *db[col]*
         :Versions:
             * 2018-12-31 ``@ddalle``: Version 1.0
+            * 2026-10-19 ``@ddalle``: Version 1.1; use :func:`eval_rbfs`
         """
         # Extrapolation option
         extrap = kw.get("extrap", False)
@@ -5375,13 +5486,209 @@ class DataKit(ftypes.BaseData):
         f0 = self.get_rbf(col, i0)
         f1 = self.get_rbf(col, i1)
         # Evaluate the RBFs at both slices
-        y0 = f0(*x0)
-        y1 = f1(*x1)
+        y0 = eval_rbfs([f0], x0)[0]
+        y1 = eval_rbfs([f1], x1)[0]
         # Interpolate between the slices
         y = (1-f)*y0 + f*y1
         # Output
         return y
 
+   # --- Multiple RBF cols ---
+    # Evaluate several RBF responses together
+    def rcall_rbfs(self, cols, *a, **kw):
+        r"""Evaluate RBF responses for several *cols* at many points
+
+        All *cols* must use the same RBF response method (``"rbf"``,
+        ``"rbf-linear"``, or ``"rbf-map"``) and the same args.  Instead
+        of evaluating each col at each point separately, each RBF (or
+        each slice) is evaluated for all cols and all points using
+        :func:`eval_rbfs`, which reuses the kernel matrix for cols with
+        the same nodes and limits memory use.
+
+        :Call:
+            >>> V = db.rcall_rbfs(cols, x0, X1, ...)
+            >>> V = db.rcall_rbfs(cols, k0=x0, k1=X1, ...)
+        :Inputs:
+            *db*: :class:`DataKit`
+                Database with scalar output functions
+            *cols*: :class:`list`\ [:class:`str`]
+                Names of columns to evaluate
+            *x0*: :class:`float` | :class:`np.ndarray`
+                Numeric value(s) for first argument
+            *k0*: :class:`str`
+                Name of first argument to *col* response
+        :Outputs:
+            *V*: :class:`list`\ [:class:`np.ndarray`]
+                Values of each *col*, same shape as largest input
+        :Versions:
+            * 2026-10-19 ``@ddalle``: Version 1.0
+        """
+        # Get method for each col
+        cls = self.__class__
+        meths = []
+        for col in cols:
+            # Get method name
+            meth = self.get_response_method(col)
+            # Use lower case with hyphens instead of underscores
+            meth = str(meth).lower().replace("_", "-")
+            meths.append(cls._method_map.get(meth, meth))
+        # Response args
+        args = self.get_response_args(cols[0])
+        # Check consistency
+        for (col, meth) in zip(cols, meths):
+            if meth not in RBF_METHODS:
+                raise ValueError(
+                    "Response method for col '%s' is not an RBF" % col)
+            elif meth != meths[0]:
+                raise ValueError(
+                    "Col '%s' has RBF method '%s'; expected '%s'"
+                    % (col, meth, meths[0]))
+            elif list(self.get_response_args(col)) != list(args):
+                raise ValueError(
+                    "Col '%s' does not have same args as '%s'"
+                    % (col, cols[0]))
+        # Method
+        meth = meths[0]
+        # Extra options, e.g. *extrap*
+        kw_fn = dict(self.get_response_kwargs(cols[0]), **kw)
+        # Process aliases in *kw*
+        arg_aliases = self.get_response_arg_aliases(cols[0])
+        for k in dict(kw):
+            if k in arg_aliases:
+                kw[arg_aliases[k]] = kw.pop(k)
+        # Get values for each arg
+        x = [
+            np.asarray(self.get_arg_value(i, k, *a, **kw))
+            for (i, k) in enumerate(args)
+        ]
+        # Normalize arguments
+        X, dims = self.normalize_args(x, asarray=True)
+        # Evaluate
+        Y = self._rcall_rbfs(cols, meth, args, X, **kw_fn)
+        # Output
+        return [Y[j].reshape(dims) for j in range(len(cols))]
+
+    # Evaluate several RBF responses at normalized points
+    def _rcall_rbfs(self, cols, meth, args, X, **kw):
+        r"""Evaluate RBF responses for several *cols* at 1D points
+
+        :Call:
+            >>> Y = db._rcall_rbfs(cols, meth, args, X, **kw)
+        :Inputs:
+            *db*: :class:`DataKit`
+                Database with scalar output functions
+            *cols*: :class:`list`\ [:class:`str`]
+                Names of columns to evaluate
+            *meth*: ``"rbf"`` | ``"rbf-linear"`` | ``"rbf-map"``
+                Response method for all *cols*
+            *args*: :class:`list`\ [:class:`str`]
+                Response args for all *cols*
+            *X*: :class:`list`\ [:class:`np.ndarray`]
+                1D array of values for each arg, all the same size
+            *extrap*: ``True`` | {``False``}
+                Option to extrapolate ``"rbf-map"`` schedules
+        :Outputs:
+            *Y*: :class:`np.ndarray`\ [:class:`float`]
+                Value of each col at each point, shape ``(ncol, nx)``
+        :Versions:
+            * 2026-10-19 ``@ddalle``: Version 1.0 (from :func:`rcall_rbfs`)
+        """
+        # Sizes
+        nx = X[0].size
+        ncol = len(cols)
+        # Evaluate
+        if meth == "rbf":
+            # Global RBF for each col
+            Y = eval_rbfs([self.get_rbf(col) for col in cols], X)
+        else:
+            # Initialize output
+            Y = np.zeros((ncol, nx))
+            # Get slice indices and lookup points for each point
+            if meth == "rbf-linear":
+                # Slice indices and weights
+                I0 = np.zeros(nx, dtype="int")
+                I1 = np.zeros(nx, dtype="int")
+                F = np.zeros(nx)
+                for j in range(nx):
+                    I0[j], I1[j], F[j] = self.get_bkpt_index(
+                        args[0], X[0][j])
+                # Remaining args are the same at both slices
+                X0 = X[1:]
+                X1 = X[1:]
+            else:
+                # Scheduled lookup points
+                I0, I1, F, X0, X1 = self.get_schedule(
+                    list(args), X, extrap=kw.get("extrap", False))
+            # Loop through slices that are needed
+            for i in np.unique(np.hstack((I0, I1))):
+                # Points using this slice as lower and upper bound
+                J0 = np.where(I0 == i)[0]
+                J1 = np.where(I1 == i)[0]
+                # Lookup points at this slice for both sets
+                xi = [
+                    np.hstack((x0[J0], x1[J1])) for (x0, x1) in zip(X0, X1)
+                ]
+                # Evaluate all cols
+                Yi = eval_rbfs([self.get_rbf(col, i) for col in cols], xi)
+                # Add weighted contributions
+                n0 = J0.size
+                Y[:, J0] += (1 - F[J0]) * Yi[:, :n0]
+                Y[:, J1] += F[J1] * Yi[:, n0:]
+        # Output
+        return Y
+
+    # Evaluate several cols with the same args
+    def _rcall_cols(self, cols, *a, **kw):
+        r"""Evaluate several cols, combining cols with RBF responses
+
+        Cols with the same RBF method, args, and response kwargs are
+        evaluated together using :func:`rcall_rbfs`; other cols are
+        evaluated one at a time using :func:`__call__`.
+
+        :Call:
+            >>> V = db._rcall_cols(cols, *a, **kw)
+        :Inputs:
+            *db*: :class:`DataKit`
+                Database with scalar output functions
+            *cols*: :class:`list`\ [:class:`str`]
+                Names of columns to evaluate
+            *a*: :class:`tuple`
+                Values for each arg, as in :func:`__call__`
+        :Outputs:
+            *V*: :class:`dict`\ [:class:`np.ndarray`]
+                Values of each *col*
+        :Versions:
+            * 2026-10-19 ``@ddalle``: Version 1.0
+        """
+        # Class handle for method aliases
+        cls = self.__class__
+        # Initialize output and groups of RBF cols
+        V = {}
+        groups = {}
+        # Loop through cols
+        for col in cols:
+            # Get method name
+            meth = self.get_response_method(col)
+            # Use lower case with hyphens instead of underscores
+            meth = str(meth).lower().replace("_", "-")
+            meth = cls._method_map.get(meth, meth)
+            # Check for scalar RBF response
+            if meth in RBF_METHODS and self.get_output_ndim(col) == 0:
+                # Group by method, args, and options
+                key = (
+                    meth,
+                    tuple(self.get_response_args(col)),
+                    repr(sorted(self.get_response_kwargs(col).items())))
+                groups.setdefault(key, []).append(col)
+            else:
+                # Evaluate separately
+                V[col] = self(col, *a, **kw)
+        # Evaluate each group of RBF cols
+        for J in groups.values():
+            V.update(zip(J, self.rcall_rbfs(J, *a, **kw)))
+        # Output
+        return V
+
    # --- Generic Function ---
     # Generic function
     def rcall_function(self, col, args, *x, **kw):
@@ -7035,6 +7342,7 @@ class DataKit(ftypes.BaseData):
                 Smoothed difference between *db2* and *db*
         :Versions:
             * 2020-05-08 ``@ddalle``: Version 1.0
+            * 2026-10-19 ``@ddalle``: Version 1.1; batch RBF cols
         """
         # Create new instance
         ddb = self.__class__()
@@ -7071,15 +7379,18 @@ class DataKit(ftypes.BaseData):
             ddb.save_col(arg, vals[arg])
             # Copy definition
             ddb.set_defn(arg, self.get_defn(arg))
+        # Evaluate both databases, combining RBF cols
+        V1 = self._rcall_cols(cols, *A, **kw_response)
+        V2 = db2._rcall_cols(cols, *A, **kw_response)
         # Loop through columns
         for col in cols:
             # Status update
             if verbose:
                 sys.stdout.write(fmt % col)
                 sys.stdout.flush()
-            # Evaluate both databases
-            v1 = self(col, *A, **kw_response)
-            v2 = db2(col, *A, **kw_response)
+            # Values from both databases
+            v1 = V1[col]
+            v2 = V2[col]
             # Save difference
             ddb.save_col(col, v2 - v1)
             # Link definition
@@ -8,16 +8,26 @@ r"""
 """
 
 # Standard library modules
+import hashlib
 import importlib
+import json
+import multiprocessing
 import os
+import queue
 import setuptools
 import sys
+import traceback
 
 # Local modules
 from . import datakitloader
 from . import pkgutils
 from .. import argread
 from .. import text as textutils
+from .. import util
+
+
+# Name of file in *DB_DIR* with hashes of inputs to last build
+STAMP_FILE = ".writedb.json"
 
 
 # Docstring for CLI
@@ -64,6 +74,13 @@ Folder names, e.g. ``sls10afa/c008/f3d/db001``, are also allowed.
     --write_func FUNC
         Function name in modules to process datakits {"write_db"}
 
+    -j N
+        Write up to *N* independent modules at once {1}
+
+    --make
+        Rewrite modules whose raw data, source files, or required
+        datakits have changed since the last build; skip the others
+
 :Versions:
 
     * 2017-07-13 ``@ddalle``: Version 1.0
@@ -72,6 +89,7 @@ Folder names, e.g. ``sls10afa/c008/f3d/db001``, are also allowed.
     * 2021-07-19 ``@ddalle``: Version 2.1; add ``--no-write``
     * 2021-08-20 ``@ddalle``: Version 3.0; generalize for ``cape``
     * 2021-09-15 ``@ddalle``: Version 3.1; more DVC support
+    * 2026-10-19 ``@ddalle``: Version 3.2; add ``-j`` and ``--make``
 """
 
 
@@ -91,17 +109,32 @@ def main():
         * 2021-08-20 ``@ddalle``: Version 3.0
             - Generalize for :mod:`cape`
             - Add *write_func* option
+
+        * 2026-10-19 ``@ddalle``: Version 3.1; exit 1 on failed DBs
     """
     # Process command-line arguments
     a, kw = argread.readkeys(sys.argv)
     # Real main function
-    write_dbs(*a, **kw)
+    status = write_dbs(*a, **kw)
+    # Check for failures
+    if status and any(v[0] == "failed" for v in status.values()):
+        sys.exit(1)
 
 
 # API to module writer
 def write_dbs(*a, **kw):
     r"""Write one or more datakit modules, with dependencies
 
+    Modules are processed in an order that satisfies *REQUIREMENTS*.
+    With *j* greater than ``1``, modules that don't depend on each other
+    are written at the same time in worker processes.  With *make*, each
+    module is checked using :func:`check_module`, and only modules whose
+    inputs have changed are rewritten.
+
+    Without *j* or *make*, an exception while writing a module is
+    raised immediately.  Otherwise the failed module and any modules
+    that require it are reported as ``"failed"`` in *status*.
+
     :Call:
         >>> write_dbs(*modnames, **kw)
     :Inputs:
@@ -120,10 +153,19 @@ def write_dbs(*a, **kw):
             Flag to write databases (otherwise just print dependencies)
         *write_func*, *func*: {``"write_db"``} | :class:`str`
             Name of function to use to write formatted files
+        *j*: {``1``} | :class:`int`
+            Maximum number of modules to write at once
+        *make*: ``True`` | {``False``}
+            Only rewrite modules with changed inputs
+    :Outputs:
+        *status*: :class:`dict`\ [:class:`tuple`]
+            Action (``"written"``, ``"rebuilt"``, ``"skipped"``, or
+            ``"failed"``) and reason for each *DB_NAME*
     :Versions:
         * 2021-07-17 ``@ddalle``: Version 1.0
         * 2021-07-19 ``@ddalle``: Version 1.1; add *write* option
         * 2021-08-20 ``@ddalle``: Version 1.2; generalize *prefix*
+        * 2026-10-19 ``@ddalle``: Version 2.0; add *j*, *make*
     """
     # Check for help flag
     if (len(a) == 0) or kw.get('h') or kw.get('help'):
@@ -152,17 +194,25 @@ def write_dbs(*a, **kw):
     force_all = kw.pop("force-all", kw.pop("force_all", kw.pop("F", False)))
     force_last = kw.pop("force", kw.pop("f", False))
     write = kw.pop("write", True)
+    make = kw.pop("make", False)
+    nproc = util.get_nproc(kw.pop("j", 1))
     # Process original module names
     anames, _ = genr8_modsequence(pkgs, reqs=False)
     # Process all other requirements
     dbnames, modnames = genr8_modsequence(pkgs, **kw)
+    # Requirements of each module
+    reqs = genr8_modgraph(dbnames, modnames, prefix=kw.get("prefix"))
     # Status update
     if force_all:
         print("Rewriting databases from source:")
+    elif make:
+        print("Rewriting databases with changed sources:")
     elif force_last:
         print("(Re)writing databases from source:")
     else:
         print("Writing databases from source (no overwrite):")
+    # Overwrite flag for each module
+    fopts = {}
     # Loop through modules in order
     for dbname, modname in zip(dbnames, modnames):
         # Get overwrite option
@@ -177,16 +227,162 @@ def write_dbs(*a, **kw):
             # 1. User specified no -f or -F option
             # 2. User specified -f but this is an extra mod from reqs
             f = False
+        # Save it
+        fopts[dbname] = f
         # Print module and name being processed
         if f:
             print("%s (%s) overwrite=True" % (dbname, modname))
         else:
             print("%s (%s)" % (dbname, modname))
-        # Check for simulate option
-        if not write:
-            continue
-        # Individual revision
-        write_db(modname, f=f, **kw)
+    # Check for simulate option
+    if not write:
+        return
+    # Run the modules
+    status = _run_modgraph(
+        dbnames, modnames, reqs, fopts, make=make, nproc=nproc, **kw)
+    # Report
+    print("Summary:")
+    for dbname in dbnames:
+        print("  %s: %s (%s)" % ((dbname,) + status[dbname]))
+    # Output
+    return status
+
+
+# Write modules in order of requirements
+def _run_modgraph(dbnames, modnames, reqs, fopts, make=False, nproc=1, **kw):
+    # Map of DB names to module names
+    modmap = dict(zip(dbnames, modnames))
+    # Modules not started yet
+    pending = list(dbnames)
+    # Modules currently being written
+    running = {}
+    # Action and reason for finished modules
+    status = {}
+    # Digest of inputs to each finished module
+    digests = {}
+    # Results from workers
+    results = queue.Queue()
+    # Start pool of workers if needed
+    pool = None
+    if nproc > 1 and len(dbnames) > 1:
+        try:
+            # Use forked workers so modules don't need to be reimported
+            ctx = multiprocessing.get_context("fork")
+            pool = ctx.Pool(min(nproc, len(dbnames)))
+        except ValueError:
+            # Forking not available
+            pool = None
+    try:
+        # Loop until all modules are finished
+        while pending or running:
+            # Start any modules whose requirements are finished
+            for dbname in list(pending):
+                # Check requirements
+                if any(req not in status for req in reqs[dbname]):
+                    continue
+                # Check limit on number of modules at once
+                if len(running) >= nproc:
+                    break
+                # Ready to process
+                pending.remove(dbname)
+                modname = modmap[dbname]
+                # Check for failed requirements
+                failed = [
+                    req for req in reqs[dbname]
+                    if status[req][0] == "failed"
+                ]
+                if failed:
+                    status[dbname] = (
+                        "failed", "requirement %s failed" % failed[0])
+                    continue
+                # Check if it needs to be written
+                f = fopts[dbname]
+                stamp = None
+                if make:
+                    # Digests of requirements
+                    upstream = {req: digests.get(req) for req in reqs[dbname]}
+                    # Check for changes
+                    mod = import_module(modname, kw.get("prefix"))
+                    q, reason, stamp = check_module(mod, upstream)
+                    digests[dbname] = stamp["digest"]
+                    # Skip it?
+                    if not (q or f):
+                        status[dbname] = ("skipped", reason)
+                        write_stamp(mod, stamp)
+                        continue
+                    # Rewrite changed modules
+                    if not f:
+                        f = True
+                    else:
+                        reason = "overwrite requested"
+                else:
+                    # Just write it
+                    reason = "overwrite requested" if f else "no overwrite"
+                # Status update
+                print("Writing %s (%s)" % (dbname, modname))
+                # Save info about this module
+                running[dbname] = (reason, stamp)
+                # Arguments to writer
+                a = (dbname, modname, f, kw)
+                if pool is None:
+                    # Write it in this process; raise errors unless
+                    # running in parallel or *make* mode
+                    strict = (nproc == 1) and not make
+                    results.put(_write_db_worker(a, strict))
+                else:
+                    # Write it in a worker
+                    pool.apply_async(
+                        _write_db_worker, (a,),
+                        callback=results.put,
+                        error_callback=lambda e, d=dbname: results.put(
+                            (d, "%s: %s" % (e.__class__.__name__, e))))
+            # Check for circular requirements
+            if not running:
+                if pending:
+                    raise ValueError(
+                        "Circular requirements for modules: %s"
+                        % ", ".join(pending))
+                break
+            # Wait for next module to finish
+            dbname, err = results.get()
+            reason, stamp = running.pop(dbname)
+            # Save status
+            if err:
+                print("Failed to write %s: %s" % (dbname, err))
+                status[dbname] = ("failed", err)
+                continue
+            # Save hashes of inputs
+            if stamp is None:
+                status[dbname] = ("written", reason)
+            else:
+                status[dbname] = ("rebuilt", reason)
+                write_stamp(import_module(modmap[dbname], kw.get("prefix")),
+                    stamp)
+    finally:
+        # Close workers
+        if pool is not None:
+            pool.close()
+            pool.join()
+    # Output
+    return status
+
+
+# Write one module, catching errors
+def _write_db_worker(a, strict=False):
+    # Unpack
+    dbname, modname, f, kw = a
+    # Write it
+    try:
+        write_db(modname, f=f, **dict(kw))
+    except Exception as e:
+        # Stop everything in serial mode
+        if strict:
+            raise
+        # Show full error but keep going with other modules
+        traceback.print_exc()
+        return dbname, "%s: %s" % (e.__class__.__name__, e)
+    # No errors
+    return dbname, None
 
 
 # Write the DB file(s) for one or more DBs
@@ -333,6 +529,324 @@ def genr8_modsequence(modnames, **kw):
     return dbnames, modnames
 
 
+# Get requirements of each module
+def genr8_modgraph(dbnames, modnames, prefix=None):
+    r"""Get the requirements of each module in a sequence
+
+    :Call:
+        >>> reqs = genr8_modgraph(dbnames, modnames, prefix=None)
+    :Inputs:
+        *dbnames*: :class:`list`\ [:class:`str`]
+            List of *DB_NAME* for modules corresponding to *modnames*
+        *modnames*: :class:`list`\ [:class:`str`]
+            Names of module names to process
+        *prefix*: {``None``} | :class:`str`
+            Optional user-specified prefix
+    :Outputs:
+        *reqs*: :class:`dict`\ [:class:`list`\ [:class:`str`]]
+            *REQUIREMENTS* of each module that are also in *dbnames*
+    :Versions:
+        * 2026-10-19 ``@ddalle``: Version 1.0
+    """
+    # Initialize
+    reqs = {}
+    # Loop through modules
+    for dbname, modname in zip(dbnames, modnames):
+        # Read the module
+        mod = import_module(modname, prefix)
+        # Get requirements
+        reqdbnames = mod.__dict__.get("REQUIREMENTS") or []
+        # Only keep requirements that are being processed
+        reqs[dbname] = [
+            reqdbname for reqdbname in reqdbnames
+            if reqdbname in dbnames and reqdbname != dbname
+        ]
+    # Output
+    return reqs
+
+
+# Check if a module needs to be rewritten
+def check_module(mod, upstream=None):
+    r"""Check if raw data or source of a datakit module has changed
+
+    The inputs of a module are its source files, the files in its raw
+    data folder, and the datakits listed in its *REQUIREMENTS*.  If the
+    stamp file from the last build (see :func:`write_stamp`) exists,
+    the module is up to date if all of these inputs have the same
+    hashes.  Otherwise the module is up to date if all of its datakit
+    files are newer than all of its inputs, like ``make``.
+
+    :Call:
+        >>> q, reason, stamp = check_module(mod, upstream=None)
+    :Inputs:
+        *mod*: :class:`module`
+            DataKit module
+        *upstream*: {``None``} | :class:`dict`\ [:class:`str`]
+            Digest of inputs of each required datakit
+    :Outputs:
+        *q*: ``True`` | ``False``
+            Whether or not module needs to be rewritten
+        *reason*: :class:`str`
+            Description of first change found
+        *stamp*: :class:`dict`
+            Hashes of current inputs, to save after rewriting
+    :Versions:
+        * 2026-10-19 ``@ddalle``: Version 1.0
+    """
+    # Default requirements
+    if upstream is None:
+        upstream = {}
+    # Get DataKitLoader
+    dkl = mod.__dict__.get("DATAKIT_LOADER")
+    # Read previous stamp
+    stamp0 = read_stamp(mod)
+    # Files from previous stamp
+    files0 = stamp0.get("files", {})
+    # Hash each input file
+    files = {}
+    for fabs in get_module_inputs(mod):
+        # Relative path
+        frel = os.path.relpath(fabs, os.path.dirname(mod.__file__))
+        # Get file info
+        st = os.stat(fabs)
+        # Reuse hash if size and time haven't changed
+        v0 = files0.get(frel)
+        if v0 and v0[0] == st.st_size and v0[1] == st.st_mtime_ns:
+            files[frel] = v0
+        else:
+            files[frel] = [st.st_size, st.st_mtime_ns, _hash_file(fabs)]
+    # Overall digest of inputs and requirements
+    h = hashlib.sha1()
+    for frel in sorted(files):
+        h.update(("%s:%s\n" % (frel, files[frel][2])).encode())
+    for dbname in sorted(upstream):
+        h.update(("%s:%s\n" % (dbname, upstream[dbname])).encode())
+    # New stamp
+    stamp = {
+        "digest": h.hexdigest(),
+        "files": files,
+        "upstream": upstream,
+    }
+    # Check if we can find the datakit files
+    if not isinstance(dkl, datakitloader.DataKitLoader):
+        return True, "no DATAKIT_LOADER to find datakit files", stamp
+    # Get datakit files
+    fouts = get_module_outputs(mod)
+    # Check for any
+    if len(fouts) == 0:
+        return True, "no datakit files", stamp
+    # Use hashes if available
+    if stamp0:
+        # Check each input
+        for frel in sorted(files):
+            # Get previous hash
+            v0 = files0.get(frel)
+            if v0 is None:
+                return True, "new file %s" % frel, stamp
+            elif v0[2] != files[frel][2]:
+                return True, "changed file %s" % frel, stamp
+        # Check for deleted files
+        for frel in sorted(files0):
+            if frel not in files:
+                return True, "removed file %s" % frel, stamp
+        # Check requirements
+        upstream0 = stamp0.get("upstream", {})
+        for dbname in sorted(upstream):
+            if upstream0.get(dbname) != upstream[dbname]:
+                return True, "requirement %s changed" % dbname, stamp
+        # Up to date
+        return False, "inputs unchanged", stamp
+    # Oldest datakit file
+    tout = min(os.path.getmtime(fout) for fout in fouts)
+    # Check each input
+    for frel in sorted(files):
+        if files[frel][1] > tout * 1e9:
+            return True, "%s newer than datakit files" % frel, stamp
+    # Check required datakits
+    for dbname in sorted(upstream):
+        # Import the required module
+        reqmod = import_dbname(mod, dbname)
+        # Get newest output
+        for fout in get_module_outputs(reqmod):
+            if os.path.getmtime(fout) > tout:
+                return True, "requirement %s is newer" % dbname, stamp
+    # Up to date
+    return False, "datakit files newer than inputs", stamp
+
+
+# Get input files for a module
+def get_module_inputs(mod):
+    r"""Get list of source and raw data files of a datakit module
+
+    :Call:
+        >>> fnames = get_module_inputs(mod)
+    :Inputs:
+        *mod*: :class:`module`
+            DataKit module
+    :Outputs:
+        *fnames*: :class:`list`\ [:class:`str`]
+            Absolute path to ``.py`` files of module (or package) and
+            all files in its raw data folder
+    :Versions:
+        * 2026-10-19 ``@ddalle``: Version 1.0
+    """
+    # Module file
+    fmod = os.path.abspath(mod.__file__)
+    # Check for a package
+    if os.path.basename(fmod) != "__init__.py":
+        return [fmod]
+    # Get DataKitLoader
+    dkl = mod.__dict__.get("DATAKIT_LOADER")
+    # Folder
+    fdir = os.path.dirname(fmod)
+    # Folders that aren't source code
+    skipdirs = set()
+    if isinstance(dkl, datakitloader.DataKitLoader):
+        skipdirs.add(os.path.abspath(dkl.get_rawdatadir()))
+        skipdirs.add(os.path.abspath(_get_dbdir(dkl)))
+    # Source files
+    fnames = [
+        fname for fname in _walk_files(fdir, skipdirs)
+        if fname.endswith(".py")
+    ]
+    # Raw data files
+    if isinstance(dkl, datakitloader.DataKitLoader):
+        fnames.extend(_walk_files(dkl.get_rawdatadir()))
+    # Output
+    return fnames
+
+
+# Get datakit files for a module
+def get_module_outputs(mod):
+    r"""Get list of datakit files written by a module
+
+    :Call:
+        >>> fnames = get_module_outputs(mod)
+    :Inputs:
+        *mod*: :class:`module`
+            DataKit module
+    :Outputs:
+        *fnames*: :class:`list`\ [:class:`str`]
+            Absolute path to each file in datakit folder, *DB_DIR*
+    :Versions:
+        * 2026-10-19 ``@ddalle``: Version 1.0
+    """
+    # Get DataKitLoader
+    dkl = mod.__dict__.get("DATAKIT_LOADER")
+    # Check for valid loader
+    if not isinstance(dkl, datakitloader.DataKitLoader):
+        return []
+    # List files
+    return [
+        fname for fname in _walk_files(_get_dbdir(dkl))
+        if os.path.basename(fname) != STAMP_FILE
+    ]
+
+
+# Read hashes from previous build
+def read_stamp(mod):
+    r"""Read hashes of inputs from last time a module was written
+
+    :Call:
+        >>> stamp = read_stamp(mod)
+    :Inputs:
+        *mod*: :class:`module`
+            DataKit module
+    :Outputs:
+        *stamp*: :class:`dict`
+            Contents of *STAMP_FILE*, or empty :class:`dict`
+    :Versions:
+        * 2026-10-19 ``@ddalle``: Version 1.0
+    """
+    # Get file name
+    fname = _get_stampfile(mod)
+    # Check for file
+    if fname is None or not os.path.isfile(fname):
+        return {}
+    # Read it
+    try:
+        with open(fname) as fp:
+            return json.load(fp)
+    except ValueError:
+        # Ignore invalid file
+        return {}
+
+
+# Save hashes of inputs
+def write_stamp(mod, stamp):
+    r"""Save hashes of inputs after a module is written
+
+    :Call:
+        >>> write_stamp(mod, stamp)
+    :Inputs:
+        *mod*: :class:`module`
+            DataKit module
+        *stamp*: :class:`dict`
+            Hashes of inputs from :func:`check_module`
+    :Versions:
+        * 2026-10-19 ``@ddalle``: Version 1.0
+    """
+    # Get file name
+    fname = _get_stampfile(mod)
+    # Check for valid loader and folder
+    if fname is None or not os.path.isdir(os.path.dirname(fname)):
+        return
+    # Write it
+    with open(fname, "w") as fp:
+        json.dump(stamp, fp, indent=1, sort_keys=True)
+
+
+# Get name of stamp file
+def _get_stampfile(mod):
+    # Get DataKitLoader
+    dkl = mod.__dict__.get("DATAKIT_LOADER")
+    # Check for valid loader
+    if not isinstance(dkl, datakitloader.DataKitLoader):
+        return
+    # Put it in datakit folder
+    return os.path.join(_get_dbdir(dkl), STAMP_FILE)
+
+
+# Get top-level datakit folder
+def _get_dbdir(dkl):
+    return os.path.join(
+        dkl.get_option("MODULE_DIR"), dkl.get_option("DB_DIR"))
+
+
+# List files in a folder recursively
+def _walk_files(fdir, skipdirs=()):
+    # Initialize
+    fnames = []
+    # Check for folder
+    if not os.path.isdir(fdir):
+        return fnames
+    # Loop through folders
+    for root, dirs, files in os.walk(fdir):
+        # Don't enter hidden, cache, or skipped folders
+        dirs[:] = sorted(
+            d for d in dirs
+            if not (d.startswith(".") or d == "__pycache__") and
+            os.path.abspath(os.path.join(root, d)) not in skipdirs)
+        # Add files
+        for fname in sorted(files):
+            if not fname.startswith("."):
+                fnames.append(os.path.join(root, fname))
+    # Output
+    return fnames
+
+
+# Hash contents of a file
+def _hash_file(fname):
+    # Initialize hash
+    h = hashlib.sha1()
+    # Read in blocks
+    with open(fname, "rb") as fp:
+        for block in iter(lambda: fp.read(1048576), b""):
+            h.update(block)
+    # Output
+    return h.hexdigest()
+
+
 # Import a child
 def import_dbname(mod, dbname, **kw):
     r"""Import a module by *DB_NAME* instead of module spec
@@ -0,0 +1,1152 @@
+#!/usr/bin/env python3
+r"""
+:mod:`cape.benchmark`: Offline benchmarks for CAPE hot paths
+=============================================================
+
+This module provides a self-contained benchmark suite for the parts of
+CAPE that dominate the run time of large run matrices and data books.
+All inputs are generated locally in a temporary folder, so no CFD
+solver, queue, or existing case is needed:
+
+    * run matrices with *N* cases and their case folders
+    * FUN3D, OVERFLOW, and Cart3D iterative force & moment histories
+    * data book component files
+    * large surface triangulations (``.tri`` and ``.triq``)
+    * :class:`cape.attdb.rdb.DataKit` tables
+
+Each benchmark is timed several times after a warm-up call, and the
+results (median, min, max, mean, standard deviation, and interquartile
+range) are written to a JSON file. A later run can be compared against
+such a file to catch performance regressions.
+
+:Versions:
+    * 2026-10-19 ``@ddalle``: Version 1.0
+"""
+
+# Standard library
+import fnmatch
+import json
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+
+# Third-party modules
+import numpy as np
+
+# CAPE modules
+from . import argread
+from . import text as textutils
+from . import version
+
+
+# Help message for executable
+HELP_BENCHMARK = r"""
+``cape-benchmark``: Time CAPE hot paths using synthetic inputs
+=====================================================================
+
+This tool generates synthetic run matrices, case histories, data books,
+triangulations, and data kits in a temporary folder and times the
+CAPE functions that process them.
+
+:Usage:
+    .. code-block:: console
+
+        $ cape-benchmark [PAT1 PAT2 ...] [OPTIONS]
+
+:Example:
+
+    Run all benchmarks and save a baseline.
+
+        .. code-block:: console
+
+            $ cape-benchmark -o baseline.json
+
+    Run only the triangulation benchmarks and compare to the baseline.
+
+        .. code-block:: console
+
+            $ cape-benchmark "tri.*" -b baseline.json
+
+:Inputs:
+    *PAT1*: Optional pattern to subset benchmarks by name
+    *PAT2*: Second pattern, use benchmarks matching *PAT1* or *PAT2*
+
+:Options:
+
+    -h, --help
+        Display this help message and quit
+
+    --list
+        List the available benchmarks and quit
+
+    -s, --size SIZE
+        Size of synthetic inputs: ``small``, {``medium``}, or ``large``
+
+    -n, --repeat N
+        Number of timed calls of each benchmark (default: 5)
+
+    -o FJSON
+        Write results to JSON file *FJSON*
+
+    -b FBASE
+        Compare results to those in JSON file *FBASE*; return a nonzero
+        status if any benchmark is slower by more than *TOL*
+
+    --tol TOL
+        Relative slowdown of median time flagged as regression
+        (default: 0.25)
+
+    --keep
+        Do not delete folder of synthetic inputs
+
+:Versions:
+    * 2026-10-19 ``@ddalle``: Version 1.0
+"""
+
+
+# Seed for synthetic inputs
+SEED = 1947
+
+# Input sizes
+SIZES = {
+    "small": {
+        "nCase": 50,
+        "nDBCase": 500,
+        "nIter": 500,
+        "nx": 40,
+        "nt": 24,
+        "nQuery": 50,
+        "nRcall": 2000,
+        "nMach": 6,
+        "nAlpha": 6,
+        "nRbf": 200,
+    },
+    "medium": {
+        "nCase": 400,
+        "nDBCase": 5000,
+        "nIter": 5000,
+        "nx": 160,
+        "nt": 96,
+        "nQuery": 200,
+        "nRcall": 20000,
+        "nMach": 12,
+        "nAlpha": 12,
+        "nRbf": 1000,
+    },
+    "large": {
+        "nCase": 2000,
+        "nDBCase": 50000,
+        "nIter": 50000,
+        "nx": 480,
+        "nt": 256,
+        "nQuery": 1000,
+        "nRcall": 200000,
+        "nMach": 20,
+        "nAlpha": 20,
+        "nRbf": 3000,
+    },
+}
+
+# Default number of timed calls
+REPEAT = 5
+# Default relative tolerance for regressions
+TOL = 0.25
+# Changes smaller than this are never flagged [s]
+ATOL = 1e-3
+
+# Data book components
+DB_COMPS = ["body", "wing"]
+# Force & moment coefficient columns in FUN3D history files
+FUN3D_COLS = ["C_x", "C_y", "C_z", "C_M_x", "C_M_y", "C_M_z"]
+# Number of columns in each OVERFLOW fomoco record
+FOMOCO_NCOL = 38
+
+
+# Synthetic run matrix and data book settings
+CAPE_JSON = r"""{
+    "RunMatrix": {
+        "File": "matrix.csv",
+        "Keys": ["mach", "alpha", "beta"]
+    },
+    "Config": {
+        "Components": %(comps)s,
+        "RefArea": 1.0,
+        "RefLength": 1.0
+    },
+    "DataBook": {
+        "Components": %(comps)s,
+        "Folder": "data",
+        "nStats": 100,
+        "nMin": 100
+    }
+}
+"""
+
+
+# --- Input generators ---
+# Create run matrix and CAPE JSON file
+def genr8_runmatrix(ncase, fdir="."):
+    r"""Write a synthetic ``cape.json`` file and run matrix
+
+    :Call:
+        >>> genr8_runmatrix(ncase, fdir=".")
+    :Inputs:
+        *ncase*: :class:`int`
+            Number of cases in run matrix
+        *fdir*: {``"."``} | :class:`str`
+            Folder in which to write ``cape.json`` and ``matrix.csv``
+    :Versions:
+        * 2026-10-19 ``@ddalle``: Version 1.0
+    """
+    # Random state
+    rng = np.random.RandomState(SEED)
+    # Conditions
+    mach = np.round(rng.uniform(0.3, 3.0, ncase), 2)
+    alph = np.round(rng.uniform(-4.0, 12.0, ncase), 1)
+    beta = np.round(rng.uniform(-2.0, 2.0, ncase), 1)
+    # Write settings
+    with open(os.path.join(fdir, "cape.json"), "w") as fp:
+        fp.write(CAPE_JSON % {"comps": json.dumps(DB_COMPS)})
+    # Write run matrix
+    with open(os.path.join(fdir, "matrix.csv"), "w") as fp:
+        fp.write("# mach, alpha, beta\n")
+        for j in range(ncase):
+            fp.write("%.2f, %.1f, %.1f\n" % (mach[j], alph[j], beta[j]))
+
+
+# Create case folders
+def genr8_case_folders(cntl):
+    r"""Create an empty folder for each case of a run matrix
+
+    :Call:
+        >>> genr8_case_folders(cntl)
+    :Inputs:
+        *cntl*: :class:`cape.cntl.Cntl`
+            CAPE control class instance
+    :Versions:
+        * 2026-10-19 ``@ddalle``: Version 1.0
+    """
+    # Loop through cases
+    for frun in cntl.x.GetFullFolderNames():
+        # Create folder (and group folder)
+        if not os.path.isdir(frun):
+            os.makedirs(frun)
+
+
+# Create data book component
+def genr8_databook_comp(cntl, comp, n):
+    r"""Create a data book component with *n* random entries
+
+    :Call:
+        >>> dbc = genr8_databook_comp(cntl, comp, n)
+    :Inputs:
+        *cntl*: :class:`cape.cntl.Cntl`
+            CAPE control class instance
+        *comp*: :class:`str`
+            Name of data book component
+        *n*: :class:`int`
+            Number of entries
+    :Outputs:
+        *dbc*: :class:`cape.cfdx.dataBook.DBComp`
+            Data book component, not yet written
+    :Versions:
+        * 2026-10-19 ``@ddalle``: Version 1.0
+    """
+    # Import here to keep module import light
+    from .cfdx import dataBook
+    # Random state
+    rng = np.random.RandomState(SEED)
+    # Empty component
+    dbc = dataBook.DBComp(comp, cntl)
+    # Make sure data book folder exists
+    _mkdir(os.path.dirname(dbc.fname))
+    # Run matrix conditions, repeated as needed
+    for col in dbc.xCols:
+        # Get values from run matrix
+        v = np.asarray(cntl.x[col])
+        # Repeat to length *n*
+        dbc[col] = np.resize(v, n)
+    # Float and iteration columns
+    for col in dbc.fCols:
+        dbc[col] = rng.randn(n)
+    for col in dbc.iCols:
+        dbc[col] = rng.randint(100, 10000, n)
+    # Save size
+    dbc.n = n
+    # Output
+    return dbc
+
+
+# Write FUN3D force & moment history
+def genr8_fun3d_fm(fname, comp, nIter):
+    r"""Write a synthetic FUN3D ``{proj}_fm_{comp}.dat`` history
+
+    :Call:
+        >>> genr8_fun3d_fm(fname, comp, nIter)
+    :Inputs:
+        *fname*: :class:`str`
+            Name of file to write
+        *comp*: :class:`str`
+            Name of component
+        *nIter*: :class:`int`
+            Number of iterations
+    :Versions:
+        * 2026-10-19 ``@ddalle``: Version 1.0
+    """
+    # Iterative history
+    A = _genr8_history(nIter, len(FUN3D_COLS))
+    # Write file
+    with open(fname, "w") as fp:
+        fp.write('title="Force and moment history for %s"\n' % comp)
+        fp.write('variables = "Iteration" %s\n' % " ".join(
+            '"%s"' % col for col in FUN3D_COLS))
+        fp.write('zone title="%s"\n' % comp)
+        np.savetxt(fp, A, fmt="%.8e")
+
+
+# Write OVERFLOW fomoco history
+def genr8_overflow_fomoco(fname, comps, nIter):
+    r"""Write a synthetic OVERFLOW ``.fomoco`` history
+
+    Each record consists of an 80-character component name line
+    followed by 38 values in 569 characters, for a total of 650.
+
+    :Call:
+        >>> genr8_overflow_fomoco(fname, comps, nIter)
+    :Inputs:
+        *fname*: :class:`str`
+            Name of file to write
+        *comps*: :class:`list`\ [:class:`str`]
+            List of component names
+        *nIter*: :class:`int`
+            Number of iterations
+    :Versions:
+        * 2026-10-19 ``@ddalle``: Version 1.0
+    """
+    # Histories for each component
+    A = [_genr8_history(nIter, FOMOCO_NCOL - 1) for comp in comps]
+    # Write file
+    with open(fname, "w") as fp:
+        # Loop through iterations
+        for i in range(nIter):
+            # Loop through components
+            for (j, comp) in enumerate(comps):
+                # Component name
+                fp.write("%-80s\n" % comp)
+                # Values
+                txt = " ".join("%13.6e" % v for v in A[j][i])
+                fp.write("%-568s\n" % txt)
+
+
+# Write Cart3D force & moment history
+def genr8_cart3d_fm(fname, nIter):
+    r"""Write a synthetic Cart3D ``{comp}.dat`` history
+
+    :Call:
+        >>> genr8_cart3d_fm(fname, nIter)
+    :Inputs:
+        *fname*: :class:`str`
+            Name of file to write
+        *nIter*: :class:`int`
+            Number of iterations
+    :Versions:
+        * 2026-10-19 ``@ddalle``: Version 1.0
+    """
+    # Iterative history
+    A = _genr8_history(nIter, 6)
+    # Write file
+    with open(fname, "w") as fp:
+        fp.write("# cycle Fx Fy Fz Mx My Mz\n")
+        np.savetxt(fp, A, fmt="%.8e")
+
+
+# Iterative history
+def _genr8_history(nIter, ncol):
+    r"""Generate a converging iterative history
+
+    :Call:
+        >>> A = _genr8_history(nIter, ncol)
+    :Inputs:
+        *nIter*: :class:`int`
+            Number of iterations
+        *ncol*: :class:`int`
+            Number of coefficients
+    :Outputs:
+        *A*: :class:`np.ndarray`\ [:class:`float`]
+            Iteration followed by *ncol* coefficients in each row
+    :Versions:
+        * 2026-10-19 ``@ddalle``: Version 1.0
+    """
+    # Random state
+    rng = np.random.RandomState(SEED)
+    # Iterations
+    i = np.arange(1, nIter + 1, dtype="float")
+    # Decaying oscillation about random mean
+    c = rng.randn(ncol)
+    e = np.exp(-i / (0.2*nIter + 1))
+    A = c + np.outer(e, rng.rand(ncol)) + 1e-4*rng.randn(nIter, ncol)
+    # Output
+    return np.hstack((i[:, None], A))
+
+
+# Create triangulation
+def genr8_tri(nx, nt, nq=0, ncomp=4):
+    r"""Create a triangulated body of revolution
+
+    The body is an ogive-cylinder with *nx* axial stations and *nt*
+    circumferential stations, split into *ncomp* components along its
+    axis.
+
+    :Call:
+        >>> tri = genr8_tri(nx, nt, nq=0, ncomp=4)
+    :Inputs:
+        *nx*: :class:`int`
+            Number of axial stations
+        *nt*: :class:`int`
+            Number of circumferential stations
+        *nq*: {``0``} | :class:`int`
+            Number of states; if nonzero, create a ``Triq``
+        *ncomp*: {``4``} | :class:`int`
+            Number of components
+    :Outputs:
+        *tri*: :class:`cape.tri.Tri` | :class:`cape.tri.Triq`
+            Surface triangulation
+    :Versions:
+        * 2026-10-19 ``@ddalle``: Version 1.0
+    """
+    # Import here to keep module import light
+    from . import tri as trifile
+    # Axial and circumferential coordinates
+    x = np.linspace(0.0, 10.0, nx)
+    t = np.linspace(0.0, 2*np.pi, nt, endpoint=False)
+    # Radius: ogive nose followed by cylinder
+    r = 0.05 + np.sqrt(np.clip(x/3.0, 0.0, 1.0) * (2 - np.clip(x/3.0, 0, 1)))
+    # Nodes
+    X, T = np.meshgrid(x, t, indexing="ij")
+    R = np.meshgrid(r, t, indexing="ij")[0]
+    Nodes = np.stack((X, R*np.cos(T), R*np.sin(T)), axis=-1).reshape(-1, 3)
+    # Node indices (1-based) for each quad
+    I = np.arange(1, nx*nt + 1).reshape(nx, nt)
+    I = np.hstack((I, I[:, :1]))
+    i0 = I[:-1, :-1].flatten()
+    i1 = I[1:, :-1].flatten()
+    i2 = I[1:, 1:].flatten()
+    i3 = I[:-1, 1:].flatten()
+    # Split each quad into two tris
+    Tris = np.vstack((
+        np.stack((i0, i1, i2), axis=1),
+        np.stack((i0, i2, i3), axis=1)))
+    # Component IDs by axial station
+    xc = np.mean(Nodes[Tris - 1, 0], axis=1)
+    CompID = 1 + np.minimum((xc * ncomp / 10.0).astype("int"), ncomp - 1)
+    # Check for states
+    if nq == 0:
+        return trifile.Tri(Nodes=Nodes, Tris=Tris, CompID=CompID)
+    # Random state
+    rng = np.random.RandomState(SEED)
+    # States: Cp followed by smooth random fields
+    q = np.hstack((
+        np.cos(Nodes[:, :1]) - 0.5,
+        1.0 + 0.01*rng.rand(Nodes.shape[0], nq - 1)))
+    # Output
+    return trifile.Triq(
+        Nodes=Nodes, Tris=Tris, CompID=CompID, nq=nq, q=q)
+
+
+# Write component names
+def genr8_config_xml(fname, ncomp=4):
+    r"""Write a ``Config.xml`` file naming the components of a tri
+
+    :Call:
+        >>> genr8_config_xml(fname, ncomp=4)
+    :Inputs:
+        *fname*: :class:`str`
+            Name of file to write
+        *ncomp*: {``4``} | :class:`int`
+            Number of components, named ``comp1``, ``comp2``, etc.
+    :Versions:
+        * 2026-10-19 ``@ddalle``: Version 1.0
+    """
+    # Write file
+    with open(fname, "w") as fp:
+        fp.write('<?xml version="1.0" encoding="ISO-8859-1"?>\n')
+        fp.write('<Configuration Name="bench" Source="bench.tri">\n')
+        for k in range(1, ncomp + 1):
+            fp.write(
+                '  <Component Name="comp%i" Type="tri">\n'
+                '    <Data> Face Label=%i </Data>\n'
+                '  </Component>\n' % (k, k))
+        fp.write('</Configuration>\n')
+
+
+# Create data kit
+def genr8_datakit(nmach, nalph):
+    r"""Create a full-factorial :class:`DataKit` of *mach* and *alpha*
+
+    :Call:
+        >>> db = genr8_datakit(nmach, nalph)
+    :Inputs:
+        *nmach*: :class:`int`
+            Number of Mach numbers
+        *nalph*: :class:`int`
+            Number of angles of attack
+    :Outputs:
+        *db*: :class:`cape.attdb.rdb.DataKit`
+            Data kit with *CN* and multilinear response
+    :Versions:
+        * 2026-10-19 ``@ddalle``: Version 1.0
+    """
+    # Import here to keep module import light
+    from .attdb import rdb
+    # Full-factorial conditions
+    mach, alph = np.meshgrid(
+        np.linspace(0.5, 2.5, nmach), np.linspace(-4.0, 12.0, nalph))
+    mach = mach.flatten()
+    alph = alph.flatten()
+    # Create data kit
+    db = rdb.DataKit()
+    db.save_col("mach", mach)
+    db.save_col("alpha", alph)
+    db.save_col("CN", 0.05*alph*np.sqrt(mach) + 0.1*np.sin(mach))
+    # Break points and response
+    db.create_bkpts(["mach", "alpha"])
+    db.make_response("CN", "linear", ["mach", "alpha"])
+    # Output
+    return db
+
+
+# Create scattered data kit
+def genr8_datakit_scattered(n):
+    r"""Create a :class:`DataKit` at *n* random *mach*, *alpha* points
+
+    :Call:
+        >>> db = genr8_datakit_scattered(n)
+    :Inputs:
+        *n*: :class:`int`
+            Number of points
+    :Outputs:
+        *db*: :class:`cape.attdb.rdb.DataKit`
+            Data kit with *CN*
+    :Versions:
+        * 2026-10-19 ``@ddalle``: Version 1.0
+    """
+    # Import here to keep module import light
+    from .attdb import rdb
+    # Random state
+    rng = np.random.RandomState(SEED)
+    # Scattered conditions
+    mach = rng.uniform(0.5, 2.5, n)
+    alph = rng.uniform(-4.0, 12.0, n)
+    # Create data kit
+    db = rdb.DataKit()
+    db.save_col("mach", mach)
+    db.save_col("alpha", alph)
+    db.save_col("CN", 0.05*alph*np.sqrt(mach) + 0.1*np.sin(mach))
+    # Output
+    return db
+
+
+# --- Benchmarks ---
+# Each benchmark takes the size options, creates its inputs, and
+# returns the function to time
+def bench_cntl_checkcase(opts):
+    r"""Benchmark :func:`cape.cntl.Cntl.CheckCase` for all cases
+
+    :Versions:
+        * 2026-10-19 ``@ddalle``: Version 1.0
+    """
+    # Import here to keep module import light
+    from .cntl import Cntl
+    # Read settings and create folders
+    cntl = Cntl()
+    genr8_case_folders(cntl)
+    # Cases
+    I = range(cntl.x.nCase)
+
+    # Timed function
+    def func():
+        for i in I:
+            cntl.CheckCase(i)
+    # Output
+    return func
+
+
+def bench_databook_read(opts):
+    r"""Benchmark :func:`cape.cfdx.dataBook.DBBase.Read`
+
+    :Versions:
+        * 2026-10-19 ``@ddalle``: Version 1.0
+    """
+    # Import here to keep module import light
+    from .cfdx import dataBook
+    from .cntl import Cntl
+    # Read settings
+    cntl = Cntl()
+    # Write each component
+    for comp in DB_COMPS:
+        # Create data book file
+        dbc = genr8_databook_comp(cntl, comp, opts["nDBCase"])
+        dbc.Write()
+
+    # Timed function
+    def func():
+        for comp in DB_COMPS:
+            dataBook.DBComp(comp, cntl)
+    # Output
+    return func
+
+
+def bench_databook_write(opts):
+    r"""Benchmark :func:`cape.cfdx.dataBook.DBBase.Write`
+
+    :Versions:
+        * 2026-10-19 ``@ddalle``: Version 1.0
+    """
+    # Import here to keep module import light
+    from .cntl import Cntl
+    # Read settings
+    cntl = Cntl()
+    # Create data book components
+    DBs = [genr8_databook_comp(cntl, comp, opts["nDBCase"])
+        for comp in DB_COMPS]
+
+    # Timed function
+    def func():
+        for dbc in DBs:
+            dbc.Write()
+    # Output
+    return func
+
+
+def bench_pyfun_casefm(opts):
+    r"""Benchmark :class:`cape.pyfun.dataBook.CaseFM`
+
+    :Versions:
+        * 2026-10-19 ``@ddalle``: Version 1.0
+    """
+    # Import here to keep module import light
+    from .pyfun import dataBook
+    # Write histories
+    fdir = _mkdir("fun3d")
+    for comp in DB_COMPS:
+        fname = os.path.join(fdir, "run_fm_%s.dat" % comp)
+        genr8_fun3d_fm(fname, comp, opts["nIter"])
+    # Output
+    return _read_in_folder(fdir, lambda comp: dataBook.CaseFM("run", comp))
+
+
+def bench_pyover_casefm(opts):
+    r"""Benchmark :class:`cape.pyover.dataBook.CaseFM`
+
+    :Versions:
+        * 2026-10-19 ``@ddalle``: Version 1.0
+    """
+    # Import here to keep module import light
+    from .pyover import dataBook
+    # Write history
+    fdir = _mkdir("overflow")
+    fname = os.path.join(fdir, "run.fomoco")
+    genr8_overflow_fomoco(fname, DB_COMPS, opts["nIter"])
+    # Output
+    return _read_in_folder(fdir, lambda comp: dataBook.CaseFM("run", comp))
+
+
+def bench_pycart_casefm(opts):
+    r"""Benchmark :class:`cape.pycart.dataBook.CaseFM`
+
+    :Versions:
+        * 2026-10-19 ``@ddalle``: Version 1.0
+    """
+    # Import here to keep module import light
+    from .pycart import dataBook
+    # Write histories
+    fdir = _mkdir("cart3d")
+    for comp in DB_COMPS:
+        genr8_cart3d_fm(os.path.join(fdir, "%s.dat" % comp), opts["nIter"])
+    # Output
+    return _read_in_folder(fdir, dataBook.CaseFM)
+
+
+def bench_triq_read(opts):
+    r"""Benchmark reading a ``.triq`` file
+
+    :Versions:
+        * 2026-10-19 ``@ddalle``: Version 1.0
+    """
+    # Import here to keep module import light
+    from . import tri as trifile
+    # Write file
+    triq = genr8_tri(opts["nx"], opts["nt"], nq=9)
+    triq.Write("bench.triq")
+
+    # Timed function
+    def func():
+        trifile.Triq("bench.triq")
+    # Output
+    return func
+
+
+def bench_tri_getnearesttri(opts):
+    r"""Benchmark :func:`cape.tri.TriBase.GetNearestTri`
+
+    :Versions:
+        * 2026-10-19 ``@ddalle``: Version 1.0
+    """
+    # Triangulation and query points
+    tri = genr8_tri(opts["nx"], opts["nt"])
+    X = _genr8_query_points(tri, opts["nQuery"])
+
+    # Timed function
+    def func():
+        for x in X:
+            tri.GetNearestTri(x)
+    # Output
+    return func
+
+
+def bench_tri_getnearesttris(opts):
+    r"""Benchmark :func:`cape.tri.TriBase.GetNearestTris`
+
+    :Versions:
+        * 2026-10-19 ``@ddalle``: Version 1.0
+    """
+    # Triangulation and query points
+    tri = genr8_tri(opts["nx"], opts["nt"])
+    X = _genr8_query_points(tri, opts["nQuery"])
+
+    # Timed function
+    def func():
+        tri.GetNearestTris(X)
+    # Output
+    return func
+
+
+def bench_tri_maptricompid(opts):
+    r"""Benchmark :func:`cape.tri.TriBase.MapTriCompID`
+
+    :Versions:
+        * 2026-10-19 ``@ddalle``: Version 1.0
+    """
+    # Triangulation and coarse one with other component labels
+    tri = genr8_tri(opts["nx"]//2, opts["nt"]//2)
+    tric = genr8_tri(opts["nx"]//8 + 2, opts["nt"]//8 + 2, ncomp=2)
+    # Component names
+    genr8_config_xml("Config.xml", 4)
+    genr8_config_xml("Config2.xml", 2)
+    tri.ReadConfigXML("Config.xml")
+    tric.ReadConfigXML("Config2.xml")
+
+    # Timed function
+    def func():
+        tri.MapTriCompID(tric)
+    # Output
+    return func
+
+
+def bench_triq_gettriforces(opts):
+    r"""Benchmark :func:`cape.tri.Triq.GetTriForces`
+
+    :Versions:
+        * 2026-10-19 ``@ddalle``: Version 1.0
+    """
+    # Annotated triangulation
+    triq = genr8_tri(opts["nx"], opts["nt"], nq=9)
+
+    # Timed function
+    def func():
+        for comp in [None, 1, 2]:
+            triq.GetTriForces(comp, mach=0.8, Re=1e4, incm=True)
+    # Output
+    return func
+
+
+def bench_datakit_rcall(opts):
+    r"""Benchmark :func:`cape.attdb.rdb.DataKit.rcall`
+
+    :Versions:
+        * 2026-10-19 ``@ddalle``: Version 1.0
+    """
+    # Data kit and random conditions
+    db = genr8_datakit(opts["nMach"], opts["nAlpha"])
+    rng = np.random.RandomState(SEED)
+    mach = rng.uniform(0.5, 2.5, opts["nRcall"])
+    alph = rng.uniform(-4.0, 12.0, opts["nRcall"])
+
+    # Timed function
+    def func():
+        db.rcall("CN", mach, alph)
+    # Output
+    return func
+
+
+def bench_datakit_regularize_by_rbf(opts):
+    r"""Benchmark :func:`cape.attdb.rdb.DataKit.regularize_by_rbf`
+
+    :Versions:
+        * 2026-10-19 ``@ddalle``: Version 1.0
+    """
+    # Regularize onto same break points as *rcall* benchmark
+    bkpts = {
+        "mach": np.linspace(0.5, 2.5, opts["nMach"]),
+        "alpha": np.linspace(-4.0, 12.0, opts["nAlpha"]),
+    }
+
+    # Timed function
+    def func():
+        # New data kit each time since regularization replaces cols
+        db = genr8_datakit_scattered(opts["nRbf"])
+        db.bkpts = dict(bkpts)
+        db.regularize_by_rbf(["CN"], ["mach", "alpha"])
+    # Output
+    return func
+
+
+# List of benchmarks, in order
+BENCHMARKS = [
+    ("cntl.CheckCase", bench_cntl_checkcase),
+    ("dataBook.DBBase.Read", bench_databook_read),
+    ("dataBook.DBBase.Write", bench_databook_write),
+    ("pyfun.CaseFM", bench_pyfun_casefm),
+    ("pyover.CaseFM", bench_pyover_casefm),
+    ("pycart.CaseFM", bench_pycart_casefm),
+    ("tri.Triq.Read", bench_triq_read),
+    ("tri.GetNearestTri", bench_tri_getnearesttri),
+    ("tri.GetNearestTris", bench_tri_getnearesttris),
+    ("tri.MapTriCompID", bench_tri_maptricompid),
+    ("tri.Triq.GetTriForces", bench_triq_gettriforces),
+    ("attdb.DataKit.rcall", bench_datakit_rcall),
+    ("attdb.DataKit.regularize_by_rbf", bench_datakit_regularize_by_rbf),
+]
+
+
+# Create subfolder
+def _mkdir(fdir):
+    # Create if necessary
+    if not os.path.isdir(fdir):
+        os.mkdir(fdir)
+    # Output
+    return os.path.abspath(fdir)
+
+
+# Create function to read each component in a folder
+def _read_in_folder(fdir, reader):
+    # Timed function
+    def func():
+        # Remember where we started
+        fpwd = os.getcwd()
+        os.chdir(fdir)
+        try:
+            for comp in DB_COMPS:
+                reader(comp)
+        finally:
+            os.chdir(fpwd)
+    # Output
+    return func
+
+
+# Query points near a triangulation
+def _genr8_query_points(tri, n):
+    # Random state
+    rng = np.random.RandomState(SEED)
+    # Random nodes, perturbed
+    X = tri.Nodes[rng.randint(0, tri.nNode, n)]
+    return X + 0.01*rng.randn(n, 3)
+
+
+# --- Timing ---
+# Time a function
+def time_func(func, repeat=REPEAT, warmup=1):
+    r"""Time repeated calls to a function
+
+    :Call:
+        >>> stats = time_func(func, repeat=5, warmup=1)
+    :Inputs:
+        *func*: **callable**
+            Function with no inputs to time
+        *repeat*: {``5``} | :class:`int`
+            Number of timed calls
+        *warmup*: {``1``} | :class:`int`
+            Number of untimed calls before timing
+    :Outputs:
+        *stats*: :class:`dict`
+            Statistics of wall-clock times [s]; keys are ``"median"``,
+            ``"min"``, ``"max"``, ``"mean"``, ``"std"``, ``"iqr"``,
+            ``"repeat"``, and ``"times"``
+    :Versions:
+        * 2026-10-19 ``@ddalle``: Version 1.0
+    """
+    # Warm-up calls (caches, imports, etc.)
+    for _ in range(warmup):
+        func()
+    # Timed calls
+    T = np.zeros(max(1, repeat))
+    for j in range(T.size):
+        tic = time.perf_counter()
+        func()
+        T[j] = time.perf_counter() - tic
+    # Quartiles
+    q1, q2, q3 = np.percentile(T, [25, 50, 75])
+    # Output
+    return {
+        "median": float(q2),
+        "min": float(np.min(T)),
+        "max": float(np.max(T)),
+        "mean": float(np.mean(T)),
+        "std": float(np.std(T)),
+        "iqr": float(q3 - q1),
+        "repeat": int(T.size),
+        "times": [float(t) for t in T],
+    }
+
+
+# Run benchmarks
+def run_benchmarks(pats=None, size="medium", repeat=REPEAT, **kw):
+    r"""Run benchmarks in a temporary folder of synthetic inputs
+
+    :Call:
+        >>> res = run_benchmarks(pats=None, size="medium", **kw)
+    :Inputs:
+        *pats*: {``None``} | :class:`list`\ [:class:`str`]
+            Patterns for benchmark names; default is all
+        *size*: ``"small"`` | {``"medium"``} | ``"large"``
+            Size of synthetic inputs
+        *repeat*: {``5``} | :class:`int`
+            Number of timed calls of each benchmark
+        *keep*: ``True`` | {``False``}
+            Do not delete folder of synthetic inputs
+        *v*: {``True``} | ``False``
+            Print each result
+    :Outputs:
+        *res*: :class:`dict`
+            Results; *res["results"][name]* has output of
+            :func:`time_func` for each benchmark
+    :Versions:
+        * 2026-10-19 ``@ddalle``: Version 1.0
+    """
+    # Check size
+    if size not in SIZES:
+        raise ValueError(
+            "Unknown benchmark size '%s'; options are %s"
+            % (size, list(SIZES)))
+    opts = SIZES[size]
+    # Options
+    keep = kw.get("keep", False)
+    v = kw.get("v", True)
+    # Select benchmarks
+    benchmarks = [
+        (name, bench) for (name, bench) in BENCHMARKS
+        if _match_name(name, pats)
+    ]
+    # Initialize results
+    res = {
+        "meta": _get_meta(),
+        "size": size,
+        "opts": dict(opts),
+        "results": {},
+    }
+    # Remember where we started
+    fpwd = os.getcwd()
+    # Create working folder
+    fwork = tempfile.mkdtemp(prefix="cape-benchmark-")
+    os.chdir(fwork)
+    # Run the benchmarks
+    try:
+        # Synthetic run matrix used by several benchmarks
+        genr8_runmatrix(opts["nCase"])
+        # Loop through benchmarks
+        for (name, bench) in benchmarks:
+            # Create inputs and time
+            stats = time_func(bench(opts), repeat=repeat)
+            res["results"][name] = stats
+            # Status update
+            if v:
+                print("%-34s %10.4f s  (min %.4f, iqr %.4f)" % (
+                    name, stats["median"], stats["min"], stats["iqr"]))
+                sys.stdout.flush()
+    finally:
+        # Return to original folder
+        os.chdir(fpwd)
+        # Clean up
+        if keep:
+            print("Synthetic inputs in '%s'" % fwork)
+        else:
+            shutil.rmtree(fwork, ignore_errors=True)
+    # Output
+    return res
+
+
+# Compare to baseline
+def compare_results(res, base, tol=TOL, atol=ATOL):
+    r"""Compare benchmark results to a saved baseline
+
+    :Call:
+        >>> cmp = compare_results(res, base, tol=0.25, atol=1e-3)
+    :Inputs:
+        *res*: :class:`dict`
+            Results from :func:`run_benchmarks`
+        *base*: :class:`dict`
+            Baseline results from :func:`run_benchmarks`
+        *tol*: {``0.25``} | :class:`float`
+            Relative increase in median time flagged as regression
+        *atol*: {``1e-3``} | :class:`float`
+            Minimum absolute change in median time to flag [s]
+    :Outputs:
+        *cmp*: :class:`list`\ [:class:`tuple`]
+            Tuple of benchmark name, baseline median, new median, ratio,
+            and status (``"ok"``, ``"faster"``, ``"slower"``, or
+            ``"new"``) for each benchmark in *res*
+    :Versions:
+        * 2026-10-19 ``@ddalle``: Version 1.0
+    """
+    # Baseline results
+    base_results = base.get("results", {})
+    # Initialize
+    cmp = []
+    # Loop through results
+    for (name, stats) in res["results"].items():
+        # New median
+        t1 = stats["median"]
+        # Check for baseline
+        if name not in base_results:
+            cmp.append((name, None, t1, None, "new"))
+            continue
+        # Baseline median
+        t0 = base_results[name]["median"]
+        ratio = t1 / max(t0, 1e-12)
+        # Status
+        if abs(t1 - t0) <= atol:
+            sts = "ok"
+        elif ratio > 1.0 + tol:
+            sts = "slower"
+        elif ratio < 1.0 / (1.0 + tol):
+            sts = "faster"
+        else:
+            sts = "ok"
+        cmp.append((name, t0, t1, ratio, sts))
+    # Output
+    return cmp
+
+
+# Read results file
+def read_results(fname):
+    r"""Read benchmark results from JSON file
+
+    :Call:
+        >>> res = read_results(fname)
+    :Inputs:
+        *fname*: :class:`str`
+            Name of JSON file
+    :Outputs:
+        *res*: :class:`dict`
+            Benchmark results
+    :Versions:
+        * 2026-10-19 ``@ddalle``: Version 1.0
+    """
+    with open(fname) as fp:
+        return json.load(fp)
+
+
+# Write results file
+def write_results(fname, res):
+    r"""Write benchmark results to JSON file
+
+    :Call:
+        >>> write_results(fname, res)
+    :Inputs:
+        *fname*: :class:`str`
+            Name of JSON file
+        *res*: :class:`dict`
+            Benchmark results
+    :Versions:
+        * 2026-10-19 ``@ddalle``: Version 1.0
+    """
+    with open(fname, "w") as fp:
+        json.dump(res, fp, indent=2, sort_keys=True)
+        fp.write("\n")
+
+
+# Check benchmark name against patterns
+def _match_name(name, pats):
+    # No filters
+    if not pats:
+        return True
+    # Check each pattern
+    return any(fnmatch.fnmatch(name, pat) for pat in pats)
+
+
+# Information about the machine
+def _get_meta():
+    return {
+        "cape": version,
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "ncpu": os.cpu_count(),
+        "date": time.strftime("%Y-%m-%d %H:%M:%S"),
+    }
+
+
+# Main function
+def main():
+    r"""Command-line interface to ``cape-benchmark``
+
+    :Call:
+        >>> ierr = main()
+    :Outputs:
+        *ierr*: :class:`int`
+            ``1`` if any benchmark is slower than baseline, else ``0``
+    :Versions:
+        * 2026-10-19 ``@ddalle``: Version 1.0
+    """
+    # Process command-line parameters
+    a, kw = argread.readkeys(sys.argv)
+    # Check for "help" option
+    if kw.get("h") or kw.get("help"):
+        print(textutils.markdown(HELP_BENCHMARK))
+        return 0
+    # Check for list
+    if kw.get("list"):
+        for (name, _) in BENCHMARKS:
+            if _match_name(name, a):
+                print(name)
+        return 0
+    # Options
+    size = kw.get("s", kw.get("size", "medium"))
+    repeat = int(kw.get("n", kw.get("repeat", REPEAT)))
+    tol = float(kw.get("tol", TOL))
+    # Run the benchmarks
+    res = run_benchmarks(
+        list(a), size=size, repeat=repeat, keep=kw.get("keep", False))
+    # Write results
+    if kw.get("o"):
+        write_results(kw["o"], res)
+    # Check for baseline
+    if not kw.get("b"):
+        return 0
+    # Read baseline
+    base = read_results(kw["b"])
+    # Check for size mismatch
+    if base.get("size") != size:
+        print("Warning: baseline size '%s' does not match '%s'"
+            % (base.get("size"), size))
+    # Compare
+    cmp = compare_results(res, base, tol=tol)
+    # Display comparison
+    print("")
+    print("%-34s %10s %10s %7s" % ("benchmark", "baseline", "current", "ratio"))
+    for (name, t0, t1, ratio, sts) in cmp:
+        # Format times
+        txt0 = "-" if t0 is None else "%10.4f" % t0
+        txtr = "-" if ratio is None else "%7.2f" % ratio
+        print("%-34s %10s %10.4f %7s  %s" % (name, txt0, t1, txtr, sts))
+    # Return nonzero status if any regressions
+    return int(any(c[4] == "slower" for c in cmp))
+
+
+# Check if run as a script.
+if __name__ == "__main__":
+    sys.exit(main())
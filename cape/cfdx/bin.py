@@ -15,7 +15,10 @@ in which it is slightly more challenging to get the output of a system call.
 The function :func:`cape.bin.callo` is provided to be a substitute for
 :func:`subprocess.check_output` (which is only available in Python 2.7+).
 Several useful system utilities are also provided that utilize this
-output-gathering capability.
+output-gathering capability.  The file-reading utilities :func:`tail`,
+:func:`head`, and :func:`grep` are implemented in Python using
+:mod:`cape.tnakit.fileutils` so that status checks of many cases do not
+launch a subprocess for each file.
 
 See also the :mod:`cape.cmd` module
 """
@@ -26,6 +29,7 @@ import subprocess as sp
 
 # Import local command-generating module for complex commands
 from . import cmd
+from ..tnakit import fileutils
 
 
 # Imitate sp.check_output() for older versions
@@ -193,13 +197,15 @@ def grep(regex, fname):
             List of lines containing the sought regular expression
     :Versions:
         * 2015-12-28 ``@ddalle``: Version 1.0
+        * 2026-10-19 ``@ddalle``: Version 2.0; no subprocess
     """
-    # Safely call
+    # Safely search
     try:
-        # Call egrep so that regular expressions are expanded fully
-        txt = callo(['egrep', str(regex), fname])
-        # Split into list of lines
-        return txt.split('\n')
+        # Read matching lines; empty last entry like ``egrep`` output
+        return fileutils.grep(str(regex), fname) + ['']
+    except (IOError, OSError):
+        # Missing file; same as empty ``egrep`` output
+        return ['']
     except Exception:
         return []
 
@@ -220,11 +226,13 @@ def head(fname, n=1):
             Output of built-in `tail` function
     :Versions:
         * 2015-01-12 ``@ddalle``: Version 1.0
+        * 2026-10-19 ``@ddalle``: Version 2.0; no subprocess
     """
-    # Create the command.
-    cmdi = ['head', '-%i'%n, fname]
-    # Use Popen because check_output is 2.7+
-    return callo(cmdi)
+    # Read the lines in this process
+    try:
+        return ''.join(fileutils.head(fname, n))
+    except (IOError, OSError):
+        return ''
 
 
 # Function to get the last line of a file.
@@ -243,11 +251,13 @@ def tail(fname, n=1):
             Output of built-in `tail` function
     :Versions:
         * 2015-01-12 ``@ddalle``: Version 1.0
+        * 2026-10-19 ``@ddalle``: Version 2.0; read backwards in blocks
     """
-    # Create the command.
-    cmdi = ['tail', '-%i'%n, fname]
-    # Use Popen because check_output is 2.7+
-    return callo(cmdi)
+    # Read the lines in this process
+    try:
+        return ''.join(fileutils.tail(fname, n))
+    except (IOError, OSError):
+        return ''
 
 
 # Simple function to make sure a file is present
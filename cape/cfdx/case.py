@@ -44,6 +44,7 @@ from numpy import nan, isnan, argmax
 from . import queue
 from . import bin
 from .options.runControl import RunControl
+from .options.util import loadJSONFile
 from ..tri import Tri, Triq
 
 
@@ -415,18 +416,41 @@ def ReadCaseJSON(fjson='case.json'):
     :Versions:
         * 2014-10-02 ``@ddalle``: Version 1.0
     """
-    # Read the file, fail if not present.
-    f = open(fjson)
-    # Read the settings.
-    opts = json.load(f)
-    # Close the file.
-    f.close()
+    # Read the settings (cached if file unchanged); fail if not present
+    opts = loadJSONFile(fjson, persist=False)
     # Convert to a Cape options object.
     fc = RunControl(**opts)
     # Output
     return fc
 
 
+# Get status of local settings file
+def GetCaseJSONStat(fjson='case.json'):
+    r"""Get size and modification time of local settings file
+
+    Case runners use this to check whether ``case.json`` has changed
+    before rereading it between phases run in the same job.
+
+    :Call:
+        >>> stat = cape.case.GetCaseJSONStat(fjson='case.json')
+    :Inputs:
+        *fjson*: {``"case.json"``} | :class:`str`
+            Name of JSON settings file
+    :Outputs:
+        *stat*: ``None`` | :class:`tuple`\ [:class:`int`]
+            File size and modification time in nanoseconds
+    :Versions:
+        * 2026-10-19 ``@ddalle``: Version 1.0
+    """
+    # Get file status
+    try:
+        st = os.stat(fjson)
+    except OSError:
+        return None
+    # Output
+    return (st.st_size, st.st_mtime_ns)
+
+
 # Read variable from conditions file
 def ReadConditions(k=None):
     r"""Read run matrix variable value in the current folder
@@ -111,6 +111,10 @@ functionality from this script is also accessible from the
     --report RP
         Update report named *RP* (default: first report in JSON file)
 
+    --report RP -j NPROC
+        Render up to *NPROC* case and sweep pages of report *RP*
+        concurrently
+
     --dezombie
         Clean up ZOMBIE cases, which appear to be RUNNING but have no
         recently modified files
@@ -124,6 +128,10 @@ functionality from this script is also accessible from the
         "DataBook" section of *FJSON*; only process components whose
         names wildcard *GLOB* if used
 
+    --fm -j NPROC
+        Extract force & moment statistics for up to *NPROC* cases
+        concurrently; results are merged and written by one process
+
     --ll, --ll GLOB
         Loop through cases and extract force and moment coefficients and
         statistics for LineLoad components described in the "DataBook"
@@ -136,6 +144,11 @@ functionality from this script is also accessible from the
         section of *FJSON*; only process components whose names match
         wildcard *GLOB* if used
 
+    --watch [--fm|--ll|--triqfm|--db] [--watch-dt DT]
+        Keep updating the data book (FM components by default) until
+        interrupted, checking every *DT* seconds {30} for cases whose
+        iterative history files have changed and processing only those
+
     --PASS
         Mark cases with "p" in run matrix to denote completion
 
@@ -153,6 +166,9 @@ functionality from this script is also accessible from the
         Create archive according to options in "Archive" section of
         *FJSON* and clean up run folder if case is marked PASS
 
+    --archive -j NPROC
+        Archive up to *NPROC* cases concurrently
+
     --skeleton
         Do ``--archive`` actions and also delete even more files
         according to *FJSON* settings like *SkeletonDeleteFiles*
@@ -179,6 +195,10 @@ functionality from this script is also accessible from the
 
     -q QUEUE
         Submit to a specific queue, overrides value in JSON file
+
+    --trace, --trace FTRACE
+        Time the stages of the command; print a summary table and write
+        trace file *FTRACE* (default: ``cape-trace.json``)
 """
 
 
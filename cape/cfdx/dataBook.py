@@ -99,7 +99,10 @@ import cape.plt
 
 # Local modules
 from . import case
+from . import dbLock
+from . import trace
 from .. import util
+from ..runmatrix import SweepMatcher
 from .options import odict
 
 
@@ -688,11 +691,16 @@ class DataBook(dict):
    # ------
    # [
     # Update data book
-    def UpdateDataBook(self, I=None, comp=None):
+    @trace.traced
+    def UpdateDataBook(self, I=None, comp=None, nproc=1):
         r"""Update the data book for a list of cases from the run matrix
 
+        If *nproc* is greater than 1, the statistics for each case are
+        computed by worker processes using :func:`ComputeCaseComp`, and
+        the results are merged into the data book by this process.
+
         :Call:
-            >>> DB.UpdateDataBook(I=None, comp=None)
+            >>> DB.UpdateDataBook(I=None, comp=None, nproc=1)
         :Inputs:
             *DB*: :class:`cape.cfdx.dataBook.DataBook`
                 Instance of the data book class
@@ -700,9 +708,12 @@ class DataBook(dict):
                 List of trajectory indices to update
             *comp*: {``None``} | :class:`list` | :class:`str`
                 Component or list of components
+            *nproc*: {``1``} | :class:`int`
+                Number of cases to process simultaneously
         :Versions:
             * 2014-12-22 ``@ddalle``: Version 1.0
             * 2017-04-12 ``@ddalle``: Split by component
+            * 2026-10-19 ``@ddalle``: Added *nproc*
         """
         # Default.
         if I is None:
@@ -721,16 +732,28 @@ class DataBook(dict):
             print("%s component '%s'..." % (tcomp, comp))
             # Read the component if necessary
             if comp not in self:
-                self.ReadDBComp(comp, check=False, lock=False)
+                with trace.span("ReadDBComp", comp=comp):
+                    self.ReadDBComp(comp, check=False, lock=False)
             # Save location
             fpwd = os.getcwd()
             os.chdir(self.RootDir)
             # Start counter
             n = 0
-            # Loop through indices.
-            for i in I:
-                # See if this works
-                n += self.UpdateCaseComp(i, comp)
+            # Check for parallel extraction
+            if nproc > 1:
+                # Compute statistics for each case in worker processes
+                with trace.span("pmap", comp=comp, nproc=nproc):
+                    recs = util.pmap(
+                        lambda i: self.ComputeCaseComp(i, comp), I, nproc)
+                # Merge results
+                for i, rec in zip(I, recs):
+                    n += self.MergeCaseComp(i, comp, rec)
+            else:
+                # Loop through indices.
+                for i in I:
+                    # See if this works
+                    with trace.span("UpdateCaseComp", i=i, comp=comp):
+                        n += self.UpdateCaseComp(i, comp)
             # Return to original location
             os.chdir(fpwd)
             # Move to next component if no updates
@@ -743,7 +766,8 @@ class DataBook(dict):
             # Sort the component
             self[comp].Sort()
             # Write the component
-            self[comp].Write(merge=True, unlock=True)
+            with trace.span("Write", comp=comp):
+                self[comp].Write(merge=True, unlock=True)
 
     # Function to delete entries by index
     def DeleteCases(self, I, comp=None):
@@ -871,6 +895,35 @@ class DataBook(dict):
             * 2014-12-22 ``@ddalle``: Version 1.0
             * 2017-04-12 ``@ddalle``: Modified to work one component
             * 2017-04-23 ``@ddalle``: Added output
+            * 2026-10-19 ``@ddalle``: Split into compute and merge
+        """
+        # Compute statistics
+        rec = self.ComputeCaseComp(i, comp)
+        # Save them
+        return self.MergeCaseComp(i, comp, rec)
+
+    # Compute statistics for one case
+    def ComputeCaseComp(self, i, comp):
+        r"""Compute new data book entry for one case, if needed
+
+        This does not alter the data book, so it can be called from
+        separate worker processes.
+
+        :Call:
+            >>> rec = DB.ComputeCaseComp(i, comp)
+        :Inputs:
+            *DB*: :class:`cape.cfdx.dataBook.DataBook`
+                Instance of the data book class
+            *i*: :class:`int`
+                RunMatrix index
+            *comp*: :class:`str`
+                Name of component
+        :Outputs:
+            *rec*: ``None`` | :class:`dict`
+                Statistics *s* from :func:`CaseFM.GetStats` plus
+                *nIter* and *nOrders*; ``None`` if no update needed
+        :Versions:
+            * 2026-10-19 ``@ddalle``: Version 1.0 (from UpdateCaseComp)
         """
         # Read if necessary
         if comp not in self:
@@ -891,11 +944,12 @@ class DataBook(dict):
         # Check if the folder exists.
         if not os.path.isdir(frun):
             # Nothing to do.
-            return 0
+            return
         # Go to the folder.
         os.chdir(frun)
         # Get the current iteration number.
-        nIter = self.GetCurrentIter()
+        with trace.span("GetCurrentIter"):
+            nIter = self.GetCurrentIter()
         # Get the number of iterations used for stats.
         nStats = self.opts.get_nStats()
         # Get the iteration at which statistics can begin.
@@ -925,7 +979,8 @@ class DataBook(dict):
             q = False
         # Check for an update
         if (not q):
-            return 0
+            os.chdir(self.RootDir)
+            return
         # Maximum number of iterations allowed
         nMaxStats = self.opts.get_nMaxStats()
         # Limit max stats if instructed to do so
@@ -936,26 +991,28 @@ class DataBook(dict):
             # Specified max, but don't use data before *nMin*
             nMax = min(nIter - nMin, nMaxStats)
         # Read residual
-        H = self.ReadCaseResid()
+        with trace.span("ReadCaseResid"):
+            H = self.ReadCaseResid()
        # --- Read Iterative History ---
         # Get component (note this automatically defaults to *comp*)
         compID = self.opts.get_DataBookCompID(comp)
         # Check for multiple components
-        if type(compID).__name__ in ['list', 'ndarray']:
-            # Read the first component
-            FM = self.ReadCaseFM(compID[0])
-            # Loop through remaining components
-            for compi in compID[1:]:
-                # Check for minus sign
-                if compi.startswith('-'):
-                    # Subtract the component
-                    FM -= self.ReadCaseFM(compi.lstrip('-'))
-                else:
-                    # Add in the component
-                    FM += self.ReadCaseFM(compi)
-        else:
-            # Read the iterative history for single component
-            FM = self.ReadCaseFM(compID)
+        with trace.span("ReadCaseFM"):
+            if type(compID).__name__ in ['list', 'ndarray']:
+                # Read the first component
+                FM = self.ReadCaseFM(compID[0])
+                # Loop through remaining components
+                for compi in compID[1:]:
+                    # Check for minus sign
+                    if compi.startswith('-'):
+                        # Subtract the component
+                        FM -= self.ReadCaseFM(compi.lstrip('-'))
+                    else:
+                        # Add in the component
+                        FM += self.ReadCaseFM(compi)
+            else:
+                # Read the iterative history for single component
+                FM = self.ReadCaseFM(compID)
         # List of transformations
         tcomp = self.opts.get_DataBookTransformations(comp)
         # Special transformation to reverse *CLL* and *CLN*
@@ -997,11 +1054,54 @@ class DataBook(dict):
             FM.TransformFM(topts, self.x, i)
 
         # Process the statistics.
-        s = FM.GetStats(nStats, nMax)
+        with trace.span("GetStats"):
+            s = FM.GetStats(nStats, nMax)
         # Get the corresponding residual drop
         if 'nOrders' in DBc:
             nOrders = H.GetNOrders(s['nStats'])
+        else:
+            nOrders = None
+        # Go back.
+        os.chdir(self.RootDir)
+        # Output
+        return {
+            "s": s,
+            "nIter": nIter,
+            "nOrders": nOrders,
+        }
+
+    # Save statistics for one case
+    def MergeCaseComp(self, i, comp, rec):
+        r"""Save a data book entry from :func:`ComputeCaseComp`
 
+        :Call:
+            >>> n = DB.MergeCaseComp(i, comp, rec)
+        :Inputs:
+            *DB*: :class:`cape.cfdx.dataBook.DataBook`
+                Instance of the data book class
+            *i*: :class:`int`
+                RunMatrix index
+            *comp*: :class:`str`
+                Name of component
+            *rec*: ``None`` | :class:`dict`
+                New statistics for case *i*
+        :Outputs:
+            *n*: ``0`` | ``1``
+                How many updates were made
+        :Versions:
+            * 2026-10-19 ``@ddalle``: Version 1.0 (from UpdateCaseComp)
+        """
+        # Check for an update
+        if rec is None:
+            return 0
+        # Unpack
+        s = rec["s"]
+        nIter = rec["nIter"]
+        nOrders = rec["nOrders"]
+        # Get the data book component.
+        DBc = self[comp]
+        # Find the match (may have changed if computed elsewhere)
+        j = DBc.FindMatch(i)
         # Save the data.
         if np.isnan(j):
             # Add to the number of cases.
@@ -1036,8 +1136,6 @@ class DataBook(dict):
                 DBc['nIter'][j]   = nIter
             if 'nStats' in DBc:
                 DBc['nStats'][j]  = s['nStats']
-        # Go back.
-        os.chdir(self.RootDir)
         # Output
         return 1
    # ]
@@ -1077,11 +1175,13 @@ class DataBook(dict):
             n = self.UpdateLineLoadComp(comp, I=I, conf=conf)
             # Check for updates
             if n == 0:
+                # Unlock
+                self.LineLoads[comp].Unlock()
                 continue
             print("Added or updated %s entries" % n)
             # Write the updated results
             self.LineLoads[comp].Sort()
-            self.LineLoads[comp].Write()
+            self.LineLoads[comp].Write(unlock=True)
 
     # Update line load data book
     def UpdateLineLoadComp(self, comp, I=None, conf=None):
@@ -1111,6 +1211,8 @@ class DataBook(dict):
             I = range(self.x.nCase)
         # Read the line load data book if necessary
         self.ReadLineLoad(comp, conf=conf)
+        # Reread while holding lock in case of other writers
+        self.LineLoads[comp].Read(check=True, lock=True)
         # Initialize number of updates
         n = 0
         # Loop through indices.
@@ -2976,18 +3078,32 @@ class DBBase(dict):
         :Versions:
             * 2015-12-04 ``@ddalle``: Version 1.0
             * 2017-06-12 ``@ddalle``: Added *lock*
+            * 2026-10-19 ``@ddalle``: Use :mod:`cape.cfdx.dbLock`
+        """
+        # Obtain shared (*check*) or exclusive (*lock*) lock
+        qlock = self.WaitLock(check=check, lock=lock)
+        # Read the file
+        try:
+            self._Read(fname)
+        finally:
+            # Release any shared lock
+            if qlock and not lock:
+                self.GetFileLock().release(shared=True)
+
+    # Read data book file
+    def _Read(self, fname=None):
+        """Read a data book statistics file without checking locks
+
+        :Call:
+            >>> DBc._Read(fname=None)
+        :Inputs:
+            *DBc*: :class:`cape.cfdx.dataBook.DBBase`
+                Data book base object
+            *fname*: {``None``} | :class:`str`
+                Name of data file to read
+        :Versions:
+            * 2026-10-19 ``@ddalle``: Version 1.0; split from Read()
         """
-        # Check for lock status?
-        if check:
-            # Wait until unlocked
-            while self.CheckLock():
-                # Status update
-                print("   Locked.  Waiting 30 s ...")
-                os.sys.stdout.flush()
-                time.sleep(30)
-        # Lock the file?
-        if lock:
-            self.Lock()
         # Check for default file name
         if fname is None: fname = self.fname
         # Process converters
@@ -3294,6 +3410,76 @@ class DBBase(dict):
         # Output
         return flock
 
+    # Get kernel-level lock interface
+    def GetFileLock(self):
+        """Get the advisory lock interface for this component
+
+        :Call:
+            >>> flock = DBc.GetFileLock()
+        :Inputs:
+            *DBc*: :class:`cape.cfdx.dataBook.DataBookBase`
+                Data book base object
+        :Outputs:
+            *flock*: :class:`cape.cfdx.dbLock.FileLock`
+                Lock interface for :func:`GetLockFile`
+        :Versions:
+            * 2026-10-19 ``@ddalle``: Version 1.0
+        """
+        return dbLock.get_lock(self.GetLockFile())
+
+    # Wait for lock
+    def WaitLock(self, check=True, lock=False):
+        """Wait for other processes to release this component
+
+        Uses :func:`fcntl.flock` if possible; otherwise waits for the
+        LOCK file to be deleted.
+
+        :Call:
+            >>> qlock = DBc.WaitLock(check=True, lock=False)
+        :Inputs:
+            *DBc*: :class:`cape.cfdx.dataBook.DataBookBase`
+                Data book base object
+            *check*: {``True``} | ``False``
+                Wait for (and take) shared lock
+            *lock*: ``True`` | {``False``}
+                Wait for and take exclusive lock
+        :Outputs:
+            *qlock*: ``True`` | ``False``
+                Whether or not a kernel-level lock was obtained
+        :Versions:
+            * 2026-10-19 ``@ddalle``: Version 1.0
+        """
+        # Check for anything to do
+        if not (check or lock):
+            return False
+        # Try kernel-level lock
+        q = self.GetFileLock().acquire(shared=(not lock), label=self._lbl())
+        # Check for success
+        if q:
+            return True
+        # Fall back to LOCK file
+        if check and (q is False):
+            # Wait until unlocked
+            while self.CheckLock():
+                # Status update
+                print("   Locked.  Waiting 30 s ...")
+                os.sys.stdout.flush()
+                time.sleep(30)
+        # Lock the file?
+        if lock:
+            self._WriteLockFile()
+        # No kernel lock
+        return False
+
+    # Label for lock file
+    def _lbl(self):
+        """Get label to write in lock file
+
+        :Versions:
+            * 2026-10-19 ``@ddalle``: Version 1.0
+        """
+        return getattr(self, "comp", getattr(self, "name", None))
+
     # Check lock file
     def CheckLock(self):
         """Check if lock file for this component exists
@@ -3341,6 +3527,25 @@ class DBBase(dict):
                 Data book base object
         :Versions:
             * 2017-06-12 ``@ddalle``: Version 1.0
+            * 2026-10-19 ``@ddalle``: Version 2.0; try kernel lock first
+        """
+        # Try kernel-level lock
+        if self.GetFileLock().acquire(label=self._lbl()):
+            return
+        # Fall back to LOCK file
+        self._WriteLockFile()
+
+    # Write the LOCK file
+    def _WriteLockFile(self):
+        """Write a 'LOCK' file without using kernel-level locks
+
+        :Call:
+            >>> DBc._WriteLockFile()
+        :Inputs:
+            *DBc*: :class:`cape.cfdx.dataBook.DataBookBase`
+                Data book base object
+        :Versions:
+            * 2017-06-12 ``@ddalle``: Version 1.0 (Lock)
         """
         # Name of the lock file
         flock = self.GetLockFile()
@@ -3373,7 +3578,8 @@ class DBBase(dict):
         # Name of the lock file
         flock = self.GetLockFile()
         # Update the file
-        os.utime(flock, None)
+        if os.path.isfile(flock):
+            os.utime(flock, None)
 
     # Unlock the file
     def Unlock(self):
@@ -3386,7 +3592,15 @@ class DBBase(dict):
                 Data book base object
         :Versions:
             * 2017-06-12 ``@ddalle``: Version 1.0
-        """
+            * 2026-10-19 ``@ddalle``: Version 1.1; release kernel lock
+        """
+        # Get kernel-level lock interface
+        flock = self.GetFileLock()
+        # Check if kernel-level locks are in use
+        if flock.kernel:
+            # Release lock held by this process (also deletes file)
+            flock.release()
+            return
         # Name of the lock file
         flock = self.GetLockFile()
         # Check if it exists
@@ -4073,6 +4287,40 @@ class DBBase(dict):
             * 2014-12-21 ``@ddalle``: Version 1.0
             * 2016-06-27 ``@ddalle``: Moved from DBTarget and generalized
             * 2018-02-12 ``@ddalle``: Changed first input to :class:`DBBase`
+            * 2026-10-19 ``@ddalle``: Version 2.0; batch search
+        """
+        # Find matches for one case
+        return self.FindTargetMatches(DBT, [i], topts, keylist, **kw)[0]
+
+    # Find entries using specified tolerance options
+    def FindTargetMatches(self, DBT, I, topts={}, keylist='tol', **kw):
+        r"""Find target entries matching each of several cases
+
+        This is equivalent to calling :func:`FindTargetMatch` for each
+        *i* in *I*, but the values of each variable are extracted only
+        once, and each search only tests target entries in a window of
+        entries sorted by one variable.
+
+        :Call:
+            >>> J = DBc.FindTargetMatches(DBT, I, topts, keylist='x', **kw)
+        :Inputs:
+            *DBc*: :class:`cape.cfdx.dataBook.DBBase` | :class:`DBTarget`
+                Instance of original databook
+            *DBT*: :class:`DBBase` | :class:`DBTarget`
+                Target databook of any type
+            *I*: :class:`list`\ [:class:`int`]
+                Indices of the cases either from *DBc.x* for *DBT.x*
+            *topts*: :class:`dict` | :class:`cape.cfdx.options.DataBook.DBTarget`
+                Criteria used to determine a match
+            *keylist*: {``"x"``} | ``"tol"``
+                Default test key source: ``x.cols`` or ``topts.Tolerances``
+            *source*: ``"self"`` | {``"target"``}
+                Match *DBc.x* case *i* if ``"self"``, else *DBT.x* case *i*
+        :Outputs:
+            *J*: :class:`list`\ [:class:`numpy.ndarray`\ [:class:`int`]]
+                Indices that match the trajectory for each case in *I*
+        :Versions:
+            * 2026-10-19 ``@ddalle``: Version 1.0
         """
         # Assign source and target
         if kw.get("source", "self").lower() in ["target", "targ"]:
@@ -4083,9 +4331,8 @@ class DBBase(dict):
             # Match DBT.x[j] to self.x[j]
             DB1 = self
             DB2 = DBT
-        # Initialize indices (assume all are matches)
+        # Number of candidates
         n = len(DB2[list(DB2.keys())[0]])
-        J = np.arange(n) > -1
         # Interpret trajectory options for both databooks
         try:
             topts1 = DB1.topts
@@ -4102,12 +4349,12 @@ class DBBase(dict):
         # Tolerance options
         tolopts1 = topts1.get('Tolerances', {})
         tolopts2 = topts2.get('Tolerances', {})
-        # Extract trajectories
-        x1 = DB1.x
-        x2 = DB2.x
         # Ensure target trajectory corresponds to its contents
         DB1.UpdateRunMatrix()
         DB2.UpdateRunMatrix()
+        # Extract trajectories
+        x1 = DB1.x
+        x2 = DB2.x
         # Get list of keys to match
         if keylist.lower() == 'x':
             # Use all trajectory keys as default
@@ -4115,6 +4362,11 @@ class DBBase(dict):
         else:
             # Use the tolerance keys
             keys = topts.get('Keys', tolopts2.keys())
+        # Initialize constraints
+        X = []
+        V = []
+        S = []
+        tols = []
         # Loop through keys requested for matches.
         for k in keys:
             # Get the name of the column according to the source file.
@@ -4129,80 +4381,42 @@ class DBBase(dict):
             # Skip if tolerance blocked out
             if tol1 is None: continue
             if tol2 is None: continue
-            # Use maximum tolerance
-            tol = max(tol1, tol2)
             # Check key type (don't filter strings)
             v1 = x1.defns.get(k,{}).get("Value", "float")
             v2 = x2.defns.get(k,{}).get("Value", "float")
             # Check for string/unicode
             if v1 in ["str", "unicode"]: continue
             if v2 in ["str", "unicode"]: continue
-
-            # Get target value
-            if col1 in DB1:
-                # Take value from column
-                v = DB1[col1][i]
-            if k in x1.cols:
-                # Directly available
-                v = x1[k][i]
-            elif k == "alpha":
-                # Get angle of attack
-                v = x1.GetAlpha(i)
-            elif k == "beta":
-                # Get sideslip
-                v = x1.GetBeta(i)
-            elif k in ["alpha_t", "aoav"]:
-                # Get total angle of attack
-                v = x1.GetAlphaTotal(i)
-            elif k in ["phi", "phiv"]:
-                # Get velocity roll angle
-                v = x1.GetPhi(i)
-            elif k in ["alpha_m", "aoam"]:
-                # Get maneuver angle of attack
-                v = x1.GetAlphaManeuver(i)
-            elif k in ["phi_m", "phim"]:
-                # Get maneuver roll angle
-                v = x1.GetPhiManeuver(i)
-
-            # Get value
+            # Get target values, preferring run matrix or special angle
+            Xk = x1.GetSweepKeyValues(k)
+            # Fall back to column
+            if Xk is None and col1 in DB1:
+                Xk = DB1[col1]
+            # Get candidate values
             if col2 in DB2:
                 # Extract value
-                V = DB2[col2]
-            elif k in x2.keys:
-                # Available in the trajectory
-                V = x2[k]
-            elif (k == "alpha"):
-                # Get angle of attack
-                V = x2.GetAlpha()
-            elif (k == "beta"):
-                # Get angle of sideslip
-                V = x2.GetBeta()
-            elif (k in ["alpha_t","aoav"]):
-                # Get total angle of attack
-                V = x2.GetAlphaTotal()
-            elif (k in ["phi","phiv"]):
-                # Get velocity roll angle
-                V = x2.GetPhi()
-            elif (k in ["alpha_m","aoam"]):
-                # Get maneuver angle of attack
-                V = x2.GetAlphaManeuver()
-            elif (k in ["phi_m","phim"]):
-                # Get maneuver roll angle
-                V = x2.GetPhiManeuver()
-
-            # Test
-            qk = np.abs(v-V) <= tol
+                Vk = DB2[col2]
+            else:
+                # Available in the trajectory or special angle
+                Vk = x2.GetSweepKeyValues(k)
+            # Skip if not found
+            if Xk is None or Vk is None:
+                continue
             # Check for special modifications
             if k in ["phi", "phi_m", "phiv", "phim"]:
-                # Get total angle of attack
-                aoav = x2.GetAlphaTotal()
                 # Combine *phi* constraint with any *aoav==0* case
-                qk = np.logical_or(qk, np.abs(aoav)<=1e-10)
-            # Combine constraints
-            J = np.logical_and(J, qk)
-
+                Sk = np.abs(x2.GetAlphaTotal()) <= 1e-10
+            else:
+                Sk = None
+            # Save constraint, using maximum tolerance
+            X.append(Xk)
+            V.append(Vk)
+            S.append(Sk)
+            tols.append(max(tol1, tol2))
+        # Sorted search interface
+        matcher = SweepMatcher(V, tols, S, n=n)
         # Output
-        return np.where(J)[0]
+        return [matcher.match([Xk[i] for Xk in X]) for i in I]
 
     # Find data book match
     def FindDBMatch(self, DBc, i):
@@ -4319,6 +4533,47 @@ class DBBase(dict):
         :Versions:
             * 2014-12-21 ``@ddalle``: Version 1.0
             * 2016-06-27 ``@ddalle``: Moved from DBTarget and generalized
+            * 2026-10-19 ``@ddalle``: Version 2.0; batch search
+        """
+        # Check types
+        if not i.__class__.__name__.startswith("int"):
+            raise TypeError("RunMatrix index must be integer")
+        # Find matches for one case
+        return self.FindCoSweeps(
+            x, [i], EqCons, TolCons, GlobCons, xkeys)[0]
+
+    # Find entries matching several cases
+    def FindCoSweeps(self, x, I, EqCons=[], TolCons={}, GlobCons=[],
+            xkeys={}):
+        r"""Find data book entries meeting constraints seeded from each point
+
+        This is equivalent to calling :func:`FindCoSweep` for each *i*
+        in *I*, but the constraints are evaluated only once, and each
+        search only tests entries in a window of entries sorted by one
+        constraint.
+
+        :Call:
+            >>> J = DBc.FindCoSweeps(x, I, EqCons={}, TolCons={}, **kw)
+        :Inputs:
+            *DBc*: :class:`cape.cfdx.dataBook.DBBase`
+                Data book component instance
+            *x*: :class:`cape.runmatrix.RunMatrix`
+                RunMatrix (i.e. run matrix) to use for target value
+            *I*: :class:`list`\ [:class:`int`]
+                Indices of the cases from the trajectory to try match
+            *EqCons*: {``[]``} | :class:`list` (:class:`str`)
+                List of variables that must match the trajectory exactly
+            *TolCons*: {``{}``} | :class:`dict`\ [:class:`float`]
+                List of variables that may match trajectory within a tolerance
+            *GlobCons*: {``[]``} | :class:`list` (:class:`str`)
+                List of global constraints, see :func:`cape.RunMatrix.Filter`
+            *xkeys*: {``{}``} | :class:`dict` (:class:`str`)
+                Dictionary of alternative names of variables
+        :Outputs:
+            *J*: :class:`list`\ [:class:`numpy.ndarray`\ [:class:`int`]]
+                Indices that match the trajectory for each case in *I*
+        :Versions:
+            * 2026-10-19 ``@ddalle``: Version 1.0
         """
         # Initialize indices (assume all are matches)
         n = len(self[list(self.keys())[0]])
@@ -4329,15 +4584,12 @@ class DBBase(dict):
         if EqCons is None:   EqCons = []
         if xkeys is None:    xkeys = {}
         # Check types
-        ti  = i.__class__.__name__
         tx  = x.__class__.__name__
         teq = EqCons.__class__.__name__
         ttc = TolCons.__class__.__name__
         tgc = GlobCons.__class__.__name__
         txk = xkeys.__class__.__name__
         # Check types
-        if not ti.startswith("int"):
-            raise TypeError("RunMatrix index must be integer")
         if tx != "RunMatrix":
             raise TypeError("Input must be of class 'RunMatrix'")
         if teq != "list":
@@ -4362,141 +4614,57 @@ class DBBase(dict):
             except Exception:
                 print("    Constraint '%s' failed to evaluate." % con)
 
-        # Loop through *EqCons*
-        for k in EqCons:
-            # Test if key is present
-            if k in x.cols:
-                # Get target value
-                v = x[k][i]
-            elif k == "alpha":
-                # Get angle of attack
-                v = x.GetAlpha(i)
-            elif k == "beta":
-                # Get sideslip
-                v = x.GetBeta(i)
-            elif k in ["alpha_t", "aoav"]:
-                # Get total angle of attack
-                v = x.GetAlphaTotal(i)
-            elif k in ["phi", "phiv"]:
-                # Get velocity roll angle
-                v = x.GetPhi(i)
-            elif k in ["alpha_m", "aoam"]:
-                # Get maneuver angle of attack
-                v = x.GetAlphaManeuver(i)
-            elif k in ["phi_m", "phim"]:
-                # Get maneuver roll angle
-                v = x.GetPhiManeuver(i)
-            # Get name of column
-            col = xkeys.get(k, k)
-            # Get value
-            if col in self:
-                # Extract value
-                V = self[col]
-            elif (k == "alpha") or (col == "alpha"):
-                # Ensure trajectory matches
-                self.UpdateRunMatrix()
-                # Get angle of attack
-                V = self.x.GetAlpha()
-            elif (k == "beta") or (col == "beta"):
-                # Get angle of sideslip
+        # Equality constraints use a tiny tolerance
+        cons = [(k, 1e-10) for k in EqCons]
+        cons.extend((k, TolCons[k]) for k in TolCons)
+        # Ensure trajectory matches if needed
+        for k, tol in cons:
+            # Check for values that come from the run matrix
+            qx = xkeys.get(k, k) not in self
+            qphi = k in ["phi", "phi_m", "phiv", "phim"]
+            # Update once
+            if qx or qphi:
                 self.UpdateRunMatrix()
-                V = self.x.GetBeta()
-            elif (k in ["alpha_t","aoav"]) or (col in ["alpha_t","aoav"]):
-                # Get maneuver angle of attack
-                self.UpdateRunMatrix()
-                V = self.x.GetAlphaTotal()
-            elif (k in ["phi","phiv"]) or (col in ["phi","phiv"]):
-                # Get maneuver roll angle
-                self.UpdateRunMatrix()
-                V = self.x.GetPhi()
-            elif (k in ["alpha_m","aoam"]) or (col in ["alpha_m","aoam"]):
-                # Get maneuver angle of attack
-                self.UpdateRunMatrix()
-                V = self.x.GetAlphaManeuver()
-            elif (k in ["phi_m","phim"]) or (col in ["phi_m","phim"]):
-                # Get maneuver roll angle
-                self.UpdateRunMatrix()
-                V = self.x.GetPhiManeuver()
-            # Evaluate constraint
-            qk = np.abs(v - V) <= 1e-10
-            # Check for special modifications
-            if k in ["phi", "phi_m", "phiv", "phim"]:
-                # Get total angle of attack
-                aoav = self.x.GetAlphaTotal()
-                # Combine *phi* constraint with any *aoav==0* case
-                qk = np.logical_or(qk, np.abs(aoav)<=1e-10)
-            # Combine constraints
-            J = np.logical_and(J, qk)
-        # Loop through *TolCons*
-        for k in TolCons:
-            # Test if key is present
-            if k in x.cols:
-                # Get target value
-                v = x[k][i]
-            elif k == "alpha":
-                # Get angle of attack
-                v = x.GetAlpha(i)
-            elif k == "beta":
-                # Get sideslip
-                v = x.GetBeta(i)
-            elif k in ["alpha_t", "aoav"]:
-                # Get total angle of attack
-                v = x.GetAlphaTotal(i)
-            elif k in ["phi", "phiv"]:
-                # Get velocity roll angle
-                v = x.GetPhi(i)
-            elif k in ["alpha_m", "aoam"]:
-                # Get maneuver angle of attack
-                v = x.GetAlphaManeuver(i)
-            elif k in ["phi_m", "phim"]:
-                # Get maneuver roll angle
-                v = x.GetPhiManeuver(i)
+                break
+        # Initialize constraints
+        X = []
+        V = []
+        S = []
+        tols = []
+        # Loop through constraints
+        for k, tol in cons:
+            # Get target values
+            Xk = x.GetSweepKeyValues(k)
             # Get name of column
             col = xkeys.get(k, k)
             # Get value
             if col in self:
                 # Extract value
-                V = self[col]
-            elif (k == "alpha") or (col == "alpha"):
-                # Ensure trajectory matches
-                self.UpdateRunMatrix()
-                # Get angle of attack
-                V = self.x.GetAlpha()
-            elif (k == "beta") or (col == "beta"):
-                # Get angle of sideslip
-                self.UpdateRunMatrix()
-                V = self.x.GetBeta()
-            elif (k in ["alpha_t","aoav"]) or (col in ["alpha_t","aoav"]):
-                # Get maneuver angle of attack
-                self.UpdateRunMatrix()
-                V = self.x.GetAlphaTotal()
-            elif (k in ["phi","phiv"]) or (col in ["phi","phiv"]):
-                # Get maneuver roll angle
-                self.UpdateRunMatrix()
-                V = self.x.GetPhi()
-            elif (k in ["alpha_m","aoam"]) or (col in ["alpha_m","aoam"]):
-                # Get maneuver angle of attack
-                self.UpdateRunMatrix()
-                V = self.x.GetAlphaManeuver()
-            elif (k in ["phi_m","phim"]) or (col in ["phi_m","phim"]):
-                # Get maneuver roll angle
-                self.UpdateRunMatrix()
-                V = self.x.GetPhiManeuver()
-            # Get tolerance
-            tol = TolCons[k]
-            # Test
-            qk = np.abs(v-V) <= tol
+                Vk = self[col]
+            else:
+                # Get special angle by original or alternate name
+                Vk = self.x.GetSweepKeyValues(k)
+                if Vk is None:
+                    Vk = self.x.GetSweepKeyValues(col)
+            # Check for errors
+            if Xk is None or Vk is None:
+                raise KeyError(
+                    "Could not find trajectory key for constraint '%s'." % k)
             # Check for special modifications
             if k in ["phi", "phi_m", "phiv", "phim"]:
-                # Get total angle of attack
-                self.UpdateRunMatrix()
-                aoav = self.x.GetAlphaTotal()
                 # Combine *phi* constraint with any *aoav==0* case
-                qk = np.logical_or(qk, np.abs(aoav)<=1e-10)
-            # Combine constraints
-            J = np.logical_and(J, qk)
-        # Output (convert boolean array to indices)
-        return np.where(J)[0]
+                Sk = np.abs(self.x.GetAlphaTotal()) <= 1e-10
+            else:
+                Sk = None
+            # Save
+            X.append(Xk)
+            V.append(Vk)
+            S.append(Sk)
+            tols.append(tol)
+        # Sorted search interface
+        matcher = SweepMatcher(V, tols, S, mask=J, n=n)
+        # Output
+        return [matcher.match([Xk[i] for Xk in X]) for i in I]
   # >
 
   # =============
@@ -4548,10 +4716,10 @@ class DBBase(dict):
         D = []
         # Initialize count
         n = 0
+        # Find targets for all cases
+        JI = self.FindTargetMatches(DBT, I, topts, keylist="tol")
         # Loop through cases
-        for i in I:
-            # Find target
-            Ji = self.FindTargetMatch(DBT, i, topts, keylist="tol")
+        for i, Ji in zip(I, JI):
             # Get the value
             v = self.GetCoeff(comp, coeff, i)
             # Number of matches
@@ -0,0 +1,302 @@
+r"""
+:mod:`cape.cfdx.dbLock`: Advisory locks for data book files
+============================================================
+
+This module provides kernel-level advisory locks for the data book
+component files, using :func:`fcntl.flock`. Several ``cape --fm``
+processes (for example from post-processing PBS jobs) can then update
+the same data book without long sleeps, and locks held by crashed
+processes are released automatically by the operating system.
+
+Each data book file ``aero_COMP.csv`` has a lock file
+``lock.aero_COMP.csv``. Readers take a shared lock while they read, and
+writers hold an exclusive lock from the time they read the file until
+they have written the updated version. The exclusive holder, or the
+last shared holder, deletes the lock file when it releases it. The
+existence of a lock file does not mean that the component is locked;
+only the kernel-level lock does.
+
+If :mod:`fcntl` is not available or the file system does not support
+:func:`fcntl.flock`, :func:`FileLock.acquire` returns ``False``, and
+:class:`cape.cfdx.dataBook.DBBase` falls back to the original LOCK-file
+method.
+
+"""
+
+# Standard library
+import errno
+import os
+import time
+
+# Kernel-level locks are not available on all systems
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+
+# Default maximum time to wait for a lock [s]
+LOCK_TIMEOUT = 5400.0
+# Initial and maximum delay between attempts [s]
+LOCK_DELAY = 0.05
+LOCK_MAXDELAY = 2.0
+
+# Error codes for a lock held by another process
+_BUSY_ERRNOS = (errno.EAGAIN, errno.EACCES, errno.EWOULDBLOCK)
+
+# Locks held by this process, by absolute file name
+_LOCKS = {}
+
+
+# Get lock for a file
+def get_lock(fname):
+    r"""Get the lock object for a lock file, shared within a process
+
+    All data book objects in one process that refer to the same file
+    use the same :class:`FileLock`, just as they would share a LOCK
+    file.
+
+    :Call:
+        >>> flock = get_lock(fname)
+    :Inputs:
+        *fname*: :class:`str`
+            Name of lock file
+    :Outputs:
+        *flock*: :class:`FileLock`
+            Lock interface
+    :Versions:
+        * 2026-10-19 ``@ddalle``: Version 1.0
+    """
+    # Absolute path
+    fabs = os.path.abspath(fname)
+    # Check for existing lock
+    if fabs not in _LOCKS:
+        _LOCKS[fabs] = FileLock(fabs)
+    # Output
+    return _LOCKS[fabs]
+
+
+# Lock class
+class FileLock(object):
+    r"""Advisory lock on a lock file using :func:`fcntl.flock`
+
+    :Call:
+        >>> flock = FileLock(fname)
+    :Inputs:
+        *fname*: :class:`str`
+            Name of lock file
+    :Outputs:
+        *flock*: :class:`FileLock`
+            Lock interface
+    :Attributes:
+        *flock.fname*: :class:`str`
+            Name of lock file
+        *flock.mode*: ``None`` | ``"shared"`` | ``"exclusive"``
+            Type of lock currently held by this process
+        *flock.kernel*: ``True`` | ``False``
+            Whether or not :func:`fcntl.flock` works for this file
+    :Versions:
+        * 2026-10-19 ``@ddalle``: Version 1.0
+    """
+    # Initialization method
+    def __init__(self, fname):
+        r"""Initialization method
+
+        :Versions:
+            * 2026-10-19 ``@ddalle``: Version 1.0
+        """
+        # Save file name
+        self.fname = fname
+        # No lock held
+        self.fd = None
+        self.mode = None
+        # Check for kernel locks
+        self.kernel = fcntl is not None
+
+    # Representation method
+    def __repr__(self):
+        r"""Representation method
+
+        :Versions:
+            * 2026-10-19 ``@ddalle``: Version 1.0
+        """
+        return "<FileLock '%s', mode=%s>" % (
+            os.path.basename(self.fname), self.mode)
+
+    # Obtain the lock
+    def acquire(self, shared=False, timeout=None, label=None):
+        r"""Wait for and obtain a shared or exclusive lock
+
+        :Call:
+            >>> q = flock.acquire(shared=False, timeout=None, label=None)
+        :Inputs:
+            *flock*: :class:`FileLock`
+                Lock interface
+            *shared*: ``True`` | {``False``}
+                Get a shared (read) lock instead of an exclusive one
+            *timeout*: {``None``} | :class:`float`
+                Maximum wait time; defaults to *LOCK_TIMEOUT*
+            *label*: {``None``} | :class:`str`
+                Text to write to lock file, e.g. component name
+        :Outputs:
+            *q*: ``True`` | ``False`` | ``None``
+                ``True`` if lock obtained, ``False`` if kernel-level
+                locks are not supported, ``None`` if timed out
+        :Versions:
+            * 2026-10-19 ``@ddalle``: Version 1.0
+        """
+        # Check for fallback
+        if not self.kernel:
+            return False
+        # Check for existing lock
+        if self.mode == "exclusive":
+            # Already have the strongest lock
+            return True
+        elif shared and self.mode == "shared":
+            # Already have this lock
+            return True
+        elif self.mode == "shared":
+            # Upgrade from shared to exclusive; release first
+            self.release()
+        # Default timeout
+        if timeout is None:
+            timeout = LOCK_TIMEOUT
+        # Lock type
+        if shared:
+            op = fcntl.LOCK_SH | fcntl.LOCK_NB
+        else:
+            op = fcntl.LOCK_EX | fcntl.LOCK_NB
+        # Start time and delay
+        tic = time.time()
+        delay = LOCK_DELAY
+        qmsg = False
+        # Loop until lock obtained
+        while True:
+            # Open the file, creating it if necessary
+            try:
+                fd = os.open(self.fname, os.O_RDWR | os.O_CREAT, 0o644)
+            except OSError:
+                # Cannot create lock file; use fallback
+                return False
+            # Attempt to lock it
+            try:
+                fcntl.flock(fd, op)
+            except OSError as e:
+                # Close the file
+                os.close(fd)
+                # Check reason
+                if e.errno not in _BUSY_ERRNOS:
+                    # Locks not supported on this file system
+                    self.kernel = False
+                    return False
+            else:
+                # Make sure previous holder didn't delete the file
+                if self._check_inode(fd):
+                    break
+                # Try again with new file
+                os.close(fd)
+                continue
+            # Check for timeout
+            if time.time() - tic > timeout:
+                print("   Lock on '%s' not released after %i s; continuing"
+                    % (os.path.basename(self.fname), timeout))
+                return None
+            # Status update
+            if not qmsg:
+                print("   Locked.  Waiting ...")
+                os.sys.stdout.flush()
+                qmsg = True
+            # Wait, increasing the delay each time
+            time.sleep(delay)
+            delay = min(2*delay, LOCK_MAXDELAY)
+        # Save the lock
+        self.fd = fd
+        self.mode = "shared" if shared else "exclusive"
+        # Write label to exclusive lock file
+        if label and not shared:
+            try:
+                os.ftruncate(fd, 0)
+                os.write(fd, ("%s\n" % label).encode("utf-8"))
+            except OSError:
+                pass
+        # Output
+        return True
+
+    # Release the lock
+    def release(self, shared=False):
+        r"""Release the lock, if any
+
+        The lock file is deleted when an exclusive lock is released.
+        When a shared lock is released, the file is deleted only if no
+        other process holds or is waiting for a lock on it.
+
+        :Call:
+            >>> flock.release(shared=False)
+        :Inputs:
+            *flock*: :class:`FileLock`
+                Lock interface
+            *shared*: ``True`` | {``False``}
+                Only release the lock if it is a shared lock
+        :Versions:
+            * 2026-10-19 ``@ddalle``: Version 1.0
+            * 2026-10-19 ``@ddalle``: Version 1.1; delete shared lock files
+        """
+        # Check for something to do
+        if self.mode is None:
+            return
+        elif shared and self.mode != "shared":
+            # Keep exclusive lock
+            return
+        # Last shared holder can upgrade to exclusive lock
+        if self.mode == "shared" and self.fd is not None:
+            try:
+                fcntl.flock(self.fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                # Another process is using this lock file
+                pass
+            else:
+                # Now holding exclusive lock
+                self.mode = "exclusive"
+        # Delete file before releasing exclusive lock
+        if self.mode == "exclusive" and self._check_inode(self.fd):
+            try:
+                os.remove(self.fname)
+            except OSError:
+                pass
+        # Release lock
+        if self.fd is not None:
+            try:
+                fcntl.flock(self.fd, fcntl.LOCK_UN)
+            except OSError:
+                pass
+            os.close(self.fd)
+        # Reset
+        self.fd = None
+        self.mode = None
+
+    # Check if lock file is still the same file
+    def _check_inode(self, fd):
+        r"""Check that an open lock file has not been deleted
+
+        :Call:
+            >>> q = flock._check_inode(fd)
+        :Inputs:
+            *flock*: :class:`FileLock`
+                Lock interface
+            *fd*: :class:`int`
+                File descriptor for locked file
+        :Outputs:
+            *q*: ``True`` | ``False``
+                Whether *fd* is still the file named *flock.fname*
+        :Versions:
+            * 2026-10-19 ``@ddalle``: Version 1.0
+        """
+        # Get file status
+        try:
+            st = os.stat(self.fname)
+        except OSError:
+            return False
+        # Compare to open file
+        st1 = os.fstat(fd)
+        # Same device and inode
+        return (st.st_dev, st.st_ino) == (st1.st_dev, st1.st_ino)
@@ -260,19 +260,48 @@ class DBLineLoad(dataBook.DBBase):
    # --------
    # [
     # function to read line load data book summary
-    def Read(self, fname=None, keys=None):
+    def Read(self, fname=None, keys=None, check=False, lock=False):
         """Read a data book summary file for a single line load group
         
         :Call:
             >>> DBL.Read()
-            >>> DBL.Read(fname)
+            >>> DBL.Read(fname, check=False, lock=False)
         :Inputs:
             *DBL*: :class:`cape.cfdx.lineLoad.DBLineLoad`
                 Instance of line load data book
             *fname*: :class:`str`
                 Name of summary file
+            *check*: ``True`` | {``False``}
+                Whether or not to check LOCK status
+            *lock*: ``True`` | {``False``}
+                If ``True``, wait for and keep exclusive lock
         :Versions:
             * 2015-09-16 ``@ddalle``: First version
+            * 2026-10-19 ``@ddalle``: Added *check* and *lock*
+        """
+        # Obtain shared (*check*) or exclusive (*lock*) lock
+        qlock = self.WaitLock(check=check, lock=lock)
+        # Read the file
+        try:
+            self._Read(fname, keys=keys)
+        finally:
+            # Release any shared lock
+            if qlock and not lock:
+                self.GetFileLock().release(shared=True)
+
+    # Read the file
+    def _Read(self, fname=None, keys=None):
+        """Read line load summary file without checking locks
+        
+        :Call:
+            >>> DBL._Read(fname=None, keys=None)
+        :Inputs:
+            *DBL*: :class:`cape.cfdx.lineLoad.DBLineLoad`
+                Instance of line load data book
+            *fname*: :class:`str`
+                Name of summary file
+        :Versions:
+            * 2026-10-19 ``@ddalle``: Split from Read()
         """
         # Check for default file name
         if fname is None: fname = self.fname
@@ -340,19 +369,22 @@ class DBLineLoad(dataBook.DBBase):
             self.n = 0
     
     # Function to write line load data book summary file
-    def Write(self, fname=None):
+    def Write(self, fname=None, unlock=True):
         """Write a single line load data book summary file
         
         :Call:
             >>> DBL.Write()
-            >>> DBL.Write(fname)
+            >>> DBL.Write(fname, unlock=True)
         :Inputs:
             *DBL*: :class:`pycart.lineLoad.DBLineLoad`
                 Instance of line load data book
             *fname*: :class:`str`
                 Name of summary file
+            *unlock*: {``True``} | ``False``
+                Whether or not to release lock after writing
         :Versions:
             * 2015-09-16 ``@ddalle``: First version
+            * 2026-10-19 ``@ddalle``: Added *unlock*
         """
         # Check for default file name
         if fname is None: fname = self.fname
@@ -405,6 +437,9 @@ class DBLineLoad(dataBook.DBBase):
         f.close()
         # Try to write the seam curves
         self.WriteSeamCurves()
+        # Unlock
+        if unlock:
+            self.Unlock()
    # ]
     
    # --------
@@ -15,6 +15,7 @@ important role in the entire CAPE coding strategy.
 # Standard library modules
 import copy
 import functools
+import hashlib
 import io
 import json
 import os
@@ -433,21 +434,46 @@ def expandJSONFile(fname):
 
 
 # Function to read JSON file with all the works
-def loadJSONFile(fname):
+def loadJSONFile(fname, persist=True):
     r"""Read JSON file w/ helpful error handling and comment stripping
+
+    The expanded contents are cached, both in memory and (if *persist*)
+    in a file in :func:`getJSONCacheDir`, together with the size and
+    modification time of *fname* and each file it includes. Later calls
+    return a fresh copy of the cached contents without parsing any file
+    if none of them have changed.
     
     :Call:
-        >>> d = loadJSONFile(fname)
+        >>> d = loadJSONFile(fname, persist=True)
     :Inputs:
         *fname*: :class:`str`
             Name of JSON file to read
+        *persist*: {``True``} | ``False``
+            Whether or not to use the cache file in addition to memory
     :Outputs:
         *d*: :class:`dict`
             JSON contents in Python form
     :Versions:
         * 2015-12-15 ``@ddalle``: Version 1.0
+        * 2026-10-19 ``@ddalle``: Version 1.1; add cache
     """
+    # Check for cached contents
+    d = readJSONCache(fname, persist=persist)
+    if d is not None:
+        return d
     # Read the input file
+    txt = io.open(fname, mode="r", encoding="utf-8").read()
+    # Try plain JSON first, which needs no expansion
+    if "JSONFile(" not in txt:
+        try:
+            d = json.loads(txt)
+        except ValueError:
+            pass
+        else:
+            # Save contents for next time
+            writeJSONCache(fname, [fname], d, persist=persist)
+            return d
+    # Expand comments and other files
     txt, fnames, linenos = expandJSONFile(fname)
     # Process into dictionary
     try:
@@ -496,10 +522,192 @@ def loadJSONFile(fname):
         except Exception:
             # Unknown error
             raise e
+    # Save contents for next time
+    writeJSONCache(fname, fnames, d, persist=persist)
     # Output
     return d
 
 
+# Folder for cached JSON files
+def getJSONCacheDir():
+    r"""Get folder for cache of expanded JSON files
+
+    The folder is ``$CAPE_CACHE_DIR/json`` if that environment variable
+    is set, otherwise ``$XDG_CACHE_HOME/cape/json``, which defaults to
+    ``~/.cache/cape/json``. Set ``CAPE_JSON_CACHE=0`` to turn off the
+    cache files.
+
+    :Call:
+        >>> fdir = getJSONCacheDir()
+    :Outputs:
+        *fdir*: ``None`` | :class:`str`
+            Absolute path to cache folder, ``None`` if turned off
+    :Versions:
+        * 2026-10-19 ``@ddalle``: Version 1.0
+    """
+    # Check for option to turn off cache
+    if os.environ.get("CAPE_JSON_CACHE", "1").lower() in ("0", "false"):
+        return None
+    # Check for CAPE-specific cache folder
+    fcape = os.environ.get("CAPE_CACHE_DIR")
+    if fcape:
+        return os.path.join(os.path.abspath(fcape), "json")
+    # Use user cache folder
+    fxdg = os.environ.get("XDG_CACHE_HOME")
+    if not fxdg:
+        fxdg = os.path.join(os.path.expanduser("~"), ".cache")
+    # Output
+    return os.path.join(fxdg, "cape", "json")
+
+
+# Version of cache file format
+JSON_CACHE_VERSION = 1
+# Cached contents: key -> (file signatures, compact JSON text)
+_JSON_CACHE = {}
+
+
+# Read cached JSON contents
+def readJSONCache(fname, persist=True):
+    r"""Read cached contents of JSON file if no inputs have changed
+
+    :Call:
+        >>> d = readJSONCache(fname, persist=True)
+    :Inputs:
+        *fname*: :class:`str`
+            Name of JSON file
+        *persist*: {``True``} | ``False``
+            Whether or not to check the cache file in addition to memory
+    :Outputs:
+        *d*: ``None`` | :class:`dict`
+            JSON contents, ``None`` if not cached or out of date
+    :Versions:
+        * 2026-10-19 ``@ddalle``: Version 1.0
+    """
+    # Contents that include other files depend on working folder
+    for key in _get_json_cache_keys(fname):
+        # Check memory
+        entry = _JSON_CACHE.get(key)
+        # Check file
+        if entry is None and persist:
+            entry = _read_json_cache_file(key)
+        # Check for match
+        if entry is None:
+            continue
+        # Unpack
+        sigs, txt = entry
+        # Check that no file has changed
+        if any(_get_file_sig(sig[0]) != sig for sig in sigs):
+            continue
+        # Save in memory
+        _JSON_CACHE[key] = entry
+        # Output new copy
+        return json.loads(txt)
+
+
+# Write cached JSON contents
+def writeJSONCache(fname, fnames, d, persist=True):
+    r"""Save contents of a JSON file and signatures of its inputs
+
+    :Call:
+        >>> writeJSONCache(fname, fnames, d, persist=True)
+    :Inputs:
+        *fname*: :class:`str`
+            Name of JSON file
+        *fnames*: :class:`list`\ [:class:`str`]
+            Files read to create *d*, starting with *fname*
+        *d*: :class:`dict`
+            JSON contents
+        *persist*: {``True``} | ``False``
+            Whether or not to write cache file in addition to memory
+    :Versions:
+        * 2026-10-19 ``@ddalle``: Version 1.0
+    """
+    # Get signatures of each file read, without repeats
+    sigs = []
+    for fn in fnames:
+        sig = _get_file_sig(fn)
+        if sig is None:
+            return
+        if sig not in sigs:
+            sigs.append(sig)
+    # Key depends on working folder only if other files were included
+    keys = _get_json_cache_keys(fname)
+    key = keys[-1] if len(sigs) == 1 else keys[0]
+    # Compact text
+    txt = json.dumps(d, separators=(",", ":"))
+    # Save in memory
+    _JSON_CACHE[key] = (sigs, txt)
+    # Check for cache file
+    fdir = getJSONCacheDir()
+    if not (persist and fdir):
+        return
+    # Write cache file, ignoring any errors (e.g. read-only home)
+    try:
+        # Create folder
+        if not os.path.isdir(fdir):
+            os.makedirs(fdir)
+        # Cache file name
+        fcache = os.path.join(fdir, key + ".json")
+        ftmp = "%s.%i.tmp" % (fcache, os.getpid())
+        # Write and move into place
+        with io.open(ftmp, mode="w", encoding="utf-8") as fp:
+            fp.write(json.dumps({
+                "version": JSON_CACHE_VERSION,
+                "files": sigs,
+                "data": txt,
+            }))
+        os.replace(ftmp, fcache)
+    except Exception:
+        pass
+
+
+# Read cache file
+def _read_json_cache_file(key):
+    # Cache folder
+    fdir = getJSONCacheDir()
+    if not fdir:
+        return
+    # Cache file
+    fcache = os.path.join(fdir, key + ".json")
+    # Read it, ignoring any errors
+    try:
+        with io.open(fcache, mode="r", encoding="utf-8") as fp:
+            entry = json.loads(fp.read())
+        # Check version
+        if entry.get("version") != JSON_CACHE_VERSION:
+            return
+        # Output
+        return [list(sig) for sig in entry["files"]], entry["data"]
+    except Exception:
+        return
+
+
+# Get possible keys for a JSON file
+def _get_json_cache_keys(fname):
+    # Absolute path
+    fabs = os.path.abspath(fname)
+    # Key for files with includes, which are relative to ``$PWD``
+    key1 = hashlib.sha1(
+        ("%s\n%s" % (fabs, os.getcwd())).encode("utf-8")).hexdigest()
+    # Key for self-contained files
+    key2 = hashlib.sha1(fabs.encode("utf-8")).hexdigest()
+    # Output
+    return key1, key2
+
+
+# Get size and modification time of a file
+def _get_file_sig(fname):
+    # Absolute path
+    fabs = os.path.abspath(fname)
+    # Get status
+    try:
+        st = os.stat(fabs)
+    except OSError:
+        return None
+    # Output
+    return [fabs, st.st_size, st.st_mtime_ns]
+
+
 # Function to get the default settings.
 def getDefaults(fname):
     r"""Read default settings configuration file
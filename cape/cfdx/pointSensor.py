@@ -64,6 +64,7 @@ output), but it is the only way to extract point iterative histories.
 # Standard library
 import os
 import glob
+import hashlib
 
 # Third-party modules
 import numpy as np
@@ -377,6 +378,54 @@ class DBPointSensorGroup(dataBook.DBBase):
             # Write it
             self[pt].Write(merge=True, unlock=True)
             
+    # Lock all points
+    def Lock(self):
+        """Lock the data book for each point in the group
+        
+        :Call:
+            >>> DBPG.Lock()
+        :Inputs:
+            *DBPG*: :class:`cape.cfdx.pointSensor.DBPointSensorGroup`
+                A point sensor group data book
+        :Versions:
+            * 2026-10-19 ``@ddalle``: First version
+        """
+        # Loop through points
+        for pt in self.pts:
+            self[pt].Lock()
+            
+    # Touch the lock files
+    def TouchLock(self):
+        """Touch the lock file for each point in the group
+        
+        :Call:
+            >>> DBPG.TouchLock()
+        :Inputs:
+            *DBPG*: :class:`cape.cfdx.pointSensor.DBPointSensorGroup`
+                A point sensor group data book
+        :Versions:
+            * 2026-10-19 ``@ddalle``: First version
+        """
+        # Loop through points
+        for pt in self.pts:
+            self[pt].TouchLock()
+            
+    # Unlock all points
+    def Unlock(self):
+        """Unlock the data book for each point in the group
+        
+        :Call:
+            >>> DBPG.Unlock()
+        :Inputs:
+            *DBPG*: :class:`cape.cfdx.pointSensor.DBPointSensorGroup`
+                A point sensor group data book
+        :Versions:
+            * 2026-10-19 ``@ddalle``: First version
+        """
+        # Loop through points
+        for pt in self.pts:
+            self[pt].Unlock()
+            
     # Update a case (alternate grouping)
     def UpdateCase(self, i, pt=None):
         """Update all points for one case
@@ -719,6 +768,10 @@ class DBTriqPointGroup(DBPointSensorGroup):
         self.cols = opts.get_DataBookCoeffs(name)
         # Divide columns into parts
         self.DataCols = opts.get_DataBookDataCols(name)
+        # Interpolation stencils by key
+        self._stencils = {}
+        # Point data for most recent case
+        self._case_points = (None, None)
         # Loop through the points.
         for pt in self.pts:
             self.ReadPointSensor(pt)
@@ -763,25 +816,188 @@ class DBTriqPointGroup(DBPointSensorGroup):
   # Case I/O
   # ==========
   # <
+    # Update a case
+    def UpdateCase(self, i, pt=None):
+        """Update all points for one case
+        
+        The surface solution is read and interpolated once for all
+        points; see :func:`ReadCasePoints`.
+
+        :Call:
+            >>> n = DBPG.UpdateCase(i, pt=None)
+        :Inputs:
+            *DBPG*: :class:`cape.cfdx.pointSensor.DBTriqPointGroup`
+                Point sensor group data book
+            *i*: :class:`int`
+                Case index
+            *pt*: {``None``} | :class:`list` (:class:`str`) | :class:`str`
+                Point name or list of point names
+        :Outputs:
+            *n*: ``0`` | ``1``
+                How many updates were made
+        :Versions:
+            * 2026-10-19 ``@ddalle``: First version
+        """
+        try:
+            return DBPointSensorGroup.UpdateCase(self, i, pt=pt)
+        finally:
+            # Release solution data
+            self._case_points = (None, None)
+
     # Read case point data
-    def ReadCasePoint(self, pt):
+    def ReadCasePoint(self, pt, i, **kw):
         """Read point data from current run folder
         
         :Call:
-            >>> P = DBPG.ReadCasePoint(pt)
+            >>> P = DBPG.ReadCasePoint(pt, i, **kw)
         :Inputs:
             *DBPG*: :class:`cape.cfdx.pointSensor.DBTriqPointGroup`
                 Point sensor group data book
             *pt*: :class:`str`
                 Name of point to read
+            *i*: :class:`int`
+                Case index
         :Outputs:
             *P*: :class:`dict`
                 Dictionary of state variables as requested from the point
         :Versions:
             * 2017-10-10 ``@ddalle``: First version
+            * 2026-10-19 ``@ddalle``: Version 2.0; use ReadCasePoints()
         """
+        # Read all points at once
+        return self.ReadCasePoints(i, **kw)[pt]
+
+    # Read data for all points from current run folder
+    def ReadCasePoints(self, i, **kw):
+        """Read data for all points in the group from current run folder
+
+        The solution is read once, and all points are interpolated with
+        one stencil from :func:`GetSurfPointStencil`.  Results are saved
+        until the next case, so calling this for each point of the same
+        case does not reread the solution.
+
+        :Call:
+            >>> PP = DBPG.ReadCasePoints(i, **kw)
+        :Inputs:
+            *DBPG*: :class:`cape.cfdx.pointSensor.DBTriqPointGroup`
+                Point sensor group data book
+            *i*: :class:`int`
+                Case index
+            *kw*: :class:`dict`
+                Options passed to :func:`ReadCaseTriq`
+        :Outputs:
+            *PP*: :class:`dict`\ [:class:`dict`]
+                Dictionary of state variables for each point
+        :Versions:
+            * 2026-10-19 ``@ddalle``: First version
+        """
+        # Check for results from this case
+        key = (i, os.getcwd())
+        if self._case_points[0] == key:
+            return self._case_points[1]
         # Read data from a custom file
-        pass
+        triq, VarList = self.ReadCaseTriq(**kw)
+        # Get stencil for all points
+        S = self.GetSurfPointStencil(triq)
+        # Interpolate
+        X0, Q = triq.InterpSurfPointStencil(S)
+        # Columns of *Q* for each coefficient
+        J = {}
+        for col in self.cols:
+            # Check for a coordinate
+            if col in ("x", "y", "z"):
+                continue
+            # Make a key name for the _avg parameter
+            kavg = col + "_tavg"
+            # Find the index
+            if kavg in VarList:
+                # Use the time-averaged parameter
+                J[col] = VarList.index(kavg)
+            elif col in VarList:
+                # Use the regular parameter
+                J[col] = VarList.index(col)
+            else:
+                # Not found
+                raise KeyError("No state named '%s' found in solution" % col)
+        # Initialize output
+        PP = {}
+        # Loop through points
+        for (k, pt) in enumerate(self.pts):
+            # Initialize point
+            P = {}
+            # Get data columns
+            for col in self.cols:
+                # Check for a point
+                if col in ("x", "y", "z"):
+                    P[col] = X0[k, "xyz".index(col)]
+                else:
+                    P[col] = Q[k, J[col]]
+            # Save point
+            PP[pt] = P
+        # Save for other points
+        self._case_points = (key, PP)
+        # Output
+        return PP
+
+    # Get interpolation stencil
+    def GetSurfPointStencil(self, triq):
+        """Get interpolation stencil for all points in the group
+
+        The stencil only depends on the surface mesh and the point
+        coordinates, so it is saved in memory and in the folder
+        ``.stencilcache`` in the root directory and reused for each
+        case with the same mesh.
+
+        :Call:
+            >>> S = DBPG.GetSurfPointStencil(triq)
+        :Inputs:
+            *DBPG*: :class:`cape.cfdx.pointSensor.DBTriqPointGroup`
+                Point sensor group data book
+            *triq*: :class:`cape.tri.Triq`
+                Annotated triangulation interface
+        :Outputs:
+            *S*: :class:`dict`\ [:class:`np.ndarray`]
+                Stencil from :func:`cape.tri.Triq.GetSurfPointStencil`
+        :Versions:
+            * 2026-10-19 ``@ddalle``: First version
+        """
+        # Coordinates of points
+        X = np.array(
+            [self.opts.get_Point(pt) for pt in self.pts], dtype="<f8")
+        # Key from mesh and points
+        sha = hashlib.sha1(triq.GetMeshHash().encode("ascii"))
+        sha.update(X.tobytes())
+        key = sha.hexdigest()
+        # Check memory
+        S = self._stencils.get(key)
+        if S is not None:
+            return S
+        # File name
+        fdir = os.path.join(self.RootDir, ".stencilcache")
+        fname = os.path.join(fdir, "%s.npz" % key)
+        # Check for saved stencil
+        if os.path.isfile(fname):
+            try:
+                with np.load(fname) as data:
+                    S = {k: data[k] for k in data.files}
+            except Exception:
+                S = None
+        # Compute it if necessary
+        if S is None:
+            S = triq.GetSurfPointStencil(X)
+            # Save it; write to temporary file and rename
+            try:
+                if not os.path.isdir(fdir):
+                    os.makedirs(fdir)
+                ftmp = "%s.tmp%i.npz" % (fname[:-4], os.getpid())
+                np.savez(ftmp, **S)
+                os.replace(ftmp, fname)
+            except OSError:
+                pass
+        # Save in memory
+        self._stencils[key] = S
+        # Output
+        return S
     
 
     # Read Triq file from this folder
@@ -16,6 +16,9 @@ import os
 # For processing qstat lines
 import re
 
+# Local modules
+from . import trace
+
 
 # Function to call `qsub` and get the PBS number
 def qsub(fname):
@@ -238,6 +241,7 @@ def pqjob(fname="jobID.dat"):
 
 
 # Function to get `qstat` information
+@trace.traced
 def qstat(u=None, J=None):
     """Call `qstat` and process information
 
@@ -292,6 +296,7 @@ def qstat(u=None, J=None):
 
 
 # Function to get `qstat` information
+@trace.traced
 def squeue(u=None, J=None):
     """Call `qstat` and process information
 
@@ -59,6 +59,7 @@ example :func:`cape.cfdx.report.Report.SubfigPlotCoeff` for ``"PlotCoeff"``  or
 # Standard library modules
 import ast
 import glob
+import hashlib
 import json
 import os
 import re
@@ -73,8 +74,10 @@ from numpy import sqrt, sin, cos, tan, exp
 # Local modules
 from cape.filecntl import tex
 from .. import tar
+from .. import util
 
 # Paraview/Tecplot interfaces
+from . import trace
 from .bin import pvpython
 from cape.filecntl.tecplot import ExportLayout, Tecscript
 import cape.plt as plt
@@ -163,7 +166,9 @@ class Report(object):
     def mkdir(self, fdir):
         """Create a folder with the correct umask
 
-        Relies on ``R.umask``
+        Relies on ``R.umask``.  It is not an error if the folder already
+        exists, which can happen when several workers render pages in
+        the same group folder at once.
 
         :Call:
             >>> R.mkdir(fdir)
@@ -174,9 +179,12 @@ class Report(object):
                 Name of folder to make
         :Versions:
             * 2015-10-15 ``@ddalle``: First versoin
+            * 2026-10-19 ``@ddalle``: Allow existing folder
         """
-        # Make the directory.
-        self.cntl.mkdir(fdir)
+        # Get umask
+        umask = self.cntl.opts.get_umask()
+        # Make the directory (or use the one another worker made)
+        os.makedirs(fdir, 0o777 - umask, exist_ok=True)
 
     # Function to go into a folder, respecting archive option
     def cd(self, fdir):
@@ -544,6 +552,7 @@ class Report(object):
    # ---------------
    # [
     # Function to update report
+    @trace.traced
     def UpdateReport(self, **kw):
         """Update a report based on the list of figures
 
@@ -557,37 +566,51 @@ class Report(object):
                 List of case indices
             *cons*: :class:`list` (:class:`str`)
                 List of constraints to define what cases to update
+            *j*: {``1``} | :class:`int`
+                Number of pages to render concurrently
         :Versions:
             * 2015-05-22 ``@ddalle``: First version
+            * 2026-10-19 ``@ddalle``: Added *j* option
+            * 2026-10-19 ``@ddalle``: Keep ``.aux`` between updates
         """
         # Get list of indices.
         I = self.cntl.x.GetIndices(**kw)
+        # Number of worker processes
+        nproc = util.get_nproc(kw.get("j"))
         # Update any sweep figures.
-        self.UpdateSweeps(I)
+        with trace.span("UpdateSweeps"):
+            self.UpdateSweeps(I, nproc=nproc)
         # Update any case-by-case figures.
         if self.HasCaseFigures():
-            self.UpdateCases(I)
+            with trace.span("UpdateCases"):
+                self.UpdateCases(I, nproc=nproc)
         # Write the file.
         self.tex.Write()
+        # Save cross-references from previous compilation
+        faux = self.fname[:-3] + "aux"
+        haux = self.GetFileHash(faux)
         # Compmile it.
         print("Compiling...")
-        self.tex.Compile(False)
-        # Need to compile twice for links
-        print("Compiling...")
-        self.tex.Compile(False)
+        with trace.span("Compile"):
+            self.tex.Compile(False)
+            # Need to compile twice for links if any changed
+            if self.GetFileHash(faux) != haux:
+                print("Compiling...")
+                self.tex.Compile(False)
         # Clean up
         print("Cleaning up...")
-        # Clean up sweeps
-        self.CleanUpSweeps(I=I)
-        # Clean up cases
-        if self.HasCaseFigures():
-            self.CleanUpCases(I=I)
+        with trace.span("CleanUp"):
+            # Clean up sweeps
+            self.CleanUpSweeps(I=I)
+            # Clean up cases
+            if self.HasCaseFigures():
+                self.CleanUpCases(I=I)
         # Get other 'report-*.*' files.
         fglob = glob.glob('%s*' % self.fname[:-3])
         # Delete most of them.
         for f in fglob:
-            # Check for the two good ones.
-            if f[-3:] in ['tex', 'pdf']: continue
+            # Check for the good ones; keep *.aux* for next compile
+            if f[-3:] in ['tex', 'pdf', 'aux']: continue
             # Else remove it.
             os.remove(f)
 
@@ -626,8 +649,11 @@ class Report(object):
                 List of case indices
             *cons*: :class:`list` (:class:`str`)
                 List of constraints to define what cases to update
+            *nproc*: {``1``} | :class:`int`
+                Number of sweep pages to render concurrently
         :Versions:
             * 2015-05-28 ``@ddalle``: Started
+            * 2026-10-19 ``@ddalle``: Added *nproc*
         """
         # Clear out the lines.
         if 'Sweeps' in self.tex.Section:
@@ -639,7 +665,7 @@ class Report(object):
         # Loop through the sweep figures.
         for fswp in fswps:
             # Update the figure.
-            self.UpdateSweep(fswp, I=I, cons=cons)
+            self.UpdateSweep(fswp, I=I, cons=cons, nproc=kw.get("nproc", 1))
         # Update the text.
         self.tex._updated_sections = True
         self.tex.UpdateLines()
@@ -660,18 +686,28 @@ class Report(object):
                 List of case indices
             *cons*: :class:`list` (:class:`str`)
                 List of constraints to define what cases to update
+            *nproc*: {``1``} | :class:`int`
+                Number of case pages to render concurrently
         :Versions:
             * 2015-03-10 ``@ddalle``: First version
             * 2015-05-22 ``@ddalle``: Moved compilation portion to UpdateReport
+            * 2026-10-19 ``@ddalle``: Added *nproc*
         """
+        # Number of worker processes
+        nproc = kw.pop("nproc", 1)
         # Check for use of constraints instead of direct list.
         I = self.cntl.x.GetIndices(I=I, **kw)
         # Clear out the lines.
         del self.tex.Section['Cases'][1:-1]
-        # Loop through those cases.
-        for i in I:
-            # Update the case
-            self.UpdateCase(i)
+        # Poll the queue once here instead of in each worker
+        if nproc > 1 and len(I) > 0 and not self.cntl.jobs:
+            self.cntl.CheckCaseStatus(I[0], auto=True)
+        # Render the case pages, possibly in worker processes
+        lines = util.pmap(self.RenderCase, I, nproc)
+        # Add the pages to the master document in order
+        for line in lines:
+            if line is not None:
+                self.tex.Section['Cases'].insert(-1, line)
         # Update the text.
         self.tex._updated_sections = True
         self.tex.UpdateLines()
@@ -685,11 +721,12 @@ class Report(object):
    # -------------------
    # [
     # Function to update a sweep
-    def UpdateSweep(self, fswp, I=None, cons=[]):
+    @trace.traced
+    def UpdateSweep(self, fswp, I=None, cons=[], nproc=1):
         """Update the pages of a sweep
 
         :Call:
-            >>> R.UpdateSweep(fswp, I)
+            >>> R.UpdateSweep(fswp, I, nproc=1)
         :Inputs:
             *R*: :class:`cape.cfdx.report.Report`
                 Automated report interface
@@ -699,9 +736,12 @@ class Report(object):
                 List of case indices
             *cons*: :class:`list` (:class:`str`)
                 List of constraints to define what cases to update
+            *nproc*: {``1``} | :class:`int`
+                Number of pages to render concurrently
         :Versions:
             * 2015-05-29 ``@ddalle``: First version
             * 2015-06-11 ``@ddalle``: Added minimum cases per page
+            * 2026-10-19 ``@ddalle``: Added *nproc*
         """
         # Divide the cases into sweeps.
         J = self.GetSweepIndices(fswp, I, cons)
@@ -723,12 +763,19 @@ class Report(object):
             self.mkdir(fdir)
         # Enter the sweep folder.
         os.chdir(fdir)
-        # Loop through pages.
-        for i in range(len(J)):
-            # Check for enough cases to report a sweep.
-            if len(J[i]) < nMin: continue
-            # Update the sweep page.
-            self.UpdateSweepPage(fswp, J[i])
+        # Pages with enough cases to report a sweep
+        J = [j for j in J if len(j) >= nMin]
+        # Read data book components before forking workers
+        if nproc > 1:
+            for fig in self.cntl.opts.get_SweepOpt(fswp, "Figures"):
+                for sfig in self.cntl.opts.get_FigSubfigList(fig):
+                    self.GetSubfigRefComponent(sfig)
+        # Render the pages, possibly in worker processes
+        lines = util.pmap(
+            lambda j: self.RenderSweepPage(fswp, j), J, nproc)
+        # Add the pages to the master document in order
+        for line in lines:
+            self.tex.Section['Sweeps'].insert(-1, line)
         # Return to original directory
         os.chdir(fpwd)
 
@@ -749,6 +796,37 @@ class Report(object):
                 List of correspond indices for each target
         :Versions:
             * 2015-05-29 ``@ddalle``: First version
+            * 2026-10-19 ``@ddalle``: Split from :func:`RenderSweepPage`
+        """
+        # Create the page
+        line = self.RenderSweepPage(fswp, I, IT)
+        # Add a line to the master document.
+        self.tex.Section['Sweeps'].insert(-1, line)
+
+    # Create a page for a single sweep
+    def RenderSweepPage(self, fswp, I, IT=[]):
+        """Create one page of a sweep without editing the main document
+
+        This is safe to call from a worker process; the caller is
+        responsible for adding the output line to the master document.
+
+        :Call:
+            >>> line = R.RenderSweepPage(fswp, I, IT=[])
+        :Inputs:
+            *R*: :class:`cape.cfdx.report.Report`
+                Automated report interface
+            *fswp*: :class:`str`
+                Name of sweep to update
+            *I*: :class:`numpy.ndarray`\ [:class:`int`]
+                List of cases in this sweep
+            *IT*: :class:`list` (:class:`numpy.ndarray`\ [:class:`int`])
+                List of correspond indices for each target
+        :Outputs:
+            *line*: :class:`str`
+                LaTeX line to include this page in master document
+        :Versions:
+            * 2015-05-29 ``@ddalle``: First version (``UpdateSweepPage``)
+            * 2026-10-19 ``@ddalle``: Version 2.0; return master line
         """
         # --------
         # Checking
@@ -772,9 +850,8 @@ class Report(object):
             self.mkdir(fdir)
         # Go into the folder.
         self.cd(fdir)
-        # Add a line to the master document.
-        self.tex.Section['Sweeps'].insert(-1,
-            '\\input{sweep-%s/%s/%s}\n' % (fswp, frun, self.fname))
+        # Line for the master document.
+        line = '\\input{sweep-%s/%s/%s}\n' % (fswp, frun, self.fname)
         # -------------
         # Initial setup
         # -------------
@@ -800,6 +877,8 @@ class Report(object):
         self.sweeps[fswp][I[0]].Write()
         # Go home.
         os.chdir(fpwd)
+        # Output
+        return line
 
     # Get appropriate list of figures
     def GetFigureList(self, i, fswp=None):
@@ -866,6 +945,35 @@ class Report(object):
                 Case index
         :Versions:
             * 2015-03-08 ``@ddalle``: First version
+            * 2026-10-19 ``@ddalle``: Split from :func:`RenderCase`
+        """
+        # Create the page
+        line = self.RenderCase(i)
+        # Add the line to the master LaTeX file.
+        if line is not None:
+            self.tex.Section['Cases'].insert(-1, line)
+
+    # Function to create the file for a case
+    @trace.traced
+    def RenderCase(self, i):
+        """Create or update the LaTeX file for a case
+
+        This does not edit the master document, so it is safe to call
+        from a worker process.
+
+        :Call:
+            >>> line = R.RenderCase(i)
+        :Inputs:
+            *R*: :class:`cape.cfdx.report.Report`
+                Automated report interface
+            *i*: :class:`int`
+                Case index
+        :Outputs:
+            *line*: ``None`` | :class:`str`
+                LaTeX line to include this case in master document
+        :Versions:
+            * 2015-03-08 ``@ddalle``: First version (``UpdateCase``)
+            * 2026-10-19 ``@ddalle``: Version 2.0; return master line
         """
         # --------
         # Checking
@@ -919,9 +1027,8 @@ class Report(object):
             # Go home and quit.
             os.chdir(fpwd)
             return
-        # Add the line to the master LaTeX file.
-        self.tex.Section['Cases'].insert(-1,
-            '\\input{%s/%s/%s}\n' % (fgrp, fdir, self.fname))
+        # Line for the master LaTeX file.
+        line = '\\input{%s/%s/%s}\n' % (fgrp, fdir, self.fname)
         # Status update
         print('%s/%s' % (fgrp, fdir))
         # -------------
@@ -950,6 +1057,8 @@ class Report(object):
         self.cases[i].Write()
         # Go home.
         os.chdir(fpwd)
+        # Output
+        return line
    # ]
 
    # -------------------------
@@ -1142,24 +1251,27 @@ class Report(object):
         rc = self.ReadCaseJSON()
         # Loop through subfigs.
         for sfig in sfigs:
+            # Hash of inputs to this subfigure
+            h = self.GetSubfigHash(sfig, i, n)
             # Check the status (also prints status update)
-            q = self.CheckSubfigStatus(sfig, rc, n)
+            q = self.CheckSubfigStatus(sfig, rc, n, h)
             # Use a separate function to find the right updater
             lines = self.SubfigSwitch(sfig, i, lines, q)
             # Update the settings
             rc["Status"][sfig] = n
             rc["Subfigures"][sfig] = self.cntl.opts.get_SubfigCascade(sfig)
+            rc["Hash"][sfig] = h
         # Write the new settings
         self.WriteCaseJSON(rc)
         # Output
         return lines
 
     # Check status of a subfigure and give status update
-    def CheckSubfigStatus(self, sfig, rc, n):
+    def CheckSubfigStatus(self, sfig, rc, n, h=None):
         """Check whether or not to update a subfigure and print status
 
         :Call:
-            >>> q = R.CheckSubfigStatus(sfig, rc, n)
+            >>> q = R.CheckSubfigStatus(sfig, rc, n, h=None)
         :Inputs:
             *R*: :class:`cape.cfdx.report.Report`
                 Automated report interface
@@ -1169,11 +1281,14 @@ class Report(object):
                 Dictionary from ``report.json``
             *n*: :class:`int` | ``None``
                 Current iteration number
+            *h*: {``None``} | :class:`str`
+                Hash of subfigure inputs from :func:`GetSubfigHash`
         :Outputs:
             *q*: ``True`` | ``False``
                 Whether or not to update the subfigure
         :Versions:
             * 2016-10-25 ``@ddalle``: First version
+            * 2026-10-19 ``@ddalle``: Added *h*
         """
         # Get the status options
         stsr = rc.get("Status", {})
@@ -1198,9 +1313,118 @@ class Report(object):
             # Definition changed
             print("  %s: Definition updated" % sfig)
             return True
+        # Get hash of inputs last used to generate this subfig
+        hr = rc.get("Hash", {}).get(sfig)
+        # Compare (if both are available)
+        if (h is not None) and (hr is not None) and (h != hr):
+            # Source file(s) changed
+            print("  %s: Source files updated" % sfig)
+            return True
         # If reached this point, no update
         return False
 
+    # Get files read by a subfigure
+    def GetSubfigSourceFiles(self, sfig, i):
+        """Get list of files (other than iterative histories) read by a
+        case subfigure
+
+        :Call:
+            >>> fsrc = R.GetSubfigSourceFiles(sfig, i)
+        :Inputs:
+            *R*: :class:`cape.cfdx.report.Report`
+                Automated report interface
+            *sfig*: :class:`str`
+                Name of subfigure
+            *i*: :class:`int`
+                Case index
+        :Outputs:
+            *fsrc*: :class:`list`\ [:class:`str`]
+                List of absolute paths to files read by *sfig*
+        :Versions:
+            * 2026-10-19 ``@ddalle``: First version
+        """
+        # Extract options
+        opts = self.cntl.opts
+        # Get the base type
+        btyp = opts.get_SubfigBaseType(sfig)
+        # Check type
+        if btyp == "Image":
+            # Image file in case folder
+            frun = self.cntl.x.GetFullFolderNames(i)
+            fimg = opts.get_SubfigOpt(sfig, "ImageFile")
+            return [os.path.join(self.cntl.RootDir, frun, fimg)]
+        elif btyp in ("Tecplot", "Paraview"):
+            # Layout file
+            flay = opts.get_SubfigOpt(sfig, "Layout")
+            return [os.path.join(self.cntl.RootDir, flay)]
+        else:
+            # Inputs are covered by iteration number
+            return []
+
+    # Get hash of subfigure inputs
+    def GetSubfigHash(self, sfig, i, n):
+        """Get hash of the inputs to a case subfigure
+
+        The hash combines the iteration number, the fully cascaded
+        subfigure definition, and the modification times of any source
+        files from :func:`GetSubfigSourceFiles`.
+
+        :Call:
+            >>> h = R.GetSubfigHash(sfig, i, n)
+        :Inputs:
+            *R*: :class:`cape.cfdx.report.Report`
+                Automated report interface
+            *sfig*: :class:`str`
+                Name of subfigure
+            *i*: :class:`int`
+                Case index
+            *n*: :class:`int` | ``None``
+                Current iteration number
+        :Outputs:
+            *h*: :class:`str`
+                SHA-1 hash of subfigure inputs
+        :Versions:
+            * 2026-10-19 ``@ddalle``: First version
+        """
+        # Get source file mod times
+        tsrc = []
+        for fname in self.GetSubfigSourceFiles(sfig, i):
+            # Get mod time if present
+            if os.path.isfile(fname):
+                tsrc.append([fname, os.path.getmtime(fname)])
+            else:
+                tsrc.append([fname, None])
+        # Combine inputs
+        txt = json.dumps(
+            [n, self.cntl.opts.get_SubfigCascade(sfig), tsrc],
+            sort_keys=True, default=str)
+        # Output
+        return hashlib.sha1(txt.encode("utf-8")).hexdigest()
+
+    # Get hash of a file
+    def GetFileHash(self, fname):
+        """Get SHA-1 hash of the contents of a file
+
+        :Call:
+            >>> h = R.GetFileHash(fname)
+        :Inputs:
+            *R*: :class:`cape.cfdx.report.Report`
+                Automated report interface
+            *fname*: :class:`str`
+                Name of file
+        :Outputs:
+            *h*: ``None`` | :class:`str`
+                SHA-1 hash of file contents; ``None`` if no file
+        :Versions:
+            * 2026-10-19 ``@ddalle``: First version
+        """
+        # Check for file
+        if not os.path.isfile(fname):
+            return None
+        # Read and hash
+        with open(fname, 'rb') as fp:
+            return hashlib.sha1(fp.read()).hexdigest()
+
     # Point to the correct subfigure updater
     def SubfigSwitch(self, sfig, i, lines, q):
         r"""Switch function to find the correct subfigure function
@@ -3447,6 +3671,11 @@ class Report(object):
        # --------
         # Number of targets plotted
         j_t = 0
+        # Seed of each sweep
+        I0 = [Jk[0] for Jk in J]
+        # Matches for each component and target
+        JC = {}
+        JT = {}
         # Loop through plots.
         for i in range(nSweep*nCoeff):
             # Coefficient index
@@ -3469,8 +3698,12 @@ class Report(object):
                 patch = None
             # Read the component
             DBc = self.ReadDBComp(comp)
-            # Get matches
-            Jj = DBc.FindCoSweep(x, J[j][0], EqCons, TolCons, GlobCons)
+            # Get matches for all sweeps (once per component)
+            if comp not in JC:
+                JC[comp] = DBc.FindCoSweeps(
+                    x, I0, EqCons, TolCons, GlobCons)
+            # Matches for this sweep
+            Jj = JC[comp][j]
             # Plot label (for legend)
             lbl = self.SubfigPlotLabel(sfig, k)
             # Carpet label appendix
@@ -3575,10 +3808,13 @@ class Report(object):
                         continue
                 # Get any translation keys
                 xkeys = topts.get("RunMatrix", {})
-                # Get matches
-                JTj = DBTc.FindCoSweep(x, J[j][0],
-                    EqCons=EqCons, TolCons=TolCons,
-                    GlobCons=GlobCons, xkeys=xkeys)
+                # Get matches for all sweeps (once per target component)
+                if (comp, targ) not in JT:
+                    JT[comp, targ] = DBTc.FindCoSweeps(x, I0,
+                        EqCons=EqCons, TolCons=TolCons,
+                        GlobCons=GlobCons, xkeys=xkeys)
+                # Matches for this sweep
+                JTj = JT[comp, targ][j]
                 # Check for results to plot.
                 if len(JTj) == 0:
                     print(
@@ -5504,7 +5740,8 @@ class Report(object):
             # Default output
             return {
                 "Status": {},
-                "Subfigures": {}
+                "Subfigures": {},
+                "Hash": {}
             }
         # Open the file
         f = open('report.json')
@@ -5520,6 +5757,7 @@ class Report(object):
         # Ensure the existence of main sections
         rc.setdefault("Status", {})
         rc.setdefault("Subfigures", {})
+        rc.setdefault("Hash", {})
         # Return the settings
         return rc
 
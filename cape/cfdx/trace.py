@@ -0,0 +1,446 @@
+r"""
+:mod:`cape.cfdx.trace`: Timing spans for CAPE commands
+=======================================================
+
+This module provides a lightweight tracing layer to find out which
+stage of a command such as ``cape -c``, ``cape --fm``, ``cape
+--report``, or ``cape --archive`` takes the most time. Stages of
+:class:`cape.cntl.Cntl` and the per-case helpers they call are wrapped
+in nested timing spans, either using the :func:`span` context manager
+
+    .. code-block:: python
+
+        with trace.span("CheckCaseStatus", i=i):
+            sts = self.CheckCaseStatus(i)
+
+or the :func:`traced` decorator.
+
+Tracing is off by default, in which case :func:`span` returns a shared
+no-op object and :func:`traced` functions call the original function
+directly. The ``--trace`` command-line flag calls :func:`start`, which
+turns on tracing and, when the command exits, prints a summary table
+(see :func:`print_summary`) and writes a trace file (see
+:func:`write_trace`) in the Chrome trace-event JSON format, which can
+be viewed in ``chrome://tracing`` or Perfetto.
+
+Only spans in the main process are recorded. Work done in worker
+processes (for example ``cape --fm -j 8``) appears as the time spent in
+the enclosing span.
+
+"""
+
+# Standard library
+import atexit
+import functools
+import json
+import os
+import sys
+import time
+
+
+# Default name of trace file
+TRACE_FILE = "cape-trace.json"
+
+# Whether or not tracing is on
+_ENABLED = False
+# Reference time for records
+_T0 = 0.0
+# Completed spans: (path, start, duration, meta)
+_RECORDS = []
+# Spans currently open
+_STACK = []
+# Name of file to write when finished
+_FNAME = None
+
+
+# No-op span used when tracing is off
+class _NullSpan(object):
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *a):
+        return False
+
+
+# Single instance of null span
+_NULL_SPAN = _NullSpan()
+
+
+# Timing span
+class Span(object):
+    r"""Timing span, used as context manager
+
+    :Call:
+        >>> with Span(name, meta):
+        ...     pass
+    :Inputs:
+        *name*: :class:`str`
+            Name of span, for example ``"CheckCase"``
+        *meta*: :class:`dict`
+            Extra information to save, for example case index *i*
+    :Versions:
+        * 2026-10-19 ``@ddalle``: Version 1.0
+    """
+    __slots__ = ("name", "meta", "path", "tic")
+
+    # Initialization method
+    def __init__(self, name, meta):
+        self.name = name
+        self.meta = meta
+        self.path = None
+        self.tic = None
+
+    # Start span
+    def __enter__(self):
+        # Full path, including parent spans
+        if _STACK:
+            self.path = _STACK[-1].path + (self.name,)
+        else:
+            self.path = (self.name,)
+        # Open
+        _STACK.append(self)
+        self.tic = time.perf_counter()
+        return self
+
+    # Finish span
+    def __exit__(self, *a):
+        # Elapsed time
+        toc = time.perf_counter()
+        # Close this span (and any left open inside it)
+        while _STACK:
+            if _STACK.pop() is self:
+                break
+        # Save record
+        _RECORDS.append((self.path, self.tic - _T0, toc - self.tic, self.meta))
+        return False
+
+
+# Create a span
+def span(name, **meta):
+    r"""Create a timing span, or a no-op if tracing is off
+
+    :Call:
+        >>> with span(name, **meta):
+        ...     pass
+    :Inputs:
+        *name*: :class:`str`
+            Name of span
+        *meta*: :class:`dict`
+            Extra information to save in trace file, e.g. *i*
+    :Outputs:
+        *s*: :class:`Span` | :class:`_NullSpan`
+            Context manager
+    :Versions:
+        * 2026-10-19 ``@ddalle``: Version 1.0
+    """
+    # Check for tracing
+    if not _ENABLED:
+        return _NULL_SPAN
+    # Output
+    return Span(name, meta)
+
+
+# Decorator
+def traced(func=None, name=None):
+    r"""Decorator to wrap each call to a function in a span
+
+    :Call:
+        >>> func = traced(func)
+        >>> func = traced(name=name)(func)
+    :Inputs:
+        *func*: **callable**
+            Function to wrap
+        *name*: {*func.__name__*} | :class:`str`
+            Name of span
+    :Outputs:
+        *func*: **callable**
+            Wrapped function
+    :Versions:
+        * 2026-10-19 ``@ddalle``: Version 1.0
+    """
+    # Check for use as decorator factory
+    if func is None:
+        return lambda f: traced(f, name=name)
+    # Default name
+    if name is None:
+        name = func.__name__
+
+    # Wrapper
+    @functools.wraps(func)
+    def wrapper_func(*a, **kw):
+        # Check for tracing
+        if not _ENABLED:
+            return func(*a, **kw)
+        # Run inside a span
+        with Span(name, {}):
+            return func(*a, **kw)
+    # Output
+    return wrapper_func
+
+
+# Turn on tracing
+def enable():
+    r"""Turn on tracing and clear any previous records
+
+    :Call:
+        >>> enable()
+    :Versions:
+        * 2026-10-19 ``@ddalle``: Version 1.0
+    """
+    global _ENABLED, _T0
+    # Reset
+    reset()
+    _T0 = time.perf_counter()
+    _ENABLED = True
+
+
+# Turn off tracing
+def disable():
+    r"""Turn off tracing, keeping any records
+
+    :Call:
+        >>> disable()
+    :Versions:
+        * 2026-10-19 ``@ddalle``: Version 1.0
+    """
+    global _ENABLED
+    _ENABLED = False
+
+
+# Check status
+def is_enabled():
+    r"""Check if tracing is on
+
+    :Call:
+        >>> q = is_enabled()
+    :Outputs:
+        *q*: ``True`` | ``False``
+            Whether or not spans are being recorded
+    :Versions:
+        * 2026-10-19 ``@ddalle``: Version 1.0
+    """
+    return _ENABLED
+
+
+# Clear records
+def reset():
+    r"""Delete all records
+
+    :Call:
+        >>> reset()
+    :Versions:
+        * 2026-10-19 ``@ddalle``: Version 1.0
+    """
+    del _RECORDS[:]
+    del _STACK[:]
+
+
+# Start tracing a command
+def start(fname=None, name="cape"):
+    r"""Start tracing a command and report the results at exit
+
+    :Call:
+        >>> start(fname=None, name="cape")
+    :Inputs:
+        *fname*: {``None``} | ``True`` | :class:`str`
+            Name of trace file; default is *TRACE_FILE*
+        *name*: {``"cape"``} | :class:`str`
+            Name of top-level span
+    :Versions:
+        * 2026-10-19 ``@ddalle``: Version 1.0
+    """
+    global _FNAME
+    # Only start once
+    if _ENABLED:
+        return
+    # Default file name
+    if not isinstance(fname, str):
+        fname = TRACE_FILE
+    # Save absolute path, since commands change folders
+    _FNAME = os.path.abspath(fname)
+    # Turn on
+    enable()
+    # Open top-level span
+    Span(name, {"argv": " ".join(sys.argv)}).__enter__()
+    # Report when finished
+    atexit.register(finish)
+
+
+# Finish tracing a command
+def finish():
+    r"""Close open spans, print summary, and write trace file
+
+    :Call:
+        >>> finish()
+    :Versions:
+        * 2026-10-19 ``@ddalle``: Version 1.0
+    """
+    # Check if already finished
+    if not _ENABLED:
+        return
+    # Close any open spans, innermost first
+    while _STACK:
+        _STACK[-1].__exit__()
+    # Stop recording
+    disable()
+    # Report
+    print_summary()
+    # Write trace file
+    if _FNAME:
+        write_trace(_FNAME)
+        print("Wrote trace to '%s'" % _FNAME)
+
+
+# Get records
+def get_records():
+    r"""Get list of completed spans
+
+    :Call:
+        >>> recs = get_records()
+    :Outputs:
+        *recs*: :class:`list`\ [:class:`tuple`]
+            Tuple of span path (names of span and its parents), start
+            time [s], duration [s], and extra info for each span
+    :Versions:
+        * 2026-10-19 ``@ddalle``: Version 1.0
+    """
+    return list(_RECORDS)
+
+
+# Aggregate records
+def summarize(recs=None):
+    r"""Total the time in each span, grouped by span path
+
+    :Call:
+        >>> stats = summarize(recs=None)
+    :Inputs:
+        *recs*: {``None``} | :class:`list`\ [:class:`tuple`]
+            Records from :func:`get_records`; default is all
+    :Outputs:
+        *stats*: :class:`list`\ [:class:`dict`]
+            Count, total, and maximum time for each path, sorted so
+            that each path follows its parent
+    :Versions:
+        * 2026-10-19 ``@ddalle``: Version 1.0
+    """
+    # Default records
+    if recs is None:
+        recs = _RECORDS
+    # Group by path
+    stats = {}
+    for (path, tic, dt, meta) in recs:
+        # Get group
+        s = stats.get(path)
+        # Initialize
+        if s is None:
+            s = stats[path] = {
+                "path": path,
+                "start": tic,
+                "count": 0,
+                "total": 0.0,
+                "max": 0.0,
+            }
+        # Accumulate
+        s["start"] = min(s["start"], tic)
+        s["count"] += 1
+        s["total"] += dt
+        s["max"] = max(s["max"], dt)
+    # Sort each path by start time of itself and its parents
+    start = {path: s["start"] for (path, s) in stats.items()}
+
+    def sortkey(path):
+        return tuple(
+            (start.get(path[:k+1], 0.0), path[k]) for k in range(len(path)))
+    # Output
+    return [stats[path] for path in sorted(stats, key=sortkey)]
+
+
+# Print summary
+def print_summary(recs=None, f=None):
+    r"""Print table of time spent in each span
+
+    :Call:
+        >>> print_summary(recs=None, f=None)
+    :Inputs:
+        *recs*: {``None``} | :class:`list`\ [:class:`tuple`]
+            Records from :func:`get_records`; default is all
+        *f*: {``None``} | :class:`file`
+            File handle; default is *sys.stdout*
+    :Versions:
+        * 2026-10-19 ``@ddalle``: Version 1.0
+    """
+    # Default file
+    if f is None:
+        f = sys.stdout
+    # Get totals
+    stats = summarize(recs)
+    # Check for empty
+    if len(stats) == 0:
+        return
+    # Total time of top-level spans
+    ttot = sum(s["total"] for s in stats if len(s["path"]) == 1)
+    ttot = max(ttot, 1e-12)
+    # Width of name column
+    names = ["  "*(len(s["path"]) - 1) + s["path"][-1] for s in stats]
+    lname = max(20, max(len(name) for name in names))
+    # Header
+    stncl = "%%-%is %%8s %%10s %%10s %%10s %%6s\n" % lname
+    f.write("\n")
+    f.write(stncl % ("span", "count", "total [s]", "mean [ms]",
+        "max [ms]", "%"))
+    f.write(stncl % ("-"*lname, "-"*8, "-"*10, "-"*10, "-"*10, "-"*6))
+    # Rows
+    stncl = "%%-%is %%8i %%10.3f %%10.3f %%10.3f %%6.1f\n" % lname
+    for (name, s) in zip(names, stats):
+        f.write(stncl % (
+            name, s["count"], s["total"], 1e3*s["total"]/s["count"],
+            1e3*s["max"], 100*s["total"]/ttot))
+    f.flush()
+
+
+# Write trace file
+def write_trace(fname, recs=None):
+    r"""Write records to a Chrome trace-event JSON file
+
+    :Call:
+        >>> write_trace(fname, recs=None)
+    :Inputs:
+        *fname*: :class:`str`
+            Name of file to write
+        *recs*: {``None``} | :class:`list`\ [:class:`tuple`]
+            Records from :func:`get_records`; default is all
+    :Versions:
+        * 2026-10-19 ``@ddalle``: Version 1.0
+    """
+    # Default records
+    if recs is None:
+        recs = _RECORDS
+    # Process ID
+    pid = os.getpid()
+    # Convert each record to complete ("X") event in microseconds
+    events = []
+    for (path, tic, dt, meta) in recs:
+        events.append({
+            "name": path[-1],
+            "ph": "X",
+            "ts": round(1e6*tic, 1),
+            "dur": round(1e6*dt, 1),
+            "pid": pid,
+            "tid": 0,
+            "args": dict(meta, path="/".join(path)),
+        })
+    # Sort by start time
+    events.sort(key=lambda e: e["ts"])
+    # Totals
+    summary = [
+        dict(s, path="/".join(s["path"])) for s in summarize(recs)
+    ]
+    # Write
+    with open(fname, "w") as fp:
+        json.dump({
+            "traceEvents": events,
+            "displayTimeUnit": "ms",
+            "summary": summary,
+        }, fp, indent=1, default=str)
@@ -31,6 +31,7 @@ individualized modules are below.
 
 # Standard library modules
 import copy
+import fnmatch
 import functools
 import getpass
 import glob
@@ -40,6 +41,7 @@ import os
 import re
 import shutil
 import time
+import traceback
 
 # Standard library partial imports
 from datetime import datetime
@@ -51,10 +53,12 @@ import numpy as np
 from .cfdx import options
 from .cfdx import queue
 from .cfdx import case
+from .cfdx import trace
 from . import convert
 from . import console
 from . import argread
 from . import manage
+from . import util
 
 # Functions and classes from other modules
 from .config import ConfigXML, ConfigJSON
@@ -143,6 +147,7 @@ class Cntl(object):
    # <
     _case_mod = case
     _zombie_files = ["*.out"]
+    _history_files = ["*.dat", "*.out", "*.resid", "*fomoco*", "*.triq"]
    # >
 
    # =============
@@ -695,7 +700,11 @@ class Cntl(object):
                 Flags with any additional preprocessing performed
         :Versions:
             * 2018-10-19 ``@ddalle``: Version 1.0
+            * 2026-10-19 ``@ddalle``: Version 1.1; add ``--trace``
         """
+        # Start timing instrumentation
+        if kw.get("trace"):
+            trace.start(kw["trace"])
         # Get constraints and convert text to list
         cons  = kw.get('cons',        '').split(',')
         cons += kw.get('constraints', '').split(',')
@@ -797,6 +806,10 @@ class Cntl(object):
             self.CheckTriqFM(**kw)
             # Output
             return "check"
+        elif kw.get('watch'):
+            # Keep updating data book as cases run
+            self.WatchDataBook(**kw)
+            return 'watch'
         elif kw.get('aero') or kw.get('fm'):
             # Collect force and moment data.
             self.UpdateFM(**kw)
@@ -913,6 +926,7 @@ class Cntl(object):
         self.SubmitJobs(**kw)
 
     # Master interface function
+    @trace.traced
     def SubmitJobs(self, **kw):
         r"""Check jobs and prepare or submit jobs if necessary
 
@@ -1001,19 +1015,21 @@ class Cntl(object):
        # Cases
        # --------
         # Get list of indices.
-        I = self.x.GetIndices(**kw)
-        # Get the case names.
-        fruns = self.x.GetFullFolderNames(I)
+        with trace.span("GetIndices"):
+            I = self.x.GetIndices(**kw)
+            # Get the case names.
+            fruns = self.x.GetFullFolderNames(I)
        # -------
        # Queue
        # -------
         # Get the qstat info (safely; do not raise an exception).
-        if qSlurm:
-            # Slurm: squeue
-            jobs = queue.squeue(u=kw.get('u'))
-        else:
-            # PBS: qstat
-            jobs = queue.qstat(u=kw.get('u'))
+        with trace.span("queue"):
+            if qSlurm:
+                # Slurm: squeue
+                jobs = queue.squeue(u=kw.get('u'))
+            else:
+                # PBS: qstat
+                jobs = queue.qstat(u=kw.get('u'))
         # Save the jobs.
         self.jobs = jobs
        # -------------
@@ -1083,15 +1099,19 @@ class Cntl(object):
                 continue
            # --- Status ---
             # Check status.
-            sts = self.CheckCaseStatus(i, jobs, u=kw.get('u'))
+            with trace.span("CheckCaseStatus", i=i):
+                sts = self.CheckCaseStatus(i, jobs, u=kw.get('u'))
             # Get active job number.
-            jobID = self.GetPBSJobID(i)
+            with trace.span("GetPBSJobID", i=i):
+                jobID = self.GetPBSJobID(i)
             # Append.
             total[sts] += 1
             # Get the current number of iterations
-            n = self.CheckCase(i)
+            with trace.span("CheckCase", i=i):
+                n = self.CheckCase(i)
             # Get CPU hours
-            t = self.GetCPUTime(i, running=(sts=='RUN'))
+            with trace.span("GetCPUTime", i=i):
+                t = self.GetCPUTime(i, running=(sts=='RUN'))
             # Convert to string
             if t is None:
                 # Empty string
@@ -1107,7 +1127,8 @@ class Cntl(object):
             else:
                 # Case is prepared and might be running.
                 # Get last iteration.
-                nMax = self.GetLastIter(i)
+                with trace.span("GetLastIter", i=i):
+                    nMax = self.GetLastIter(i)
                 # Iteration string
                 itr = "%i/%i" % (n, nMax)
                 # Check the queue.
@@ -1152,10 +1173,12 @@ class Cntl(object):
             # If submitting is allowed, check the job status.
             if (sts in stat_submit) and self.FilterUser(i, **kw):
                 # Prepare the job.
-                self.PrepareCase(i)
+                with trace.span("PrepareCase", i=i):
+                    self.PrepareCase(i)
                 # Start (submit or run) case
                 if q_strt:
-                    self.StartCase(i)
+                    with trace.span("StartCase", i=i):
+                        self.StartCase(i)
                 # Increase job number
                 nSub += 1
             # Revert to original optons
@@ -2263,6 +2286,7 @@ class Cntl(object):
    # =========
    # <
     # Function to archive results and remove files
+    @trace.traced
     @run_rootdir
     def ArchiveCases(self, **kw):
         r"""Archive completed cases and clean them up if specified
@@ -2277,14 +2301,23 @@ class Cntl(object):
                 List of constraints
             *I*: :class:`list`\ [:class:`int`]
                 List of indices
+            *j*: {``1``} | :class:`int`
+                Number of cases to archive concurrently
         :Versions:
             * 2016-12-09 ``@ddalle``: Version 1.0
+            * 2026-10-19 ``@ddalle``: Version 1.1; add *j* option
         """
         # Get the format
         fmt = self.opts.get_ArchiveAction()
         # Check for directive not to archive
         if not fmt or not self.opts.get_ArchiveFolder():
             return
+        # Option to only write log
+        phantom = kw.get("phantom", False)
+        # Number of concurrent cases
+        nproc = util.get_nproc(kw.get("j"))
+        # List of cases to archive concurrently
+        tasks = []
         # Loop through folders
         for i in self.x.GetIndices(**kw):
             # Go to root folder
@@ -2298,17 +2331,53 @@ class Cntl(object):
                 print("  Folder does not exist.")
                 continue
             # Get status
-            sts = self.CheckCaseStatus(i)
-            # Enter the case folder
-            os.chdir(frun)
-            # Perform cleanup
+            with trace.span("CheckCaseStatus", i=i):
+                sts = self.CheckCaseStatus(i)
+            # Archive task
+            task = (frun, sts in ('PASS', 'ERROR'), phantom)
+            # Archive now if running serially
+            if nproc == 1:
+                self._archive_case(task)
+            else:
+                tasks.append(task)
+        # Archive remaining cases concurrently
+        with trace.span("pmap", n=len(tasks), nproc=nproc):
+            util.pmap(self._archive_case, tasks, nproc)
+
+    # Archive one case, possibly in a worker process
+    def _archive_case(self, task):
+        r"""Clean and, if ready, archive one case
+
+        :Call:
+            >>> cntl._archive_case((frun, q, phantom))
+        :Inputs:
+            *cntl*: :class:`cape.cntl.Cntl`
+                Instance of overall control interface
+            *frun*: :class:`str`
+                Name of case folder
+            *q*: ``True`` | ``False``
+                Whether case is ready to archive
+            *phantom*: ``True`` | ``False``
+                Option to write actions to ``archive.log`` only
+        :Versions:
+            * 2026-10-19 ``@ddalle``: Version 1.0
+        """
+        # Unpack
+        frun, q, phantom = task
+        # Enter the case folder
+        os.chdir(os.path.join(self.RootDir, frun))
+        # Perform cleanup
+        with trace.span("CleanPWD", frun=frun):
             self.CleanPWD()
-            # Check status
-            if sts not in ('PASS', 'ERROR'):
-                print("  Case is not marked PASS.")
-                continue
+        # Check status
+        if not q:
+            print("  %s: Case is not marked PASS." % frun)
+        else:
             # Archive
-            self.ArchivePWD(phantom=kw.get("phantom",False))
+            with trace.span("ArchivePWD", frun=frun):
+                self.ArchivePWD(phantom=phantom)
+        # Return to root folder
+        os.chdir(self.RootDir)
 
     # Individual case archive function
     def ArchivePWD(self, phantom=False):
@@ -4013,6 +4082,7 @@ class Cntl(object):
    # =================
    # <
     # Function to collect statistics
+    @trace.traced
     @run_rootdir
     def UpdateFM(self, **kw):
         r"""Collect force and moment data
@@ -4028,6 +4098,8 @@ class Cntl(object):
                 List of indices
             *cons*: :class:`list`\ [:class:`str`]
                 List of constraints like ``'Mach<=0.5'``
+            *j*: {``None``} | :class:`int`
+                Number of cases to process simultaneously
         :Versions:
             * 2014-12-12 ``@ddalle``: Version 1.0
             * 2014-12-22 ``@ddalle``: Version 2.0
@@ -4036,6 +4108,7 @@ class Cntl(object):
 
             * 2017-04-25 ``@ddalle``: Version 2.1, add wildcards
             * 2018-10-19 ``@ddalle``: Version 3.0, rename from Aero()
+            * 2026-10-19 ``@ddalle``: Version 3.1, add *j*
         """
         # Get component option
         comp = kw.get("fm", kw.get("aero"))
@@ -4050,10 +4123,13 @@ class Cntl(object):
             # Delete cases.
             self.DataBook.DeleteCases(I, comp=comp)
         else:
+            # Number of simultaneous cases
+            nproc = util.get_nproc(kw.get("j"))
             # Read an empty data book
-            self.ReadDataBook(comp=[])
+            with trace.span("ReadDataBook"):
+                self.ReadDataBook(comp=[])
             # Read the results and update as necessary.
-            self.DataBook.UpdateDataBook(I, comp=comp)
+            self.DataBook.UpdateDataBook(I, comp=comp, nproc=nproc)
 
     # Function to collect statistics from generic-property component
     @run_rootdir
@@ -4239,6 +4315,203 @@ class Cntl(object):
             self.DataBook.UpdateTriqPoint(I, comp=comp)
    # >
 
+    # Keep data book up to date as cases run
+    @run_rootdir
+    def WatchDataBook(self, **kw):
+        r"""Update data book repeatedly, only for cases with new data
+
+        Each pass checks the size and modification time of the
+        iterative history files (see :func:`GetCaseHistorySignature`)
+        of each case, and only cases whose files have changed since the
+        last pass are given to the data book updaters.  All changed
+        cases are processed together, so each data book file is written
+        at most once per pass, and passes are at least *watch-dt*
+        seconds apart.  The first pass processes all cases with history
+        files, like ``cape --fm``.  If an updater raises an exception,
+        the error is printed and the cases from that pass are processed
+        again on the next pass.
+
+        :Call:
+            >>> cntl.WatchDataBook(**kw)
+        :Inputs:
+            *cntl*: :class:`cape.cntl.Cntl`
+                Overall CAPE control instance
+            *fm*, *aero*: {``None``} | ``True`` | :class:`str`
+                Update FM components (default if no other type given)
+            *ll*: {``None``} | ``True`` | :class:`str`
+                Update line load components
+            *triqfm*: {``None``} | ``True`` | :class:`str`
+                Update TriqFM components
+            *pt*: {``None``} | ``True`` | :class:`str`
+                Update TriqPoint components
+            *prop*: {``None``} | ``True`` | :class:`str`
+                Update CaseProp components
+            *data*, *db*: ``True`` | {``False``}
+                Update FM, line load, TriqFM, TriqPoint, and CaseProp
+                components
+            *I*: :class:`list`\ [:class:`int`]
+                List of indices
+            *cons*: :class:`list`\ [:class:`str`]
+                List of constraints like ``'Mach<=0.5'``
+            *watch-dt*: {``30.0``} | :class:`float`
+                Minimum time between passes [s]
+            *watch-n*: {``None``} | :class:`int`
+                Maximum number of passes; default is to run until
+                interrupted
+        :Versions:
+            * 2026-10-19 ``@ddalle``: Version 1.0
+            * 2026-10-19 ``@ddalle``: Version 1.1; retry failed updates
+        """
+        # Time between passes
+        dt = float(kw.get("watch-dt", kw.get("watch_dt", 30.0)))
+        # Number of passes
+        npass = kw.get("watch-n", kw.get("watch_n"))
+        npass = None if npass is None else int(npass)
+        # Check which data book types to update
+        qdb = kw.get("data", kw.get("db"))
+        qfm = kw.get("fm", kw.get("aero"))
+        qll = kw.get("ll") or qdb
+        qtq = kw.get("triqfm") or qdb
+        qpt = kw.get("pt") or qdb
+        qcp = kw.get("prop") or qdb
+        # Default to FM
+        if not (qll or qtq or qpt or qcp):
+            qfm = qfm or True
+        elif qdb:
+            qfm = qfm or True
+        # Options for updaters
+        kwu = dict(kw)
+        for k in (
+                "data", "db", "watch", "fm", "aero",
+                "ll", "triqfm", "pt", "prop"):
+            kwu.pop(k, None)
+        # Updaters to run each pass
+        updaters = []
+        if qfm:
+            updaters.append((self.UpdateFM, "fm", qfm))
+        if qll:
+            updaters.append((self.UpdateLL, "ll", qll))
+        if qtq:
+            updaters.append((self.UpdateTriqFM, "triqfm", qtq))
+        if qpt:
+            updaters.append((self.UpdateTriqPoint, "pt", qpt))
+        if qcp:
+            updaters.append((self.UpdateCaseProp, "prop", qcp))
+        # Apply constraints
+        I = self.x.GetIndices(**kw)
+        # Signature of history files last time each case was processed
+        sigs = {}
+        # Pass counter
+        n = 0
+        # Status update
+        print("Watching %i cases for new data (Ctrl-C to stop)" % len(I))
+        try:
+            while (npass is None) or (n < npass):
+                # Start time
+                tic = time.time()
+                n += 1
+                # Find cases with new data
+                J = []
+                sigsj = {}
+                for i in I:
+                    # Get current signature
+                    sig = self.GetCaseHistorySignature(i)
+                    # Check for changes
+                    if sig and (sig != sigs.get(i)):
+                        J.append(i)
+                        sigsj[i] = sig
+                # Update data book
+                if J:
+                    print("Pass %i: updating %i cases" % (n, len(J)))
+                    # Only process changed cases
+                    kwu["I"] = J
+                    # Run each updater
+                    qerr = False
+                    for fn, k, v in updaters:
+                        # Keep watching if one updater fails
+                        try:
+                            fn(**dict(kwu, **{k: v}))
+                        except Exception:
+                            # Log the error
+                            print("Pass %i: '--%s' update failed" % (n, k))
+                            traceback.print_exc()
+                            qerr = True
+                    # Save signatures so these cases are skipped next
+                    # time, unless they need to be retried
+                    if not qerr:
+                        sigs.update(sigsj)
+                # Check for last pass
+                if (npass is not None) and (n >= npass):
+                    break
+                # Wait until next pass
+                time.sleep(max(0.0, dt - (time.time() - tic)))
+        except KeyboardInterrupt:
+            print("Stopped watching after %i passes" % n)
+
+    # Get signature of case history files
+    def GetCaseHistorySignature(self, i):
+        r"""Get size and modification time of case history files
+
+        This includes files matching the class attribute
+        *_history_files* in the case folder and its subfolders (but not
+        deeper), such as ``*.dat`` and ``*fomoco*``.
+
+        :Call:
+            >>> sig = cntl.GetCaseHistorySignature(i)
+        :Inputs:
+            *cntl*: :class:`cape.cntl.Cntl`
+                Overall CAPE control instance
+            *i*: :class:`int`
+                Case index
+        :Outputs:
+            *sig*: ``None`` | :class:`tuple`\ [:class:`tuple`]
+                Relative path, size, and modification time of each
+                file; ``None`` if case folder doesn't exist
+        :Versions:
+            * 2026-10-19 ``@ddalle``: Version 1.0
+        """
+        # Case folder
+        fdir = os.path.join(self.RootDir, self.x.GetFullFolderNames(i))
+        # Check for folder
+        if not os.path.isdir(fdir):
+            return None
+        # File patterns
+        pats = self.__class__._history_files
+        # Initialize
+        sig = []
+        # Folders to check
+        fdirs = [("", fdir)]
+        # Loop through case folder, then subfolders
+        while fdirs:
+            # Next folder
+            frel, fabs = fdirs.pop(0)
+            # Get entries
+            try:
+                entries = list(os.scandir(fabs))
+            except OSError:
+                continue
+            # Loop through entries
+            for e in entries:
+                # Check type
+                if e.is_dir():
+                    # Only go one level deep
+                    if frel == "":
+                        fdirs.append((e.name, e.path))
+                    continue
+                # Check file name
+                if not any(fnmatch.fnmatch(e.name, pat) for pat in pats):
+                    continue
+                # Get size and time
+                try:
+                    st = e.stat()
+                except OSError:
+                    continue
+                # Save it
+                sig.append(
+                    (os.path.join(frel, e.name), st.st_size, st.st_mtime_ns))
+        # Output
+        return tuple(sorted(sig))
+
    # =================
    # DataBook Checkers
    # =================
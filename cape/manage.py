@@ -129,10 +129,15 @@ directly with one function from this module.
 """
 
 # Standard library modules
+import fnmatch
+import glob
+import hashlib
+import json
 import os
 import shutil
-import glob
 import sys
+import tarfile
+import zipfile
 
 # Standard library, renamed
 import subprocess as sp
@@ -146,6 +151,7 @@ import numpy as np
 # Local modules, partial imports
 from .cfdx.options import Archive
 from .cfdx.bin     import check_output, tail
+from .cfdx import trace
 
 
 # Type helpers
@@ -322,16 +328,641 @@ def sortfiles(fglob):
     :Versions:
         * 2016-03-14 ``@ddalle``: Version 1.0
     """
-    # Time function
-    ft = lambda f: os.path.getmtime(f) if os.path.exists(f) else 0.0
-    # Initialize times
-    t = np.array([ft(f) for f in fglob])
+    # Initialize times (using cached directory listings if possible)
+    t = np.array([_getmtime_cached(f) for f in fglob])
     # Get the order
-    i = np.argsort(t)
+    i = np.argsort(t, kind="stable")
     # Return the files in order
     return [fglob[j] for j in i]
 
 
+# ----------------------------------------------------------------------------
+# DIRECTORY LISTING CACHE
+# ----------------------------------------------------------------------------
+# Cache of directory listings: {fdir: {fname: (ftype, size, mtime)}}
+_LISTDIR_CACHE = {}
+
+
+# Reset directory listing cache
+def reset_glob_cache():
+    r"""Clear the cache of directory listings used by file matching
+
+    This is called at the start of each archiving action and after any
+    action that creates or deletes files so that the next glob sees
+    the current state of each folder.
+
+    :Call:
+        >>> reset_glob_cache()
+    :Versions:
+        * 2026-10-19 ``@ddalle``: Version 1.0
+    """
+    _LISTDIR_CACHE.clear()
+
+
+# List a directory once
+def _listdir_cached(fdir):
+    r"""List a folder and stat its entries, reusing previous results
+
+    :Call:
+        >>> ls = _listdir_cached(fdir)
+    :Inputs:
+        *fdir*: :class:`str`
+            Name of folder, ``""`` for current folder
+    :Outputs:
+        *ls*: :class:`dict`\ [:class:`tuple`]
+            Type (``"f"``, ``"d"``, ``"l"``, or ``"b"`` for broken
+            link), size, and modification time for each entry
+    :Versions:
+        * 2026-10-19 ``@ddalle``: Version 1.0
+    """
+    # Normalize the key
+    fkey = os.path.abspath(fdir or ".")
+    # Check cache
+    ls = _LISTDIR_CACHE.get(fkey)
+    if ls is not None:
+        return ls
+    # Initialize listing
+    ls = {}
+    # Scan the folder (one system call per entry at most)
+    try:
+        entries = list(os.scandir(fkey))
+    except OSError:
+        entries = []
+    # Loop through entries
+    for e in entries:
+        try:
+            if e.is_symlink():
+                # Get type of target (``stat()`` follows links)
+                try:
+                    st = e.stat()
+                    ftyp = "l"
+                except OSError:
+                    # Broken link
+                    ls[e.name] = ("b", 0, 0.0)
+                    continue
+            else:
+                # Regular file or folder
+                st = e.stat()
+                ftyp = "d" if e.is_dir() else "f"
+        except OSError:
+            continue
+        # Save type, size, and mtime
+        ls[e.name] = (ftyp, st.st_size, st.st_mtime)
+    # Save it
+    _LISTDIR_CACHE[fkey] = ls
+    # Output
+    return ls
+
+
+# Get stat info for one file from the cache
+def _stat_cached(fname):
+    r"""Get cached type, size, and mod time of a file
+
+    :Call:
+        >>> ftyp, size, mtime = _stat_cached(fname)
+    :Inputs:
+        *fname*: :class:`str`
+            Name of file
+    :Outputs:
+        *ftyp*: ``None`` | ``"f"`` | ``"d"`` | ``"l"`` | ``"b"``
+            File type; ``None`` if *fname* does not exist
+        *size*: :class:`int`
+            Size of file in bytes
+        *mtime*: :class:`float`
+            Modification time
+    :Versions:
+        * 2026-10-19 ``@ddalle``: Version 1.0
+    """
+    # Split folder
+    fdir, fn = os.path.split(os.path.normpath(fname))
+    # Get listing
+    return _listdir_cached(fdir).get(fn, (None, 0, 0.0))
+
+
+# Get mod time from cache
+def _getmtime_cached(fname):
+    r"""Get the mod time of a file using cached directory listings
+
+    :Call:
+        >>> t = _getmtime_cached(fname)
+    :Inputs:
+        *fname*: :class:`str`
+            Name of file
+    :Outputs:
+        *t*: :class:`float`
+            Modification time, ``0.0`` if *fname* does not exist
+    :Versions:
+        * 2026-10-19 ``@ddalle``: Version 1.0
+    """
+    return _stat_cached(fname)[2]
+
+
+# Glob using cached listing of folder
+@trace.traced(name="glob")
+def _glob(fglob):
+    r"""Expand a file name pattern using cached directory listings
+
+    This matches :func:`glob.glob` for patterns whose folder part does
+    not contain wildcards; other patterns use :func:`glob.glob`
+    directly.
+
+    :Call:
+        >>> fnames = _glob(fglob)
+    :Inputs:
+        *fglob*: :class:`str`
+            File name pattern
+    :Outputs:
+        *fnames*: :class:`list`\ [:class:`str`]
+            List of matching files and folders
+    :Versions:
+        * 2026-10-19 ``@ddalle``: Version 1.0
+    """
+    # Split folder
+    fdir, fpat = os.path.split(fglob)
+    # Check for wildcards in folder name
+    if glob.has_magic(fdir) or not fpat:
+        return glob.glob(fglob)
+    # Get folder listing
+    ls = _listdir_cached(fdir)
+    # Check for literal file name
+    if not glob.has_magic(fpat):
+        return [fglob] if fpat in ls else []
+    # Hidden files only if explicitly requested
+    qhidden = fpat.startswith(".")
+    # Filter
+    fnames = [
+        fn for fn in fnmatch.filter(list(ls.keys()), fpat)
+        if qhidden or not fn.startswith(".")
+    ]
+    # Prepend folder name
+    return [os.path.join(fdir, fn) for fn in fnames]
+
+
+# ----------------------------------------------------------------------------
+# IN-PROCESS ARCHIVES
+# ----------------------------------------------------------------------------
+# Name of manifest file
+ARCHIVE_MANIFEST = "archive.manifest.json"
+# Block size for checksums
+_HASH_BLOCK = 1048576
+
+
+# File-like wrapper to compute checksums while writing
+class _HashWriter(object):
+    r"""Writable file wrapper that computes size and SHA-1 checksum
+
+    :Call:
+        >>> fw = _HashWriter(fp)
+    :Inputs:
+        *fp*: :class:`file`
+            File handle open for writing in binary mode
+    :Versions:
+        * 2026-10-19 ``@ddalle``: Version 1.0
+    """
+    def __init__(self, fp):
+        self.fp = fp
+        self.hash = hashlib.sha1()
+        self.size = 0
+
+    def write(self, b):
+        self.hash.update(b)
+        self.size += len(b)
+        return self.fp.write(b)
+
+    def flush(self):
+        self.fp.flush()
+
+
+# Checksum of a file
+def sha1sum(fname):
+    r"""Compute the SHA-1 checksum of a file in blocks
+
+    :Call:
+        >>> h = sha1sum(fname)
+    :Inputs:
+        *fname*: :class:`str`
+            Name of file
+    :Outputs:
+        *h*: :class:`str`
+            Hexadecimal SHA-1 digest
+    :Versions:
+        * 2026-10-19 ``@ddalle``: Version 1.0
+    """
+    # Initialize hash
+    h = hashlib.sha1()
+    # Read file in blocks
+    with open(fname, 'rb') as fp:
+        for b in iter(lambda: fp.read(_HASH_BLOCK), b''):
+            h.update(b)
+    # Output
+    return h.hexdigest()
+
+
+# Get mode for :mod:`tarfile` from command
+def _get_tarmode(cmd):
+    r"""Convert an archive command to a :mod:`tarfile` mode
+
+    :Call:
+        >>> mode = _get_tarmode(cmd)
+    :Inputs:
+        *cmd*: :class:`list`\ [:class:`str`]
+            Archive command, e.g. ``["tar", "-czf"]``
+    :Outputs:
+        *mode*: ``"zip"`` | ``"w|"`` | ``"w|gz"`` | ``"w|bz2"`` | ``"a"``
+            Streaming :func:`tarfile.open` mode or ``"zip"``
+    :Versions:
+        * 2026-10-19 ``@ddalle``: Version 1.0
+    """
+    # Check for zip
+    if cmd[0] == "zip":
+        return "zip"
+    # Get flags
+    flags = cmd[-1] if len(cmd) > 1 else "-cf"
+    # Check for update
+    if "u" in flags or "r" in flags:
+        return "a"
+    elif "z" in flags:
+        return "w|gz"
+    elif "j" in flags:
+        return "w|bz2"
+    elif "J" in flags:
+        return "w|xz"
+    else:
+        return "w|"
+
+
+# Create an archive in-process
+@trace.traced(name="tar")
+def tar_files(cmd, ftar, fnames):
+    r"""Create or update an archive without calling an external program
+
+    New archives are streamed (with compression, if any) into a
+    temporary file and renamed when complete, so an interrupted run
+    never leaves a truncated archive in place.
+
+    :Call:
+        >>> size, h = tar_files(cmd, ftar, fnames)
+    :Inputs:
+        *cmd*: :class:`list`\ [:class:`str`]
+            Archive command, e.g. ``["tar", "-czf"]``
+        *ftar*: :class:`str`
+            Name of archive to create
+        *fnames*: :class:`list`\ [:class:`str`]
+            Files and folders to add (folders are added recursively)
+    :Outputs:
+        *size*: :class:`int`
+            Size of archive in bytes
+        *h*: :class:`str`
+            SHA-1 checksum of archive
+    :Versions:
+        * 2026-10-19 ``@ddalle``: Version 1.0
+        * 2026-10-19 ``@ddalle``: Version 1.1; replace zip entries
+        * 2026-10-19 ``@ddalle``: Version 1.2; replace tar members
+    """
+    # Get mode
+    mode = _get_tarmode(cmd)
+    # Check for zip or update modes, which require seekable files
+    if mode == "zip":
+        # Update or create zip archive
+        _zip_files(ftar, fnames)
+        # Get checksum
+        return os.path.getsize(ftar), sha1sum(ftar)
+    elif mode == "a":
+        # Update tar, replacing existing members
+        return _tar_update(ftar, fnames)
+    # Temporary file name
+    ftmp = ftar + ".part"
+    # Stream archive into temporary file
+    try:
+        with open(ftmp, 'wb') as fp:
+            # Wrap file to compute checksum while writing
+            fw = _HashWriter(fp)
+            # Open stream
+            with tarfile.open(fileobj=fw, mode=mode) as tar:
+                for fname in fnames:
+                    tar.add(fname)
+    except Exception:
+        # Clean up partial file
+        if os.path.isfile(ftmp):
+            os.remove(ftmp)
+        raise
+    # Move into place
+    os.replace(ftmp, ftar)
+    # Output
+    return fw.size, fw.hash.hexdigest()
+
+
+# Update a tar archive
+def _tar_update(ftar, fnames):
+    r"""Write files to a tar archive, replacing any existing members
+
+    Unlike appending to the archive, members already in *ftar* are
+    replaced rather than added a second time, so repeated updates do
+    not grow the archive.  Members of *ftar* that are not among the new
+    files are kept (only the last copy if a name appears more than
+    once).  The new archive is written to a temporary file and renamed
+    when complete.
+
+    :Call:
+        >>> size, h = _tar_update(ftar, fnames)
+    :Inputs:
+        *ftar*: :class:`str`
+            Name of archive to create or update
+        *fnames*: :class:`list`\ [:class:`str`]
+            Files and folders to add (folders are added recursively)
+    :Outputs:
+        *size*: :class:`int`
+            Size of archive in bytes
+        *h*: :class:`str`
+            SHA-1 checksum of archive
+    :Versions:
+        * 2026-10-19 ``@ddalle``: Version 1.0
+    """
+    # Names of new members
+    arcnames = set()
+
+    # Filter to record names of new members
+    def _addname(tarinfo):
+        arcnames.add(tarinfo.name)
+        return tarinfo
+
+    # Temporary file name
+    ftmp = ftar + ".part"
+    # Write new archive
+    try:
+        with open(ftmp, 'wb') as fp:
+            # Wrap file to compute checksum while writing
+            fw = _HashWriter(fp)
+            # Open stream
+            with tarfile.open(fileobj=fw, mode="w|") as tar:
+                # Add new files
+                for fname in fnames:
+                    tar.add(fname, filter=_addname)
+                # Copy members of existing archive not being replaced
+                if os.path.isfile(ftar):
+                    with tarfile.open(ftar, "r") as tar0:
+                        # Last copy of each member
+                        members = {}
+                        for info in tar0.getmembers():
+                            members.pop(info.name, None)
+                            members[info.name] = info
+                        # Copy them
+                        for info in members.values():
+                            # Skip replaced members
+                            if info.name in arcnames:
+                                continue
+                            # Copy contents, if any
+                            if info.isreg():
+                                tar.addfile(info, tar0.extractfile(info))
+                            else:
+                                tar.addfile(info)
+    except Exception:
+        # Clean up partial file
+        if os.path.isfile(ftmp):
+            os.remove(ftmp)
+        raise
+    # Move into place
+    os.replace(ftmp, ftar)
+    # Output
+    return fw.size, fw.hash.hexdigest()
+
+
+# Create or update a zip archive
+def _zip_files(ftar, fnames):
+    r"""Write files to a zip archive, replacing any existing entries
+
+    Like ``zip -r``, files already in *ftar* are replaced rather than
+    added a second time.  The new archive is written to a temporary
+    file and renamed when complete.
+
+    :Call:
+        >>> _zip_files(ftar, fnames)
+    :Inputs:
+        *ftar*: :class:`str`
+            Name of archive to create or update
+        *fnames*: :class:`list`\ [:class:`str`]
+            Files and folders to add (folders are added recursively)
+    :Versions:
+        * 2026-10-19 ``@ddalle``: Version 1.0
+    """
+    # Expand folders
+    fzips = []
+    for fname in fnames:
+        if os.path.isdir(fname) and not os.path.islink(fname):
+            # Walk through folder
+            for fdir, _, fls in os.walk(fname):
+                fzips.append(fdir)
+                for fn in fls:
+                    fzips.append(os.path.join(fdir, fn))
+        else:
+            fzips.append(fname)
+    # Names of new entries in the archive
+    arcnames = set(zipfile.ZipInfo.from_file(fn).filename for fn in fzips)
+    # Temporary file name
+    ftmp = ftar + ".part"
+    # Write new archive
+    try:
+        with zipfile.ZipFile(ftmp, "w", zipfile.ZIP_DEFLATED) as fz:
+            # Copy entries of existing archive that aren't being replaced
+            if os.path.isfile(ftar):
+                with zipfile.ZipFile(ftar, "r") as fz0:
+                    for info in fz0.infolist():
+                        # Skip replaced entries
+                        if info.filename in arcnames:
+                            continue
+                        # Copy contents without decompressing to memory
+                        with fz0.open(info) as fr, fz.open(info, "w") as fw:
+                            shutil.copyfileobj(fr, fw)
+            # Add new files
+            for fn in fzips:
+                fz.write(fn)
+    except Exception:
+        # Clean up partial file
+        if os.path.isfile(ftmp):
+            os.remove(ftmp)
+        raise
+    # Move into place
+    os.replace(ftmp, ftar)
+
+
+# Filter for extracting members of tar archives
+def _untar_filter(member, path):
+    r"""Check a tar member using the ``"data"`` extraction filter
+
+    Symbolic links in link archives usually point outside the case
+    folder (e.g. to the mesh in the group folder), so their targets
+    are checked with the less strict ``"tar"`` filter.  Member names
+    are still required to stay inside *path*.
+
+    :Call:
+        >>> member = _untar_filter(member, path)
+    :Inputs:
+        *member*: :class:`tarfile.TarInfo`
+            Archive member
+        *path*: :class:`str`
+            Destination folder
+    :Outputs:
+        *member*: :class:`tarfile.TarInfo`
+            Filtered member
+    :Versions:
+        * 2026-10-19 ``@ddalle``: Version 1.0
+    """
+    # Check for symbolic link
+    if member.issym():
+        return tarfile.tar_filter(member, path)
+    else:
+        return tarfile.data_filter(member, path)
+
+
+# Extract an archive in-process
+def untar_file(ftar):
+    r"""Extract a tar or zip archive into the current folder
+
+    :Call:
+        >>> untar_file(ftar)
+    :Inputs:
+        *ftar*: :class:`str`
+            Name of archive to extract
+    :Versions:
+        * 2026-10-19 ``@ddalle``: Version 1.0
+        * 2026-10-19 ``@ddalle``: Version 1.1; use extraction filter
+    """
+    # Check type
+    if zipfile.is_zipfile(ftar):
+        with zipfile.ZipFile(ftar, "r") as fz:
+            fz.extractall()
+    else:
+        # Autodetect compression; stream to avoid seeking
+        with tarfile.open(ftar, "r|*") as tar:
+            # Use extraction filters if available
+            if hasattr(tarfile, "data_filter"):
+                tar.extractall(filter=_untar_filter)
+            else:
+                tar.extractall()
+
+
+# Read manifest
+def read_manifest(fdir="."):
+    r"""Read the archive manifest from a folder
+
+    :Call:
+        >>> manifest = read_manifest(fdir=".")
+    :Inputs:
+        *fdir*: {``"."``} | :class:`str`
+            Folder containing archives
+    :Outputs:
+        *manifest*: :class:`dict`\ [:class:`dict`]
+            Files, sizes, and checksum for each archive in *fdir*
+    :Versions:
+        * 2026-10-19 ``@ddalle``: Version 1.0
+    """
+    # Name of file
+    fjson = os.path.join(fdir, ARCHIVE_MANIFEST)
+    # Check for file
+    if not os.path.isfile(fjson):
+        return {}
+    # Read it; treat bad files as empty
+    try:
+        with open(fjson) as fp:
+            return json.load(fp)
+    except ValueError:
+        return {}
+
+
+# Save manifest entry
+def update_manifest(ftar, fsig, size, h):
+    r"""Record the contents and checksum of an archive in its manifest
+
+    :Call:
+        >>> update_manifest(ftar, fsig, size, h)
+    :Inputs:
+        *ftar*: :class:`str`
+            Name of archive
+        *fsig*: :class:`list`\ [:class:`list`]
+            Name, size, and mod time of each source file
+        *size*: :class:`int`
+            Size of archive
+        *h*: :class:`str`
+            SHA-1 checksum of archive
+    :Versions:
+        * 2026-10-19 ``@ddalle``: Version 1.0
+    """
+    # Split folder
+    fdir, fn = os.path.split(ftar)
+    # Read current manifest
+    manifest = read_manifest(fdir or ".")
+    # Update entry
+    manifest[fn] = {
+        "files": fsig,
+        "size": size,
+        "sha1": h,
+    }
+    # Name of file
+    fjson = os.path.join(fdir, ARCHIVE_MANIFEST)
+    # Write to temporary file and move into place
+    with open(fjson + ".part", 'w') as fp:
+        json.dump(manifest, fp, indent=1)
+    os.replace(fjson + ".part", fjson)
+
+
+# Signature of a list of files
+def get_filesig(fnames):
+    r"""Get list of names, sizes, and mod times of files
+
+    :Call:
+        >>> fsig = get_filesig(fnames)
+    :Inputs:
+        *fnames*: :class:`list`\ [:class:`str`]
+            List of file names
+    :Outputs:
+        *fsig*: :class:`list`\ [:class:`list`]
+            Name, size, and mod time of each file
+    :Versions:
+        * 2026-10-19 ``@ddalle``: Version 1.0
+    """
+    # Initialize
+    fsig = []
+    # Loop through files
+    for fname in fnames:
+        # Get cached info
+        _, size, mtime = _stat_cached(fname)
+        # Save it
+        fsig.append([fname, size, mtime])
+    # Output
+    return fsig
+
+
+# Check if an archive is already up-to-date
+def check_manifest(ftar, fsig):
+    r"""Check if an archive matches its manifest entry
+
+    :Call:
+        >>> q = check_manifest(ftar, fsig)
+    :Inputs:
+        *ftar*: :class:`str`
+            Name of archive
+        *fsig*: :class:`list`\ [:class:`list`]
+            Name, size, and mod time of each source file
+    :Outputs:
+        *q*: ``True`` | ``False`` | ``None``
+            Whether *ftar* is up-to-date; ``None`` if no manifest entry
+    :Versions:
+        * 2026-10-19 ``@ddalle``: Version 1.0
+    """
+    # Split folder
+    fdir, fn = os.path.split(ftar)
+    # Read manifest
+    entry = read_manifest(fdir or ".").get(fn)
+    # Check for entry
+    if entry is None:
+        return None
+    # Check that archive is still present and has recorded size
+    if _stat_cached(ftar)[1] != entry.get("size"):
+        return False
+    # Compare sources
+    return entry.get("files") == fsig
+
+
 # Archive group
 def process_ArchiveGroup(grp):
     r"""Process an archive group, which has a precise format
@@ -447,7 +1078,7 @@ def GetSearchDirs(fsub=None, fsort=None):
         # Ensure string
         if type(fi).__name__ not in ['str', 'unicode']: continue
         # Get the matching glob
-        fglob = glob.glob(fi)
+        fglob = _glob(fi)
         # Loop through matches
         for fdir in fglob:
             # Make sure it's a directory
@@ -516,7 +1147,7 @@ def GetMatches(fname,
             # Prepend the folder name to the file name glob
             fn = os.path.join(fdir, fname)
         # Apply the glob
-        fglobn = glob.glob(fn)
+        fglobn = _glob(fn)
         # Sort it
         if fsort is None:
             # Default sorting function
@@ -835,6 +1466,8 @@ def DeleteFiles(fdel, fsub=None, n=1, phantom=False):
         if phantom: continue
         # Delete it.
         os.remove(fn)
+    # Folder contents changed
+    reset_glob_cache()
 
 
 # Function to delete all files *except* specified list
@@ -912,6 +1545,8 @@ def DeleteFilesExcept(fskel, dskel=[], fsub=None, n=0, phantom=False):
                 continue
             # Delete it
             os.remove(fn)
+    # Folder contents changed
+    reset_glob_cache()
 
 
 # Function to delete all files *except* specified list
@@ -978,6 +1613,8 @@ def TailFiles(ftail, fsub=None, n=1, phantom=False):
                 f.write(txt)
             # Delete input file
             if os.path.isfile(fn): os.remove(fn)
+    # Folder contents changed
+    reset_glob_cache()
 
 
 # ----------------------------------------------------------------------------
@@ -1002,6 +1639,8 @@ def ManageFilesProgress(opts=None, fsub=None, phantom=False):
     """
     # Convert options
     opts = Archive.auto_Archive(opts)
+    # Start with fresh directory listings
+    reset_glob_cache()
     # Perform actions
     ProgressDeleteFiles(opts, fsub=fsub, phantom=phantom)
     ProgressUpdateFiles(opts, fsub=fsub, phantom=phantom)
@@ -1029,6 +1668,8 @@ def ManageFilesPre(opts=None, fsub=None, phantom=False):
     """
     # Convert options
     opts = Archive.auto_Archive(opts)
+    # Start with fresh directory listings
+    reset_glob_cache()
     # Perform actions
     PreDeleteFiles(opts, fsub=fsub, phantom=phantom)
     PreUpdateFiles(opts, fsub=fsub, phantom=phantom)
@@ -1056,6 +1697,8 @@ def ManageFilesPost(opts=None, fsub=None, phantom=False):
     """
     # Convert options
     opts = Archive.auto_Archive(opts)
+    # Start with fresh directory listings
+    reset_glob_cache()
     # Perform actions
     PostDeleteFiles(opts, fsub=fsub, phantom=phantom)
     PostUpdateFiles(opts, fsub=fsub, phantom=phantom)
@@ -1134,6 +1777,8 @@ def ArchiveFolder(opts, fsub=[], phantom=False):
     # Ensure folder exists
     CreateArchiveFolder(opts)
     CreateArchiveCaseFolder(opts)
+    # Start with fresh directory listings
+    reset_glob_cache()
 
     # Get the archive format, extension, and command
     fmt  = opts.get_ArchiveFormat()
@@ -1148,7 +1793,7 @@ def ArchiveFolder(opts, fsub=[], phantom=False):
         # Archive entire folder
         ArchiveCaseWhole(opts)
         # Post-archiving file management
-        MangeFilesPost(opts, fsub=fsub)
+        ManageFilesPost(opts, fsub=fsub)
     else:
         # Partial archive; create folder containing several files
         # Form destination folder name
@@ -1229,6 +1874,9 @@ def UnarchiveFolder(opts):
         fglob = check_output(cmd).strip().split('\n')
         # Loop through files
         for fname in fglob:
+            # Skip archive bookkeeping
+            if fname == ARCHIVE_MANIFEST:
+                continue
             # Remote file name
             fsrc = os.path.join(fdir, fname)
             # Check if file is a tar ball
@@ -1242,9 +1890,7 @@ def UnarchiveFolder(opts):
                 # Status update
                 print("  %s %s" % (' '.join(cmdu), fname))
                 # Untar
-                ierr = sp.call([cmdu, fname])
-                if ierr:
-                    raise SystemError("Untar command failed.")
+                untar_file(fname)
             else:
                 # Single file
                 # Check dates
@@ -1271,6 +1917,9 @@ def UnarchiveFolder(opts):
         fglob = os.listdir(fdir)
         # Loop through files
         for fname in fglob:
+            # Skip archive bookkeeping
+            if fname == ARCHIVE_MANIFEST:
+                continue
             # Remote file name
             fsrc = os.path.join(fdir, fname)
             # Check if file is a tar ball
@@ -1278,8 +1927,7 @@ def UnarchiveFolder(opts):
                 # Status pdate
                 print("  %s ARCHIVE/%s" % (' '.join(cmdu), fname))
                 # Untar without copying
-                ierr = sp.call(cmdu + [fsrc])
-                if ierr: raise SystemError("Untar command failed.")
+                untar_file(fsrc)
             else:
                 # Single file
                 if os.path.isfile(fname) and getmtime(fname) > getmtime(fsrc):
@@ -1467,9 +2115,7 @@ def ArchiveCaseWhole(opts):
         # Status update
         print("  %s --> %s" % (fdir, ftar))
         # Tar the folder locally.
-        ierr = sp.call(cmdu + [ftar, fdir])
-        if ierr:
-            raise SystemError("Archiving failed.")
+        tar_files(cmdu, ftar, [fdir])
         # Status update
         print("  %s --> %s" % (ftar, frtar))
         # Remote copy
@@ -1485,9 +2131,7 @@ def ArchiveCaseWhole(opts):
         # Status update
         print("  %s --> %s" % (fdir, ftar))
         # Tar the folder.
-        ierr = sp.call(cmdu + [ftar, fdir])
-        if ierr:
-            raise SystemError("Archiving failed.")
+        tar_files(cmdu, ftar, [fdir])
 
     # Return to folder
     os.chdir(fdir)
@@ -1549,9 +2193,7 @@ def UnarchiveCaseWhole(opts):
         # Status update
         print("  %s --> %s" % (ftar, fdir))
         # Unarchive
-        ierr = sp.call(cmdu + [ftar])
-        if ierr:
-            raise SystemError("Unarchiving failed.")
+        untar_file(ftar)
     else:
         # Name of archive
         ftar = os.path.join(flfe, fgrp, '%s.%s'%(fdir, ext))
@@ -1562,9 +2204,7 @@ def UnarchiveCaseWhole(opts):
         # Status update
         print("  %s --> %s" % (ftar, fdir))
         # Untar the folder
-        ierr = sp.call(cmdu + [ftar])
-        if ierr:
-            raise SystemError("Unarchiving failed.")
+        untar_file(ftar)
 
     # Return to folder
     os.chdir(fdir)
@@ -1603,13 +2243,19 @@ def DeleteDirs(fdel, fsub=None, n=1, phantom=False):
         if phantom: continue
         # Delete the folder
         shutil.rmtree(fn)
+    # Folder contents changed
+    reset_glob_cache()
 
 
 # Archive groups
 def TarGroup(cmd, ftar, fname, n=0, clean=False):
     r"""Archive a group of files and delete the files
 
-    Only the present folder will searched for file name matches
+    Only the present folder will searched for file name matches.  The
+    archive is created in-process using :func:`tar_files`, and its
+    contents and checksum are recorded in the manifest in the folder
+    containing *ftar*.  If the manifest shows that the group has not
+    changed, the archive is not rebuilt.
 
     :Call:
         >>> TarGroup(cmd, ftar, fname, clean=False)
@@ -1625,6 +2271,7 @@ def TarGroup(cmd, ftar, fname, n=0, clean=False):
     :Versions:
         * 2016-03-01 ``@ddalle``: Version 1.0
         * 2016-03-14 ``@ddalle``: Version 2.0; generalized
+        * 2026-10-19 ``@ddalle``: Version 3.0; in-process w/ manifest
     """
     # Check input
     if not isinstance(cmd, list):
@@ -1637,6 +2284,10 @@ def TarGroup(cmd, ftar, fname, n=0, clean=False):
     fglob = [f for f in fglob if not f.endswith(ext)]
     # Exit if not matches
     if len(fglob) < 2: return
+    # Get names, sizes, and mod times of sources
+    fsig = get_filesig(fglob)
+    # Check manifest
+    qman = check_manifest(ftar, fsig)
     # Get modification times
     tsrc = getmtime_glob(fglob)
     tto = getmtime(ftar)
@@ -1644,7 +2295,10 @@ def TarGroup(cmd, ftar, fname, n=0, clean=False):
     if (tsrc is None):
         # No files to copy
         return
-    elif (tto is not None) and (tto >= tsrc):
+    elif qman:
+        # Archive matches manifest
+        return
+    elif (qman is None) and (tto is not None) and (tto >= tsrc):
         # Archive is up-to-date
         return
     # Create command
@@ -1653,10 +2307,16 @@ def TarGroup(cmd, ftar, fname, n=0, clean=False):
     write_log('  ' + ' '.join(cmdc))
     # Status update
     print("  tar -cf ARCHIVE/%s" % os.path.split(ftar)[-1])
-    # Run the command
-    ierr = sp.call(cmdc)
-    # Exit if unsuccessful
-    if ierr: return
+    # Create the archive
+    try:
+        size, h = tar_files(cmd, ftar, fglob)
+    except (OSError, tarfile.TarError, zipfile.BadZipfile) as e:
+        # Report failure and leave the files in place
+        write_log('  FAILED: %s' % e)
+        print("  Archiving failed: %s" % e)
+        return
+    # Save manifest entry
+    update_manifest(ftar, fsig, size, h)
     # Check clean-up flag
     if not clean: return
     # Delete matches
@@ -1664,6 +2324,8 @@ def TarGroup(cmd, ftar, fname, n=0, clean=False):
         if isfile(fn):
             write_log('  rm %s' % fn)
             os.remove(fn)
+    # Folder contents changed
+    reset_glob_cache()
 
 
 # Tar all links
@@ -1681,34 +2343,38 @@ def TarLinks(cmd, ext, clean=True):
             Whether or not to clean up after archiving
     :Versions:
         * 2016-03-01 ``@ddalle``: Version 1.0
+        * 2026-10-19 ``@ddalle``: Version 2.0; in-process
     """
-    # Get all files
-    flist = os.listdir('.')
-    # Initialize
-    flink = []
-    # Loop through files
-    for fn in flist:
-        # Check if it's a link
-        if os.path.islink(fn): flink.append(fn)
-    # Exit if no links
-    if len(flink) < 2: return
     # Form file name for tar ball
     ftar = 'links.' + ext
-    # Remove *ftar* from this list to avoid recursions
-    fglob = [f for f in fglob if f != ftar]
+    # Get all links (from cached listing), except *ftar* itself
+    flink = [
+        fn for fn, (ftyp, _, _) in _listdir_cached("").items()
+        if ftyp in ("l", "b") and fn != ftar
+    ]
+    # Exit if no links
+    if len(flink) < 2: return
     # Create command
     cmdc = cmd + [ftar] + flink
     # Write command to log
     write_log('  ' + ' '.join(cmdc))
-    # Run command
-    ierr = sp.call(cmdc)
-    # Exit if unsuccessful
-    if ierr: return
+    # Create archive
+    try:
+        size, h = tar_files(cmd, ftar, flink)
+    except (OSError, tarfile.TarError, zipfile.BadZipfile) as e:
+        write_log('  FAILED: %s' % e)
+        return
+    # Save manifest entry
+    update_manifest(ftar, get_filesig(flink), size, h)
+    # Check clean-up flag
+    if not clean: return
     # Delete links
     for fn in flink:
         if os.path.islink(fn):
             write_log('  rm %s' % fn)
             os.remove(fn)
+    # Folder contents changed
+    reset_glob_cache()
 
 
 # Tar a folder
@@ -1728,21 +2394,29 @@ def TarDir(cmd, ftar, fdir, clean=True):
             Whether or not to delete folder afterwards
     :Versions:
         * 2016-03-01 ``@ddalle``: Version 1.0
+        * 2026-10-19 ``@ddalle``: Version 2.0; in-process w/ manifest
     """
     # Check if the folder exists
     if not os.path.isdir(fdir): return
     # List of files to in dir
-    fnames = os.listdir(fdir)
+    fnames = sorted(_listdir_cached(fdir).keys())
     # Check for anything to tar
     if len(fnames) < 1: return
+    # Get names, sizes, and mod times of contents
+    fsig = get_filesig([os.path.join(fdir, f) for f in fnames])
+    # Check manifest
+    qman = check_manifest(ftar, fsig)
     # Get the modification times
-    tto  = getmtime(ftar)
-    # Get the time from each file in the line load
-    tsrc = [getmtime(os.path.join(fdir,f)) for f in fnames]
+    tto = getmtime(ftar)
+    # Get the time from each file in the folder
+    tsrc = [t for _, _, t in fsig]
     # Check options for already-existing archives
-    if tto:
+    if qman:
+        # Archive matches manifest
+        return
+    elif tto:
         # Check if archive is already up to date
-        if tto >= max(tsrc): return
+        if qman is None and tto >= max(tsrc): return
         # Ensure we use "update" tar option
         if cmd == ["tar", "-cf"]:
             # Change the command to "-uf" for an update
@@ -1750,19 +2424,26 @@ def TarDir(cmd, ftar, fdir, clean=True):
     # Create command
     cmdc = cmd + [ftar, fdir]
     # Status update
-    cmd = "  %s ARCHIVE/%s %s" % (' '.join(cmd), os.path.split(ftar)[1], fdir)
-    print(cmd)
-    write_log(cmd)
-    # Run the command
-    ierr = sp.call(cmdc)
-    # Exit if unsuccessful
-    if ierr: return
+    cmd1 = "  %s ARCHIVE/%s %s" % (' '.join(cmd), os.path.split(ftar)[1], fdir)
+    print(cmd1)
+    write_log(cmd1)
+    # Create the archive
+    try:
+        size, h = tar_files(cmd, ftar, [fdir])
+    except (OSError, tarfile.TarError, zipfile.BadZipfile) as e:
+        write_log('  FAILED: %s' % e)
+        print("  Archiving failed: %s" % e)
+        return
+    # Save manifest entry
+    update_manifest(ftar, fsig, size, h)
     # Check for clean flag
     if not clean: return
     # Delete the folder
     if os.path.isdir(fdir):
         write_log('  rm -r %s' % fdir)
         shutil.rmtree(fdir)
+    # Folder contents changed
+    reset_glob_cache()
 
 
 # Untar a folder
@@ -1780,19 +2461,24 @@ def Untar(cmd, ftar):
             File name pattern or list thereof to combine into archive
     :Versions:
         * 2016-03-01 ``@ddalle``: Version 1.0
+        * 2026-10-19 ``@ddalle``: Version 2.0; in-process
     """
     # Create command
     cmdc = cmd + [ftar]
     # Log
     write_log('  ' + ' '.join(cmdc))
-    # Run the command
-    ierr = sp.call(cmdc)
-    # Exit if unsuccessful
-    if ierr: return
+    # Extract the archive
+    try:
+        untar_file(ftar)
+    except (OSError, tarfile.TarError, zipfile.BadZipfile) as e:
+        write_log('  FAILED: %s' % e)
+        return
     # Delete the folder
     if os.path.isfile(ftar):
         write_log('  rm %s' % ftar)
         os.remove(ftar)
+    # Folder contents changed
+    reset_glob_cache()
 # ----------------------------
 
 
@@ -2510,7 +3196,29 @@ def CreateArchiveFolder(opts):
         # Test locally.
         if not os.path.isdir(flfe):
             # Create it.
-            opts.mkdir(flfe)
+            _mkdir(opts, flfe)
+
+
+# Create a folder that another case may be creating simultaneously
+def _mkdir(opts, fdir):
+    r"""Create a folder, ignoring errors if it already exists
+
+    :Call:
+        >>> _mkdir(opts, fdir)
+    :Inputs:
+        *opts*: :class:`cape.cfdx.options.Options`
+            Options interface
+        *fdir*: :class:`str`
+            Name of folder to create
+    :Versions:
+        * 2026-10-19 ``@ddalle``: Version 1.0
+    """
+    try:
+        opts.mkdir(fdir)
+    except OSError:
+        # Another process may have created it in the meantime
+        if not os.path.isdir(fdir):
+            raise
 
 
 # Create archive group folders
@@ -2564,11 +3272,11 @@ def CreateArchiveCaseFolder(opts):
         # Test locally.
         if not os.path.isdir(flgrp):
             # Create it.
-            opts.mkdir(flgrp)
+            _mkdir(opts, flgrp)
         # Test for run folder
         if (ftyp!="full") and not os.path.isdir(flrun):
             # Create it.
-            opts.mkdir(flrun)
+            _mkdir(opts, flrun)
     # Return to the folder
     os.chdir(fdir)
 
@@ -2618,6 +3326,6 @@ def CreateArchiveGroupFolder(opts):
         # Test locally.
         if not os.path.isdir(flgrp):
             # Create it.
-            opts.mkdir(flgrp)
+            _mkdir(opts, flgrp)
 # -------------
 
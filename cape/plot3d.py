@@ -1226,6 +1226,8 @@ class X(object):
                 Triangulation; likely with named components
             *n*: {``1``} | positive :class:`int`
                 Grid number to process (1-based index)
+            *nproc*, *j*: {``1``} | :class:`int`
+                Number of worker processes
         :Outputs:
             *C*: :class:`np.ndarray`\ [:class:`int`]
                 * *shape*: (nj, nk, 2)
@@ -1234,11 +1236,52 @@ class X(object):
 
         :Versions:
             * 2017-02-08 ``@ddalle``: Version 1.0
+            * 2026-10-19 ``@ddalle``: Version 2.0; use MapTriCompIDs()
         """
         # Check grid number
         if n > self.NG:
             raise ValueError("Cannot process grid %i; only %s grids present"
                 % (n, self.NG))
+        # Map the one grid
+        return self.MapTriCompIDs(tri, [n], **kw)[0]
+
+    # Map surface grid points of several grids to TRI file components
+    def MapTriCompIDs(self, tri, grids=None, **kw):
+        r"""Map surface grid points of several grids to tri components
+
+        All the points of each grid are searched together using
+        :func:`cape.tri.TriBase.GetNearestTris`, and blocks of points
+        are distributed to *nproc* worker processes.
+
+        :Call:
+            >>> CC = x.MapTriCompIDs(tri, grids=None, **kw)
+        :Inputs:
+            *x*: :class:`cape.plot3d.X`
+                Plot3D grid interface
+            *tri*: :class:`cape.tri.Tri`
+                Triangulation; likely with named components
+            *grids*: {``None``} | :class:`list`\ [:class:`int`]
+                Grid numbers to process (1-based); default is all
+            *nproc*, *j*: {``1``} | :class:`int`
+                Number of worker processes
+            *v*: ``True`` | {``False``}
+                Verbose flag
+        :Outputs:
+            *CC*: :class:`list`\ [:class:`np.ndarray`]
+                Component IDs for each grid, as in :func:`MapTriCompID`
+        :Versions:
+            * 2026-10-19 ``@ddalle``: Version 1.0
+        """
+        # Default grid list
+        if grids is None:
+            grids = range(1, self.NG + 1)
+        grids = list(grids)
+        # Check grid numbers
+        for n in grids:
+            if n > self.NG:
+                raise ValueError(
+                    "Cannot process grid %i; only %s grids present"
+                    % (n, self.NG))
         # Check triangulation type
         tt = type(tri).__name__
         if not tt.startswith("Tri"):
@@ -1263,92 +1306,105 @@ class X(object):
         cnftol = kw.get("cnftol", kw.get("CompProjFamilyTol", cnftoldef))
         # Get scale of the entire triangulation
         L = tri.GetCompScale()
-        # Initialize scales of components
-        LC = {}
         # Put together absolute and relative tols
         tol   = atol   + rtol*L
         ntol  = antol  + rntol*L
         ftol  = aftol  + rftol*L
         nftol = anftol + rnftol*L
-        # Get number of points in prior grids
-        ia = np.prod(self.NJ[:n-1] * self.NK[:n-1] * self.NL[:n-1]) - 1
-        # Get number of points
-        nj = self.NJ[n-1]
-        nk = self.NK[n-1]
-        nl = self.NL[n-1]
         # Verbose flag
         v = kw.get("v", False)
-        # Initialize components for each surface grid
-        C = np.zeros((nj,nk,4), dtype=int)
-        # Loop through columns
-        for k in range(nk):
-            # Status update if verbose
+        # Number of processes
+        nproc = util.get_nproc(kw.get("nproc", kw.get("j", 1)))
+        # Start index of each grid
+        npt = self.NJ * self.NK * self.NL
+        mpt = np.append([0], np.cumsum(npt))
+        # Split grids into blocks of points to balance workers
+        mblock = max(1, int(np.sum(npt[np.array(grids) - 1])) // (4*nproc))
+        blocks = []
+        for n in grids:
+            for ia in range(mpt[n-1], mpt[n], mblock):
+                blocks.append((ia, min(mpt[n], ia + mblock)))
+        # Compute basis vectors and tri vertices before forking
+        tri.GetBasisVectors()
+        tri.GetTriNodes()
+
+        # Search function for one block
+        def search(block):
+            # Unpack point indices
+            ia, ib = block
+            # Status update
             if v:
-                print("  k = %i/%i" % (k+1,nk))
-            # Loop through rows of points
-            for j in range(nj):
-                # Get overall index
-                i = ia + k*nj + j
-                # Perform search
-                T = tri.GetNearestTri(self.X[:,i])
-                # Get components
-                c1 = T.get("c1")
-                c2 = T.get("c2")
-                c3 = T.get("c3")
-                c4 = T.get("c4")
-                # Make sure component scale is present
-                if c1 not in LC:
-                    LC[c1] = tri.GetCompScale(c1)
-                # Make sure secondary component scale is present
-                if (c2 is not None) and (c2 not in LC):
-                    LC[c2] = tri.GetCompScale(c2)
-                # Get overall tolerances
-                toli  = tol + ctol*LC[c1]
-                ntoli = ntol + cntol*LC[c1]
-                # Filter results
-                if (T["d1"] > toli) or (T["z1"] > ntoli):
-                    # Status update
-                    if v:
-                        print("   j=%s, k=%s, d1=%.2e/%.2e, z1=%.2e/%.2e"
-                            % (j,k, T["d1"],toli, T["z1"],ntoli))
-                    continue
-                # Check proximity of secondary component
-                if (c2 is not None):
-                     # Make sure secondary component scale is present
-                    if c2 not in LC:
-                        LC[c2] = tri.GetCompScale(c2)
-                    # Maximum component scale
-                    Li = max(LC[c1], LC[c2])
-                    # Get overall tolerances
-                    ftoli  = ftol  + cftol*Li
-                    nftoli = nftol + cnftol*Li
-                    # Filter family matches
-                    if (T["d2"] > ftoli) or (T["z2"] > nftoli):
-                        c2 = None
-                # Filter tertiary family proximity
-                if (c3 is not None):
-                    if (T["d3"]>ftoli) or (T["z3"]>nftoli):
-                        c3 = None
-                # Filter fourth family proximity
-                if (c4 is not None):
-                    if (T["d4"]>ftoli) or (T["z4"]>nftoli):
-                        c4 = None
-                # Save components
-                if (c2 is None):
-                    # Save primary family only
-                    C[j,k,0] = c1
-                elif (c3 is None):
-                    # Sort primary and secondary families
-                    C[j,k,0] = min(c1,c2)
-                    C[j,k,1] = max(c1,c2)
-                elif (c4 is None):
-                    # Sort primary, secondary, tertiary families
-                    C[j,k,:3] = np.sort([c1,c2,c3])
-                else:
-                    # Sort maximum of four families
-                    C[j,k,:] = np.sort([c1,c2,c3,c4])
+                print("  Points %i-%i" % (ia+1, ib))
+            # Perform search
+            return tri.GetNearestTris(self.X[:, ia:ib].T)
+
+        # Run searches
+        TT = util.pmap(search, blocks, nproc)
+        # Combine results
+        T = {}
+        for k in TT[0] if TT else []:
+            T[k] = np.hstack([Tj[k] for Tj in TT])
+        # Get components
+        c1 = T.get("c1", np.zeros(0, dtype="int"))
+        c2 = T.get("c2", np.full(c1.size, -1))
+        c3 = T.get("c3", np.full(c1.size, -1))
+        c4 = T.get("c4", np.full(c1.size, -1))
+        # Masks for secondary, etc. matches
+        q2 = c2 != -1
+        q3 = c3 != -1
+        q4 = c4 != -1
+        # Scale of each component found
+        comps = np.unique(np.hstack((c1, c2[q2])))
+        LC = np.array([tri.GetCompScale(c) for c in comps])
+        L1 = LC[np.searchsorted(comps, c1)]
+        L2 = LC[np.searchsorted(comps, np.where(q2, c2, c1))]
+        # Get overall tolerances
+        toli  = tol + ctol*L1
+        ntoli = ntol + cntol*L1
+        # Filter results
+        qskip = np.logical_or(T["d1"] > toli, T["z1"] > ntoli)
+        # Family tolerances using maximum component scale
+        Li = np.fmax(L1, L2)
+        ftoli  = ftol  + cftol*Li
+        nftoli = nftol + cnftol*Li
+        # Filter family matches
+        q2 = q2 & ~((T["d2"] > ftoli) | (T["z2"] > nftoli))
+        q3 = q3 & ~((T["d3"] > ftoli) | (T["z3"] > nftoli))
+        q4 = q4 & ~((T["d4"] > ftoli) | (T["z4"] > nftoli))
+        # Only use third family if second is used, etc.
+        q3 = q3 & q2
+        q4 = q4 & q3
+        # Sort the families, keeping unused slots at the end
+        cmax = np.iinfo(c1.dtype).max
+        CT = np.stack((
+            c1,
+            np.where(q2, c2, cmax),
+            np.where(q3, c3, cmax),
+            np.where(q4, c4, cmax)), axis=1)
+        CT = np.sort(CT, axis=1)
+        CT[CT == cmax] = 0
+        CT[qskip, :] = 0
+        # Status update on rejected points
+        if v:
+            for i in np.where(qskip)[0]:
+                print("   i=%s, d1=%.2e/%.2e, z1=%.2e/%.2e"
+                    % (i, T["d1"][i], toli[i], T["z1"][i], ntoli[i]))
+        # Split into grids
+        CC = []
+        ia = 0
+        for n in grids:
+            # Dimensions
+            nj = self.NJ[n-1]
+            nk = self.NK[n-1]
+            nl = self.NL[n-1]
+            # Points of this grid (first surface only)
+            ib = ia + nj*nk*nl
+            Cn = CT[ia:ia + nj*nk].reshape((nk, nj, 4))
+            # Save as *C[j,k,:]*
+            CC.append(np.array(Cn.transpose((1, 0, 2)), dtype="int"))
+            ia = ib
         # Output
-        return C
+        return CC
         
     # Map surface grid points to TRI file components
     def MapTriBCs(self, tri, n=1, **kw):
@@ -1389,6 +1445,8 @@ class X(object):
         :Keyword Arguments:
             *v*: ``True`` | {``False``}
                 Verbose
+            *nproc*, *j*: {``1``} | :class:`int`
+                Number of worker processes for nearest-tri search
             *atol*, *AbsTol*: {``_atol_``} | :class:`float` > 0
                 Absolute tolerance for nearest-tri search
             *rtol*, *RelTol*: {``_rtol_``} | :class:`float` >= 0
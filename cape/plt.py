@@ -26,7 +26,10 @@ See also:
 """
 
 # Standard library
+import mmap
+import os
 import re
+import struct
 
 # Third-party
 import numpy as np
@@ -55,6 +58,103 @@ FEPOLYHEDRON = 7
 N_AUX_MAX = 100
 
 
+# Read contents of a file to a buffer
+def _read_buffer(fname, qmmap=True):
+    r"""Get the contents of a file as a memory map or buffer
+
+    The memory map is copy-on-write, so arrays using it can be modified
+    without changing the file.
+
+    :Call:
+        >>> buf = _read_buffer(fname, qmmap=True)
+    :Inputs:
+        *fname*: :class:`str`
+            Name of file to read
+        *qmmap*: {``True``} | ``False``
+            Whether to memory-map the file instead of reading it
+    :Outputs:
+        *buf*: :class:`mmap.mmap` | :class:`bytearray`
+            Contents of file
+    :Versions:
+        * 2026-10-19 ``@ddalle``: Version 1.0
+    """
+    with open(fname, 'rb') as f:
+        # Try to map the file
+        if qmmap:
+            try:
+                return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+            except (ValueError, OSError):
+                # Empty file or no mmap support
+                pass
+        # Read entire file
+        return bytearray(f.read())
+
+
+# Check that mapped file still has all the bytes needed
+def _check_size(fname, pos):
+    r"""Check that a file is at least *pos* bytes long
+
+    Accessing a memory map beyond the end of a file that has been
+    truncated crashes with ``SIGBUS``, so this is checked first.
+
+    :Call:
+        >>> _check_size(fname, pos)
+    :Inputs:
+        *fname*: :class:`str`
+            Name of file
+        *pos*: :class:`int`
+            Number of bytes needed
+    :Versions:
+        * 2026-10-19 ``@ddalle``: Version 1.0
+    """
+    # Current size of file
+    size = os.path.getsize(fname)
+    # Check it
+    if size < pos:
+        raise ValueError(
+            "PLT file '%s' has %i bytes; expected at least %i"
+            % (fname, size, pos))
+
+
+# Unpack values from buffer, raising ValueError at end of file
+def _unpack_from(fmt, buf, pos):
+    try:
+        return struct.unpack_from(fmt, buf, pos)
+    except struct.error:
+        raise ValueError("Unexpected end of PLT file at byte %i" % pos)
+
+
+# Read string from buffer
+def _read_lb4_s(buf, pos):
+    r"""Read C-style string with 4 bytes per char from a buffer
+
+    :Call:
+        >>> s, pos = _read_lb4_s(buf, pos)
+    :Inputs:
+        *buf*: :class:`mmap.mmap` | :class:`bytearray`
+            Contents of file
+        *pos*: :class:`int`
+            Position of start of string
+    :Outputs:
+        *s*: :class:`str`
+            String read from file
+        *pos*: :class:`int`
+            Position after the terminating zero
+    :Versions:
+        * 2026-10-19 ``@ddalle``: Version 1.0
+    """
+    # Find terminating zero
+    pos1 = pos
+    n = len(buf)
+    while pos1 + 4 <= n and buf[pos1:pos1+4] != b"\x00\x00\x00\x00":
+        pos1 += 4
+    # Convert characters
+    chars = np.frombuffer(buf, dtype="<i4", count=(pos1-pos)//4, offset=pos)
+    s = bytearray(chars.astype("u1")).decode("utf-8")
+    # Output
+    return s, min(n, pos1 + 4)
+
+
 # Convert a PLT to TRIQ
 def Plt2Triq(fplt, ftriq=None, **kw):
     """Convert a Tecplot PLT file to a Cart3D annotated triangulation (TRIQ)
@@ -130,6 +230,8 @@ class Plt(object):
     :Inputs:
         *fname*: {``None``} | :class:`str`
             Name of binary PLT file to read
+        *mmap*: {``True``} | ``False``
+            Whether to memory-map *fname* instead of reading it
         *dat*: {``None``} | :class:`str`
             Name of ASCII file to read
         *triq*: {``None``} | :class:`trifile.Triq`
@@ -162,11 +264,12 @@ class Plt(object):
         :Versions:
             * 2016-11-21 ``@ddalle``: Started
             * 2016-11-22 ``@ddalle``: First version
+            * 2026-10-19 ``@ddalle``: Pass *kw* to :func:`Read`
         """
         # Check for an input file
         if fname is not None:
             # Read the file
-            self.Read(fname)
+            self.Read(fname, **kw)
         elif dat is not None:
             # Read an ASCII file
             self.ReadDat(dat)
@@ -182,46 +285,61 @@ class Plt(object):
             self.Tris = []
     
     # Tec Boundary reader
-    def Read(self, fname):
+    def Read(self, fname, **kw):
         """Read a Fun3D boundary Tecplot binary file
-        
+
+        The header is parsed in one pass from a memory map of the file
+        (or one buffer if *mmap* is ``False``), recording the location of
+        each zone's data. The state arrays in *plt.q* and node indices
+        in *plt.Tris* are views of that map, so the parts of the file
+        that are never used (e.g. variables not needed by
+        :func:`CreateTriq`) are never read from disk.
+
         :Call:
-            >>> plt.Read(fname)
+            >>> plt.Read(fname, mmap=True)
         :Inputs:
             *plt*: :class:`pyFun.plt.Plt`
                 Tecplot PLT interface
             *fname*: :class:`str`
                 Name of file to read
+            *mmap*: {``True``} | ``False``
+                Whether to memory-map the file instead of reading it
+        :Attributes:
+            *plt.QOffset*: :class:`np.ndarray`\ [:class:`int`]
+                File position of each variable in each zone,
+                *shape*: (*nZone*, *nVar*)
         :Versions:
             * 2016-11-22 ``@ddalle``: Version 1.0
             * 2022-09-16 ``@ddalle``: Version 2.0; unstruc volume
+            * 2026-10-19 ``@ddalle``: Version 3.0; single pass, mmap
+            * 2026-10-19 ``@ddalle``: Version 3.1; check mapped file size
         """
-        # Open the file
-        f = open(fname, 'rb')
+        # Get contents of file
+        buf = _read_buffer(fname, kw.get("mmap", True))
+        # Save name of mapped file
+        qmmap = isinstance(buf, mmap.mmap)
+        self.fmmap = os.path.abspath(fname) if qmmap else None
         # Read the opening string
-        s = np.fromfile(f, count=1, dtype='|S8')
-        # Get string
-        if len(s) == 0:
-            # No string
-            header = None
-        else:
-            # Get and convert
-            header = s[0].decode("ascii")
+        header = bytes(buf[:8]).decode("ascii", errors="replace")
         # Check it
         if header != '#!TDV112':
-            f.close()
             raise ValueError("File '%s' must start with '#!TDV112'" % fname)
+        # File position
+        pos = 8
         # Throw away the next two integers
-        self.line2 = np.fromfile(f, count=2, dtype='i4')
+        self.line2 = np.frombuffer(buf, dtype='i4', count=2, offset=pos)
+        pos += 8
         # Read the title
-        self.title = capeio.read_lb4_s(f)
-        # Get number of variables (, unpacks the list)
-        self.nVar, = np.fromfile(f, count=1, dtype='i4')
+        self.title, pos = _read_lb4_s(buf, pos)
+        # Get number of variables
+        self.nVar, = _unpack_from('i', buf, pos)
+        pos += 4
         # Loop through variables
         self.Vars = []
         for i in range(self.nVar):
             # Read the name of variable *i*
-            self.Vars.append(capeio.read_lb4_s(f))
+            var, pos = _read_lb4_s(buf, pos)
+            self.Vars.append(var)
         # Initialize zones
         self.nZone = 0
         self.Zones = []
@@ -235,7 +353,8 @@ class Plt(object):
         self.nPt = []
         self.nElem = []
         # This number should be 299.0
-        marker, = np.fromfile(f, dtype='f4', count=1)
+        marker, = _unpack_from('f', buf, pos)
+        pos += 4
         # Read until no more zones
         while True:
             # Test the marker
@@ -246,28 +365,28 @@ class Plt(object):
                 # Increase zone count
                 self.nZone += 1
                 # Read zone name
-                zone = capeio.read_lb4_s(f).strip('"')
+                zone, pos = _read_lb4_s(buf, pos)
                 # Save it
-                self.Zones.append(zone)
-                # Parent zone
-                i, = np.fromfile(f, count=1, dtype='i4')
+                self.Zones.append(zone.strip('"'))
+                # Parent zone, strand ID
+                i, j = _unpack_from('ii', buf, pos)
                 self.ParentZone.append(i)
-                # Strand ID
-                i, = np.fromfile(f, count=1, dtype='i4')
-                self.StrandID.append(i)
+                self.StrandID.append(j)
                 # Solution time
-                v, = np.fromfile(f, count=1, dtype='f8')
+                v, = _unpack_from('d', buf, pos + 8)
                 self.t.append(v)
                 # Read a -1 and then the zone type
-                i, zt = np.fromfile(f, count=2, dtype='i4')
+                i, zt = _unpack_from('ii', buf, pos + 16)
                 self.ZoneType.append(zt)
+                pos += 24
                 # Check zone type
                 if zt == ORDERED:
                     raise ValueError("Ordered zone type not implemented")
                 # Read option related fo variable location
                 # 0: data at notes
                 # 1: specify for each var
-                vl, = np.fromfile(f, count=1, dtype='i4')
+                vl, = _unpack_from('i', buf, pos)
+                pos += 4
                 # Check for var location
                 self.QVarLoc.append(vl)
                 if vl == 0:
@@ -275,23 +394,24 @@ class Plt(object):
                     self.VarLocs.append([])
                 else:
                     # Read variable locations... {0: "node", 1: "cell"}
-                    self.VarLocs.append(
-                        np.fromfile(f, dtype='i4', count=self.nVar))
+                    self.VarLocs.append(np.frombuffer(
+                        buf, dtype='i4', count=self.nVar, offset=pos).copy())
+                    pos += 4*self.nVar
                 # Two options about face neighbors
-                neighbor_opt, n_neighbor = np.fromfile(f, dtype='i4', count=2)
+                neighbor_opt, n_neighbor = _unpack_from('ii', buf, pos)
                 if n_neighbor > 0:
                     raise ValueError("Local face neighbors not implemented")
                 # Number of points
-                nPt, = np.fromfile(f, count=1, dtype="i4")
+                nPt, = _unpack_from('i', buf, pos + 8)
+                pos += 12
                 # Check polygon/polyhedron
                 if zt in (FEPOLYGON, FEPOLYHEDRON):
                     raise ValueError(
                         "Arbitrary polygon/polyhedron zones not implemented")
-                # Number of elements
-                nElem, = np.fromfile(f, count=1, dtype="i4")
-                # Cell dims
-                celldims = np.fromfile(f, count=3, dtype="i4")
-                if np.any(celldims):
+                # Number of elements and cell dims
+                nElem, c1, c2, c3 = _unpack_from('iiii', buf, pos)
+                pos += 16
+                if c1 or c2 or c3:
                     raise ValueError(
                         "In zone %i, expected cell dims to be zero" % self.nZone)
                 # Save point and element count
@@ -303,53 +423,60 @@ class Plt(object):
                 # Check optio nfor aux name/value paris
                 for naux in range(N_AUX_MAX):
                     # Read aux flag
-                    aux, = np.fromfile(f, count=1, dtype="i4")
+                    aux, = _unpack_from('i', buf, pos)
+                    pos += 4
                     # Check flag
                     if aux == 0:
                         break
                     # Read name
-                    auxname = capeio.read_lb4_s(f)
+                    auxname, pos = _read_lb4_s(buf, pos)
                     # Read data type (must be 0)
-                    auxtype = np.fromfile(f, count=1, dtype="i4")
+                    auxtype, = _unpack_from('i', buf, pos)
+                    pos += 4
                     if auxtype != 0:
                         raise ValueError(
                             "Aux data type %i in zone %i not supported"
                             % (auxtype, self.nZone))
                     # Read string property
-                    auxval = capeio.read_lb4_s(f)
+                    auxval, pos = _read_lb4_s(buf, pos)
                     # Save it
                     auxdict[auxname] = auxval
                 # Read some zeros at the end.
             elif marker == 799.0:
                 # Auxiliary data
-                name = capeio.read_lb4_s(f).strip('"')
+                name, pos = _read_lb4_s(buf, pos)
                 # Read format
-                fmt, = np.fromfile(f, count=1, dtype='i4')
+                fmt, = _unpack_from('i', buf, pos)
+                pos += 4
                 # Check value of *fmt*
                 if fmt != 0:
                     raise ValueError(
                         ("Dataset Auxiliary data value format is %i; " % fmt) +
                         ("expected 0"))
                 # Read value
-                val = capeio.read_lb4_s(f).strip('"')
+                val, pos = _read_lb4_s(buf, pos)
             else:
                 # Unknown marker
                 raise ValueError(
                     "Expecting end-of-header marker 357.0\n" +
                     ("  Found: %s" % marker))
             # This number should be 299.0
-            marker, = np.fromfile(f, dtype='f4', count=1)
+            marker, = _unpack_from('f', buf, pos)
+            pos += 4
         # Convert arrays
         self.nPt = np.array(self.nPt)
         self.nElem = np.array(self.nElem)
         # This number should be 299.0
-        marker, = np.fromfile(f, dtype='f4', count=1)
+        marker, = _unpack_from('f', buf, pos)
+        pos += 4
         # Initialize format list
         self.fmt = np.zeros((self.nZone, self.nVar), dtype='i4')
         # Initialize values and min/max
         self.qmin = np.zeros((self.nZone, self.nVar))
         self.qmax = np.zeros((self.nZone, self.nVar))
         self.q = []
+        # Location of each variable
+        self.QOffset = np.zeros((self.nZone, self.nVar), dtype="int")
         # Initialize node numbers
         self.Tris = []
         # Read until no more zones
@@ -360,28 +487,44 @@ class Plt(object):
             npt = self.nPt[n]
             nelem = self.nElem[n]
             # Read zone type
-            self.fmt[n] = np.fromfile(f, dtype='i4', count=self.nVar)
+            self.fmt[n] = np.frombuffer(
+                buf, dtype='i4', count=self.nVar, offset=pos)
+            pos += 4*self.nVar
             # Check for passive variables
-            ipass, = np.fromfile(f, dtype='i4', count=1)
+            ipass, = _unpack_from('i', buf, pos)
+            pos += 4
             if ipass != 0:
-                np.fromfile(f, dtype='i4', count=self.nVar)
+                pos += 4*self.nVar
             # Check for variable sharing
-            ishare, = np.fromfile(f, dtype='i4', count=1)
+            ishare, = _unpack_from('i', buf, pos)
+            pos += 4
             if ishare != 0:
-                np.fromfile(f, dtype='i4', count=self.nVar)
+                pos += 4*self.nVar
             # Zone number to share with
-            zshare, = np.fromfile(f, dtype='i4', count=1)
+            zshare, = _unpack_from('i', buf, pos)
+            pos += 4
             # Read the min and max variables
-            qi = np.fromfile(f, dtype='f8', count=(self.nVar*2))
+            qi = np.frombuffer(buf, dtype='f8', count=self.nVar*2, offset=pos)
+            pos += 16*self.nVar
             self.qmin[n] = qi[0::2]
             self.qmax[n] = qi[1::2]
-            # Read the actual data
+            # Data type
             if self.fmt[n][0] == 2:
-                # Read doubles
-                qi = np.fromfile(f, dtype="f8", count=self.nVar*npt)
+                # Doubles
+                dt = "f8"
             else:
-                # Read floats
-                qi = np.fromfile(f, dtype='f4', count=self.nVar*npt)
+                # Floats
+                dt = "f4"
+            # Size of each variable
+            nb = np.dtype(dt).itemsize * npt
+            # Make sure mapped file wasn't truncated
+            if qmmap:
+                _check_size(fname, pos + nb*self.nVar)
+            # Save location of each variable
+            self.QOffset[n] = pos + nb*np.arange(self.nVar)
+            # View of the actual data (not read until used)
+            qi = np.frombuffer(buf, dtype=dt, count=self.nVar*npt, offset=pos)
+            pos += nb*self.nVar
             # Reshape
             qi = np.transpose(np.reshape(qi, (self.nVar, npt)))
             self.q.append(qi)
@@ -403,19 +546,47 @@ class Plt(object):
             else:
                 raise ValueError(
                     "Zone type %i (zone %i) is unsupported" % (zt, n + 1))
-            # Read the tris
-            ii = np.fromfile(f, dtype='i4', count=(melem*nelem))
+            # Make sure mapped file wasn't truncated
+            if qmmap:
+                _check_size(fname, pos + 4*melem*nelem)
+            # View of the tris
+            ii = np.frombuffer(buf, dtype='i4', count=melem*nelem, offset=pos)
+            pos += 4*melem*nelem
             # Reshape and save
             self.Tris.append(np.reshape(ii, (nelem, melem)))
             # Read the next marker
-            i = np.fromfile(f, dtype='f4', count=1)
-            # Check length
-            if len(i) == 1:
-                marker = i[0]
+            if pos + 4 <= len(buf):
+                marker, = _unpack_from('f', buf, pos)
+                pos += 4
             else:
                 break
-        # Close the file
-        f.close()
+        # Number of bytes used by views of the mapped file
+        self.nmmap = pos
+
+    # Copy memory-mapped data into memory
+    def Unmap(self):
+        """Copy the memory-mapped states and node indices into memory
+
+        This reads all the remaining data of the file, after which the
+        file can be modified or deleted without affecting *plt*.
+
+        :Call:
+            >>> plt.Unmap()
+        :Inputs:
+            *plt*: :class:`pyFun.plt.Plt`
+                Tecplot PLT interface
+        :Versions:
+            * 2026-10-19 ``@ddalle``: Version 1.0
+            * 2026-10-19 ``@ddalle``: Version 1.1; check file size
+        """
+        # Make sure mapped file wasn't truncated since reading
+        if getattr(self, "fmmap", None):
+            _check_size(self.fmmap, self.nmmap)
+        # Copy each zone
+        self.q = [np.array(q) for q in self.q]
+        self.Tris = [np.array(T) for T in self.Tris]
+        # No mapped file
+        self.fmmap = None
     
     # Write Tec Boundary
     def Write(self, fname, Vars=None, **kw):
@@ -448,6 +619,9 @@ class Plt(object):
         nZone = len(IZone)
         # Indices of variabels
         IVar = np.array([self.Vars.index(v) for v in Vars])
+        # Read all data before overwriting the mapped file
+        if getattr(self, "fmmap", None) == os.path.abspath(fname):
+            self.Unmap()
         # Open the file
         f = open(fname, 'wb')
         # Write the opening string
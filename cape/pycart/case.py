@@ -17,7 +17,6 @@ It also contains Cart3D-specific versions of some of the generic methods from
 
 # Standard library modules
 import glob
-import json
 import os
 import re
 import resource
@@ -39,6 +38,7 @@ from cape.cfdx.case import CaseIntersect, CaseVerify
 # Direct local imports
 from .tri import Tri, Triq
 from .options.runControl import RunControl
+from ..cfdx.options.util import loadJSONFile
 
 # Local modules
 from . import cmd
@@ -81,6 +81,10 @@ runs it.
 # Function to setup and call the appropriate flowCart file.
 def run_flowCart():
     r"""Setup and run ``flowCart``, ``mpi_flowCart`` command
+
+    Consecutive phases that continue in the same job are run in a loop
+    within this process, keeping the run control settings in memory;
+    ``case.json`` is only reread if it changes.
     
     :Call:
         >>> run_flowCart()
@@ -88,6 +92,7 @@ def run_flowCart():
         * 2014-10-02 ``@ddalle``: Version 1.0
         * 2014-12-18 ``@ddalle``: Version 1.1; Added :func:`TarAdapt`
         * 2021-10-08 ``@ddalle``: Version 1.2; removed args
+        * 2026-10-19 ``@ddalle``: Version 2.0; chain phases in-process
     """
     # Parse arguments
     a, kw = argread.readkeys(sys.argv)
@@ -96,39 +101,48 @@ def run_flowCart():
         # Display help and exit
         print(textutils.markdown(HELP_RUN_FLOWCART))
         return
-    # Check for RUNNING file.
-    if os.path.isfile('RUNNING'):
-        # Case already running
-        raise SystemError('Case already running!')
-    # Touch the running file.
-    os.system('touch RUNNING')
-    # Start timer
-    tic = datetime.now()
     # Get the settings.
     rc = ReadCaseJSON()
-    # Run intersect and verify
-    cc.CaseIntersect(rc)
-    cc.CaseVerify(rc)
-    # Determine the run index.
-    i = GetPhaseNumber(rc)
-    # Write start time
-    WriteStartTime(tic, rc, i)
-    # Prepare all files
-    PrepareFiles(rc, i)
-    # Prepare environment variables (other than OMP_NUM_THREADS)
-    cc.PrepareEnvironment(rc, i)
-    # Run the appropriate commands
-    RunPhase(rc, i)
-    # Clean up the folder
-    FinalizeFiles(rc, i)
-    # Remove the RUNNING file.
-    if os.path.isfile('RUNNING'): os.remove('RUNNING')
-    # Save time usage
-    WriteUserTime(tic, rc, i)
-    # Check for bomb/early termination
-    CheckSuccess(rc, i)
-    # Run full restart command, including qsub if appropriate
-    RestartCase(i)
+    stat = cc.GetCaseJSONStat()
+    # Loop through phases run in this job
+    while True:
+        # Check for RUNNING file.
+        if os.path.isfile('RUNNING'):
+            # Case already running
+            raise SystemError('Case already running!')
+        # Touch the running file.
+        open('RUNNING', 'w').close()
+        # Start timer
+        tic = datetime.now()
+        # Run intersect and verify
+        cc.CaseIntersect(rc)
+        cc.CaseVerify(rc)
+        # Determine the run index.
+        i = GetPhaseNumber(rc)
+        # Write start time
+        WriteStartTime(tic, rc, i)
+        # Prepare all files
+        PrepareFiles(rc, i)
+        # Prepare environment variables (other than OMP_NUM_THREADS)
+        cc.PrepareEnvironment(rc, i)
+        # Run the appropriate commands
+        RunPhase(rc, i)
+        # Clean up the folder
+        FinalizeFiles(rc, i)
+        # Remove the RUNNING file.
+        if os.path.isfile('RUNNING'): os.remove('RUNNING')
+        # Save time usage
+        WriteUserTime(tic, rc, i)
+        # Check for bomb/early termination
+        CheckSuccess(rc, i)
+        # Reread settings only if ``case.json`` has changed
+        stat1 = cc.GetCaseJSONStat()
+        if stat1 != stat:
+            rc = ReadCaseJSON()
+            stat = stat1
+        # Run full restart command, including qsub if appropriate
+        if RestartCase(i, rc=rc, chain=True) is not True:
+            return
     
     
 # Write time used
@@ -603,24 +617,35 @@ def StartCase():
         run_flowCart()
         
 # Function to call script or submit.
-def RestartCase(i0=None):
+def RestartCase(i0=None, rc=None, chain=False):
     """Restart a case by either submitting it or calling with a system command
     
     This version of the command is called within :func:`run_flowCart` after
     running a phase or attempting to run a phase.
     
     :Call:
-        >>> pyCart.case.RetartCase(i0=None)
+        >>> q = pyCart.case.RetartCase(i0=None, rc=None, chain=False)
     :Inputs:
         *i0*: :class:`int` | ``None``
             Run sequence index of the previous run
+        *rc*: {``None``} | :class:`RunControl`
+            Run control settings; read from ``case.json`` if ``None``
+        *chain*: ``True`` | {``False``}
+            Return ``True`` instead of calling :func:`run_flowCart` if
+            the next phase should be run in this job
+    :Outputs:
+        *q*: ``True`` | ``None`` | :class:`int`
+            ``True`` if *chain* and next phase is to be run here, or
+            job ID if case was resubmitted
     :Versions:
         * 2014-10-06 ``@ddalle``: Version 1.0
         * 2015-11-08 ``@ddalle``: Added resubmit/continue functionality
         * 2015-12-28 ``@ddalle``: Split from :func:`StartCase`
+        * 2026-10-19 ``@ddalle``: Added *rc*, *chain*
     """
     # Get the config.
-    rc = ReadCaseJSON()
+    if rc is None:
+        rc = ReadCaseJSON()
     # Determine the run index.
     i = GetPhaseNumber(rc)
     # Get the new restart iteration.
@@ -631,11 +656,8 @@ def RestartCase(i0=None):
     # Check current iteration count.
     if n >= rc.get_LastIter():
         return
-    # Check qsub status.
-    if not (qpbs or qslr):
-        # Run the case.
-        run_flowCart()
-    elif rc.get_Resubmit(i):
+    # Check for resubmission to task manager
+    if (qpbs or qslr) and rc.get_Resubmit(i):
         # Check for continuance
         if (i0 is None) or (i>i0) or (not rc.get_Continue(i)):
             # Get the name of the PBS file.
@@ -651,12 +673,11 @@ def RestartCase(i0=None):
                 # No task manager
                 raise NotImplementedError("Could not determine task manager")
             return pbs
-        else:
-            # Continue on the same job
-            run_flowCart()
-    else:
-        # Simply run the case. Don't reset modules either.
-        run_flowCart()
+    # Continue on the same job
+    if chain:
+        return True
+    # Simply run the case. Don't reset modules either.
+    run_flowCart()
         
 # Function to delete job and remove running file.
 def StopCase():
@@ -756,12 +777,8 @@ def ReadCaseJSON():
     :Versions:
         * 2014-10-02 ``@ddalle``: Version 1.0
     """
-    # Read the file, fail if not present.
-    f = open('case.json')
-    # Read the settings.
-    opts = json.load(f)
-    # Close the file.
-    f.close()
+    # Read the settings (cached if file unchanged); fail if not present
+    opts = loadJSONFile('case.json', persist=False)
     # Convert to a RunControl object.
     rc = RunControl(**opts)
     # Output
@@ -43,8 +43,10 @@ also available here.
 
 # Standard library modules
 import os
+import copy
 import shutil
 import json
+import hashlib
 import subprocess as sp
 from datetime import datetime
 
@@ -59,7 +61,9 @@ from . import manage
 from . import dataBook
 from . import report
 from .. import cntl as capecntl
+from .. import util
 from ..cfdx import queue
+from ..cfdx import trace
 from .inputCntl import InputCntl
 from .aeroCsh import AeroCsh
 from .preSpecCntl import PreSpecCntl
@@ -74,6 +78,30 @@ _fname = os.path.abspath(__file__)
 PyCartFolder = os.path.split(_fname)[0]
 TemplateFodler = os.path.join(PyCartFolder, "templates")
 
+
+# Create hard link to a file, or copy it
+def _link_or_copy(fsrc, fdst):
+    """Create hard link to a file, or copy it if links are not possible
+
+    :Call:
+        >>> _link_or_copy(fsrc, fdst)
+    :Inputs:
+        *fsrc*: :class:`str`
+            Name of existing file
+        *fdst*: :class:`str`
+            Name of link/copy to create (replaced if it exists)
+    :Versions:
+        * 2026-10-19 ``@ddalle``: First version
+    """
+    # Remove existing file or link
+    if os.path.islink(fdst) or os.path.isfile(fdst):
+        os.remove(fdst)
+    # Try a hard link
+    try:
+        os.link(fsrc, fdst)
+    except OSError:
+        shutil.copyfile(fsrc, fdst)
+
     
 # Class to read input files
 class Cntl(capecntl.Cntl):
@@ -103,6 +131,9 @@ class Cntl(capecntl.Cntl):
         * 2014-06-30 ``@ddalle``  : Reduced number of data members
         * 2014-07-27 ``@ddalle``  : `cart3d.RunMatrix` --> `cart3d.x`
     """
+    # Most recent transformed triangulation: (key, tri, points)
+    _tri_memo = (None, None, None)
+
   # =============
   # Configuration
   # =============
@@ -722,19 +753,41 @@ class Cntl(capecntl.Cntl):
         print("  Preparing surface triangulation...")
         # Read the mesh.
         self.ReadTri()
-        # Revert to initial surface.
-        self.tri = self.tri0.Copy()
-        # Apply rotations, translations, etc.
-        self.PrepareTri(i)
-        # Check intersection status.
-        if self.opts.get_intersect():
-            # Write the tri file as non-intersected; each volume is one CompID
-            self.tri.WriteVolTri('Components.tri')
-            # Write the existing triangulation with existing CompIDs.
-            self.tri.Write('Components.c.tri')
+        # Get hash of source tri file(s) and transformations
+        key = self.GetTriCacheKey(i)
+        # Check for same transformations as a recent case
+        if key is not None and self._tri_memo[0] == key:
+            # Reuse transformed surface and points
+            self.tri = self._tri_memo[1].Copy()
+            self.opts['Config']['Points'] = copy.deepcopy(self._tri_memo[2])
         else:
-            # Write the tri file.
-            self.tri.Write('Components.i.tri')
+            # Revert to initial surface.
+            self.tri = self.tri0.Copy()
+            # Apply rotations, translations, etc.
+            self.PrepareTri(i)
+            # Save for subsequent cases
+            if key is not None:
+                self._tri_memo = (
+                    key, self.tri,
+                    copy.deepcopy(self.opts['Config'].get('Points', {})))
+        # Check for previously written files
+        if not self.LinkCachedTri(key):
+            # Remove old files, which may be links to the cache
+            for fname in self.GetTriCacheFiles():
+                if os.path.isfile(fname) or os.path.islink(fname):
+                    os.remove(fname)
+            # Check intersection status.
+            if self.opts.get_intersect():
+                # Write the tri file as non-intersected; each volume is one
+                # CompID
+                self.tri.WriteVolTri('Components.tri')
+                # Write the existing triangulation with existing CompIDs.
+                self.tri.Write('Components.c.tri')
+            else:
+                # Write the tri file.
+                self.tri.Write('Components.i.tri')
+            # Save the files for other cases
+            self.SaveCachedTri(key)
         # --------------------
         # Volume mesh creation
         # --------------------
@@ -769,6 +822,220 @@ class Cntl(capecntl.Cntl):
             case.CaseCubes(rc, j=0)
         # Return to original folder.
         os.chdir(fpwd)
+
+    # Get key for cache of transformed tri files
+    def GetTriCacheKey(self, i):
+        """Get hash of source tri file(s) and transformations for case *i*
+
+        Cases with the same key have identical surface triangulations.
+        The key is ``None`` if the run matrix has any *TriFunction* keys,
+        because their effects are not known in advance.  Source files
+        are identified by the SHA-1 hash of their contents, and the
+        *Points* are the original ones, before any case transformed
+        them, so the key does not depend on the order of cases.
+
+        :Call:
+            >>> key = cntl.GetTriCacheKey(i)
+        :Inputs:
+            *cntl*: :class:`cape.pycart.cntl.Cntl`
+                Instance of control class containing relevant parameters
+            *i*: :class:`int`
+                Case index
+        :Outputs:
+            *key*: ``None`` | :class:`str`
+                SHA-1 hash of triangulation inputs
+        :Versions:
+            * 2026-10-19 ``@ddalle``: First version
+            * 2026-10-19 ``@ddalle``: Hash contents and original points
+        """
+        # Get transformation keys
+        keys = self.x.GetKeysByType(['translation', 'rotation', 'TriFunction'])
+        # Cannot predict effects of user-defined functions
+        for k in keys:
+            if self.x.defns[k]['Type'] == "TriFunction":
+                return None
+        # Source files
+        ftri = self.opts.get_TriFile()
+        if not isinstance(ftri, (list, tuple, np.ndarray)):
+            ftri = [ftri]
+        fsrc = [f.lstrip('-') for f in ftri] + [
+            self.opts.get_ConfigFile(), self.opts.get_aflr3_BCFile()]
+        # Get hash of contents of each
+        sigs = []
+        for fname in fsrc:
+            # Check for file
+            if not fname:
+                continue
+            # Absolute path
+            fabs = os.path.join(self.RootDir, fname)
+            # Save hash
+            sigs.append([fname, self.GetTriSourceHash(fabs)])
+        # Transformation parameters
+        trans = [
+            [k, self.x[k][i], self.x.defns[k]] for k in keys
+        ]
+        # Original points, before previous cases' transformations
+        config = self.opts['Config']
+        pts = getattr(config, "_Points", None)
+        if pts is None:
+            pts = config.get('Points', {})
+        # Combine inputs
+        txt = json.dumps([
+            ftri, sigs, trans, pts,
+            self.opts.get_intersect()
+        ], sort_keys=True, default=str)
+        # Output
+        return hashlib.sha1(txt.encode("utf-8")).hexdigest()
+
+    # Hash of tri source file
+    def GetTriSourceHash(self, fname):
+        """Get SHA-1 hash of the contents of a tri source file
+
+        Hashes are saved and only recomputed if the size or
+        modification time of the file changes.
+
+        :Call:
+            >>> h = cntl.GetTriSourceHash(fname)
+        :Inputs:
+            *cntl*: :class:`cape.pycart.cntl.Cntl`
+                Instance of control class containing relevant parameters
+            *fname*: :class:`str`
+                Absolute path to file
+        :Outputs:
+            *h*: ``None`` | :class:`str`
+                SHA-1 hash of file contents; ``None`` if no file
+        :Versions:
+            * 2026-10-19 ``@ddalle``: First version
+        """
+        # Check for file
+        if not os.path.isfile(fname):
+            return None
+        # Saved hashes
+        hashes = self.__dict__.setdefault("_tri_src_hashes", {})
+        # Check for unchanged file
+        st = os.stat(fname)
+        sig = (st.st_size, st.st_mtime_ns)
+        if fname in hashes and hashes[fname][0] == sig:
+            return hashes[fname][1]
+        # Read and hash in blocks
+        h = hashlib.sha1()
+        with open(fname, 'rb') as fp:
+            for b in iter(lambda: fp.read(1048576), b''):
+                h.update(b)
+        # Save it
+        hashes[fname] = (sig, h.hexdigest())
+        return hashes[fname][1]
+
+    # Folder for cache of transformed tri files
+    def GetTriCacheDir(self, key):
+        """Get folder in which to save tri files with hash *key*
+
+        :Call:
+            >>> fdir = cntl.GetTriCacheDir(key)
+        :Inputs:
+            *cntl*: :class:`cape.pycart.cntl.Cntl`
+                Instance of control class containing relevant parameters
+            *key*: ``None`` | :class:`str`
+                Hash from :func:`GetTriCacheKey`
+        :Outputs:
+            *fdir*: ``None`` | :class:`str`
+                Absolute path to cache folder
+        :Versions:
+            * 2026-10-19 ``@ddalle``: First version
+        """
+        # Check for valid key
+        if key is None:
+            return None
+        # Folder in root directory
+        return os.path.join(self.RootDir, ".tricache", key)
+
+    # Get list of tri files written by PrepareMesh
+    def GetTriCacheFiles(self):
+        """Get list of tri files written by :func:`PrepareMesh`
+
+        :Call:
+            >>> fnames = cntl.GetTriCacheFiles()
+        :Inputs:
+            *cntl*: :class:`cape.pycart.cntl.Cntl`
+                Instance of control class containing relevant parameters
+        :Outputs:
+            *fnames*: :class:`list`\ [:class:`str`]
+                Names of files
+        :Versions:
+            * 2026-10-19 ``@ddalle``: First version
+        """
+        # Check intersection status.
+        if self.opts.get_intersect():
+            return ['Components.tri', 'Components.c.tri']
+        else:
+            return ['Components.i.tri']
+
+    # Link previously written tri files
+    def LinkCachedTri(self, key):
+        """Link or copy tri files from the cache into current folder
+
+        :Call:
+            >>> q = cntl.LinkCachedTri(key)
+        :Inputs:
+            *cntl*: :class:`cape.pycart.cntl.Cntl`
+                Instance of control class containing relevant parameters
+            *key*: ``None`` | :class:`str`
+                Hash from :func:`GetTriCacheKey`
+        :Outputs:
+            *q*: ``True`` | ``False``
+                Whether or not files were found in the cache
+        :Versions:
+            * 2026-10-19 ``@ddalle``: First version
+        """
+        # Get cache folder
+        fdir = self.GetTriCacheDir(key)
+        # Check for it
+        if fdir is None or not os.path.isdir(fdir):
+            return False
+        # Files needed
+        fnames = self.GetTriCacheFiles()
+        # Check for all files
+        for fname in fnames:
+            if not os.path.isfile(os.path.join(fdir, fname)):
+                return False
+        # Link them
+        for fname in fnames:
+            _link_or_copy(os.path.join(fdir, fname), fname)
+        # Status update
+        print("  Using cached triangulation %s" % key[:12])
+        return True
+
+    # Save tri files to cache
+    def SaveCachedTri(self, key):
+        """Save tri files in current folder to the cache
+
+        :Call:
+            >>> cntl.SaveCachedTri(key)
+        :Inputs:
+            *cntl*: :class:`cape.pycart.cntl.Cntl`
+                Instance of control class containing relevant parameters
+            *key*: ``None`` | :class:`str`
+                Hash from :func:`GetTriCacheKey`
+        :Versions:
+            * 2026-10-19 ``@ddalle``: First version
+        """
+        # Get cache folder
+        fdir = self.GetTriCacheDir(key)
+        # Check for valid key
+        if fdir is None:
+            return
+        # Create folder (tolerate other processes creating it)
+        try:
+            os.makedirs(fdir)
+        except OSError:
+            if not os.path.isdir(fdir):
+                return
+        # Link each file
+        for fname in self.GetTriCacheFiles():
+            # Check for file (and don't overwrite)
+            fout = os.path.join(fdir, fname)
+            if os.path.isfile(fname) and not os.path.isfile(fout):
+                _link_or_copy(fname, fout)
    # ]
     
    # ++++++++++++++++
@@ -1705,6 +1972,7 @@ class Cntl(capecntl.Cntl):
 
         
     # Function to archive 'adaptXX/' folders (except for newest)
+    @trace.traced
     def ArchiveCases(self, **kw):
         """Archive completed cases and clean them up if specified
         
@@ -1718,8 +1986,11 @@ class Cntl(capecntl.Cntl):
                 List of indices
             *cons*: :class:`list`\ [:class:`str`]
                 List of constraints
+            *j*: {``1``} | :class:`int`
+                Number of cases to archive concurrently
         :Versions:
             * 2015-01-11 ``@ddalle``: First version
+            * 2026-10-19 ``@ddalle``: Added *j* option
         """
         # Get the format.
         fmt = self.opts.get_ArchiveAction()
@@ -1727,6 +1998,10 @@ class Cntl(capecntl.Cntl):
         if not fmt or not self.opts.get_ArchiveFolder(): return
         # Save current path.
         fpwd = os.getcwd()
+        # Number of concurrent cases
+        nproc = util.get_nproc(kw.get("j"))
+        # Cases ready to archive
+        fruns = []
         # Loop through folders.
         for i in self.x.GetIndices(**kw):
             # Go to root folder.
@@ -1742,10 +2017,17 @@ class Cntl(capecntl.Cntl):
             elif self.CheckCaseStatus(i) != 'PASS':
                 print("  Case is not marked PASS.")
                 continue
+            # Save the case
+            fruns.append(frun)
+        # Archive one case
+        def archive_case(frun):
             # Go to the folder.
-            os.chdir(frun)
+            os.chdir(os.path.join(self.RootDir, frun))
             # Archive.
             manage.ArchiveFolder(self.opts)
+        # Archive the cases, possibly concurrently
+        with trace.span("pmap", n=len(fruns), nproc=nproc):
+            util.pmap(archive_case, fruns, nproc)
         # Go back to original directory.
         os.chdir(fpwd)
     
@@ -21,7 +21,6 @@ are available unless specifically overwritten by specific
 
 # Standard library modules
 import glob
-import json
 import os
 import re
 import shutil
@@ -38,7 +37,9 @@ from .. import argread
 from .. import text as textutils
 from ..cfdx import case as cc
 from ..cfdx import queue
+from ..tnakit import fileutils
 from .options.runControl import RunControl
+from ..cfdx.options.util import loadJSONFile
 from .namelist import Namelist
 
 
@@ -81,12 +82,17 @@ runs it.
 # Function to complete final setup and call the appropriate FUN3D commands
 def run_fun3d():
     r"""Setup and run the appropriate FUN3D command
+
+    Consecutive phases that continue in the same job are run in a loop
+    within this process, keeping the run control settings in memory;
+    ``case.json`` is only reread if it changes.
     
     :Call:
         >>> case.run_fun3d()
     :Versions:
         * 2015-10-19 ``@ddalle``: Version 1.0
         * 2016-04-05 ``@ddalle``: Added AFLR3 to this function
+        * 2026-10-19 ``@ddalle``: Version 2.0; chain phases in-process
     """
     # Process arguments
     a, kw = argread.readkeys(sys.argv)
@@ -95,37 +101,46 @@ def run_fun3d():
         # Display help and exit
         print(textutils.markdown(HELP_RUN_FUN3D))
         return
-    # Check for RUNNING file.
-    if os.path.isfile('RUNNING'):
-        # Case already running
-        raise IOError('Case already running!')
-    # Touch (create) the running file
-    open("RUNNING", "w").close()
-    # Start timer
-    tic = datetime.now()
     # Get the run control settings
     rc = ReadCaseJSON()
-    # Determine the run index.
-    i = GetPhaseNumber(rc)
-    # Write the start time
-    WriteStartTime(tic, rc, i)
-    # Prepare files
-    PrepareFiles(rc, i)
-    # Prepare environment variables (other than OMP_NUM_THREADS)
-    cc.PrepareEnvironment(rc, i)
-    # Run the appropriate commands
-    RunPhase(rc, i)
-    # Clean up files
-    FinalizeFiles(rc, i)
-    # Remove the RUNNING file.
-    if os.path.isfile('RUNNING'):
-        os.remove('RUNNING')
-    # Save time usage
-    WriteUserTime(tic, rc, i)
-    # Check for errors
-    CheckSuccess(rc, i)
-    # Resubmit/restart if this point is reached.
-    RestartCase(i)
+    stat = cc.GetCaseJSONStat()
+    # Loop through phases run in this job
+    while True:
+        # Check for RUNNING file.
+        if os.path.isfile('RUNNING'):
+            # Case already running
+            raise IOError('Case already running!')
+        # Touch (create) the running file
+        open("RUNNING", "w").close()
+        # Start timer
+        tic = datetime.now()
+        # Determine the run index.
+        i = GetPhaseNumber(rc)
+        # Write the start time
+        WriteStartTime(tic, rc, i)
+        # Prepare files
+        PrepareFiles(rc, i)
+        # Prepare environment variables (other than OMP_NUM_THREADS)
+        cc.PrepareEnvironment(rc, i)
+        # Run the appropriate commands
+        RunPhase(rc, i)
+        # Clean up files
+        FinalizeFiles(rc, i)
+        # Remove the RUNNING file.
+        if os.path.isfile('RUNNING'):
+            os.remove('RUNNING')
+        # Save time usage
+        WriteUserTime(tic, rc, i)
+        # Check for errors
+        CheckSuccess(rc, i)
+        # Reread settings only if ``case.json`` has changed
+        stat1 = cc.GetCaseJSONStat()
+        if stat1 != stat:
+            rc = ReadCaseJSON()
+            stat = stat1
+        # Resubmit/restart if this point is reached.
+        if RestartCase(i, rc=rc, chain=True) is not True:
+            return
 
 
 # Prepare the files of the case
@@ -418,7 +433,7 @@ def StartCase():
 
 
 # Function to call script or submit.
-def RestartCase(i0=None):
+def RestartCase(i0=None, rc=None, chain=False):
     r"""Restart a case by either submitting it or calling with a system
     command
     
@@ -426,15 +441,26 @@ def RestartCase(i0=None):
     running a phase or attempting to run a phase.
     
     :Call:
-        >>> case.RestartCase(i0=None)
+        >>> q = case.RestartCase(i0=None, rc=None, chain=False)
     :Inputs:
         *i0*: :class:`int` | ``None``
             Run sequence index of the previous run
+        *rc*: {``None``} | :class:`RunControl`
+            Run control settings; read from ``case.json`` if ``None``
+        *chain*: ``True`` | {``False``}
+            Return ``True`` instead of calling :func:`run_fun3d` if
+            the next phase should be run in this job
+    :Outputs:
+        *q*: ``True`` | ``None`` | :class:`int`
+            ``True`` if *chain* and next phase is to be run here, or
+            job ID if case was resubmitted
     :Versions:
         * 2015-12-30 ``@ddalle``: Split from pyCart
+        * 2026-10-19 ``@ddalle``: Version 1.1; add *rc*, *chain*
     """
     # Get the config.
-    rc = ReadCaseJSON()
+    if rc is None:
+        rc = ReadCaseJSON()
     # Determine the run index.
     i = GetPhaseNumber(rc)
     # Get restart iteration
@@ -445,11 +471,8 @@ def RestartCase(i0=None):
     # Check for exit
     if n and n >= rc.get_LastIter():
         return
-    # Check qsub status.
-    if not (qpbs or qslr):
-        # Run the case.
-        run_fun3d()
-    elif rc.get_Resubmit(max(0, i-1)):
+    # Check for resubmission to task manager
+    if (qpbs or qslr) and rc.get_Resubmit(max(0, i-1)):
         # Check for continuance
         if (i0 is None) or (i > i0) or (not rc.get_Continue(i)):
             # Get the name of the PBS file.
@@ -465,12 +488,11 @@ def RestartCase(i0=None):
                 # No task manager
                 raise NotImplementedError("Could not determine task manager")
             return pbs
-        else:
-            # Continue on the same job
-            run_fun3d()
-    else:
-        # Simply run the case. Don't reset modules either.
-        run_fun3d()
+    # Continue on the same job
+    if chain:
+        return True
+    # Simply run the case. Don't reset modules either.
+    run_fun3d()
     
 
 # Write start time
@@ -718,12 +740,8 @@ def ReadCaseJSON():
         * 2014-10-02 ``@ddalle``: Version 1.0
         * 2015-10-19 ``@ddalle``: FUN3D version
     """
-    # Read the file, fail if not present.
-    f = open('case.json')
-    # Read the settings.
-    opts = json.load(f)
-    # Close the file.
-    f.close()
+    # Read the settings (cached if file unchanged); fail if not present
+    opts = loadJSONFile('case.json', persist=False)
     # Convert to a flowCart object.
     rc = RunControl(**opts)
     # Output
@@ -902,9 +920,9 @@ def GetRunningIter():
         # No current file
         return None
     # Check for flag to ignore restart history
-    lines = bin.grep('on_nohistorykept', fflow)
+    line = fileutils.grep_last('on_nohistorykept', fflow)
     # Check whether or not to add restart iterations
-    if len(lines) < 2:
+    if line is None:
         # Get the restart iteration line
         try:
             # Search for particular text
@@ -917,42 +935,32 @@ def GetRunningIter():
     else:
         # Do not use restart iterations
         nr = None
-    # Length of chunk at end of line to check
-    nchunk = 10
-    # Maximum number of chunks to scan
-    mchunk = 50
-    # Loop until chunk found with iteration number
-    for ichunk in range(mchunk):
-        # Get (cumulative) size of chunk and previous chunk
-        ia = ichunk * nchunk
-        ib = ia + nchunk
-        # Get the last few lines of :file:`fun3d.out`
-        lines = bin.tail(fflow, ib).strip().split('\n')
-        lines.reverse()
-        # Initialize output
-        n = None
-        # Try each line
-        for line in lines[ia:]:
-            try:
-                # Check for direct specification
-                if 'current history iterations' in line:
-                    # Direct specification
-                    n = int(line.split()[-1])
-                    nr = None
-                    break
-                # Use the iteration regular expression
-                match = REGEX_F3DOUT.match(line)
-                # Check for match
-                if match:
-                    # Get the iteration number from the line
-                    n = int(match.group('iter'))
-                    # Search completed
-                    break
-            except Exception:
-                continue
-        # Exit if valid line was found
-        if n is not None:
+    # Maximum number of lines to scan from end of file
+    mline = 500
+    # Initialize output
+    n = None
+    # Read the last few lines of :file:`fun3d.out`, last first
+    for j, line in enumerate(fileutils.readlines_reverse(fflow)):
+        # Check line count
+        if j >= mline:
             break
+        try:
+            # Check for direct specification
+            if 'current history iterations' in line:
+                # Direct specification
+                n = int(line.split()[-1])
+                nr = None
+                break
+            # Use the iteration regular expression
+            match = REGEX_F3DOUT.match(line)
+            # Check for match
+            if match:
+                # Get the iteration number from the line
+                n = int(match.group('iter'))
+                # Search completed
+                break
+        except Exception:
+            continue
     # Output
     if n is None:
         return nr
@@ -1025,17 +1033,17 @@ def GetRestartIter():
     # Loop through the matches.
     for fname in fflow:
         # Check for restart of iteration counter
-        lines = bin.grep('on_nohistorykept', fname)
-        if len(lines) > 1:
+        line = fileutils.grep_last('on_nohistorykept', fname)
+        if line is not None:
             # Reset iteration counter
             n0 = n
             n = 0
-        # Get the output report lines
-        lines = bin.grep('current history iterations', fname)
+        # Get the last output report line
+        line = fileutils.grep_last('current history iterations', fname)
         # Be safe
         try:
             # Split up line
-            V = lines[-2].split()
+            V = line.split()
             # Attempt to get existing iterations
             try:
                 # Format: "3000 + 2000 = 5000"
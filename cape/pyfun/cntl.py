@@ -226,7 +226,7 @@ class Cntl(ccntl.Cntl):
             self.CheckTriqPoint(**kw)
             # Quit
             return
-        elif kw.get('data', kw.get('db')):
+        elif kw.get('data', kw.get('db')) and not kw.get('watch'):
             # Update all
             print("---- Updating FM DataBook components ----")
             self.UpdateFM(**kw)
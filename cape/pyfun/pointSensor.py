@@ -158,6 +158,7 @@ class DBTriqPointGroup(cptsensor.DBTriqPointGroup):
                 point
         :Versions:
             * 2017-10-10 ``@ddalle``: First version
+            * 2026-10-19 ``@ddalle``: Version 2.0; use ReadCasePoints()
         """
         # Try to set the Mach number for *Cp* conversion
         try:
@@ -167,43 +168,8 @@ class DBTriqPointGroup(cptsensor.DBTriqPointGroup):
             kw["mach"] = mach
         except Exception:
             pass
-        # Read data from a custom file
-        triq, VarList = self.ReadCaseTriq(**kw)
-        # Get the coordinates of point *pt*
-        x = self.opts.get_Point(pt)
-        # Project to surface and interpolate
-        x0, q = triq.InterpSurfPoint(x)
-        # Initialize output
-        P = {}
-        # Get data columns
-        for col in self.cols:
-            # Check for a point
-            if col == "x":
-                # x-coordinate
-                P["x"] = x0[0]
-            elif col == "y":
-                # y-coordinate
-                P["y"] = x0[1]
-            elif col == "z":
-                # z-coordinate
-                P["z"] = x0[2]
-            else:
-                # Make a key name for the _avg parameter
-                kavg = col + "_tavg"
-                # Find the index
-                if kavg in VarList:
-                    # Use the time-averaged parameter
-                    j = VarList.index(kavg)
-                elif col in VarList:
-                    # Use the regular parameter
-                    j = VarList.index(col)
-                else:
-                    # Not found
-                    raise KeyError("No state named '%s' found in PLT file"%col)
-                # Save the parameter
-                P[col] = q[j]
-        # Output
-        return P
+        # Read all points at once
+        return self.ReadCasePoints(i, **kw)[pt]
 
     # Read Triq file from this folder
     def ReadCaseTriq(self, **kw):
@@ -36,11 +36,13 @@ import numpy as np
 # Local imports
 from . import bin
 from . import cmd
+from . import plot3d
 from .. import argread
 from .. import text as textutils
 from ..cfdx import queue
 from ..cfdx import case as cc
 from .options.runControl import RunControl
+from ..cfdx.options.util import loadJSONFile
 from .overNamelist import OverNamelist
 
 
@@ -86,12 +88,17 @@ runs it.
 # Function to complete final setup and call the appropriate FUN3D commands
 def run_overflow():
     r"""Setup and run the appropriate OVERFLOW command
+
+    Consecutive phases that continue in the same job are run in a loop
+    within this process, keeping the run control settings in memory;
+    ``case.json`` is only reread if it changes.
     
     :Call:
         >>> run_overflow()
     :Versions:
         * 2016-02-02 ``@ddalle``: Version 1.0
         * 2021-10-08 ``@ddalle``: Version 1.1
+        * 2026-10-19 ``@ddalle``: Version 2.0; chain phases in-process
     """
     # Parse arguments
     a, kw = argread.readkeys(sys.argv)
@@ -100,74 +107,84 @@ def run_overflow():
         # Display help and exit
         print(textutils.markdown(HELP_RUN_OVERFLOW))
         return
-    # Check for RUNNING file.
-    if os.path.isfile('RUNNING'):
-        # Case already running
-        raise IOError('Case already running!')
-    # Start timer
-    tic = datetime.now()
     # Get the run control settings
     rc = ReadCaseJSON()
-    # Get the project name
-    fproj = GetPrefix()
-    # Determine the run index.
-    i = GetPhaseNumber(rc)
-    # Record current iteration
-    n0 = GetCurrentIter()
-    # Write start time
-    WriteStartTime(tic, rc, i)
-    # Delete any input file.
-    if os.path.isfile("over.namelist") or os.path.islink("over.namelist"):
-        os.remove("over.namelist")
-    # Prepare environment variables (other than OMP_NUM_THREADS)
-    cc.PrepareEnvironment(rc, i)
-    # Create the correct namelist.
-    shutil.copy("%s.%02i.inp" % (fproj,i+1), "over.namelist")
-    # Get the ``overrunmpi`` command
-    cmdi = cmd.overrun(rc, i=i)
-    # Call the command.
-    bin.callf(cmdi, f="overrun.out", check=False)
-    # Remove the RUNNING file.
-    if os.path.isfile("RUNNING"):
-        os.remove("RUNNING")
-    # Save time usage
-    WriteUserTime(tic, rc, i)
-    # Get the most recent iteration number
-    n = GetCurrentIter()
-    # Get STOP iteration, if any
-    nstop = GetStopIter()
-    # Assuming that worked, move the temp output file
-    fout = "%s.%02i.out" % (fproj, i+1)
-    flog = "%s.%02i.%i" % (fproj, i+1, n)
-    flogj = flog + ".1"
-    jlog = 1
-    # Check if expected output file exists
-    if os.path.isfile(fout):
-        # Check if final file name already exists
-        if os.path.isfile(flog):
-            # Loop utnil we find a viable log file name
-            while os.path.isfile(flogj):
-                # Increase counter
-                jlog += 1
-                flogj = "%s.%i" % (flog, jlog)
-            # Move the existing log file
-            os.rename(flog, flogj)
-        # Move immediate output file to log location
-        os.rename(fout, flog)
-    # Check current iteration count and phase
-    if (i>=rc.get_PhaseSequence(-1)) and (n>=rc.get_LastIter()):
-        # Case completed
-        return
-    elif (nstop is not None) and (n >= nstop):
-        # Stop requested externally
-        return
-    elif (n is None) or ((n0 is not None) and n <= n0):
-        # Failed to advance
-        with open("FAIL", "w") as fp:
-            fp.write("no-advance")
-        return
-    # Resubmit/restart if this point is reached.
-    RestartCase(i)
+    stat = cc.GetCaseJSONStat()
+    # Loop through phases run in this job
+    while True:
+        # Check for RUNNING file.
+        if os.path.isfile('RUNNING'):
+            # Case already running
+            raise IOError('Case already running!')
+        # Start timer
+        tic = datetime.now()
+        # Get the project name
+        fproj = GetPrefix(rc)
+        # Determine the run index.
+        i = GetPhaseNumber(rc)
+        # Record current iteration
+        n0 = GetCurrentIter()
+        # Write start time
+        WriteStartTime(tic, rc, i)
+        # Delete any input file.
+        if os.path.isfile("over.namelist") or \
+                os.path.islink("over.namelist"):
+            os.remove("over.namelist")
+        # Prepare environment variables (other than OMP_NUM_THREADS)
+        cc.PrepareEnvironment(rc, i)
+        # Create the correct namelist.
+        shutil.copy("%s.%02i.inp" % (fproj,i+1), "over.namelist")
+        # Get the ``overrunmpi`` command
+        cmdi = cmd.overrun(rc, i=i)
+        # Call the command.
+        bin.callf(cmdi, f="overrun.out", check=False)
+        # Remove the RUNNING file.
+        if os.path.isfile("RUNNING"):
+            os.remove("RUNNING")
+        # Save time usage
+        WriteUserTime(tic, rc, i)
+        # Get the most recent iteration number
+        n = GetCurrentIter()
+        # Get STOP iteration, if any
+        nstop = GetStopIter()
+        # Assuming that worked, move the temp output file
+        fout = "%s.%02i.out" % (fproj, i+1)
+        flog = "%s.%02i.%i" % (fproj, i+1, n)
+        flogj = flog + ".1"
+        jlog = 1
+        # Check if expected output file exists
+        if os.path.isfile(fout):
+            # Check if final file name already exists
+            if os.path.isfile(flog):
+                # Loop utnil we find a viable log file name
+                while os.path.isfile(flogj):
+                    # Increase counter
+                    jlog += 1
+                    flogj = "%s.%i" % (flog, jlog)
+                # Move the existing log file
+                os.rename(flog, flogj)
+            # Move immediate output file to log location
+            os.rename(fout, flog)
+        # Check current iteration count and phase
+        if (i>=rc.get_PhaseSequence(-1)) and (n>=rc.get_LastIter()):
+            # Case completed
+            return
+        elif (nstop is not None) and (n >= nstop):
+            # Stop requested externally
+            return
+        elif (n is None) or ((n0 is not None) and n <= n0):
+            # Failed to advance
+            with open("FAIL", "w") as fp:
+                fp.write("no-advance")
+            return
+        # Reread settings only if ``case.json`` has changed
+        stat1 = cc.GetCaseJSONStat()
+        if stat1 != stat:
+            rc = ReadCaseJSON()
+            stat = stat1
+        # Resubmit/restart if this point is reached.
+        if RestartCase(i, rc=rc, chain=True) is not True:
+            return
 
 
 # Function to call script or submit.
@@ -254,23 +271,34 @@ def WriteStopIter(n=0):
     f.close()
         
 # Function to call script or submit
-def RestartCase(i0=None):
+def RestartCase(i0=None, rc=None, chain=False):
     """Restart a case by either submitting it or calling with a system command
     
     This version of the command is called with :func:`run_overflow` after
     running a phase or attempting to run a phase.
     
     :Call:
-        >>> RestartCase(i0=None)
+        >>> q = RestartCase(i0=None, rc=None, chain=False)
     :Inputs:
         *i0*: :class:`int` | ``None``
             Phase index of the previous run
+        *rc*: {``None``} | :class:`RunControl`
+            Run control settings; read from ``case.json`` if ``None``
+        *chain*: ``True`` | {``False``}
+            Return ``True`` instead of calling :func:`run_overflow` if
+            the next phase should be run in this job
+    :Outputs:
+        *q*: ``True`` | ``None`` | :class:`int`
+            ``True`` if *chain* and next phase is to be run here, or
+            job ID if case was resubmitted
     :Versions:
         * 2016-02-01 ``@ddalle``: Version 1.0
+        * 2026-10-19 ``@ddalle``: Version 1.1; add *rc*, *chain*
     """
     global twall, dtwall, twall_avail
     # Get the config.
-    rc = ReadCaseJSON()
+    if rc is None:
+        rc = ReadCaseJSON()
     # Determine the run index.
     i = GetPhaseNumber(rc)
     # Task manager
@@ -289,7 +317,7 @@ def RestartCase(i0=None):
     # Check qsub status.
     if not (qpbs or qslr):
         # Run the case.
-        run_overflow()
+        pass
     elif rc.get_Resubmit(i):
         # Check for continuance
         if (i0 is None) or (i>i0) or (not rc.get_Continue(i)):
@@ -306,12 +334,17 @@ def RestartCase(i0=None):
                 # No task manager
                 raise NotImplementedError("Could not determine task manager")
             return pbs
-        else:
-            # Continue on the same job
-            if qtime: run_overflow()
-    else:
-        # Simply run the case. Don't reset modules either.
-        if qtime: run_overflow()
+        elif not qtime:
+            # Not enough time left to continue on the same job
+            return
+    elif not qtime:
+        # Not enough time left in this job
+        return
+    # Continue on the same job
+    if chain:
+        return True
+    # Simply run the case. Don't reset modules either.
+    run_overflow()
     
 # Extend case
 def ExtendCase(m=1, run=True):
@@ -585,12 +618,8 @@ def ReadCaseJSON():
         * 2014-10-02 ``@ddalle``: Version 1.0
         * 2015-12-29 ``@ddalle``: OVERFLOW version
     """
-    # Read the file, fail if not present.
-    f = open('case.json')
-    # Read the settings.
-    opts = json.load(f)
-    # Close the file.
-    f.close()
+    # Read the settings (cached if file unchanged); fail if not present
+    opts = loadJSONFile('case.json', persist=False)
     # Convert to a flowCart object.
     rc = RunControl(**opts)
     # Output
@@ -969,6 +998,44 @@ def EditSplitmqI(fin, fout, qin, qout):
     # Close files
     fi.close()
     fo.close()
+
+
+# Extract subsets of a ``q`` or ``x`` file
+def RunSplitmq(fsplit, flog, cmd):
+    """Run ``splitmq``/``splitmx`` in-process, or *cmd* as a fallback
+
+    The subsets are extracted using :func:`cape.pyover.plot3d.Splitmq`,
+    which reads only the requested planes.  If the input file cannot
+    be parsed, for example because of an unusual record layout, the
+    external program is run using the system command *cmd*.
+
+    :Call:
+        >>> ierr = RunSplitmq(fsplit, flog, cmd)
+    :Inputs:
+        *fsplit*: :class:`str`
+            Name of ``splitmq`` input file
+        *flog*: :class:`str`
+            Name of file to list subsets in
+        *cmd*: :class:`str`
+            Command to run external ``splitmq`` or ``splitmx``
+    :Outputs:
+        *ierr*: :class:`int`
+            Exit status, ``0`` if successful
+    :Versions:
+        * 2026-10-19 ``@ddalle``: Version 1.0
+    """
+    # Try to extract subsets directly
+    try:
+        plot3d.Splitmq(fsplit, flog)
+        return 0
+    except (ValueError, IOError, OSError) as e:
+        # Status update
+        print("    Native extraction failed: %s" % e)
+    # Status update
+    print("    %s" % cmd)
+    # Run external program
+    return os.system(cmd)
+
         
 # Get best Q file
 def GetQ():
@@ -24,6 +24,8 @@ Finally, reading seam curves from individual cases utilizes the class
 
 # File interface
 import os, glob, shutil
+import hashlib
+import json
 # Basic numerics
 import numpy as np
 # Date processing
@@ -37,6 +39,182 @@ from cape import config
 import cape.cfdx.lineLoad
 
 
+# Files created by ``mixsur`` that only depend on the grid
+MIXSUR_FILES = [
+    "grid.i.tri", "grid.bnd", "grid.ib",  "grid.ibi",
+    "mixsur.fmp", "grid.map", "grid.nsf", "grid.ptv"
+]
+# Files created by ``usurp`` that only depend on the grid
+USURP_FILES = ["grid.i.tri", "panel_weights.dat", "usurp.map"]
+
+# Content hashes of files: (path, size, mtime) -> hash
+_FILE_HASHES = {}
+
+
+# Get hash of file contents
+def _hash_file(fname):
+    # Get file signature
+    fabs = os.path.realpath(fname)
+    st = os.stat(fabs)
+    sig = (fabs, st.st_size, st.st_mtime_ns)
+    # Check for previous hash
+    h = _FILE_HASHES.get(sig)
+    if h is not None:
+        return h
+    # Hash contents in blocks
+    sha = hashlib.sha1()
+    with open(fabs, 'rb') as f:
+        for b in iter(lambda: f.read(1 << 20), b""):
+            sha.update(b)
+    # Save
+    h = _FILE_HASHES[sig] = sha.hexdigest()
+    return h
+
+
+# Copy a file, never writing through an existing link
+def _copy_file(fsrc, fdst, readonly=False):
+    # Remove existing file or link (may be a link to the cache)
+    if os.path.islink(fdst) or os.path.isfile(fdst):
+        os.remove(fdst)
+    # Copy contents only (not permissions)
+    shutil.copyfile(fsrc, fdst)
+    # Protect cache entries from accidental edits
+    if readonly:
+        os.chmod(fdst, 0o444)
+
+
+# Get key for surface map cache
+def GetSurfMapKey(fgrid, fmixsur, cmd):
+    """Get hash of surface grid and ``mixsur``/``usurp`` inputs
+
+    The surface triangulation, panel weights, and maps created by
+    ``mixsur`` or ``usurp`` only depend on these inputs, so cases with
+    the same key can share them.
+
+    :Call:
+        >>> key = GetSurfMapKey(fgrid, fmixsur, cmd)
+    :Inputs:
+        *fgrid*: :class:`str`
+            Name of (surface) grid file, usually ``grid.in``
+        *fmixsur*: :class:`str`
+            Name of ``mixsur`` or ``usurp`` input file
+        *cmd*: :class:`str`
+            Name of program and options
+    :Outputs:
+        *key*: ``None`` | :class:`str`
+            SHA-1 hash of inputs; ``None`` if a file is missing
+    :Versions:
+        * 2026-10-19 ``@ddalle``: Version 1.0
+    """
+    # Check for files
+    if not (os.path.isfile(fgrid) and os.path.isfile(fmixsur)):
+        return None
+    # Combine contents of each file
+    txt = json.dumps([cmd, _hash_file(fgrid), _hash_file(fmixsur)])
+    # Output
+    return hashlib.sha1(txt.encode("utf-8")).hexdigest()
+
+
+# Get surface map cache folder
+def GetSurfMapCacheDir(rootdir, key):
+    """Get folder in which to save surface map files with hash *key*
+
+    :Call:
+        >>> fdir = GetSurfMapCacheDir(rootdir, key)
+    :Inputs:
+        *rootdir*: :class:`str`
+            Absolute path to run matrix root folder
+        *key*: ``None`` | :class:`str`
+            Hash from :func:`GetSurfMapKey`
+    :Outputs:
+        *fdir*: ``None`` | :class:`str`
+            Absolute path to cache folder
+    :Versions:
+        * 2026-10-19 ``@ddalle``: Version 1.0
+    """
+    # Check for valid key
+    if key is None:
+        return None
+    # Folder in root directory
+    return os.path.join(rootdir, ".surfmapcache", key)
+
+
+# Link files from surface map cache
+def LinkSurfMapCache(fdir, fnames):
+    """Copy surface map files from cache into current folder
+
+    Files are copied rather than linked so that ``overint`` or
+    ``usurp --use-map`` rewriting them in one case cannot change the
+    shared cache entry.
+
+    :Call:
+        >>> q = LinkSurfMapCache(fdir, fnames)
+    :Inputs:
+        *fdir*: ``None`` | :class:`str`
+            Cache folder from :func:`GetSurfMapCacheDir`
+        *fnames*: :class:`list`\ [:class:`str`]
+            Names of files, e.g. *MIXSUR_FILES*
+    :Outputs:
+        *q*: ``True`` | ``False``
+            Whether or not all files were found in the cache
+    :Versions:
+        * 2026-10-19 ``@ddalle``: Version 1.0
+        * 2026-10-19 ``@ddalle``: Version 1.1; copy instead of link
+    """
+    # Check for folder
+    if fdir is None or not os.path.isdir(fdir):
+        return False
+    # Check for all files
+    for fname in fnames:
+        if not os.path.isfile(os.path.join(fdir, fname)):
+            return False
+    # Copy them
+    for fname in fnames:
+        _copy_file(os.path.join(fdir, fname), fname)
+    return True
+
+
+# Save files to surface map cache
+def SaveSurfMapCache(fdir, fnames):
+    """Save surface map files in current folder to the cache
+
+    Files are copied to a temporary folder which is then renamed, so
+    other processes never see a partial cache entry.  The cached copies
+    are read-only and not linked to the files in the current folder.
+
+    :Call:
+        >>> SaveSurfMapCache(fdir, fnames)
+    :Inputs:
+        *fdir*: ``None`` | :class:`str`
+            Cache folder from :func:`GetSurfMapCacheDir`
+        *fnames*: :class:`list`\ [:class:`str`]
+            Names of files, e.g. *MIXSUR_FILES*
+    :Versions:
+        * 2026-10-19 ``@ddalle``: Version 1.0
+        * 2026-10-19 ``@ddalle``: Version 1.1; read-only copies
+    """
+    # Check for valid key or existing entry
+    if fdir is None or os.path.isdir(fdir):
+        return
+    # Only save complete sets
+    for fname in fnames:
+        if not os.path.isfile(fname):
+            return
+    # Temporary folder
+    ftmp = "%s.tmp%i" % (fdir, os.getpid())
+    try:
+        # Create folder and copy files
+        os.makedirs(ftmp)
+        for fname in fnames:
+            _copy_file(fname, os.path.join(ftmp, fname), readonly=True)
+        # Move into place
+        os.rename(ftmp, fdir)
+    except OSError:
+        # Another process may have saved the same entry
+        if os.path.isdir(ftmp):
+            shutil.rmtree(ftmp, ignore_errors=True)
+
+
 # Create grid.itriq
 def PreprocessTriqOverflow(DB, fq, fdir="lineload"):
     """Perform any necessary preprocessing to create ``triq`` file
@@ -52,6 +230,8 @@ def PreprocessTriqOverflow(DB, fq, fdir="lineload"):
         * 2016-12-20 ``@ddalle``: First version
         * 2016-12-21 ``@ddalle``: Added PBS
         * 2017-04-13 ``@ddalle``: Wrote single version for LL and TriqFM
+        * 2026-10-19 ``@ddalle``: Extract ``q``/``x`` subsets in-process
+        * 2026-10-19 ``@ddalle``: Cache ``mixsur``/``usurp`` output
     """
    # -------
    # Options
@@ -107,10 +287,7 @@ def PreprocessTriqOverflow(DB, fq, fdir="lineload"):
     # Check status of self.fomodir folder
     if qfomo:
         # List of required mixsur files
-        fmo = [
-            "grid.i.tri", "grid.bnd", "grid.ib",  "grid.ibi",
-            "mixsur.fmp", "grid.map", "grid.nsf", "grid.ptv"
-        ]
+        fmo = MIXSUR_FILES
         # Initialize a flag that all these files exist
         qmixsur = True
         qusurp = True
@@ -122,7 +299,7 @@ def PreprocessTriqOverflow(DB, fq, fdir="lineload"):
                 qmixsur = False
                 break
         # List of required usurp files
-        fus = ["grid.i.tri", "panel_weights.dat", "usurp.map"]
+        fus = USURP_FILES
         # Loop through ``usurp`` files
         for f in fus:
             # Check if the file exists
@@ -226,10 +403,8 @@ def PreprocessTriqOverflow(DB, fq, fdir="lineload"):
         case.EditSplitmqI("splitmq.i", lsplitmq, "q.vol", "q.save")
         # Command to run splitmq
         cmd = "splitmq < %s >& splitmq.%s.o" % (lsplitmq, DB.comp)
-        # Status update
-        print("    %s" % cmd)
-        # Run ``splitmq``
-        ierr = os.system(cmd)
+        # Extract subsets, running ``splitmq`` if necessary
+        ierr = case.RunSplitmq(lsplitmq, "splitmq.%s.o" % DB.comp, cmd)
         # Check for errors
         if ierr:
             raise SystemError("Failure while running ``splitmq``")
@@ -248,10 +423,8 @@ def PreprocessTriqOverflow(DB, fq, fdir="lineload"):
         case.EditSplitmqI("splitmq.i", lsplitmx, "x.vol", "grid.in")
         # Command to run splitmx
         cmd = "splitmx < %s >& splitmx.%s.o" % (lsplitmx, DB.comp)
-        # Status update
-        print("    %s" % cmd)
-        # Run ``splitmx``
-        ierr = os.system(cmd)
+        # Extract subsets, running ``splitmx`` if necessary
+        ierr = case.RunSplitmq(lsplitmx, "splitmx.%s.o" % DB.comp, cmd)
         # Check for errors
         if ierr:
             raise SystemError("Failure while running ``splitmx``")
@@ -267,27 +440,48 @@ def PreprocessTriqOverflow(DB, fq, fdir="lineload"):
    # Prepare ``grid.i.tri``
    # ----------------------
     # Check for ``mixsur`` or ``usurp``
-    if qfusurp or (not qusurp):
+    if qfusurp or qusurp:
+        # Files from ``usurp``
+        fmap = USURP_FILES
+        qmap = qusurp
         # Command to usurp
         cmd = ("usurp -v --watertight --disjoin=yes < %s >& usurp.%s.o"
             % (fmixsur, DB.comp))
-        # Status update
-        print("    %s" % cmd)
-        # Run ``usurp``
-        ierr = os.system(cmd)
-        # Check for errors
-        if ierr:
-            raise SystemError("Failure while running ``usurp``")
-    elif (not qfusurp) and (not qusurp) and (not qmixsur):
+        prog = "usurp"
+        opts = "-v --watertight --disjoin=yes"
+    else:
+        # Files from ``mixsur``
+        fmap = MIXSUR_FILES
+        qmap = qmixsur
         # Command to mixsur
         cmd = "mixsur < %s >& mixsur.%s.o" % (fmixsur, DB.comp)
+        prog = "mixsur"
+        opts = ""
+    # Check for output from another case with the same grid
+    if not qmap:
+        # Hash of surface grid and input file
+        key = GetSurfMapKey("grid.in", fmixsur, prog + " " + opts)
+        fcache = GetSurfMapCacheDir(DB.RootDir, key)
+        # Link files from cache
+        qmap = LinkSurfMapCache(fcache, fmap)
+        # Status update
+        if qmap:
+            print("    Using cached %s output %s" % (prog, key[:12]))
+    # Run ``mixsur`` or ``usurp`` if necessary
+    if not qmap:
+        # Remove links so the program doesn't write to cached files
+        for f in fmap:
+            if os.path.islink(f) or os.path.isfile(f):
+                os.remove(f)
         # Status update
         print("    %s" % cmd)
-        # Run ``mixsur``
+        # Run ``usurp`` or ``mixsur``
         ierr = os.system(cmd)
         # Check for errors
         if ierr:
-            raise SystemError("Failure while running ``mixsur``")
+            raise SystemError("Failure while running ``%s``" % prog)
+        # Save output for other cases with the same grid
+        SaveSurfMapCache(fcache, fmap)
    # -----------------------
    # Prepare ``grid.i.triq``
    # -----------------------
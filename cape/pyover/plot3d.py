@@ -13,6 +13,12 @@ custommized header from OVERFLOW ``q`` files, it also contains special
 calculators such as :func:`Q.get_Cp` that calculate derived quantities
 from the native OVERFLOW output state variables.
 
+The class :class:`P3DIndex` and the function :func:`Splitmq` extract
+subsets of grids and index planes from OVERFLOW ``q`` and ``x`` files
+in the same way as the ``splitmq`` and ``splitmx`` utilities. The
+record offsets of the file are indexed once, and only the requested
+planes are read using a memory map.
+
 :See also:
     * :mod:`cape.plot3d`
 """
@@ -20,6 +26,9 @@ from the native OVERFLOW output state variables.
 # Standard library modules
 import os
 import io
+import mmap
+import re
+import struct
 
 # Third-party modules
 import numpy as np
@@ -935,8 +944,477 @@ class X(P3D):
         # Get flags
         self.get_dtypes()
 
+# class X
+
+
+# Read ``splitmq`` input file
+def ReadSplitmqI(fname):
+    r"""Read a ``splitmq`` or ``splitmx`` input file
+
+    Each line after the two file names is a grid number followed by
+    start, end, and increment for *J*, *K*, and *L*.  Negative indices
+    count from the end of the grid, so ``-1`` is the last index.  A
+    line with only a grid number selects the whole grid.
+
+    :Call:
+        >>> fin, fout, subsets = ReadSplitmqI(fname)
+    :Inputs:
+        *fname*: :class:`str`
+            Name of ``splitmq`` input file
+    :Outputs:
+        *fin*: :class:`str`
+            Name of input solution or grid file
+        *fout*: :class:`str`
+            Name of output solution or grid file
+        *subsets*: :class:`list`\ [:class:`tuple`]
+            Grid number and *JS*, *JE*, *JI*, *KS*, *KE*, *KI*, *LS*,
+            *LE*, *LI* for each subset
+    :Versions:
+        * 2026-10-19 ``@ddalle``: Version 1.0
+    """
+    # Read file
+    with open(fname, 'r') as f:
+        lines = f.read().split("\n")
+    # Check for file names
+    if len(lines) < 2:
+        raise ValueError("No input and output files in '%s'" % fname)
+    # Input and output files
+    fin = lines[0].strip()
+    fout = lines[1].strip()
+    # Initialize subsets
+    subsets = []
+    # Loop through remaining lines
+    for line in lines[2:]:
+        # Split into integers
+        V = [int(v) for v in re.split(r"[\s,]+", line) if v]
+        # Check for empty line
+        if len(V) == 0:
+            continue
+        elif len(V) == 1:
+            # Entire grid
+            subsets.append((V[0], 1, -1, 1, 1, -1, 1, 1, -1, 1))
+        elif len(V) == 10:
+            # Grid and index ranges
+            subsets.append(tuple(V))
+        else:
+            raise ValueError(
+                "Invalid ``splitmq`` subset '%s' in '%s'" % (line, fname))
+    # Output
+    return fin, fout, subsets
+
+
+# Extract subsets
+def Splitmq(fname, flog=None):
+    r"""Extract subsets of a ``q`` or ``x`` file like ``splitmq``
+
+    This reads the same input file as ``splitmq`` and ``splitmx`` and
+    writes the same output file without running either program.
+
+    :Call:
+        >>> Splitmq(fname, flog=None)
+    :Inputs:
+        *fname*: :class:`str`
+            Name of ``splitmq`` or ``splitmx`` input file
+        *flog*: {``None``} | :class:`str`
+            Name of file to list subsets in
+    :Versions:
+        * 2026-10-19 ``@ddalle``: Version 1.0
+    """
+    # Read input file
+    fin, fout, subsets = ReadSplitmqI(fname)
+    # Index the input file
+    p3d = P3DIndex(fin)
+    # Write subsets
+    try:
+        dims = p3d.WriteSubsets(fout, subsets)
+    finally:
+        p3d.close()
+    # Write log
+    if flog:
+        with open(flog, 'w') as f:
+            f.write("Input file: %s\n" % fin)
+            f.write("Output file: %s\n" % fout)
+            for (sub, dim) in zip(subsets, dims):
+                f.write("grid %i: %i x %i x %i\n" % ((sub[0],) + dim))
+
+
+# Record index of OVERFLOW Plot3D file
+class P3DIndex(object):
+    r"""Index of records in an OVERFLOW ``q`` or ``x`` file
+
+    The file is opened as a read-only memory map, and the locations of
+    the header and data records for each grid are saved.  Solution or
+    coordinate arrays are views into the map, so only the parts of the
+    file that are used are read from disk.
+
+    :Call:
+        >>> p3d = P3DIndex(fname, endian=None)
+    :Inputs:
+        *fname*: :class:`str`
+            Name of OVERFLOW ``q`` or ``x`` file
+        *endian*: {``None``} | ``"big"`` | ``"little"``
+            Manually-specified byte order
+    :Outputs:
+        *p3d*: :class:`P3DIndex`
+            Record index
+    :Attributes:
+        *p3d.kind*: ``"q"`` | ``"x"``
+            File type
+        *p3d.nGrid*: :class:`int`
+            Number of grids
+        *p3d.dims*: :class:`np.ndarray`\ [:class:`int`]
+            *JD*, *KD*, *LD* for each grid, shape (*nGrid*, 3)
+        *p3d.NQ*: :class:`int`
+            Number of states per point, including species (``q`` only)
+        *p3d.NQC*: :class:`int`
+            Number of species (``q`` only)
+        *p3d.HeaderRecords*: :class:`list`\ [:class:`tuple`]
+            Position and length of each ``q`` header record
+        *p3d.DataRecords*: :class:`list`\ [:class:`tuple`]
+            Position and length of each data record
+    :Versions:
+        * 2026-10-19 ``@ddalle``: Version 1.0
+    """
+    # Initialization method
+    def __init__(self, fname, endian=None):
+        """Initialization method
+
+        :Versions:
+            * 2026-10-19 ``@ddalle``: Version 1.0
+        """
+        # Save file name
+        self.fname = fname
+        # Open memory map
+        with open(fname, 'rb') as f:
+            try:
+                self.buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (ValueError, OSError):
+                raise ValueError("Cannot map Plot3D file '%s'" % fname)
+        # Index records
+        try:
+            self.Index(endian)
+        except Exception:
+            self.close()
+            raise
+
+    # Close memory map
+    def close(self):
+        """Close memory map
+
+        :Call:
+            >>> p3d.close()
+        :Inputs:
+            *p3d*: :class:`P3DIndex`
+                Record index
+        :Versions:
+            * 2026-10-19 ``@ddalle``: Version 1.0
+        """
+        # Check for map
+        if self.buf is None:
+            return
+        # Close it unless arrays still point to it
+        try:
+            self.buf.close()
+        except BufferError:
+            pass
+        self.buf = None
+
+    # Read a record and check end-of-record marker
+    def _record(self, pos):
+        # Size of file
+        n = len(self.buf)
+        # Check for start marker
+        if pos + 4 > n:
+            raise ValueError("Unexpected end of file '%s'" % self.fname)
+        # Record length
+        nr, = struct.unpack_from(self._ifmt, self.buf, pos)
+        # Check end marker
+        if nr < 0 or pos + nr + 8 > n:
+            raise ValueError(
+                "Invalid record at byte %i of '%s'" % (pos, self.fname))
+        if struct.unpack_from(self._ifmt, self.buf, pos + 4 + nr)[0] != nr:
+            raise ValueError(
+                "End-of-record marker does not match start at byte %i" % pos)
+        # Output
+        return nr
 
+    # Read integer record
+    def _read_ints(self, pos, nr):
+        return np.frombuffer(
+            self.buf, dtype=self.itype, count=nr//4, offset=pos+4)
 
+    # Create index
+    def Index(self, endian=None):
+        """Find record locations for each grid
 
+        :Call:
+            >>> p3d.Index(endian=None)
+        :Inputs:
+            *p3d*: :class:`P3DIndex`
+                Record index
+            *endian*: {``None``} | ``"big"`` | ``"little"``
+                Manually-specified byte order
+        :Versions:
+            * 2026-10-19 ``@ddalle``: Version 1.0
+        """
+        # Check for empty file
+        if len(self.buf) < 4:
+            raise ValueError("Plot3D file '%s' is empty" % self.fname)
+        # Determine byte order from first record marker
+        if endian is None:
+            i0, = struct.unpack_from("<i", self.buf, 0)
+            endian = "little" if 0 < i0 < 0x100000 else "big"
+        # Save byte order
+        self.endian = endian
+        self.itype = "<i4" if endian == "little" else ">i4"
+        self._ifmt = "<i" if endian == "little" else ">i"
+        # First record
+        pos = 0
+        nr = self._record(pos)
+        # Check for multiple-grid file
+        if nr == 4:
+            # Number of grids
+            self.mGrid = True
+            self.nGrid = int(self._read_ints(pos, nr)[0])
+            # Go to dimensions record
+            pos += nr + 8
+            nr = self._record(pos)
+        else:
+            # Single grid
+            self.mGrid = False
+            self.nGrid = 1
+        # Read dimensions
+        D = self._read_ints(pos, nr)
+        pos += nr + 8
+        # Check file type from size of dimensions record
+        if D.size == 3*self.nGrid + 2:
+            # Solution file with *NQ* and *NQC*
+            self.kind = "q"
+            self.NQ = int(D[-2] + D[-1])
+            self.NQC = int(D[-1])
+        elif D.size == 3*self.nGrid:
+            # Grid file
+            self.kind = "x"
+            self.NQ = 0
+            self.NQC = 0
+        else:
+            raise ValueError(
+                "Dimensions record of '%s' has %i entries for %i grids"
+                % (self.fname, D.size, self.nGrid))
+        # Save dimensions
+        self.dims = np.array(D[:3*self.nGrid], dtype="int64").reshape(
+            (self.nGrid, 3))
+        # Initialize record lists
+        self.HeaderRecords = []
+        self.DataRecords = []
+        self.ftypes = []
+        self.iblank = []
+        # Loop through grids
+        for (jd, kd, ld) in self.dims:
+            # Number of points
+            npt = int(jd * kd * ld)
+            # Solution header record
+            if self.kind == "q":
+                nr = self._record(pos)
+                self.HeaderRecords.append((pos, nr))
+                pos += nr + 8
+            # Data record
+            nr = self._record(pos)
+            self.DataRecords.append((pos, nr))
+            pos += nr + 8
+            # Determine precision and iblanks from record length
+            if self.kind == "q":
+                nv = self.NQ * npt
+                if nr == 8*nv:
+                    fsize = 8
+                elif nr == 4*nv:
+                    fsize = 4
+                else:
+                    raise ValueError(
+                        "Data record for grid %i has incorrect length"
+                        % len(self.DataRecords))
+                qb = False
+            elif nr == 28*npt:
+                fsize, qb = 8, True
+            elif nr == 24*npt:
+                fsize, qb = 8, False
+            elif nr == 16*npt:
+                fsize, qb = 4, True
+            elif nr == 12*npt:
+                fsize, qb = 4, False
+            else:
+                raise ValueError(
+                    "Data record for grid %i has incorrect length"
+                    % len(self.DataRecords))
+            # Save data types
+            self.ftypes.append(self.itype[0] + "f%i" % fsize)
+            self.iblank.append(qb)
+
+    # Get data arrays
+    def GetGridArrays(self, IG):
+        """Get memory-mapped arrays for one grid
 
-# CLASS x
+        :Call:
+            >>> V, IB = p3d.GetGridArrays(IG)
+        :Inputs:
+            *p3d*: :class:`P3DIndex`
+                Record index
+            *IG*: :class:`int`
+                Grid number (one-based index)
+        :Outputs:
+            *V*: :class:`np.ndarray`\ [:class:`float`]
+                States or coordinates, shape (*NQ* or 3, *LD*, *KD*, *JD*)
+            *IB*: ``None`` | :class:`np.ndarray`\ [:class:`int`]
+                Iblanks for ``x`` files, shape (*LD*, *KD*, *JD*)
+        :Versions:
+            * 2026-10-19 ``@ddalle``: Version 1.0
+        """
+        # Check grid number
+        if IG < 1 or IG > self.nGrid:
+            raise ValueError(
+                "Grid %i out of range for '%s' with %i grids"
+                % (IG, self.fname, self.nGrid))
+        # Dimensions
+        jd, kd, ld = [int(d) for d in self.dims[IG-1]]
+        npt = jd * kd * ld
+        # Record location
+        pos, nr = self.DataRecords[IG-1]
+        # Number of variables
+        nv = self.NQ if self.kind == "q" else 3
+        # View of states or coordinates
+        dtype = np.dtype(self.ftypes[IG-1])
+        V = np.frombuffer(
+            self.buf, dtype=dtype, count=nv*npt, offset=pos+4)
+        V = V.reshape((nv, ld, kd, jd))
+        # View of iblanks
+        if self.iblank[IG-1]:
+            IB = np.frombuffer(
+                self.buf, dtype=self.itype, count=npt,
+                offset=pos + 4 + nv*npt*dtype.itemsize)
+            IB = IB.reshape((ld, kd, jd))
+        else:
+            IB = None
+        # Output
+        return V, IB
+
+    # Convert subset to slices
+    def GetSubsetSlices(self, subset):
+        """Convert a ``splitmq`` subset to slices of grid arrays
+
+        :Call:
+            >>> IG, J, K, L = p3d.GetSubsetSlices(subset)
+        :Inputs:
+            *p3d*: :class:`P3DIndex`
+                Record index
+            *subset*: :class:`tuple`\ [:class:`int`]
+                Grid number and *JS*, *JE*, *JI*, *KS*, *KE*, *KI*, *LS*,
+                *LE*, *LI*; negative indices count from end
+        :Outputs:
+            *IG*: :class:`int`
+                Grid number
+            *J*: :class:`slice`
+                Zero-based slice in *J* direction; likewise *K*, *L*
+        :Versions:
+            * 2026-10-19 ``@ddalle``: Version 1.0
+        """
+        # Grid number
+        IG = subset[0]
+        if IG < 1 or IG > self.nGrid:
+            raise ValueError(
+                "Grid %i out of range for '%s' with %i grids"
+                % (IG, self.fname, self.nGrid))
+        # Initialize slices
+        slices = []
+        # Loop through directions
+        for (k, d) in enumerate(self.dims[IG-1]):
+            # Start, end, increment
+            ia, ib, di = subset[3*k+1:3*k+4]
+            # Negative indices count back from last index
+            if ia < 0: ia += d + 1
+            if ib < 0: ib += d + 1
+            # Check range
+            if not (1 <= ia <= ib <= d) or di < 1:
+                raise ValueError(
+                    "Invalid range %s for grid %i with dimensions %s"
+                    % (subset[3*k+1:3*k+4], IG, tuple(self.dims[IG-1])))
+            # Save slice
+            slices.append(slice(ia-1, ib, di))
+        # Output
+        return (IG,) + tuple(slices)
+
+    # Write subsets
+    def WriteSubsets(self, fname, subsets):
+        """Write subsets of grids to a new multiple-grid file
+
+        The output has the same type, byte order, and precision as the
+        input file, and each ``q`` grid keeps its original header.
+
+        :Call:
+            >>> dims = p3d.WriteSubsets(fname, subsets)
+        :Inputs:
+            *p3d*: :class:`P3DIndex`
+                Record index
+            *fname*: :class:`str`
+                Name of output file
+            *subsets*: :class:`list`\ [:class:`tuple`]
+                List of ``splitmq`` subsets, see :func:`ReadSplitmqI`
+        :Outputs:
+            *dims*: :class:`list`\ [:class:`tuple`]
+                Dimensions of each subset
+        :Versions:
+            * 2026-10-19 ``@ddalle``: Version 1.0
+        """
+        # Check for subsets
+        if len(subsets) == 0:
+            raise ValueError("No subsets to write to '%s'" % fname)
+        # Convert subsets to slices
+        S = [self.GetSubsetSlices(subset) for subset in subsets]
+        # Dimensions of each subset
+        dims = [
+            tuple(len(range(*s.indices(int(d))))
+                for (s, d) in zip(Si[1:], self.dims[Si[0]-1]))
+            for Si in S
+        ]
+        # Integer type for markers
+        ti = self.itype
+        # Dimensions record
+        D = [d for dim in dims for d in dim]
+        if self.kind == "q":
+            D += [self.NQ - self.NQC, self.NQC]
+        # Don't overwrite the input file while it's mapped
+        if os.path.abspath(fname) == os.path.abspath(self.fname):
+            raise ValueError("Cannot overwrite input file '%s'" % fname)
+        # Remove links so that the target is not overwritten
+        if os.path.islink(fname):
+            os.remove(fname)
+        # Open output file
+        with open(fname, 'wb') as f:
+            # Number of grids
+            np.array([4, len(S), 4], dtype=ti).tofile(f)
+            # Dimensions
+            np.array([4*len(D)] + D + [4*len(D)], dtype=ti).tofile(f)
+            # Loop through subsets
+            for (IG, J, K, L) in S:
+                # Copy header record
+                if self.kind == "q":
+                    pos, nr = self.HeaderRecords[IG-1]
+                    f.write(self.buf[pos:pos+nr+8])
+                # Get views of the grid
+                V, IB = self.GetGridArrays(IG)
+                # Extract requested planes
+                V = np.ascontiguousarray(V[:, L, K, J])
+                # Record length
+                nr = V.nbytes
+                if IB is not None:
+                    IB = np.ascontiguousarray(IB[L, K, J])
+                    nr += IB.nbytes
+                # Write record
+                np.array([nr], dtype=ti).tofile(f)
+                V.tofile(f)
+                if IB is not None:
+                    IB.tofile(f)
+                np.array([nr], dtype=ti).tofile(f)
+                # Release views
+                del V, IB
+        # Output
+        return dims
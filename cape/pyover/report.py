@@ -418,8 +418,7 @@ class Report(capereport.Report):
             case.EditSplitmqI(fname, fspq, fqi, fqo)
             # Split the solution
             cmd = 'splitmq < %s > %s' % (fspq, fspqo)
-            print("    %s" % cmd)
-            ierr = os.system(cmd)
+            ierr = case.RunSplitmq(fspq, fspqo, cmd)
             # Check for errors
             if ierr: return
             # Delete files
@@ -431,8 +430,7 @@ class Report(capereport.Report):
             case.EditSplitmqI(fname, fspx, fxi, fxo)
             # Split the surface grid
             cmd = 'splitmx < %s > %s' % (fspx, fspxo)
-            print("    %s" % cmd)
-            ierr = os.system(cmd)
+            ierr = case.RunSplitmq(fspx, fspxo, cmd)
             # Check for errors
             if ierr: return
             # Delete files
@@ -17,7 +17,6 @@ obviously a solver-specific task.
 # Standard library modules
 import os
 import glob
-import json
 import shutil
 import resource
 
@@ -35,6 +34,7 @@ from . import cmd
 
 # Partial local imports
 from .options.runControl import RunControl
+from ..cfdx.options.util import loadJSONFile
 from .inputInp import InputInp
 
 
@@ -128,10 +128,8 @@ def ReadCaseJSON():
         * 2014-10-02 ``@ddalle``: First version
         * 2015-10-19 ``@ddalle``: FUN3D version
     """
-    # Read the file, fail if not present.
-    with open('case.json') as f:
-        # Read the settings
-        opts = json.load(f)
+    # Read the settings (cached if file unchanged); fail if not present
+    opts = loadJSONFile('case.json', persist=False)
     # Convert to a flowCart object.
     rc = RunControl(**opts)
     # Output
@@ -106,6 +106,275 @@ regex_line_parts = re.compile(r"\s*[^\s,]*\s*,|\s*[^\s,]+")
 regex_float = re.compile(
     r"[+-]?[0-9]*\.(?P<dec>[0-9]+)(?P<exp>[DdEe][+-][0-9]{1,3})")
 
+# Regular expressions for converting constraints to Python expressions
+regex_con_eq = re.compile("(?<![<>=!~])=(?!=)")
+regex_con_var = re.compile(r"(?<!['\"@\w.])([A-Za-z_]\w*)(?![\w(.'\"])")
+regex_con_func = re.compile(r"(?<![\w.])([A-Za-z_]\w*)(?=\()")
+
+# Cache of compiled constraint functions
+_CONSTRAINT_CACHE = {}
+
+
+# Convert a constraint to a function
+def compile_constraint(con):
+    r"""Compile a run matrix constraint into a reusable mask function
+
+    The constraint is rewritten and compiled only once for each unique
+    string; subsequent calls return the same function.
+
+    :Call:
+        >>> func, expr = compile_constraint(con)
+        >>> mask = func(x)
+    :Inputs:
+        *con*: :class:`str`
+            Constraint, for example ``"mach>=0.5"``
+        *x*: :class:`cape.runmatrix.RunMatrix`
+            Run matrix interface
+    :Outputs:
+        *func*: ``None`` | :class:`function`
+            Function returning mask of cases that satisfy *con*;
+            ``None`` if *con* is not a valid expression
+        *expr*: :class:`str`
+            Python expression used to evaluate *con*
+        *mask*: :class:`np.ndarray`\ [:class:`bool`]
+            Whether or not each case satisfies *con*
+    :Versions:
+        * 2026-10-19 ``@ddalle``: Version 1.0
+    """
+    # Check cache
+    if con in _CONSTRAINT_CACHE:
+        return _CONSTRAINT_CACHE[con]
+    # Substitute '=' -> '==' while leaving '==', '<=', '>=', '!='
+    expr = regex_con_eq.sub("==", con)
+    # Replace variable names with calls to GetValue()
+    # But don't replace functions
+    #     sin(phi)      --> sin(self.GetValue('phi'))
+    #     np.sin(phi)   --> np.sin(self.GetValue('phi'))
+    #     sin(self.phi) --> sin(self.phi)
+    #     user=="@user" --> self.GetValue('user')=="@user"
+    expr = regex_con_var.sub(r"self.GetValue('\1')", expr)
+    # Replace any raw function calls with numpy ones
+    expr = regex_con_func.sub(r"np.\1", expr)
+    # Compile into a function of the run matrix
+    try:
+        func = eval("lambda self: (%s)" % expr, globals())
+    except Exception:
+        func = None
+    # Save
+    _CONSTRAINT_CACHE[con] = (func, expr)
+    # Output
+    return func, expr
+
+
+# Check which entries of an array are nonzero/nonempty
+def _truthy(V):
+    r"""Get mask of which entries of an array evaluate to ``True``
+
+    :Call:
+        >>> mask = _truthy(V)
+    :Inputs:
+        *V*: :class:`np.ndarray`
+            Array of values
+    :Outputs:
+        *mask*: :class:`np.ndarray`\ [:class:`bool`]
+            ``bool(V[i])`` for each *i*
+    :Versions:
+        * 2026-10-19 ``@ddalle``: Version 1.0
+    """
+    # Check type
+    if V.dtype.kind in "US":
+        # Nonempty strings
+        return np.char.str_len(V) > 0
+    elif V.dtype.kind in "biufc":
+        # Nonzero numbers
+        return V != 0
+    else:
+        # General objects
+        return np.array([bool(v) for v in V], dtype="bool")
+
+
+# Check which cases have text for a key
+def _has_text(txt, n):
+    r"""Get mask of which cases have nonblank text for a run matrix key
+
+    :Call:
+        >>> mask = _has_text(txt, n)
+    :Inputs:
+        *txt*: :class:`list`\ [:class:`str`]
+            Text for each case from run matrix file
+        *n*: :class:`int`
+            Number of cases
+    :Outputs:
+        *mask*: :class:`np.ndarray`\ [:class:`bool`]
+            Whether or not each case has text for this key
+    :Versions:
+        * 2026-10-19 ``@ddalle``: Version 1.0
+    """
+    # Initialize
+    mask = np.zeros(n, dtype="bool")
+    # Number of cases with text
+    m = min(n, len(txt))
+    # Check text
+    if m > 0:
+        mask[:m] = np.char.str_len(np.char.strip(np.array(txt[:m]))) > 0
+    # Output
+    return mask
+
+
+# Class to find points matching sweep constraints
+class SweepMatcher(object):
+    r"""Find cases matching equality or tolerance constraints
+
+    The values for each constraint are evaluated once for all cases,
+    and the cases are sorted by the values of the most selective
+    constraint.  Each search then only tests the cases in a small
+    window of that sorted list instead of the entire run matrix.  A
+    case matches if, for each constraint *k*,
+
+    .. code-block:: python
+
+        abs(V[k][j] - v0[k]) <= tols[k] or S[k][j]
+
+    :Call:
+        >>> matcher = SweepMatcher(V, tols, S=None, mask=None, n=None)
+    :Inputs:
+        *V*: :class:`list`\ [:class:`np.ndarray`]
+            Values of each constraint for each candidate
+        *tols*: :class:`list`\ [:class:`float`]
+            Tolerance for each constraint
+        *S*: {``None``} | :class:`list`\ [``None`` | :class:`np.ndarray`]
+            Optional mask of candidates that always pass each constraint
+        *mask*: {``None``} | :class:`np.ndarray`\ [:class:`bool`]
+            Mask of candidates to consider; default is all
+        *n*: {``None``} | :class:`int`
+            Number of candidates; default from *mask* or *V*
+    :Outputs:
+        *matcher*: :class:`SweepMatcher`
+            Sweep search interface
+    :Versions:
+        * 2026-10-19 ``@ddalle``: Version 1.0
+    """
+    # Initialization method
+    def __init__(self, V, tols, S=None, mask=None, n=None):
+        r"""Initialization method
+
+        :Versions:
+            * 2026-10-19 ``@ddalle``: Version 1.0
+        """
+        # Save constraint values
+        self.V = [np.asarray(v) for v in V]
+        self.tols = list(tols)
+        # Special masks
+        if S is None:
+            S = [None for v in self.V]
+        self.S = list(S)
+        # Number of candidates
+        if n is None:
+            if mask is not None:
+                n = len(mask)
+            elif len(self.V) > 0:
+                n = self.V[0].size
+            else:
+                n = 0
+        self.n = n
+        # Candidates to consider
+        if mask is None:
+            self.I = np.arange(n)
+        else:
+            self.I = np.where(mask)[0]
+        # Choose constraint for sorting
+        self.k = self._choose_key()
+        # Sort candidates by that constraint
+        if self.k is None:
+            self.isort = None
+            self.vsort = None
+        else:
+            vk = self.V[self.k][self.I]
+            j = np.argsort(vk, kind="stable")
+            self.isort = self.I[j]
+            self.vsort = vk[j]
+
+    # Pick the constraint used to sort candidates
+    def _choose_key(self):
+        r"""Choose the most selective numeric constraint
+
+        :Call:
+            >>> k = matcher._choose_key()
+        :Outputs:
+            *k*: ``None`` | :class:`int`
+                Index of constraint with most distinct values
+        :Versions:
+            * 2026-10-19 ``@ddalle``: Version 1.0
+        """
+        # Initialize
+        kbest = None
+        nbest = 0
+        # Loop through constraints
+        for k, v in enumerate(self.V):
+            # Only numeric constraints w/o special cases can be sorted
+            if v.dtype.kind not in "biuf" or self.S[k] is not None:
+                continue
+            # Check size
+            if v.ndim != 1 or v.size != self.n:
+                continue
+            # Number of distinct values
+            nk = np.unique(v[self.I]).size
+            # Check for most selective constraint
+            if nk > nbest:
+                kbest = k
+                nbest = nk
+        # Output
+        return kbest
+
+    # Find matches
+    def match(self, v0, imax=None):
+        r"""Find candidates matching reference values
+
+        :Call:
+            >>> J = matcher.match(v0, imax=None)
+        :Inputs:
+            *matcher*: :class:`SweepMatcher`
+                Sweep search interface
+            *v0*: :class:`list`
+                Reference value for each constraint
+            *imax*: {``None``} | :class:`int`
+                If specified, only consider candidates with ``j<imax``
+        :Outputs:
+            *J*: :class:`np.ndarray`\ [:class:`int`]
+                Sorted indices of candidates meeting all constraints
+        :Versions:
+            * 2026-10-19 ``@ddalle``: Version 1.0
+        """
+        # Get candidates
+        if self.k is None:
+            # Test all candidates
+            J = self.I
+        else:
+            # Reference value and tolerance for sorted constraint
+            x = v0[self.k]
+            tol = self.tols[self.k]
+            # Widen window slightly; exact test is below
+            dx = tol + 1e-12*(abs(x) + tol + 1.0)
+            # Window of sorted candidates
+            ja = np.searchsorted(self.vsort, x - dx, side="left")
+            jb = np.searchsorted(self.vsort, x + dx, side="right")
+            # Candidates in original order
+            J = np.sort(self.isort[ja:jb])
+        # Restrict index
+        if imax is not None:
+            J = J[J < imax]
+        # Apply each constraint to remaining candidates
+        for k, v in enumerate(self.V):
+            # Test
+            q = np.abs(v[J] - v0[k]) <= self.tols[k]
+            # Add special cases
+            if self.S[k] is not None:
+                q = np.logical_or(q, self.S[k][J])
+            # Apply
+            J = J[q]
+        # Output
+        return J
+
 
 # RunMatrix class
 class RunMatrix(dict):
@@ -588,6 +857,8 @@ class RunMatrix(dict):
                 self[k] = V
         # Save that value to the data
         V[i] = v
+        # Reset folder names
+        self.ClearFolderNameCache()
 
     # Pass a case
     def MarkPASS(self, i, flag="p"):
@@ -1219,6 +1490,8 @@ class RunMatrix(dict):
         y = [list(xi) for xi in x]
         # Initialize list of unique conditions.
         Y = []
+        # Index of each unique condition
+        iY = {}
         # Initialize the groupID numbers.
         gID = []
         # Test for case of now groups.
@@ -1227,16 +1500,21 @@ class RunMatrix(dict):
             gID = np.zeros(self.nCase)
         # Loop through the full set of conditions.
         for yi in y:
+            # Hashable version
+            ti = tuple(yi)
             # Test if it's in the existing set of unique conditions.
-            if not (yi in Y):
+            if ti not in iY:
                 # If not, append it.
+                iY[ti] = len(Y)
                 Y.append(yi)
             # Save the index.
-            gID.append(Y.index(yi))
+            gID.append(iY[ti])
         # Convert the result and save it.
         self.GroupX = np.array(Y)
         # Save the group index for *all* conditions.
         self.GroupID = np.array(gID)
+        # Group keys may have changed
+        self.ClearFolderNameCache()
         return None
 
     # Get all keys by type
@@ -1663,6 +1941,145 @@ class RunMatrix(dict):
         # Return the result.
         return dname
 
+    # Assemble names of all cases
+    def _AssembleNames(self, keys, prefix):
+        r"""Assemble group or case folder names for all cases at once
+
+        This produces the same names as :func:`_AssembleName` but
+        formats each key for the whole run matrix using vectorized
+        string operations.
+
+        :Call:
+            >>> dlist = x._AssembleNames(keys, prefix)
+        :Inputs:
+            *x*: :class:`cape.runmatrix.RunMatrix`
+                Instance of the pyCart trajectory class
+            *keys*: :type:`list` (:class:`str`)
+                List of keys to use for this folder name
+            *prefix*: :class:`str`
+                Header for name of each case folder
+        :Outputs:
+            *dlist*: :class:`list`\ [:class:`str`]
+                Name of each case
+        :Versions:
+            * 2026-10-19 ``@ddalle``: Version 1.0
+        """
+        # Number of cases
+        n = self.nCase
+        # Unusual data (e.g. mismatched lengths) uses case-by-case method
+        try:
+            return self._AssembleNamesVectorized(keys, prefix, n)
+        except Exception:
+            return [self._AssembleName(keys, prefix, i) for i in range(n)]
+
+    # Vectorized version of name assembly
+    def _AssembleNamesVectorized(self, keys, prefix, n):
+        r"""Assemble folder names using vectorized string operations
+
+        :Call:
+            >>> dlist = x._AssembleNamesVectorized(keys, prefix, n)
+        :Inputs:
+            *x*: :class:`cape.runmatrix.RunMatrix`
+                Instance of the pyCart trajectory class
+            *keys*: :type:`list` (:class:`str`)
+                List of keys to use for this folder name
+            *prefix*: :class:`str`
+                Header for name of each case folder
+            *n*: :class:`int`
+                Number of cases
+        :Outputs:
+            *dlist*: :class:`list`\ [:class:`str`]
+                Name of each case
+        :Versions:
+            * 2026-10-19 ``@ddalle``: Version 1.0
+        """
+        # Process the key types.
+        types = [self.defns[k].get("Type", "") for k in keys]
+        # Check for a prefix.
+        if "Config" in types:
+            # Figure out which key it is
+            j = types.index("Config")
+            # Get the specified prefix.
+            V = np.asarray(self[keys[j]])[:n]
+            # Use the specified prefix/config unless empty
+            dname = np.where(
+                _truthy(V), np.char.mod("%s", V), str(prefix))
+            # Add underscore if more keys remaining.
+            if len(types) > 1:
+                dname = np.char.add(dname, "_")
+        elif prefix:
+            # The prefix is likely to be the whole name.
+            dname = str(prefix)
+            # Add underscore if there are keys.
+            if (keys is not None) and (len(keys) > 0):
+                dname += "_"
+            # Expand
+            dname = np.full(n, dname)
+        else:
+            # Initialize an empty string.
+            dname = np.full(n, "")
+        # Append based on the keys.
+        for k in keys:
+            # Get definitions for this key
+            defns = self.defns.get(k, {})
+            # Useful values
+            typ = defns.get("Type", "value")
+            fmt = defns.get("Format", "%s")
+            grp = defns.get("Group", False)
+            qlbl = defns.get("Label", True)
+            abbrev = defns.get("Abbreviation", k)
+            # Check for unlabeled values
+            if (not qlbl):
+                continue
+            # Check for special keys
+            if grp and (typ.lower() == "config"):
+                continue
+            if typ.lower() == "label":
+                continue
+            # Get the values
+            V = np.asarray(self[k])[:n]
+            # Skip unentered values
+            mask = _has_text(self.text[k], n)
+            # Check for "SkipZero" flag
+            if defns.get("SkipIfZero", False):
+                mask = np.logical_and(mask, _truthy(V))
+            # Check for "make positive" option
+            qnn  = defns.get("NonnegativeFormat", False)
+            qabs = defns.get("AbsoluteValueFormat", False)
+            # Check for absolute value flag
+            if qabs and not qnn:
+                # Replace value with magnitude
+                V = np.abs(V)
+            # Make the string of what's going to be printed.
+            # This is something like ``'%.2f' % x.alpha[i]``.
+            lbl = np.char.mod(fmt, V)
+            # Check for nonnegative flag
+            if qnn:
+                # Replace nonpositive values with zero
+                lbl = np.where(V > 0, lbl, fmt % 0)
+            # Append the text in the trajectory file.
+            dname = np.where(
+                mask, np.char.add(dname, np.char.add(abbrev, lbl)), dname)
+        # Check for suffix keys.
+        for k in keys:
+            # Only look for labels.
+            if self.defns[k].get("Type") != "Label":
+                continue
+            # Get the labels, padding end of matrix
+            lbl = np.array(self.text[k][:n] + [""]*(n - len(self.text[k])))
+            # Check the value
+            mask = np.char.str_len(lbl) > 0
+            # Add underscore if necessary.
+            sep = np.where(np.char.str_len(dname) > 0, "_", "")
+            # Add the label itself
+            dname = np.where(
+                mask,
+                np.char.add(
+                    np.char.add(dname, sep), np.char.add(self.abbrv[k], lbl)),
+                dname)
+        # Return the result.
+        return [str(dname[i]) for i in range(n)]
+
     # Get PBS name
     def GetPBSName(self, i, pre=None):
         r"""Get PBS name for a given case
@@ -1755,18 +2172,14 @@ class RunMatrix(dict):
                 Folder name or list of folder names
         :Versions:
             * 2014-06-05 ``@ddalle``: Version 1.0
+            * 2026-10-19 ``@ddalle``: Version 2.0; use name cache
         """
-        # Get the two components.
-        glist = self.GetGroupFolderNames(i)
-        flist = self.GetFolderNames(i, prefix)
-        # Check for list or not.
-        if type(glist) is list:
-            # Return the list of combined strings.
-            return [
-                os.path.join(glist[i], flist[i]) for i in range(len(glist))]
-        else:
-            # Just join the one.
-            return os.path.join(glist, flist)
+        # Process the prefix.
+        if prefix is None: prefix = self.prefix
+        # Get cached names for all cases
+        dlist = self._GetNameCache("full", prefix)
+        # Select requested cases
+        return self._SelectNames(dlist, i)
 
     # Function to list directory names
     def GetFolderNames(self, i=None, prefix=None):
@@ -1804,28 +2217,14 @@ class RunMatrix(dict):
         :Versions:
             * 2014-05-28 ``@ddalle``: Version 1.0
             * 2014-06-05 ``@ddalle``: Version 1.1; case folder only
+            * 2026-10-19 ``@ddalle``: Version 2.0; use name cache
         """
         # Process the prefix.
         if prefix is None: prefix = self.prefix
-        # Process the index list.
-        if i is None: i = range(self.nCase)
-        # Get the variable names.
-        keys = self.NonGroupKeys
-        # Check for a list.
-        if np.isscalar(i):
-            # Get the name.
-            dlist = self._AssembleName(keys, prefix, i)
-        else:
-            # Initialize the list.
-            dlist = []
-            # Loop through the conditions.
-            for j in i:
-                # Get the folder name.
-                dname = self._AssembleName(keys, prefix, j)
-                # Append to the list.
-                dlist.append(dname)
-        # Return the list.
-        return dlist
+        # Get cached names for all cases
+        dlist = self._GetNameCache("case", prefix)
+        # Select requested cases
+        return self._SelectNames(dlist, i)
 
     # Function to get grid folder names
     def GetGroupFolderNames(self, i=None):
@@ -1845,29 +2244,149 @@ class RunMatrix(dict):
                 Folder name or list of folder names
         :Versions:
             * 2014-06-05 ``@ddalle``: Version 1.0
+            * 2026-10-19 ``@ddalle``: Version 2.0; use name cache
+        """
+        # Get cached names for all cases
+        dlist = self._GetNameCache("group", self.GroupPrefix)
+        # Select requested cases
+        return self._SelectNames(dlist, i)
+
+    # Select subset of names
+    def _SelectNames(self, dlist, i=None):
+        r"""Select one or more names from full list of names
+
+        :Call:
+            >>> dname = x._SelectNames(dlist, i=None)
+        :Inputs:
+            *x*: :class:`cape.runmatrix.RunMatrix`
+                Instance of the pyCart trajectory class
+            *dlist*: :class:`list`\ [:class:`str`]
+                Name of each case in run matrix
+            *i*: :class:`int` or :class:`list`
+                Index of cases to process or list of cases.  If this is
+                ``None``, all cases will be processed.
+        :Outputs:
+            *dname*: :class:`str` or :class:`list`
+                Folder name or list of folder names
+        :Versions:
+            * 2026-10-19 ``@ddalle``: Version 1.0
         """
-        # Set the prefix
-        prefix = self.GroupPrefix
-        # Process the index list.
-        if i is None: i = range(self.nCase)
-        # Get the names of variables requiring separate grids.
-        keys = self.GroupKeys
         # Check for a list.
-        if np.isscalar(i):
-            # Get the name.
-            dlist = self._AssembleName(keys, prefix, i)
+        if i is None:
+            # Copy of the whole list
+            return list(dlist)
+        elif np.isscalar(i):
+            # Single name
+            return dlist[i]
+        else:
+            # Subset
+            return [dlist[j] for j in i]
+
+    # Get cached names
+    def _GetNameCache(self, typ, prefix):
+        r"""Get group, case, or full folder names of all cases
+
+        The names are assembled for the whole run matrix at once and
+        saved.  The cache is rebuilt if any key's values or text is
+        replaced, if *x.nCase* changes, or after
+        :func:`ClearFolderNameCache`.
+
+        :Call:
+            >>> dlist = x._GetNameCache(typ, prefix)
+        :Inputs:
+            *x*: :class:`cape.runmatrix.RunMatrix`
+                Instance of the pyCart trajectory class
+            *typ*: ``"group"`` | ``"case"`` | ``"full"``
+                Which folder names to get
+            *prefix*: :class:`str`
+                Header for name of each folder
+        :Outputs:
+            *dlist*: :class:`list`\ [:class:`str`]
+                Name of each case in run matrix
+        :Versions:
+            * 2026-10-19 ``@ddalle``: Version 1.0
+        """
+        # Get cache
+        cache = self.__dict__.setdefault("_name_cache", {})
+        # Current state of run matrix data
+        state = (
+            self.nCase,
+            [self.get(k) for k in self.cols],
+            [self.text.get(k) for k in self.cols])
+        # Check for match to state used to create cache
+        if not self._CheckNameCacheState(cache.get("state"), state):
+            # Reset cache
+            cache.clear()
+            cache["state"] = state
+        # Check for names already assembled
+        if (typ, prefix) in cache:
+            return cache[typ, prefix]
+        # Assemble names
+        if typ == "full":
+            # Combine group and case names
+            glist = self._GetNameCache("group", self.GroupPrefix)
+            flist = self._GetNameCache("case", prefix)
+            dlist = [os.path.join(g, f) for g, f in zip(glist, flist)]
+        elif typ == "group":
+            # Names of groups
+            dlist = self._AssembleNames(self.GroupKeys, prefix)
         else:
-            # Initialize the list.
-            dlist = []
-            # Loop through the conditions.
-            for j in i:
-                # Get the folder name.
-                dname = self._AssembleName(keys, prefix, j)
-                # Append to the list.
-                dlist.append(dname)
-        # Return the list.
+            # Names of cases within group
+            dlist = self._AssembleNames(self.NonGroupKeys, prefix)
+        # Save
+        cache[typ, prefix] = dlist
+        # Output
         return dlist
 
+    # Compare states
+    def _CheckNameCacheState(self, state0, state):
+        r"""Check if run matrix data matches that used for name cache
+
+        :Call:
+            >>> q = x._CheckNameCacheState(state0, state)
+        :Inputs:
+            *x*: :class:`cape.runmatrix.RunMatrix`
+                Instance of the pyCart trajectory class
+            *state0*: ``None`` | :class:`tuple`
+                State saved with the name cache
+            *state*: :class:`tuple`
+                Current state
+        :Outputs:
+            *q*: ``True`` | ``False``
+                Whether or not cache is valid
+        :Versions:
+            * 2026-10-19 ``@ddalle``: Version 1.0
+        """
+        # Check for empty cache
+        if state0 is None:
+            return False
+        # Check case count
+        if state0[0] != state[0]:
+            return False
+        # Check that each array and text list is the same object
+        for V0, V in zip(state0[1] + state0[2], state[1] + state[2]):
+            if V0 is not V:
+                return False
+        # Check number of keys
+        return len(state0[1]) == len(state[1])
+
+    # Reset cache
+    def ClearFolderNameCache(self):
+        r"""Reset cached group and case folder names
+
+        This must be called after editing values of run matrix keys in
+        place (other than via :func:`SetValue`).
+
+        :Call:
+            >>> x.ClearFolderNameCache()
+        :Inputs:
+            *x*: :class:`cape.runmatrix.RunMatrix`
+                Instance of the pyCart trajectory class
+        :Versions:
+            * 2026-10-19 ``@ddalle``: Version 1.0
+        """
+        self.__dict__["_name_cache"] = {}
+
     # Function to get grid folder names
     def GetUniqueGroupFolderNames(self, i=None):
         r"""Get unique names of folders that require separate meshes
@@ -1940,6 +2459,8 @@ class RunMatrix(dict):
             * 2019-12-09 ``@ddalle``: Version 2.0
                 - Discontinue attributes, i.e. *x.mach*
                 - Use :mod:`re` to process constraints
+            * 2026-10-19 ``@ddalle``: Version 2.1
+                - Use :func:`compile_constraint`
         """
         # Initialize the conditions.
         if I is None:
@@ -1960,28 +2481,15 @@ class RunMatrix(dict):
             if re.search('[\n]', con):
                 print("Constraint %s contains escape character; skipping")
                 continue
-            # Substitute '=' -> '==' while leaving '==', '<=', '>=', '!='
-            con = re.sub("(?<![<>=!~])=(?!=)", "==", con)
-            # Replace variable names with calls to GetValue()
-            # But don't replace functions
-            #     sin(phi)      --> sin(self.GetValue('phi'))
-            #     np.sin(phi)   --> np.sin(self.GetValue('phi'))
-            #     sin(self.phi) --> sin(self.phi)
-            #     user=="@user" --> self.GetValue('user')=="@user"
-            con = re.sub(
-                r"(?<!['\"@\w.])([A-Za-z_]\w*)(?![\w(.'\"])",
-                r"self.GetValue('\1')", con)
-            # Replace any raw function calls with numpy ones
-            con = re.sub(
-                r"(?<![\w.])([A-Za-z_]\w*)(?=\()",
-                r"np.\1", con)
+            # Get compiled version of constraint
+            func, expr = compile_constraint(con)
             # Constraint may fail with bad input.
             try:
                 # Apply the constraint.
-                i = np.logical_and(i, eval(con))
+                i = np.logical_and(i, func(self))
             except Exception:
                 # Print a warning and move on.
-                print("Constraint '%s' failed to evaluate." % con)
+                print("Constraint '%s' failed to evaluate." % expr)
         # Output
         return np.where(i)[0]
 
@@ -2014,12 +2522,12 @@ class RunMatrix(dict):
             i = np.arange(self.nCase) < -1
             # Set the specified indices to True
             i[I] = True
+        # Get all case names
+        fruns = self.GetFullFolderNames()
         # Loop through conditions
         for j in np.where(i)[0]:
-            # Get the case name.
-            frun = self.GetFullFolderNames(j)
             # Check if the string is in there.
-            if txt not in frun:
+            if txt not in fruns[j]:
                 i[j] = False
         # Output
         return np.where(i)[0]
@@ -2059,12 +2567,14 @@ class RunMatrix(dict):
             i = np.arange(self.nCase) < -1
             # Set the specified indices to True
             i[I] = True
+        # Get all case names
+        fruns = self.GetFullFolderNames()
+        # Compile the wildcard
+        regex = re.compile(fnmatch.translate(txt))
         # Loop through conditions
         for j in np.where(i)[0]:
-            # Get the case name.
-            frun = self.GetFullFolderNames(j)
             # Check if the string is in there.
-            if not fnmatch.fnmatch(frun, txt):
+            if not regex.match(fruns[j]):
                 i[j] = False
         # Output
         return np.where(i)[0]
@@ -2098,12 +2608,14 @@ class RunMatrix(dict):
             i = np.arange(self.nCase) < -1
             # Set the specified indices to True
             i[I] = True
+        # Get all case names
+        fruns = self.GetFullFolderNames()
+        # Compile the regular expression
+        regex = re.compile(txt)
         # Loop through conditions
         for j in np.where(i)[0]:
-            # Get the case name.
-            frun = self.GetFullFolderNames(j)
             # Check if the name matches the regular expression.
-            if not re.search(txt, frun):
+            if not regex.search(fruns[j]):
                 i[j] = False
         # Output
         return np.where(i)[0]
@@ -2400,6 +2912,7 @@ class RunMatrix(dict):
         :Versions:
             * 2015-05-24 ``@ddalle``: Version 1.0
             * 2017-06-27 ``@ddalle``: Added special variables
+            * 2026-10-19 ``@ddalle``: Version 2.0; common constraint eval
         """
         # Check for an *i0* point.
         if not np.any(M): return np.array([])
@@ -2433,114 +2946,18 @@ class RunMatrix(dict):
         if imax < self.nCase:
             # Remove from the mask
             m[imax:] = False
-        # Loop through equality constraints.
-        for c in EqCons:
-            # Get the key (for instance if matching ``k%10``)
-            match = re.match("[A-Za-z_]\w+", c)
-            # Check if valid
-            if match is None:
-                raise ValueError("Invalid run matrix key expression '%s'" % c)
-            # Get first group, keeping in mind ``alpha%1`` is valid
-            k = match.group(0)
-            # Check for the key.
-            if k in self.cols:
-                # Get the target value.
-                x0 = self[k][i0]
-                # Get the value
-                V = eval(c, self)
-            elif k == "alpha":
-                # Get the target value.
-                x0 = self.GetAlpha(i0)
-                # Extract matrix values
-                V = self.GetAlpha()
-            elif k == "beta":
-                # Get the target value
-                x0 = self.GetBeta(i0)
-                # Extract matrix values
-                V = self.GetBeta()
-            elif k in ["alpha_t", "aoav"]:
-                # Get the target value.
-                x0 = self.GetAlphaTotal(i0)
-                # Extract matrix values
-                V = self.GetAlphaTotal()
-            elif k in ["phi", "phiv"]:
-                # Get the target value.
-                x0 = self.GetPhi(i0)
-                # Extract matrix values
-                V = self.GetPhi()
-            elif k in ["alpha_m", "aoam"]:
-                # Get the target value.
-                x0 = self.GetAlphaManeuver(i0)
-                # Extract matrix values
-                V = self.GetAlphaManeuver()
-            elif k in ["phi_m", "phim"]:
-                # Get the target value.
-                x0 = self.GetPhiManeuver(i0)
-                # Extract matrix values
-                V = self.GetPhiManeuver()
-            else:
-                raise KeyError(
-                    "Could not find trajectory key for constraint '%s'." % c)
+        # Loop through equality and tolerance constraints
+        for c, tol in self._GetSweepCons(EqCons, TolCons):
+            # Get values and special cases
+            V, S = self._GetSweepConValues(c)
             # Evaluate constraint
-            qk = np.abs(V - x0) <= 1e-10
+            qk = np.abs(V - V[i0]) <= tol
             # Check for special modifications
-            if k in ["phi", "phi_m", "phiv", "phim"]:
-                # Get total angle of attack
-                aoav = self.GetAlphaTotal()
-                # Test and combine with any "aoav=0" cases
-                qk = np.logical_or(qk, np.abs(aoav) <= 1e-10)
+            if S is not None:
+                # Combine with any "aoav=0" cases
+                qk = np.logical_or(qk, S)
             # Combine constraint
             m = np.logical_and(m, qk)
-        # Loop through tolerance-based constraints.
-        for c in TolCons:
-            # Get the key (for instance if matching ``k%10``)
-            match = re.match("[A-Za-z_]\w+", c)
-            # Check if valid
-            if match is None:
-                raise ValueError("Invalid run matrix key expression '%s'" % c)
-            # Get first group, keeping in mind ``alpha%1`` is valid
-            k = match.group(0)
-            # Get tolerance.
-            tol = TolCons[c]
-            # Check for the key.
-            if k in self.cols:
-                # Get the target value.
-                x0 = self[k][i0]
-                # Get the values
-                V = eval(c, self)
-            elif k == "alpha":
-                # Get the target value.
-                x0 = self.GetAlpha(i0)
-                # Get trajectory values
-                V = self.GetAlpha()
-            elif k == "beta":
-                # Get the target value
-                x0 = self.GetBeta(i0)
-                # Get trajectory values
-                V = self.GetBeta()
-            elif k in ["alpha_m", "aoam"]:
-                # Get the target value.
-                x0 = self.GetAlphaManeuver(i0)
-                # Extract matrix values
-                V = self.GetAlphaManeuver()
-            elif k in ["phi_m", "phim"]:
-                # Get the target value.
-                x0 = self.GetPhiManeuver(i0)
-                # Extract matrix values
-                V = self.GetPhiManeuver()
-            else:
-                raise KeyError(
-                    "Could not find trajectory key for constraint '%s'." % c)
-            # Evaluate constraint
-            qk = np.abs(x0-V) <= tol
-            # Check for special modifications
-            if k in ["phi", "phi_m", "phiv", "phim"]:
-                # Get total angle of attack
-                aoav = self.GetAlphaTotal()
-                # Test and combine with any "aoav=0" cases
-                qk = np.logical_or(qk, np.abs(aoav) <= 1e-10)
-            # Combine constraints
-            m = np.logical_and(m, qk)
         # Initialize output.
         I = np.arange(self.nCase)
         # Apply the final mask.
@@ -2548,30 +2965,7 @@ class RunMatrix(dict):
         # Check for a sort variable.
         if (xk is not None):
             # Sort based on that key.
-            if xk in self.cols:
-                # Sort based on trajectory key
-                vx = self[xk][J]
-            elif xk.lower() in ["alpha"]:
-                # Sort based on angle of attack
-                vx = self.GetAlpha(J)
-            elif xk.lower() in ["beta"]:
-                # Sort based on angle of sideslip
-                vx = self.GetBeta(J)
-            elif xk.lower() in ["alpha_t", "aoav"]:
-                # Sort based on total angle of attack
-                vx = self.GetAlphaTotal(J)
-            elif xk.lower() in ["alpha_m", "aoam"]:
-                # Sort based on total angle of attack
-                vx = self.GetAlphaManeuver(J)
-            elif xk.lower() in ["phi_m", "phim"]:
-                # Sort based on velocity roll
-                vx = self.GetPhiManeuver(J)
-            elif xk.lower() in ["phi", "phiv"]:
-                # Sort based on velocity roll
-                vx = self.GetPhi(J)
-            else:
-                # Unable to sort
-                raise ValueError("Unable to sort based on variable '%s'" % xk)
+            vx = self._GetSweepSortValues(xk)[J]
             # Order
             j = np.argsort(vx)
             # Sort the indices.
@@ -2789,6 +3183,7 @@ class RunMatrix(dict):
                 List of trajectory point sweeps
         :Versions:
             * 2015-05-25 ``@ddalle``: Version 1.0
+            * 2026-10-19 ``@ddalle``: Version 2.0; use :class:`SweepMatcher`
         """
         # Expand global index constraints.
         I0 = self.GetIndices(I=kw.get('I'), cons=kw.get('cons'))
@@ -2801,25 +3196,198 @@ class RunMatrix(dict):
         #  appear in multiple sweeps while still disallowing cases that
         #  don't meet cons)
         M0 = M.copy()
+        # Sort key
+        xk = kw.get('SortVar')
+        # Check for an IndexTol
+        itol = kw.get('IndexTol', self.nCase)
+        # Only integers restrict the index
+        if not type(itol).__name__.startswith('int'):
+            itol = None
+        # Evaluate each constraint once for all cases
+        V = []
+        S = []
+        tols = []
+        for c, tol in self._GetSweepCons(kw.get('EqCons'), kw.get('TolCons')):
+            # Get values and special cases
+            Vc, Sc = self._GetSweepConValues(c)
+            # Save
+            V.append(Vc)
+            S.append(Sc)
+            tols.append(tol)
+        # Sorted search interface using *M0* for validity
+        matcher = SweepMatcher(V, tols, S, mask=M0, n=self.nCase)
+        # Values of sort variable
+        if xk is not None:
+            vx = self._GetSweepSortValues(xk)
         # Initialize output.
         J = []
-        # Safety check: no more than *nCase* sets.
-        i = 0
-        # Loop through cases.
-        while np.any(M) and i < self.nCase:
-            # Increase number of sweeps.
-            i += 1
-            # Seed for this sweep
-            i0 = np.where(M)[0][0]
+        # Loop through seeds in order
+        for i0 in np.where(M)[0]:
+            # Skip cases already in a sweep
+            if not M[i0]:
+                continue
+            # Max index to consider
+            if itol is None:
+                imax = None
+            else:
+                imax = min(self.nCase, i0+itol)
             # Get the current sweep
-            #  (Use initial mask *M0* for validity but seed based on *M*)
-            I = self.GetSweep(M0, i0=i0, **kw)
+            I = matcher.match([Vc[i0] for Vc in V], imax)
+            # Sort it
+            if xk is not None:
+                I = I[np.argsort(vx[I])]
             # Save the sweep
             J.append(I)
             # Update the mask
             M[I] = False
+            M[i0] = False
         # Output
         return J
+
+    # Combine sweep constraints
+    def _GetSweepCons(self, EqCons=None, TolCons=None):
+        r"""Get list of sweep constraints and tolerances
+
+        :Call:
+            >>> cons = x._GetSweepCons(EqCons=None, TolCons=None)
+        :Inputs:
+            *x*: :class:`cape.runmatrix.RunMatrix`
+                Run matrix interface
+            *EqCons*: {``None``} | :class:`list`\ [:class:`str`]
+                Keys that must match (to within ``1e-10``)
+            *TolCons*: {``None``} | :class:`dict`\ [:class:`float`]
+                Keys that must match to within a specified tolerance
+        :Outputs:
+            *cons*: :class:`list`\ [:class:`tuple`]
+                Constraint and tolerance for each constraint
+        :Versions:
+            * 2026-10-19 ``@ddalle``: Version 1.0
+        """
+        # Ensure no NoneType
+        if EqCons is None:
+            EqCons = []
+        if TolCons is None:
+            TolCons = {}
+        # Equality constraints use a tiny tolerance
+        cons = [(c, 1e-10) for c in EqCons]
+        # Tolerance constraints
+        cons.extend((c, TolCons[c]) for c in TolCons)
+        # Output
+        return cons
+
+    # Get values of a sweep key
+    def GetSweepKeyValues(self, k):
+        r"""Get values of a run matrix key or special angle for all cases
+
+        :Call:
+            >>> V = x.GetSweepKeyValues(k)
+        :Inputs:
+            *x*: :class:`cape.runmatrix.RunMatrix`
+                Run matrix interface
+            *k*: :class:`str`
+                Name of run matrix key, or ``"alpha"``, ``"beta"``,
+                ``"alpha_t"``, ``"aoav"``, ``"phi"``, ``"phiv"``,
+                ``"alpha_m"``, ``"aoam"``, ``"phi_m"``, or ``"phim"``
+        :Outputs:
+            *V*: ``None`` | :class:`np.ndarray`
+                Value of *k* for each case, if recognized
+        :Versions:
+            * 2026-10-19 ``@ddalle``: Version 1.0
+        """
+        # Check for the key
+        if k in self.cols:
+            return self[k]
+        elif k == "alpha":
+            return self.GetAlpha()
+        elif k == "beta":
+            return self.GetBeta()
+        elif k in ["alpha_t", "aoav"]:
+            return self.GetAlphaTotal()
+        elif k in ["phi", "phiv"]:
+            return self.GetPhi()
+        elif k in ["alpha_m", "aoam"]:
+            return self.GetAlphaManeuver()
+        elif k in ["phi_m", "phim"]:
+            return self.GetPhiManeuver()
+
+    # Evaluate a sweep constraint
+    def _GetSweepConValues(self, c):
+        r"""Evaluate a sweep constraint for all cases
+
+        The constraint may be an expression of a key, like ``"k%10"``,
+        in which case both the candidates and the reference case use
+        the value of the expression.
+
+        :Call:
+            >>> V, S = x._GetSweepConValues(c)
+        :Inputs:
+            *x*: :class:`cape.runmatrix.RunMatrix`
+                Run matrix interface
+            *c*: :class:`str`
+                Key or expression of a key
+        :Outputs:
+            *V*: :class:`np.ndarray`
+                Value of constraint expression for each case
+            *S*: ``None`` | :class:`np.ndarray`\ [:class:`bool`]
+                Cases that always match, e.g. ``aoav=0`` for *phi*
+        :Versions:
+            * 2026-10-19 ``@ddalle``: Version 1.0
+        """
+        # Get the key (for instance if matching ``k%10``)
+        match = re.match(r"[A-Za-z_]\w+", c)
+        # Check if valid
+        if match is None:
+            raise ValueError("Invalid run matrix key expression '%s'" % c)
+        # Get first group, keeping in mind ``alpha%1`` is valid
+        k = match.group(0)
+        # Check for the key
+        if k in self.cols:
+            # Evaluate expression
+            V = eval(c, self)
+        else:
+            # Special angle
+            V = self.GetSweepKeyValues(k)
+        # Check for the key
+        if V is None:
+            raise KeyError(
+                "Could not find trajectory key for constraint '%s'." % c)
+        # Check for special modifications
+        if k in ["phi", "phi_m", "phiv", "phim"]:
+            # Cases with zero total angle of attack match any roll
+            S = np.abs(self.GetAlphaTotal()) <= 1e-10
+        else:
+            S = None
+        # Output
+        return V, S
+
+    # Get values of sweep sort variable
+    def _GetSweepSortValues(self, xk):
+        r"""Get values of the variable used to sort each sweep
+
+        :Call:
+            >>> V = x._GetSweepSortValues(xk)
+        :Inputs:
+            *x*: :class:`cape.runmatrix.RunMatrix`
+                Run matrix interface
+            *xk*: :class:`str`
+                Name of sort variable
+        :Outputs:
+            *V*: :class:`np.ndarray`
+                Value of *xk* for each case
+        :Versions:
+            * 2026-10-19 ``@ddalle``: Version 1.0
+        """
+        # Check for key
+        if xk in self.cols:
+            return self[xk]
+        # Check special angles
+        k = xk.lower()
+        V = None if k in self.cols else self.GetSweepKeyValues(k)
+        # Check for error
+        if V is None:
+            raise ValueError("Unable to sort based on variable '%s'" % xk)
+        # Output
+        return V
   # >
 
   # =================
@@ -31,6 +31,8 @@ options to the test crawler.
 import os
 import sys
 import math
+import multiprocessing
+import tempfile
 
 # Local modules
 from . import argread
@@ -57,8 +59,12 @@ is to run a test in each subfolder that exists.
     -f, --json FNAME
         Read settings from file *FNAME* {cape-test.json}
 
+    -j N
+        Run up to *N* tests at once in separate processes {MaxJobs}
+
 :Versions:
     * 2019-07-03 ``@ddalle``: Version 1.0
+    * 2026-10-19 ``@ddalle``: Version 1.1; add ``-j``
 """
 
 
@@ -71,6 +77,9 @@ class TestCrawler(object):
     :Inputs:
         *f*, *json*: {``"cape-test.json"``} | :class:`str`
             Name of JSON settings file
+        *j*: {``None``} | :class:`int`
+            Max number of tests to run at once; default is *MaxJobs*
+            option from JSON file
     :Outputs:
         *crawler*: :class:`cape.testutils.crawler.TestCrawler`
             Test crawler controller
@@ -96,6 +105,7 @@ class TestCrawler(object):
     testdirs = []
     crawldirs = []
     results = {}
+    jobs = None
 
     # Initialization method
     def __init__(self, *a, **kw):
@@ -103,7 +113,10 @@ class TestCrawler(object):
 
         :Versions:
             * 2019-07-03 ``@ddalle``: Version 1.0
+            * 2026-10-19 ``@ddalle``: Version 1.1; add *j*
         """
+        # Number of tests to run at once
+        self.jobs = kw.pop("j", None)
         # Process options file name
         fname = kw.pop("f", kw.pop("json", "cape-test.json"))
         # Save name of file
@@ -204,10 +217,45 @@ class TestCrawler(object):
         # Output
         return self.crawldirs
 
+    # Get number of tests to run at once
+    def get_jobs(self):
+        r"""Get maximum number of tests to run at once
+
+        :Call:
+            >>> n = crawler.get_jobs()
+        :Inputs:
+            *crawler*: :class:`TestCrawler`
+                Test crawler controller
+        :Outputs:
+            *n*: :class:`int`
+                Value of *j* keyword or *MaxJobs* option; at least ``1``
+        :Versions:
+            * 2026-10-19 ``@ddalle``: Version 1.0
+        """
+        # Get option
+        n = self.jobs
+        # Default from JSON file
+        if n is None or n is True:
+            n = self.opts.get("MaxJobs", 1)
+        # Convert to integer
+        try:
+            n = int(n)
+        except (TypeError, ValueError):
+            raise ValueError("Invalid number of jobs '%s'" % n)
+        # Use all CPUs for 0
+        if n == 0:
+            n = multiprocessing.cpu_count()
+        # Output
+        return max(1, n)
+
     # Primary function
     def crawl(self, **kw):
         r"""Execute tests
 
+        If more than one job is allowed (see :func:`get_jobs`), each test
+        runs in a separate process, and its output is printed along with
+        its result once it and all tests before it are finished.
+
         :Call:
             >>> stats = crawler.crawl()
         :Inputs:
@@ -223,6 +271,7 @@ class TestCrawler(object):
         :Versions:
             * 2019-07-03 ``@ddalle``: Version 1.0
             * 2019-07-05 ``@ddalle``: Version 1.1; add recursion
+            * 2026-10-19 ``@ddalle``: Version 1.2; concurrent tests
         """
         # Update test list if necessary
         self.get_test_dirs()
@@ -245,106 +294,51 @@ class TestCrawler(object):
         }
         # Format string for status updates
         fmt1 = "  Test %%%ii: %%s ...\n" % itest
-        fmt2 = "    PASS (%.4g seconds)\n"
-        fmt3 = "    FAIL (command %i, %s) (%.4g seconds)\n"
-        # Loop through the tests
-        for (i, fdir) in enumerate(self.testdirs):
-            # Status update
-            sys.stdout.write(fmt1 % (i+1, fdir))
+        # Number of tests to run at once
+        nproc = min(self.get_jobs(), ntest)
+        # Absolute path to each test
+        fdirs = [os.path.join(self.RootDir, fdir) for fdir in self.testdirs]
+        # Check for concurrent tests
+        if nproc > 1:
+            # Flush output before starting workers
             sys.stdout.flush()
-            # Enter the test folder
-            os.chdir(self.RootDir)
-            os.chdir(fdir)
-            # Create a driver
-            try:
-                # Create the driver
-                testd = driver.TestDriver()
-            except Exception as e:
-                # Get the message
-                if sys.version_info.major == 2:
-                    fmt = "%s: %s\n" % (e.__class__.__name__, e.message)
-                else:
-                    fmt = "%s: %s\n" % (e.__class__.__name__, e)
-                # Indent it
-                fmt = "".join(
-                    ["    " + line + "\n" for line in fmt.split("\n")])
-                # Show the STDERR output
-                sys.stderr.write(fmt.rstrip() + "\n")
-                sys.stderr.flush()
-                # Some other problem
-                testd = None
-                # Create results
-                results = {
-                    "TestStatus": False,
-                    "TestStatus_Init": False
-                }
-            # Run the test
-            if testd is not None:
-                # Run the driver to get results
-                try:
-                    results = testd.run()
-                except Exception as e:
-                    # Get the message
-                    if sys.version_info.major == 2:
-                        fmt = "%s: %s\n" % (e.__class__.__name__, e.message)
-                    else:
-                        fmt = "%s: %s\n" % (e.__class__.__name__, e)
-                    # Indent it
-                    fmt = "".join(
-                        ["    " + line + "\n" for line in fmt.split("\n")])
-                    # Show the STDERR output
-                    sys.stderr.write(fmt.rstrip() + "\n")
+            sys.stderr.flush()
+            # Run each test in a new process
+            pool = multiprocessing.Pool(nproc, maxtasksperchild=1)
+            # Results in order, as soon as they're available
+            tests = pool.imap(_run_test_captured, fdirs)
+        else:
+            # Run the tests here, one at a time
+            pool = None
+            tests = ((run_test(fdir), None, None) for fdir in fdirs)
+        # Loop through the tests
+        try:
+            for (i, fdir) in enumerate(self.testdirs):
+                # Status update
+                sys.stdout.write(fmt1 % (i+1, fdir))
+                sys.stdout.flush()
+                # Get results
+                results, out, err = next(tests)
+                # Show output from worker
+                if out:
+                    sys.stdout.write(out)
+                    sys.stdout.flush()
+                if err:
+                    sys.stderr.write(err)
                     sys.stderr.flush()
-                    # Create results
-                    results = {
-                        "TestStatus": False,
-                        "TestStatus_Exec": False
-                    }
-            # Get execution time
-            ttot = results.get("TestRunTimeTotal", 0.0)
-            # Determine status
-            if results["TestStatus"]:
-                # Success: show the time used
-                msg = fmt2 % ttot
-                # Track statustics
-                stats["PASS"] += 1
-            else:
-                # Failure: find reason
-                tststr = results.get("TestStatus_Init", True)
-                tstex  = results.get("TestStatus_Exec", True)
-                tstrc  = results.get("TestStatus_ReturnCode", [])
-                tstt   = results.get("TestStatus_MaxTime",  [])
-                tstout = results.get("TestStatus_STDOUT", [])
-                tsterr = results.get("TestStatus_STDERR", [])
-                # Track result
-                stats["FAIL"] += 1
-                # Find the first cause of failure, with preferred order
-                if not tststr:
-                    ifail = 0
-                    reason = "JSON read"
-                elif not tstex:
-                    ifail = 0
-                    reason = "test driver execution"
-                elif not all(tstrc):
-                    ifail = tstrc.index(False)
-                    reason = "return code"
-                elif not all(tstt):
-                    ifail = tstt.index(False)
-                    reason = "max time"
-                elif not all(tstout):
-                    ifail = tstout.index(False)
-                    reason = "STDOUT"
-                elif not all(tsterr):
-                    ifail = tsterr.index(False)
-                    reason = "STDERR"
+                # Update statistics
+                if results["TestStatus"]:
+                    stats["PASS"] += 1
                 else:
-                    ifail = 0
-                    reason = "no reason..."
-                # Failure: show command and cause
-                msg = fmt3 % (ifail+1, reason, ttot)
-            # Final update
-            sys.stdout.write(msg)
-            sys.stdout.flush()
+                    stats["FAIL"] += 1
+                # Final update
+                sys.stdout.write(genr8_result_msg(results))
+                sys.stdout.flush()
+        finally:
+            # Clean up workers
+            if pool is not None:
+                pool.close()
+                pool.join()
         # Status update
         if stats["FAIL"]:
             sys.stdout.write(
@@ -358,8 +352,10 @@ class TestCrawler(object):
             # Enter the test folder
             os.chdir(self.RootDir)
             os.chdir(fdir)
-            # Create a crawler
-            crawler = self.__class__(**kw)
+            # Create a crawler, using same number of jobs
+            kwj = dict(kw)
+            kwj.setdefault("j", self.jobs)
+            crawler = self.__class__(**kwj)
             # Run the crawler
             stats_sub = crawler.crawl()
             # Accumulate stats
@@ -377,6 +373,173 @@ class TestCrawler(object):
         return stats
 
 
+# Run one test
+def run_test(fdir):
+    r"""Run the test driver in one folder
+
+    :Call:
+        >>> results = run_test(fdir)
+    :Inputs:
+        *fdir*: :class:`str`
+            Absolute path to test folder
+    :Outputs:
+        *results*: :class:`dict`
+            Results from :func:`driver.TestDriver.run`, or failure
+            status if the driver could not be created or run
+    :Versions:
+        * 2019-07-03 ``@ddalle``: Version 1.0 (in :func:`crawl`)
+        * 2026-10-19 ``@ddalle``: Version 1.1; separate function
+    """
+    # Save current location
+    fpwd = os.getcwd()
+    # Enter the test folder
+    os.chdir(fdir)
+    # Create a driver
+    try:
+        # Create the driver
+        testd = driver.TestDriver()
+    except Exception as e:
+        # Show the error
+        _write_exception(e)
+        # Some other problem
+        testd = None
+        # Create results
+        results = {
+            "TestStatus": False,
+            "TestStatus_Init": False
+        }
+    # Run the test
+    if testd is not None:
+        # Run the driver to get results
+        try:
+            results = testd.run()
+        except Exception as e:
+            # Show the error
+            _write_exception(e)
+            # Create results
+            results = {
+                "TestStatus": False,
+                "TestStatus_Exec": False
+            }
+    # Go back to original location
+    os.chdir(fpwd)
+    # Output
+    return results
+
+
+# Run one test, capturing output
+def _run_test_captured(fdir):
+    # Temporary files to hold STDOUT and STDERR of this process
+    fout = tempfile.TemporaryFile()
+    ferr = tempfile.TemporaryFile()
+    # Save original file descriptors
+    sys.stdout.flush()
+    sys.stderr.flush()
+    fd1 = os.dup(1)
+    fd2 = os.dup(2)
+    # Redirect (includes output of commands run by test)
+    os.dup2(fout.fileno(), 1)
+    os.dup2(ferr.fileno(), 2)
+    try:
+        # Run the test
+        results = run_test(fdir)
+    finally:
+        # Restore original file descriptors
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os.dup2(fd1, 1)
+        os.dup2(fd2, 2)
+        os.close(fd1)
+        os.close(fd2)
+    # Read output
+    fout.seek(0)
+    ferr.seek(0)
+    out = fout.read().decode("utf-8", "replace")
+    err = ferr.read().decode("utf-8", "replace")
+    fout.close()
+    ferr.close()
+    # Only keep the parts of *results* needed by crawler
+    results = {
+        k: v for (k, v) in results.items()
+        if k == "TestRunTimeTotal" or k.startswith("TestStatus")
+    }
+    # Output
+    return results, out, err
+
+
+# Show an exception from a test
+def _write_exception(e):
+    # Get the message
+    if sys.version_info.major == 2:
+        fmt = "%s: %s\n" % (e.__class__.__name__, e.message)
+    else:
+        fmt = "%s: %s\n" % (e.__class__.__name__, e)
+    # Indent it
+    fmt = "".join(
+        ["    " + line + "\n" for line in fmt.split("\n")])
+    # Show the STDERR output
+    sys.stderr.write(fmt.rstrip() + "\n")
+    sys.stderr.flush()
+
+
+# Create status message for one test
+def genr8_result_msg(results):
+    r"""Create status message, such as ``PASS``, for one test
+
+    :Call:
+        >>> msg = genr8_result_msg(results)
+    :Inputs:
+        *results*: :class:`dict`
+            Results from :func:`run_test`
+    :Outputs:
+        *msg*: :class:`str`
+            ``PASS`` and time or ``FAIL``, reason, and time
+    :Versions:
+        * 2019-07-03 ``@ddalle``: Version 1.0 (in :func:`crawl`)
+        * 2026-10-19 ``@ddalle``: Version 1.1; separate function
+    """
+    # Format strings
+    fmt2 = "    PASS (%.4g seconds)\n"
+    fmt3 = "    FAIL (command %i, %s) (%.4g seconds)\n"
+    # Get execution time
+    ttot = results.get("TestRunTimeTotal", 0.0)
+    # Determine status
+    if results["TestStatus"]:
+        # Success: show the time used
+        return fmt2 % ttot
+    # Failure: find reason
+    tststr = results.get("TestStatus_Init", True)
+    tstex  = results.get("TestStatus_Exec", True)
+    tstrc  = results.get("TestStatus_ReturnCode", [])
+    tstt   = results.get("TestStatus_MaxTime",  [])
+    tstout = results.get("TestStatus_STDOUT", [])
+    tsterr = results.get("TestStatus_STDERR", [])
+    # Find the first cause of failure, with preferred order
+    if not tststr:
+        ifail = 0
+        reason = "JSON read"
+    elif not tstex:
+        ifail = 0
+        reason = "test driver execution"
+    elif not all(tstrc):
+        ifail = tstrc.index(False)
+        reason = "return code"
+    elif not all(tstt):
+        ifail = tstt.index(False)
+        reason = "max time"
+    elif not all(tstout):
+        ifail = tstout.index(False)
+        reason = "STDOUT"
+    elif not all(tsterr):
+        ifail = tsterr.index(False)
+        reason = "STDERR"
+    else:
+        ifail = 0
+        reason = "no reason..."
+    # Failure: show command and cause
+    return fmt3 % (ifail+1, reason, ttot)
+
+
 # Command-line interface
 def cli(*a, **kw):
     r"""Test crawler command-line interface
@@ -21,6 +21,7 @@ from .testopts import read_json
 rc = {
     "Glob": "*",
     "CrawlGlob": [],
+    "MaxJobs": 1,
 }
 
 
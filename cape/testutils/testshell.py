@@ -114,8 +114,8 @@ def comm(cmd, maxtime=None, dt=None, stdout=sp.PIPE, stderr=sp.PIPE):
         *maxtime*: {``None``} | :class:`float` | :class:`str`
             Optional maximum time allowed for process
         *dt*: {``None``}  | :class:`float` | :class:`str`
-            Sleep time to wait between checking for completion if
-            *maxtime* is used; default is 1/1000th of *maxtime*
+            No longer used; the process is waited on with a deadline of
+            *maxtime* instead of checked at intervals
         *stdout*: {``sp.PIPE``} | ``None`` | :class:`file`
             Optional file to contain STDOUT
         *stderr*: {``sp.PIPE``} | ``None`` | :class:`file`
@@ -132,36 +132,24 @@ def comm(cmd, maxtime=None, dt=None, stdout=sp.PIPE, stderr=sp.PIPE):
     :Versions:
         * 2019-07-01 ``@ddalle``: First version
         * 2019-07-02 ``@ddalle``: Added *maxtime*
+        * 2026-10-19 ``@ddalle``: Blocking wait with timeout, no polling
     """
     # Process maximum time to seconds
     tmax = _time2sec(maxtime)
-    tstp = _time2sec(dt)
-    # Default time step
-    if tmax and (not tstp):
-        tstp = max(0.001, 0.001*tmax)
     # Start timer
     tic = time.time()
     # Check for system errors
     try:
         # Create a Popen process (starts running immediately)
         proc = sp.Popen(cmd, stdout=stdout, stderr=stderr)
-        # Loop through timer
-        while tmax:
-            # Check time
-            if time.time() - tic >= tmax:
-                # Kill the process
-                proc.kill()
-                # Exit loop
-                break
-            # Check if process has ended
-            ierr = proc.poll()
-            # If still running, this will be ``None``
-            if ierr is not None:
-                break
-            # Pause *dt* seconds before trying again
-            time.sleep(tstp)
-        # Run the command
-        out, err = proc.communicate()
+        # Wait for process to finish, up to *tmax* seconds
+        try:
+            out, err = proc.communicate(timeout=tmax)
+        except sp.TimeoutExpired:
+            # Kill the process
+            proc.kill()
+            # Collect any output so far
+            out, err = proc.communicate()
         # Update *returncode*
         ierr = proc.poll()
     except OSError:
@@ -200,8 +188,7 @@ def call(cmd, maxtime=None, dt=None, stdout=None, stderr=None):
         *maxtime*: {``None``} | :class:`float` | :class:`str`
             Optional maximum time allowed for process
         *dt*: {``None``}  | :class:`float` | :class:`str`
-            Sleep time to wait between checking for completion if
-            *maxtime* is used; default is 1/1000th of *maxtime*
+            No longer used
         *stdout*: {``None``} | :class:`file`
             Optional file to contain STDOUT
         *stderr*: {``None``} | :class:`file`
@@ -243,8 +230,7 @@ def check_call(cmd, maxtime=None, dt=None, stdout=None, stderr=None):
         *maxtime*: {``None``} | :class:`float` | :class:`str`
             Optional maximum time allowed for process
         *dt*: {``None``}  | :class:`float` | :class:`str`
-            Sleep time to wait between checking for completion if
-            *maxtime* is used; default is 1/1000th of *maxtime*
+            No longer used
         *stdout*: {``None``} | :class:`file`
             Optional file to contain STDOUT
         *stderr*: {``None``} | :class:`file`
@@ -284,8 +270,7 @@ def check_comm(cmd, maxtime=None, dt=None, stdout=sp.PIPE, stderr=sp.PIPE):
         *maxtime*: {``None``} | :class:`float` | :class:`str`
             Optional maximum time allowed for process
         *dt*: {``None``}  | :class:`float` | :class:`str`
-            Sleep time to wait between checking for completion if
-            *maxtime* is used; default is 1/1000th of *maxtime*
+            No longer used
         *stdout*: {``sp.PIPE``} | ``None`` | :class:`file`
             Optional file to contain STDOUT
         *stderr*: {``sp.PIPE``} | ``None`` | :class:`file`
@@ -323,8 +308,7 @@ def check_output(cmd, maxtime=None, dt=None, stderr=sp.PIPE):
         *maxtime*: {``None``} | :class:`float` | :class:`str`
             Optional maximum time allowed for process
         *dt*: {``None``}  | :class:`float` | :class:`str`
-            Sleep time to wait between checking for completion if
-            *maxtime* is used; default is 1/1000th of *maxtime*
+            No longer used
         *stderr*: {``sp.PIPE``} | ``None`` | :class:`file`
             Optional file to contain STDERR
     :Ouputs:
@@ -7,15 +7,26 @@ This module provides Python versions of tools familiar to the Linux
 command line. For example :func:`tail` to read the last one or more
 lines of a file.
 
+Files given by name are read backwards in blocks of *BLOCK_SIZE* bytes
+starting from the end, so the cost of :func:`tail` and
+:func:`grep_last` does not depend on the size of the file. These
+functions are used instead of calling ``tail`` and ``grep`` in a
+subprocess when checking the status of many cases.
+
 """
 
 # Standard library modules
+import re
 
 
 # Local imports
 from . import typeutils
 
 
+# Size of blocks to read when seeking backwards
+BLOCK_SIZE = 8192
+
+
 # Read last *n* lines of file
 def tail(fname, n=1):
     r"""Read last *n* lines of a file
@@ -35,12 +46,20 @@ def tail(fname, n=1):
             Last *n* lines of file, or fewer if file is shorter
     :Versions:
         * 2021-11-05 ``@ddalle``: Version 1.0
+        * 2026-10-19 ``@ddalle``: Version 1.1; read blocks for names
     """
     # Check type
     if typeutils.isstr(fname):
-        # Open the file by name
-        with open(fname, 'r') as fp:
-            return _tail(fp, n=n)
+        # Initialize lines
+        lines = []
+        # Read lines from end of file
+        for line in readlines_reverse(fname):
+            # Check count
+            if len(lines) >= n:
+                break
+            lines.insert(0, line)
+        # Output
+        return lines
     elif typeutils.isfile(fname):
         # File already opened
         return _tail(fname, n=n)
@@ -49,6 +68,166 @@ def tail(fname, n=1):
             "Expected file name or handle, got '%s'" % type(fname).__name__)
 
 
+# Read first *n* lines of file
+def head(fname, n=1):
+    r"""Read first *n* lines of a file
+
+    :Call:
+        >>> lines = head(fname, n=1)
+    :Inputs:
+        *fname*: :class:`str`
+            Name of file to read
+        *n*: {``1``} | :class:`int`
+            Number of lines to read from start
+    :Outputs:
+        *lines*: :class:`list`\ [:class:`str`]
+            First *n* lines of file, or fewer if file is shorter
+    :Versions:
+        * 2026-10-19 ``@ddalle``: Version 1.0
+    """
+    # Initialize lines
+    lines = []
+    # Open file
+    with open(fname, 'rb') as fp:
+        # Read lines
+        for line in fp:
+            # Check count
+            if len(lines) >= n:
+                break
+            lines.append(_decode(line))
+    # Output
+    return lines
+
+
+# Find all lines matching a regular expression
+def grep(regex, fname):
+    r"""Find lines of a file that contain a regular expression
+
+    :Call:
+        >>> lines = grep(regex, fname)
+    :Inputs:
+        *regex*: :class:`str`
+            Regular expression to search for
+        *fname*: :class:`str`
+            Name of file to read
+    :Outputs:
+        *lines*: :class:`list`\ [:class:`str`]
+            Lines containing *regex*, without newline characters
+    :Versions:
+        * 2026-10-19 ``@ddalle``: Version 1.0
+    """
+    # Compile regular expression
+    pattern = re.compile(regex, re.MULTILINE)
+    # Read the file
+    with open(fname, 'rb') as fp:
+        txt = _decode(fp.read())
+    # Initialize lines
+    lines = []
+    # Start of search
+    pos = 0
+    # Loop through matches
+    while True:
+        # Search from current position
+        match = pattern.search(txt, pos)
+        # Check for end
+        if match is None:
+            break
+        # Get start and end of line containing match
+        ia = match.start()
+        i0 = txt.rfind("\n", 0, ia) + 1
+        i1 = txt.find("\n", ia)
+        # Check for last line of file
+        if i1 == -1:
+            i1 = len(txt)
+        # Save line
+        lines.append(txt[i0:i1])
+        # Continue on next line
+        pos = i1 + 1
+        if pos > len(txt):
+            break
+    # Output
+    return lines
+
+
+# Find last line matching a regular expression
+def grep_last(regex, fname):
+    r"""Find the last line of a file that contains a regular expression
+
+    The file is read backwards from the end until a match is found.
+
+    :Call:
+        >>> line = grep_last(regex, fname)
+    :Inputs:
+        *regex*: :class:`str`
+            Regular expression to search for
+        *fname*: :class:`str`
+            Name of file to read
+    :Outputs:
+        *line*: :class:`str` | ``None``
+            Last line containing *regex*, without newline character
+    :Versions:
+        * 2026-10-19 ``@ddalle``: Version 1.0
+    """
+    # Compile regular expression
+    pattern = re.compile(regex)
+    # Read lines from end of file
+    for line in readlines_reverse(fname):
+        # Remove newline
+        line = line.rstrip("\n")
+        # Check for match
+        if pattern.search(line):
+            return line
+
+
+# Iterate backwards through lines of a file
+def readlines_reverse(fname, nblock=None):
+    r"""Iterate through the lines of a file, starting at the end
+
+    :Call:
+        >>> for line in readlines_reverse(fname, nblock=None):
+    :Inputs:
+        *fname*: :class:`str`
+            Name of file to read
+        *nblock*: {``None``} | :class:`int`
+            Number of bytes to read at a time; default *BLOCK_SIZE*
+    :Outputs:
+        *line*: :class:`str`
+            Next line, starting from last, including newline character
+    :Versions:
+        * 2026-10-19 ``@ddalle``: Version 1.0
+    """
+    # Default block size
+    if nblock is None:
+        nblock = BLOCK_SIZE
+    # Open file
+    with open(fname, 'rb') as fp:
+        # Go to end of file
+        fp.seek(0, 2)
+        pos = fp.tell()
+        # Partial line at start of previous block
+        buf = b""
+        # Read backwards
+        while pos > 0:
+            # Move back one block
+            nb = min(nblock, pos)
+            pos -= nb
+            fp.seek(pos)
+            # Read block and prepend to partial line
+            buf = fp.read(nb) + buf
+            # Find last complete line in buffer
+            ia = buf.rfind(b"\n", 0, len(buf) - 1)
+            # Output complete lines
+            while ia >= 0:
+                # Yield line after the newline character
+                yield _decode(buf[ia + 1:])
+                # Remove it
+                buf = buf[:ia + 1]
+                ia = buf.rfind(b"\n", 0, ia)
+        # First line of file
+        if buf:
+            yield _decode(buf)
+
+
 # Move backwards by one line
 def readline_reverse(fp):
     r"""Read backwards from current position until start of line
@@ -107,4 +286,9 @@ def _tail(fp, n=1):
     # Output
     return lines
 
-        
\ No newline at end of file
+        
+
+
+# Convert bytes to text
+def _decode(txt):
+    return txt.decode("utf-8", errors="replace")
@@ -25,6 +25,7 @@ a method like :func:`TriBase.WriteFast` for the compiled version and
 
 # Standard library
 import getpass
+import hashlib
 import os
 import subprocess as sp
 import sys
@@ -49,6 +50,9 @@ from .cgns import CGNS
 # Constants
 INT_TYPES = (int, np.int64, np.int32)
 
+# Max number of point-tri pairs for each block of GetNearestTris()
+NEAREST_BATCH = 4194304
+
 # Default tolerances for mapping triangulations
 atoldef = options.rc.get("atoldef", 1e-2)
 rtoldef = options.rc.get("rtoldef", 1e-4)
@@ -3392,9 +3396,12 @@ class TriBase(object):
                 Indices of faces in *tric* to considerider
         :Versions:
             * 2015-02-24 ``@ddalle``: Version 1.0
+            * 2026-10-19 ``@ddalle``: Version 1.1; clear :func:`GetCompStats`
         """
         # Default last index.
         if kc is None: kc = np.arange(tric.nTri)
+        # Component IDs are modified in place
+        self.ClearCompStats()
         # Indices of tris to map.
         K1 = np.where(self.CompID == compID)[0]
         # Check for a single component to map (volume really is one CompID).
@@ -3662,6 +3669,7 @@ class TriBase(object):
                 Name of XML config file
         :Versions:
             * 2014-11-10 ``@ddalle``: Version 1.0
+            * 2026-10-19 ``@ddalle``: Version 1.1; clear :func:`GetCompStats`
         """
         # Check for Conf in the triangulation.
         try:
@@ -3709,6 +3717,8 @@ class TriBase(object):
                 self.Conf[k] = cID
                 # Save the compID as an int in the *config* just for clarity
                 #self.config.faces[k] = cID
+        # Component IDs were modified in place
+        self.ClearCompStats()
         # Restrict
         #self.RestrictConfigCompID()
 
@@ -4070,6 +4080,7 @@ class TriBase(object):
                 Node indices, 0-based
         :Versions:
             * 2014-09-27 ``@ddalle``: Version 1.0
+            * 2026-10-19 ``@ddalle``: Version 1.1; use :func:`GetCompIndex`
         """
         # Process inputs.
         if compID is None:
@@ -4078,6 +4089,21 @@ class TriBase(object):
         elif compID == 'entire':
             # Return all the tris.
             return np.arange(self.nNode)
+        # Use the sorted index unless there are quads
+        if self.__dict__.get("nQuad", 0) == 0:
+            # Get nodes sorted by component
+            cidx = self.GetCompIndex()
+            ptr = cidx["NodePtr"]
+            # Nodes in each requested component
+            I = [
+                cidx["NodeIndex"][ptr[j]:ptr[j+1]]
+                for j in self._get_comp_index(compID)
+            ]
+            # Check for no matches
+            if len(I) == 0:
+                return np.zeros(0, dtype="int")
+            # Combine
+            return np.unique(np.hstack(I))
         # Get matches from tris and quads
         kTri  = self.GetTrisFromCompID(compID)
         kQuad = self.GetQuadsFromCompID(compID)
@@ -4116,6 +4142,7 @@ class TriBase(object):
                 List of triangle indices in requested component(s)
         :Versions:
             * 2015-01-23 ``@ddalle``: Version 1.0
+            * 2026-10-19 ``@ddalle``: Version 1.1; use :func:`GetCompIndex`
         """
         # Process inputs.
         if compID is None:
@@ -4124,21 +4151,19 @@ class TriBase(object):
         elif compID == 'entire':
             # Return all the tris.
             return np.arange(self.nTri)
-        # Get list of components
-        comps = self.GetCompID(compID)
-        # Check for single match
-        if len(comps) == 1:
-            # Get a single component.
-            K = self.CompID == comps[0]
-        else:
-            # Initialize with all False (same size as number of tris)
-            K = self.CompID < 0
-            # List of components.
-            for comp in comps:
-                # Add matches for component *ii*.
-                K = np.logical_or(K, self.CompID==comp)
-        # Turn boolean vector into vector of indices]
-        return np.where(K)[0]
+        # Get tris sorted by component
+        cidx = self.GetCompIndex()
+        ptr = cidx["TriPtr"]
+        # Tris in each requested component
+        K = [
+            cidx["TriIndex"][ptr[j]:ptr[j+1]]
+            for j in self._get_comp_index(compID)
+        ]
+        # Check for no matches
+        if len(K) == 0:
+            return np.zeros(0, dtype="int")
+        # Combine (and copy to protect cache)
+        return np.sort(np.hstack(K))
 
     # Get tri indices from node indices
     def GetTrisFromNodes(self, I, skip=1):
@@ -4158,25 +4183,21 @@ class TriBase(object):
                 Array of triangle indices
         :Versions:
             * 2019-05-14 ``@ddalle``: Version 1.0
-        """
-        # Initialize True|{False} array of each triangle
-        Q = np.arange(self.nTri) < 0
-        # Handle to triangle indices
-        T = self.Tris
-        # Loop through nodes
-        for i in I[::skip]:
-            # Status update
-            sys.stdout.write("   %5i/%5i\r" % (i, np.max(I)))
-            sys.stdout.flush()
-            # Process three columns of *Tris*
-            Q[T[:,0] == i] = True
-            Q[T[:,1] == i] = True
-            Q[T[:,2] == i] = True
-        # Clean up prompt
-        sys.stdout.write("%14s\r" % "")
-        sys.stdout.flush()
+            * 2026-10-19 ``@ddalle``: Version 2.0; use half-edges
+        """
+        # Build connectivity
+        self.GetHalfEdges()
+        # Node offsets
+        ptr = self.NodeHalfEdgePtr
+        # Nodes to analyze (ignoring any out of range)
+        I = np.asarray(I, dtype="int")[::skip]
+        I = I[(I > 0) & (I < ptr.size)]
+        # Number of half-edges starting at each node
+        n = ptr[I] - ptr[I-1]
+        # Position of each half-edge in *NodeHalfEdges*
+        J = np.repeat(ptr[I-1] - np.cumsum(n) + n, n) + np.arange(n.sum())
         # Get indices
-        return np.where(Q)[0]
+        return np.unique(self.NodeHalfEdges[J] // 3)
 
     # Get components from compIDs
     def GetFacesFromTris(self, K, nmin=10):
@@ -4415,6 +4436,7 @@ class TriBase(object):
                 Whether or not to remove newly created small tris
         :Versions:
             * 2017-06-19 ``@ddalle``: Version 1.0
+            * 2026-10-19 ``@ddalle``: Version 1.1; vectorize node map
         """
         # Calculate areas
         self.GetNormals()
@@ -4473,10 +4495,9 @@ class TriBase(object):
         I0 = I0[O1]
         # Initialize node index map; node i --> node I1[i] (0-based)
         I1 = np.arange(self.nNode)
-        # Loop through node replacements
-        for (ia, ib) in I0:
-            # Make assignment
-            I1[ia] = ib
+        # Last replacement for each outgoing node wins
+        J = np.hstack((I0[1:,0] != I0[:-1,0], True))
+        I1[I0[J,0]] = I0[J,1]
         # Outgoing nodes
         IA = np.unique(I0[:,0])
         # Make new triangle index array with replacements
@@ -4543,6 +4564,7 @@ class TriBase(object):
                 Only consider tris in this component(s)
         :Versions:
             * 2017-02-09 ``@ddalle``: Version 1.0
+            * 2026-10-19 ``@ddalle``: Version 1.1; clear :func:`GetCompStats`
         """
         # Check triangulation type
         tt = type(tri).__name__
@@ -4619,6 +4641,8 @@ class TriBase(object):
                 continue
             # Save new component ID
             self.CompID[k] = compmap[c1]
+        # Component IDs were modified in place
+        self.ClearCompStats()
         # Clean up prompt
         if v:
             sys.stdout.write("%72s\r" % "")
@@ -5176,6 +5200,32 @@ class TriBase(object):
         # Save the unit normals.
         self.AreaVectors = n
 
+    # Get hash of nodes and tris
+    def GetMeshHash(self):
+        r"""Get a hash of the node coordinates and tri node indices
+
+        Two triangulations with the same hash have identical surfaces,
+        so quantities that only depend on the mesh can be reused.
+
+        :Call:
+            >>> h = tri.GetMeshHash()
+        :Inputs:
+            *tri*: :class:`cape.tri.Tri`
+                Triangulation instance
+        :Outputs:
+            *h*: :class:`str`
+                SHA-1 hash of *tri.Nodes* and *tri.Tris*
+        :Versions:
+            * 2026-10-19 ``@ddalle``: Version 1.0
+        """
+        # Initialize hash
+        sha = hashlib.sha1()
+        # Add nodes and tris in fixed data types
+        sha.update(np.ascontiguousarray(self.Nodes, dtype="<f8").tobytes())
+        sha.update(np.ascontiguousarray(self.Tris, dtype="<i8").tobytes())
+        # Output
+        return sha.hexdigest()
+
     # Get right-handed coordinate system
     def GetBasisVectors(self):
         """Get a right-handed coordinate basis for all triangles
@@ -5433,6 +5483,219 @@ class TriBase(object):
     GetNearestTri.__doc__=GetNearestTri.__doc__.replace("_ztol_",str(ztoldef))
     GetNearestTri.__doc__=GetNearestTri.__doc__.replace("_rztol_",str(rztoldef))
 
+    # Get nearest triangle to each of several points
+    def GetNearestTris(self, X, n=4, **kw):
+        r"""Get the nearest triangles to each of several points
+
+        This performs the same search as :func:`GetNearestTri` for all
+        points at once, processing blocks of points with array
+        operations instead of one point at a time.
+
+        :Call:
+            >>> T = tri.GetNearestTris(X, n=4, **kw)
+        :Inputs:
+            *tri*: :class:`cape.tri.Tri`
+                Triangulation instance
+            *X*: :class:`np.ndarray`\ [:class:`float`]
+                Coordinates of test points, *shape*: (*m*, 3)
+            *n*: {``4``} | :class:`int`
+                Number of *tri* components to search
+            *ztol*: {_ztol_} | positive :class:`float`
+                Maximum extra projection distance
+            *rztol*: {_rztol_} | positive :class:`float`
+                Maximum relative projection distance
+            *nbatch*: {``NEAREST_BATCH``} | :class:`int`
+                Max number of point-triangle pairs in each block
+        :Outputs:
+            *T*: :class:`dict`\ [:class:`np.ndarray`]
+                Match parameters for each point, as in
+                :func:`GetNearestTri`; *T["k2"]*, etc. are ``-1`` and
+                *T["d2"]*, etc. are ``nan`` where there is no match
+        :Versions:
+            * 2026-10-19 ``@ddalle``: Version 1.0
+        """
+        # Get coordinates and triangle vertices
+        self.GetBasisVectors()
+        self.GetTriNodes()
+        # Ensure 2D array of points
+        X = np.asarray(X, dtype="float")
+        if X.ndim == 1:
+            X = X.reshape((1, 3))
+        # Number of points and tris
+        m = X.shape[0]
+        ntri = self.TriX.shape[0]
+        # Process max tol
+        ztol = kw.get("ztol", ztoldef)
+        rztol = kw.get("rztol", rztoldef)
+        # Scale of vehicle
+        bbox = self.GetCompBBox()
+        # Use largest dimension of bbox
+        Lref = np.max(bbox[1::2] - bbox[::2])
+        # Relative tolerance
+        ztol = ztol + rztol*Lref
+        # Number of points per block
+        nbatch = kw.get("nbatch", NEAREST_BATCH)
+        mblock = max(1, nbatch // max(1, ntri))
+        # Initialize output
+        T = {}
+        for j in range(n):
+            # Tag
+            sj = str(j + 1)
+            T["k" + sj] = np.full(m, -1, dtype="int")
+            T["c" + sj] = np.full(m, -1, dtype="int")
+            T["d" + sj] = np.full(m, np.nan)
+            T["z" + sj] = np.full(m, np.nan)
+            T["t" + sj] = np.full(m, np.nan)
+        # Loop through blocks of points
+        for ia in range(0, m, mblock):
+            # End of block
+            ib = min(m, ia + mblock)
+            # Search
+            Tj = self._get_nearest_tris(X[ia:ib], n, ztol)
+            # Save
+            for k, v in Tj.items():
+                T[k][ia:ib] = v
+        # Output
+        return T
+    # Edit default tolerances
+    GetNearestTris.__doc__ = GetNearestTris.__doc__.replace(
+        "_ztol_", str(ztoldef))
+    GetNearestTris.__doc__ = GetNearestTris.__doc__.replace(
+        "_rztol_", str(rztoldef))
+
+    # Nearest triangles for one block of points
+    def _get_nearest_tris(self, X, n, ztol):
+        r"""Get the nearest triangles to a block of points
+
+        :Call:
+            >>> T = tri._get_nearest_tris(X, n, ztol)
+        :Inputs:
+            *tri*: :class:`cape.tri.Tri`
+                Triangulation instance
+            *X*: :class:`np.ndarray`\ [:class:`float`]
+                Coordinates of test points, *shape*: (*m*, 3)
+            *n*: :class:`int`
+                Number of *tri* components to search
+            *ztol*: :class:`float`
+                Maximum extra projection distance, including *rztol*
+        :Outputs:
+            *T*: :class:`dict`\ [:class:`np.ndarray`]
+                Match parameters for each point
+        :Versions:
+            * 2026-10-19 ``@ddalle``: Version 1.0
+        """
+        # Extract coordinate basis function
+        e1 = self.e1
+        e2 = self.e2
+        e3 = self.e3
+        # Extract the vertices of each tri
+        TX = self.TriX
+        TY = self.TriY
+        TZ = self.TriZ
+        # Number of points and tris
+        m = X.shape[0]
+        ntri = TX.shape[0]
+        # Test point coordinates as columns
+        x = X[:, [0]]
+        y = X[:, [1]]
+        z = X[:, [2]]
+        # Get the projection distance to each tri, *shape*: (m, ntri)
+        zi = np.abs(
+            (x - TX[:, 0])*e3[:, 0] +
+            (y - TY[:, 0])*e3[:, 1] +
+            (z - TZ[:, 0])*e3[:, 2])
+        # Get minimum projection distance for each point
+        zmin = np.nanmin(zi, axis=1)
+        # Tris within *zmin* and *ztol*
+        I = zi <= (zmin + ztol)[:, None]
+        # Number of candidates for each point
+        ncand = min(ntri, 100)
+        # Filter best candidates
+        if ntri > ncand:
+            # Centers
+            XC = np.mean(TX, axis=1)
+            YC = np.mean(TY, axis=1)
+            ZC = np.mean(TZ, axis=1)
+            # L1 distance to each center for tris within *ztol*
+            L1 = np.abs(XC - x) + np.abs(YC - y) + np.abs(ZC - z)
+            L1[~I] = np.inf
+            # Closest 100 (or all of them if there are fewer)
+            K = np.argpartition(L1, ncand - 1, axis=1)[:, :ncand]
+            L1 = np.take_along_axis(L1, K, axis=1)
+            # Points with more than 100 tris within *ztol*
+            qbig = np.sum(I, axis=1) > ncand
+            # Order by *L1* if filtered, otherwise by tri index
+            S = np.where(qbig[:, None], L1, K)
+            S[np.isinf(L1)] = np.inf
+            J = np.argsort(S, axis=1, kind="stable")
+            K = np.take_along_axis(K, J, axis=1)
+        else:
+            # All tris are candidates
+            K = np.tile(np.arange(ntri), (m, 1))
+        # Valid candidates
+        V = np.take_along_axis(I, K, axis=1)
+        zi = np.take_along_axis(zi, K, axis=1)
+        # Vertices and basis vectors of candidates
+        XI0, XI1, XI2 = np.moveaxis(TX[K], 2, 0)
+        YI0, YI1, YI2 = np.moveaxis(TY[K], 2, 0)
+        ZI0, ZI1, ZI2 = np.moveaxis(TZ[K], 2, 0)
+        e10, e11, e12 = np.moveaxis(e1[K], 2, 0)
+        e20, e21, e22 = np.moveaxis(e2[K], 2, 0)
+        # Convert the test points into coordinates aligned with first edge
+        xi = (x-XI0)*e10 + (y-YI0)*e11 + (z-ZI0)*e12
+        yi = (x-XI0)*e20 + (y-YI0)*e21 + (z-ZI0)*e22
+        # Transformed triangles
+        XI = np.zeros((m*ncand, 3))
+        YI = np.zeros((m*ncand, 3))
+        XI[:, 1] = ((XI1-XI0)*e10 + (YI1-YI0)*e11 + (ZI1-ZI0)*e12).ravel()
+        XI[:, 2] = ((XI2-XI0)*e10 + (YI2-YI0)*e11 + (ZI2-ZI0)*e12).ravel()
+        YI[:, 2] = ((XI2-XI0)*e20 + (YI2-YI0)*e21 + (ZI2-ZI0)*e22).ravel()
+        # Get distance to each triangle within the plane of each triangle
+        DI = geom.dist2_tris_to_pt(XI, YI, xi.ravel(), yi.ravel())
+        DI = DI.reshape((m, ncand))
+        # Get total distance from point to each triangle
+        D = zi*zi + DI
+        # Ignore invalid candidates
+        V = np.logical_and(V, np.logical_not(np.isnan(D)))
+        D[~V] = np.inf
+        # Point indices
+        P = np.arange(m)
+        # Get index of minimum distance
+        i1 = np.argmin(D, axis=1)
+        k1 = K[P, i1]
+        c1 = self.CompID[k1]
+        # Initialize output
+        T = {
+            "k1": k1,
+            "c1": c1,
+            "d1": np.sqrt(D[P, i1]),
+            "t1": np.sqrt(DI[P, i1]),
+            "z1": zi[P, i1],
+        }
+        # Initialize submask; same first filter as GetNearestTri()
+        I1 = np.logical_and(V, K != c1[:, None])
+        C1 = self.CompID[K]
+        # Loop through until we find up to four components
+        for nj in range(n-1):
+            # Tag
+            sj = str(nj + 2)
+            # Points with remaining triangles
+            Q = np.any(I1, axis=1)
+            # Find nearest match from remaining triangles
+            j = np.argmin(np.where(I1, D, np.inf), axis=1)
+            k = K[P, j]
+            c = self.CompID[k]
+            # Save parameters
+            T["k"+sj] = np.where(Q, k, -1)
+            T["c"+sj] = np.where(Q, c, -1)
+            T["d"+sj] = np.where(Q, np.sqrt(D[P, j]), np.nan)
+            T["z"+sj] = np.where(Q, zi[P, j], np.nan)
+            T["t"+sj] = np.where(Q, DI[P, j], np.nan)
+            # Update mask
+            I1 = np.logical_and(I1, C1 != c[:, None])
+        # Output
+        return T
+
     # Get tris by bbox
     def FilterTrisBBox(self, bbox):
         """Get the list of Tris in a specified rectangular prism
@@ -5591,6 +5854,217 @@ class TriBase(object):
         # Save sorted edges
         self.EdgeTable = E[I,:]
 
+    # Get half-edge connectivity
+    def GetHalfEdges(self):
+        r"""Build cached half-edge connectivity of the triangulation
+
+        Each triangle *k* (0-based) has three half-edges, ``3*k + e``,
+        where half-edge *e* runs from node ``tri.Tris[k,e]`` to node
+        ``tri.Tris[k,(e+1)%3]``. The tables are built in one
+        vectorized pass and reused until *tri.Tris* is replaced.
+
+        :Call:
+            >>> tri.GetHalfEdges()
+        :Inputs:
+            *tri*: :class:`cape.tri.TriBase`
+                Triangulation instance
+        :Effects:
+            *tri.HalfEdgeTwin*: :class:`np.ndarray`, shape=(3*nTri,)
+                Index of half-edge running in opposite direction, or
+                ``-1`` for open or non-manifold edges
+            *tri.TriNeighbors*: :class:`np.ndarray`, shape=(nTri, 3)
+                Tri [1-based] across each edge of each tri, else ``0``
+            *tri.NodeHalfEdgePtr*: :class:`np.ndarray`, shape=(nNode+1,)
+                Half-edges starting at node *i* [1-based] are
+                ``tri.NodeHalfEdges[ptr[i-1]:ptr[i]]``
+            *tri.NodeHalfEdges*: :class:`np.ndarray`, shape=(3*nTri,)
+                Half-edge indices sorted by start node
+        :Versions:
+            * 2026-10-19 ``@ddalle``: Version 1.0
+        """
+        # Check for current tables
+        if getattr(self, "_HalfEdgeTris", None) is self.Tris:
+            return
+        # Triangulation handle
+        T = np.asarray(self.Tris)
+        nTri = T.shape[0]
+        # Number of nodes (safe if *nNode* is stale)
+        nNode = max(self.nNode, int(np.max(T)) if nTri else 0)
+        # Start and end node of each half-edge
+        I0 = T.ravel().astype("int64")
+        I1 = T[:,[1,2,0]].ravel().astype("int64")
+        # Unique key for each directed edge
+        n = nNode + 1
+        key = I0*n + I1
+        # Sort keys for searching
+        O = np.argsort(key, kind="stable")
+        S = key[O]
+        # Search for the reversed edge of each half-edge
+        rkey = I1*n + I0
+        j0 = np.searchsorted(S, rkey, side="left")
+        j1 = np.searchsorted(S, rkey, side="right")
+        # Only accept a unique reversed half-edge
+        J = np.minimum(j0, S.size - 1)
+        twin = np.where(j1 - j0 == 1, O[J], -1)
+        # Neighbor tri across each edge (1-based, 0 if none)
+        TN = np.where(twin >= 0, twin//3 + 1, 0).reshape((nTri, 3))
+        # Sort half-edges by start node for node ring queries
+        H = np.argsort(I0, kind="stable")
+        # Offsets by node (1-based node *i* -> ptr[i-1]:ptr[i])
+        ptr = np.zeros(nNode + 1, dtype="int64")
+        ptr[1:] = np.cumsum(np.bincount(I0 - 1, minlength=nNode))
+        # Save
+        self.HalfEdgeTwin = twin
+        self.TriNeighbors = TN
+        self.NodeHalfEdgePtr = ptr
+        self.NodeHalfEdges = H
+        self._HalfEdgeTris = self.Tris
+
+    # Get neighbors of all tris
+    def GetTriNeighbors(self):
+        r"""Get the neighboring triangles of every triangle
+
+        :Call:
+            >>> K = tri.GetTriNeighbors()
+        :Inputs:
+            *tri*: :class:`cape.tri.TriBase`
+                Triangulation instance
+        :Outputs:
+            *K*: :class:`np.ndarray`\ [:class:`int`], shape=(nTri, 3)
+                ``K[k,e]`` is the tri [1-based] sharing edge *e* of
+                tri *k* [0-based], or ``0`` if there is none
+        :Versions:
+            * 2026-10-19 ``@ddalle``: Version 1.0
+        """
+        # Build connectivity
+        self.GetHalfEdges()
+        # Output
+        return self.TriNeighbors
+
+    # Get half-edges starting at a node
+    def GetNodeHalfEdges(self, i):
+        r"""Get the half-edges that start at one node
+
+        :Call:
+            >>> J = tri.GetNodeHalfEdges(i)
+        :Inputs:
+            *tri*: :class:`cape.tri.TriBase`
+                Triangulation instance
+            *i*: :class:`int` > 0
+                Node index [1-based]
+        :Outputs:
+            *J*: :class:`np.ndarray`\ [:class:`int`]
+                Half-edge indices; tri ``J//3`` [0-based], edge ``J%3``
+        :Versions:
+            * 2026-10-19 ``@ddalle``: Version 1.0
+        """
+        # Build connectivity
+        self.GetHalfEdges()
+        # Check range
+        if i < 1 or i >= self.NodeHalfEdgePtr.size:
+            return np.zeros(0, dtype="int")
+        # Slice of half-edges starting at *i*
+        ptr = self.NodeHalfEdgePtr
+        return self.NodeHalfEdges[ptr[i-1]:ptr[i]]
+
+    # Get tris around a node
+    def GetNodeTris(self, i):
+        r"""Get the triangles that use one node
+
+        :Call:
+            >>> K = tri.GetNodeTris(i)
+        :Inputs:
+            *tri*: :class:`cape.tri.TriBase`
+                Triangulation instance
+            *i*: :class:`int` > 0
+                Node index [1-based]
+        :Outputs:
+            *K*: :class:`np.ndarray`\ [:class:`int`]
+                Indices of triangles [0-based] containing node *i*
+        :Versions:
+            * 2026-10-19 ``@ddalle``: Version 1.0
+        """
+        # One half-edge per tri starts at each of its nodes
+        return self.GetNodeHalfEdges(i) // 3
+
+    # Get nodes around a node
+    def GetNodeNeighbors(self, i):
+        r"""Get the nodes connected to one node by an edge
+
+        :Call:
+            >>> I = tri.GetNodeNeighbors(i)
+        :Inputs:
+            *tri*: :class:`cape.tri.TriBase`
+                Triangulation instance
+            *i*: :class:`int` > 0
+                Node index [1-based]
+        :Outputs:
+            *I*: :class:`np.ndarray`\ [:class:`int`]
+                Sorted indices [1-based] of nodes sharing an edge
+        :Versions:
+            * 2026-10-19 ``@ddalle``: Version 1.0
+        """
+        # Half-edges starting at *i*
+        J = self.GetNodeHalfEdges(i)
+        # Tri and edge index
+        K = J // 3
+        E = J % 3
+        # End of outgoing edge and start of incoming edge
+        I1 = self.Tris[K, (E + 1) % 3]
+        I2 = self.Tris[K, (E + 2) % 3]
+        # Output
+        return np.unique(np.hstack((I1, I2)))
+
+    # Get edges with no neighbor
+    def GetOpenEdges(self):
+        r"""Get the edges that do not have exactly one matching edge
+
+        :Call:
+            >>> E = tri.GetOpenEdges()
+        :Inputs:
+            *tri*: :class:`cape.tri.TriBase`
+                Triangulation instance
+        :Outputs:
+            *E*: :class:`np.ndarray`\ [:class:`int`], shape=(n, 3)
+                Start node, end node [1-based], and tri [1-based] of
+                each open or non-manifold half-edge
+        :Versions:
+            * 2026-10-19 ``@ddalle``: Version 1.0
+        """
+        # Build connectivity
+        self.GetHalfEdges()
+        # Half-edges with no twin
+        J = np.where(self.HalfEdgeTwin < 0)[0]
+        # Tri and edge index
+        K = J // 3
+        E = J % 3
+        # Output
+        return np.stack(
+            (self.Tris[K, E], self.Tris[K, (E + 1) % 3], K + 1), axis=1)
+
+    # Check for closed surface
+    def IsWatertight(self):
+        r"""Check if every edge is shared by exactly two triangles
+
+        This also requires consistent orientation, i.e. the two
+        triangles must traverse the shared edge in opposite directions.
+
+        :Call:
+            >>> q = tri.IsWatertight()
+        :Inputs:
+            *tri*: :class:`cape.tri.TriBase`
+                Triangulation instance
+        :Outputs:
+            *q*: ``True`` | ``False``
+                Whether or not all half-edges have a unique twin
+        :Versions:
+            * 2026-10-19 ``@ddalle``: Version 1.0
+        """
+        # Build connectivity
+        self.GetHalfEdges()
+        # Check for any open edges
+        return bool(np.all(self.HalfEdgeTwin >= 0))
+
     # Find neighbor
     def FindTriFromEdge(self, i0, i1):
         """Find the triangle index from a specified edge
@@ -5610,22 +6084,17 @@ class TriBase(object):
                 if no match, returns ``0``
         :Versions:
             * 2019-06-20 ``@ddalle``: Version 1.0
+            * 2026-10-19 ``@ddalle``: Version 1.1; use half-edges
         """
-        # Get edge table
-        self.GetEdgeTable()
-        # Get handle
-        ET = self.EdgeTable
-        # Find edges starting with node *i0*
-        j0 = np.where(ET[:,0] == i0)[0]
+        # Half-edges starting at node *i0*
+        J = self.GetNodeHalfEdges(i0)
         # Of these, find the one with *i1* as the end
-        j1 = np.where(ET[j0,1] == i1)[0]
+        J = J[self.Tris[J//3, (J%3 + 1) % 3] == i1]
         # Check validity
-        if j1.size != 1:
+        if J.size != 1:
             return 0
-        # Get edge index
-        j = j0[j1[0]]
-        # Get triangle index from table
-        return ET[j, 2]
+        # Get triangle index
+        return J[0]//3 + 1
 
 
     # Find neighbors of a triangle
@@ -5650,27 +6119,237 @@ class TriBase(object):
                 Triangle index sharing edge 1 of triangle *k*
         :Versions:
             * 2019-06-20 ``@ddalle``: Version 1.0
+            * 2026-10-19 ``@ddalle``: Version 1.1; use half-edges
         """
-        # Get nodes of this triangle
-        i0, i1, i2 = self.Tris[k]
-        # Find triangles containing reversed edges
-        k0 = self.FindTriFromEdge(i1, i0)
-        k1 = self.FindTriFromEdge(i2, i1)
-        k2 = self.FindTriFromEdge(i0, i2)
-        # Output
-        return np.array([k0, k1, k2])
+        # Triangles containing reversed edges
+        return self.GetTriNeighbors()[k].copy()
    # }
 
    # ++++++++++
    # Components
    # ++++++++++
    # {
+    # Get index of tris and nodes in each component
+    def GetCompIndex(self):
+        r"""Sort tris and nodes by component ID in one pass
+
+        The result is cached until *tri.Tris* or *tri.CompID* is
+        replaced or :func:`ClearCompStats` is called.
+
+        :Call:
+            >>> cidx = tri.GetCompIndex()
+        :Inputs:
+            *tri*: :class:`cape.tri.TriBase`
+                Triangulation instance
+        :Outputs:
+            *cidx*: :class:`dict`
+                Index of each component, with keys
+
+                * ``"CompID"``: sorted unique component IDs
+                * ``"TriPtr"``: tris of component ``CompID[j]`` are
+                  ``TriIndex[TriPtr[j]:TriPtr[j+1]]``
+                * ``"TriIndex"``: tri indices [0-based] sorted by comp
+                * ``"NodePtr"``: nodes of component ``CompID[j]`` are
+                  ``NodeIndex[NodePtr[j]:NodePtr[j+1]]``
+                * ``"NodeIndex"``: node indices [0-based] of each comp
+        :Versions:
+            * 2026-10-19 ``@ddalle``: Version 1.0
+        """
+        # Check for current index
+        cidx = self.__dict__.get("_CompIndex")
+        if cidx is not None:
+            q = cidx["C"] is self.__dict__.get("CompID")
+            if q and cidx["Tris"] is self.Tris:
+                return cidx
+        # Triangulation and component ID of each tri
+        T = np.asarray(self.Tris)
+        C = self.__dict__.get("CompID")
+        # Treat missing component IDs as one component
+        if C is None:
+            C = np.zeros(T.shape[0], dtype="int")
+        else:
+            C = np.asarray(C)
+        # Sort tris by component, keeping tri order within each comp
+        K = np.argsort(C, kind="stable")
+        # Unique components and number of tris in each
+        comps, ntri = np.unique(C[K], return_counts=True)
+        ncomp = comps.size
+        # Offsets
+        tptr = np.zeros(ncomp + 1, dtype="int")
+        tptr[1:] = np.cumsum(ntri)
+        # Number of nodes (safe if *nNode* is stale)
+        nNode = max(self.nNode, 1)
+        if T.size:
+            nNode = max(nNode, int(np.max(T)))
+        # Unique (comp, node) pairs
+        J = np.repeat(np.arange(ncomp), ntri)
+        key = np.unique(J[:,None]*nNode + (T[K] - 1))
+        # Offsets of nodes for each comp
+        nptr = np.searchsorted(key // nNode, np.arange(ncomp + 1))
+        # Save
+        cidx = {
+            "CompID": comps,
+            "TriPtr": tptr,
+            "TriIndex": K,
+            "NodePtr": nptr,
+            "NodeIndex": key % nNode,
+            "Tris": self.Tris,
+            "C": self.__dict__.get("CompID"),
+        }
+        self._CompIndex = cidx
+        # Output
+        return cidx
+
+    # Get geometric properties of every component
+    def GetCompStats(self):
+        r"""Get area, bounding box, etc. of every component at once
+
+        All components are reduced in a single pass over the tris, and
+        the result is cached.  The cache is rebuilt automatically when
+
+            * *tri.Nodes*, *tri.Tris*, or *tri.CompID* is replaced by a
+              new array, e.g. by :func:`Add` or :func:`RemoveSmallTris`
+            * nodes are moved with :func:`SetNodes`, which is used by
+              :func:`Translate` and :func:`Rotate`
+            * component IDs are changed by :func:`MapSubCompID`,
+              :func:`ApplyConfig`, or :func:`MapTriCompID`
+
+        Other in-place edits of those arrays, such as
+        ``tri.Nodes[:,0] += 1.0``, are not detected; call
+        :func:`ClearCompStats` after them.
+
+        :Call:
+            >>> stats = tri.GetCompStats()
+        :Inputs:
+            *tri*: :class:`cape.tri.TriBase`
+                Triangulation instance
+        :Outputs:
+            *stats*: :class:`dict`
+                Contents of :func:`GetCompIndex` and, for each comp,
+
+                * ``"nTri"``: number of tris
+                * ``"nNode"``: number of nodes
+                * ``"Area"``: total area
+                * ``"AreaVector"``: sum of area times unit normal
+                * ``"Moment"``: area-weighted sum of tri centers
+                * ``"Centroid"``: area-weighted centroid
+                * ``"BBox"``: *xmin*, *xmax*, *ymin*, *ymax*, ...
+        :Versions:
+            * 2026-10-19 ``@ddalle``: Version 1.0
+            * 2026-10-19 ``@ddalle``: Version 1.1; compute tri areas here
+        """
+        # Get index by component
+        cidx = self.GetCompIndex()
+        # Check for current stats
+        stats = self.__dict__.get("_CompStats")
+        if stats is not None:
+            if stats["_index"] is cidx and stats["_nodes"] is self.Nodes:
+                return stats
+        # Sorted tris
+        K = cidx["TriIndex"]
+        # Start of each comp
+        I0 = cidx["TriPtr"][:-1]
+        # Coordinates of each vertex, shape=(nTri, 3, nd)
+        X = self.Nodes[self.Tris[K] - 1]
+        nd = X.shape[2]
+        # Dimensioned normals from current nodes (same as GetNormals())
+        N = np.cross(X[:,1] - X[:,0], X[:,2] - X[:,0])
+        A = np.fmax(1e-10, np.sqrt(np.sum(N**2, axis=1)))
+        # Unit normals and areas
+        N = N / A[:,None]
+        A = 0.5*A
+        # Initialize outputs
+        ncomp = I0.size
+        stats = dict(cidx)
+        stats["nTri"] = np.diff(cidx["TriPtr"])
+        stats["nNode"] = np.diff(cidx["NodePtr"])
+        stats["Area"] = np.zeros(ncomp)
+        stats["AreaVector"] = np.zeros((ncomp, 3))
+        stats["Moment"] = np.zeros((ncomp, nd))
+        stats["BBox"] = np.zeros((ncomp, 2*nd))
+        # Reduce each comp (no empty groups by construction)
+        if ncomp > 0:
+            # Areas and area vectors
+            stats["Area"] = np.add.reduceat(A, I0)
+            stats["AreaVector"] = np.add.reduceat(
+                A[:,None]*N, I0, axis=0)
+            # Area-weighted tri centers
+            stats["Moment"] = np.add.reduceat(
+                A[:,None]*np.mean(X, axis=1), I0, axis=0)
+            # Extrema
+            stats["BBox"][:,0::2] = np.minimum.reduceat(
+                np.min(X, axis=1), I0, axis=0)
+            stats["BBox"][:,1::2] = np.maximum.reduceat(
+                np.max(X, axis=1), I0, axis=0)
+        # Centroids
+        stats["Centroid"] = stats["Moment"] / np.fmax(
+            stats["Area"][:,None], 1e-300)
+        # Cache keys
+        stats["_index"] = cidx
+        stats["_nodes"] = self.Nodes
+        self._CompStats = stats
+        # Output
+        return stats
+
+    # Delete cached component properties
+    def ClearCompStats(self, index=True):
+        r"""Delete cached results of :func:`GetCompStats`
+
+        This must be called after modifying *tri.CompID* or
+        *tri.Nodes* in place without :func:`SetNodes` or the other
+        methods listed in :func:`GetCompStats`.  The areas and normals
+        of each tri from :func:`GetNormals` and :func:`GetAreaVectors`
+        are also deleted so that they are recomputed from the current
+        nodes.
+
+        :Call:
+            >>> tri.ClearCompStats(index=True)
+        :Inputs:
+            *tri*: :class:`cape.tri.TriBase`
+                Triangulation instance
+            *index*: {``True``} | ``False``
+                Also delete :func:`GetCompIndex`, i.e. if *CompID* or
+                *Tris* changed rather than just *Nodes*
+        :Versions:
+            * 2026-10-19 ``@ddalle``: Version 1.0
+            * 2026-10-19 ``@ddalle``: Version 1.1; delete tri areas
+        """
+        # Delete geometric properties
+        self.__dict__.pop("_CompStats", None)
+        # Delete properties of each tri
+        for k in ("Areas", "Normals", "AreaVectors"):
+            self.__dict__.pop(k, None)
+        # Delete index
+        if index:
+            self.__dict__.pop("_CompIndex", None)
+
+    # Find position of components in *GetCompIndex()*
+    def _get_comp_index(self, compID):
+        # Get index
+        cidx = self.GetCompIndex()
+        comps = cidx["CompID"]
+        # Check for all components
+        if compID is None or isinstance(compID, str) and compID == "entire":
+            return np.arange(comps.size)
+        # Get list of components
+        C = np.asarray(self.GetCompID(compID), dtype=comps.dtype)
+        # Find them in sorted list
+        J = np.searchsorted(comps, C)
+        Q = J < comps.size
+        J = J[Q]
+        # Only keep exact matches
+        return np.unique(J[comps[J] == C[Q]])
+
     # Get normals and areas
     def GetCompArea(self, compID=None, n=None):
         """
         Get the total area of a component, or get the total area of a component
         projected to a plane with a given normal vector.
 
+        Areas are cached by :func:`GetCompStats`, which lists the
+        changes to *tri* that are detected automatically; call
+        :func:`ClearCompStats` after any other in-place edit.
+
         :Call:
             >>> A = tri.GetCompArea(compID)
             >>> A = tri.GetCompArea(compID, n)
@@ -5686,29 +6365,19 @@ class TriBase(object):
                 Area of the component
         :Versions:
             * 2014-06-13 ``@ddalle``: Version 1.0
+            * 2026-10-19 ``@ddalle``: Version 1.1; use :func:`GetCompStats`
         """
-        # Check for areas.
-        try:
-            self.Areas
-        except AttributeError:
-            self.GetNormals()
-        # Find the indices of tris in the component.
-        k = self.GetTrisFromCompID(compID)
+        # Get properties of all components
+        stats = self.GetCompStats()
+        # Find the requested components
+        J = self._get_comp_index(compID)
         # Check for direction projection.
         if n is None:
             # No projection
-            return np.sum(self.Areas[k])
+            return np.sum(stats["Area"][J])
         else:
-            # Extract the normals and copy to new matrix.
-            N = self.Normals[k].copy()
-            # Dot those normals with the requested vector.
-            N[:,0] *= n[0]
-            N[:,1] *= n[1]
-            N[:,2] *= n[2]
-            # Sum to get the dot product.
-            d = np.sum(N, 1)
-            # Multiply this dot product by the area of each tri
-            return np.sum(self.Areas[k] * d)
+            # Dot total area vector with the requested vector
+            return np.dot(np.sum(stats["AreaVector"][J], axis=0), n)
 
     # Get normals and areas
     def GetCompAreaVector(self, compID, n=None):
@@ -5731,13 +6400,14 @@ class TriBase(object):
                 Area of the component
         :Versions:
             * 2014-06-13 ``@ddalle``: Version 1.0
+            * 2026-10-19 ``@ddalle``: Version 1.1; use :func:`GetCompStats`
         """
-        # Check for areas.
-        self.GetAreaVectors()
-        # Find the indices of tris in the component.
-        k = self.GetTrisFromCompID(compID)
-        # Add up component areas
-        return np.sum(self.AreaVectors[k], axis=0)
+        # Get properties of all components
+        stats = self.GetCompStats()
+        # Find the requested components
+        J = self._get_comp_index(compID)
+        # Add up component areas (*AreaVectors* are twice tri area)
+        return 2*np.sum(stats["AreaVector"][J], axis=0)
 
     # Get normals and areas
     def GetCompNormal(self, compID):
@@ -5755,23 +6425,14 @@ class TriBase(object):
                 Area-averaged unit normal
         :Versions:
             * 2014-06-13 ``@ddalle``: Version 1.0
-        """
-        # Check for areas.
-        try:
-            self.Areas
-        except AttributeError:
-            self.GetNormals()
-        # Find the indices of tris in the component.
-        i = self.CompID == compID
-        # Extract those normals and areas.
-        N = self.Normals[i].copy()
-        A = self.Areas[i].copy()
-        # Weight the normals.
-        N[:,0] *= A
-        N[:,1] *= A
-        N[:,2] *= A
-        # Compute the mean.
-        n = np.mean(N, 0)
+            * 2026-10-19 ``@ddalle``: Version 1.1; use :func:`GetCompStats`
+        """
+        # Get properties of all components
+        stats = self.GetCompStats()
+        # Find the requested components
+        J = self._get_comp_index(compID)
+        # Total area-weighted normal
+        n = np.sum(stats["AreaVector"][J], axis=0)
         # Unitize.
         return n / np.sqrt(np.sum(n**2))
 
@@ -5796,46 +6457,17 @@ class TriBase(object):
                 Coordinate of the centroid
         :Versions:
             * 2016-03-29 ``@ddalle``: Version 1.0
+            * 2026-10-19 ``@ddalle``: Version 1.1; use :func:`GetCompStats`
         """
-        # Check for areas.
-        try:
-            self.Areas
-        except AttributeError:
-            self.GetNormals()
-        # Get tris
-        k = self.GetTrisFromCompID(compID)
+        # Get properties of all components
+        stats = self.GetCompStats()
+        # Find the requested components
+        J = self._get_comp_index(compID)
         # Check for no triangles
-        if k.size == 0:
+        if np.sum(stats["nTri"][J]) == 0:
             raise ValueError("Found no tris for comp '%s'" % compID)
-        # Get corresponding nodes
-        i = self.Tris[k,:] - 1
-        # Get areas of those components
-        A = self.Areas[k]
-        # Total area
-        AT = np.sum(A)
-        # Dimensions
-        nd = self.Nodes.shape[1]
-        # Get coordinates
-        if nd == 2:
-            # 2D coordinates
-            x = np.mean(self.Nodes[i,0], axis=1)
-            y = np.mean(self.Nodes[i,1], axis=1)
-            # Weighting
-            xc = np.sum(x*A) / AT
-            yc = np.sum(y*A) / AT
-            # Output
-            return np.array([xc, yc])
-        else:
-            # 3D coordinates
-            x = np.mean(self.Nodes[i,0], axis=1)
-            y = np.mean(self.Nodes[i,1], axis=1)
-            z = np.mean(self.Nodes[i,2], axis=1)
-            # Weighted averages
-            xc = np.sum(x*A) / AT
-            yc = np.sum(y*A) / AT
-            zc = np.sum(z*A) / AT
-            # Output
-            return np.array([xc, yc, zc])
+        # Area-weighted average of tri centers
+        return np.sum(stats["Moment"][J], axis=0) / np.sum(stats["Area"][J])
 
     # Function to add a bounding box based on a component and buffer
     def GetCompBBox(self, compID=None, **kwargs):
@@ -5844,6 +6476,10 @@ class TriBase(object):
         or list of components, with an optional buffer or buffers in each
         direction
 
+        Bounding boxes are cached by :func:`GetCompStats`, which lists
+        the changes to *tri* that are detected automatically; call
+        :func:`ClearCompStats` after any other in-place edit.
+
         :Call:
             >>> xlim = tri.GetCompBBox(compID, **kwargs)
         :Inputs:
@@ -5879,11 +6515,14 @@ class TriBase(object):
             * 2014-06-16 ``@ddalle``: Version 1.0
             * 2014-08-03 ``@ddalle``: Changed "buff" --> "pad"
             * 2017-02-08 ``@ddalle``: CompID ``None`` gets BBox for full tri
+            * 2026-10-19 ``@ddalle``: Version 1.1; use :func:`GetCompStats`
         """
-        # List of components; initialize with first.
-        i = self.GetTrisFromCompID(compID)
+        # Get properties of all components
+        stats = self.GetCompStats()
+        # Find the requested components
+        J = self._get_comp_index(compID)
         # Check for null component
-        if i is None or len(i) == 0:
+        if np.sum(stats["nTri"][J]) == 0:
             return
         # Get the overall buffer.
         pad = kwargs.get('pad', 0.0)
@@ -5898,17 +6537,15 @@ class TriBase(object):
         ym = kwargs.get('ym', ypad)
         zp = kwargs.get('zp', zpad)
         zm = kwargs.get('zm', zpad)
-        # Get the coordinates of each vertex of included tris.
-        x = self.Nodes[self.Tris[i,:]-1, 0]
-        y = self.Nodes[self.Tris[i,:]-1, 1]
-        z = self.Nodes[self.Tris[i,:]-1, 2]
+        # Bounding boxes of included components
+        BBox = stats["BBox"][J]
         # Get the extrema
-        xmin = np.min(x) - xm
-        xmax = np.max(x) + xp
-        ymin = np.min(y) - ym
-        ymax = np.max(y) + yp
-        zmin = np.min(z) - zm
-        zmax = np.max(z) + zp
+        xmin = np.min(BBox[:,0]) - xm
+        xmax = np.max(BBox[:,1]) + xp
+        ymin = np.min(BBox[:,2]) - ym
+        ymax = np.max(BBox[:,3]) + yp
+        zmin = np.min(BBox[:,4]) - zm
+        zmax = np.max(BBox[:,5]) + zp
         # Return the list.
         return np.array([xmin, xmax, ymin, ymax, zmin, zmax])
 
@@ -6242,13 +6879,14 @@ class TriBase(object):
                 Number of curve segments to discount from next search
         :Versions:
             * 2016-09-29 ``@ddalle``: Version 1.0
+            * 2026-10-19 ``@ddalle``: Version 1.1; use half-edges
         """
         # Direction tolerance
         atol = np.cos(kw.get('atol', 60.0) * np.pi/180)
         # Distance tolerance
         dtol = kw.get('dtol', 0.05)
-        # Get the indices of neighboring nodes (leave zero-based)
-        I = self.Edges[self.Edges[:,0]==icur, 1]
+        # Get the indices of neighboring nodes
+        I = self.GetNodeNeighbors(icur)
         # Get coordinates of neighboring nodes
         X = self.Nodes[I-1,:]
         # Current node
@@ -6543,6 +7181,7 @@ class TriBase(object):
             * 2014-05-23 ``@ddalle``: Version 1.0
             * 2014-10-08 ``@ddalle``: Exported functionality to function
             * 2016-04-08 ``@ddalle``: Redid inputs
+            * 2026-10-19 ``@ddalle``: Version 1.1; clear :func:`GetCompStats`
         """
         # Get component ID
         compID = kw.get('compID')
@@ -6596,7 +7235,7 @@ class TriBase(object):
         # Apply the translation.
         Y = geom.TranslatePoints(X, [dx, dy, dz])
         # Save the translated points.
-        self.Nodes[i,:] = Y
+        self.SetNodes(Y, i)
 
     # Function to rotate a triangulation about an arbitrary vector
     def Rotate(self, v1, v2, theta, compID=None):
@@ -6618,6 +7257,7 @@ class TriBase(object):
         :Versions:
             * 2014-05-27 ``@ddalle``: Version 1.0
             * 2014-10-07 ``@ddalle``: Exported functionality to function
+            * 2026-10-19 ``@ddalle``: Version 1.1; clear :func:`GetCompStats`
         """
         # Get the node indices.
         i = self.GetNodesFromCompID(compID)
@@ -6626,7 +7266,38 @@ class TriBase(object):
         # Apply the rotation.
         Y = geom.RotatePoints(X, v1, v2, theta)
         # Save the rotated points.
-        self.Nodes[i,:] = Y
+        self.SetNodes(Y, i)
+
+    # Function to modify node coordinates
+    def SetNodes(self, X, i=None, j=None):
+        r"""Set coordinates of some or all nodes
+
+        This sets ``tri.Nodes[i,j] = X`` and then deletes the cached
+        component properties from :func:`GetCompStats`.
+
+        :Call:
+            >>> tri.SetNodes(X, i=None, j=None)
+        :Inputs:
+            *tri*: :class:`cape.tri.Tri`
+                Triangulation instance
+            *X*: :class:`float` | :class:`np.ndarray`\ [:class:`float`]
+                New coordinates
+            *i*: {``None``} | :class:`np.ndarray`\ [:class:`int`]
+                Indices (0-based) or mask of nodes to set; default all
+            *j*: {``None``} | ``0`` | ``1`` | ``2``
+                Coordinate to set; default all
+        :Versions:
+            * 2026-10-19 ``@ddalle``: Version 1.0
+        """
+        # Default indices
+        if i is None:
+            i = slice(None)
+        if j is None:
+            j = slice(None)
+        # Save the points
+        self.Nodes[i,j] = X
+        # Nodes were modified in place
+        self.ClearCompStats(index=False)
   # >
 
 
@@ -7012,6 +7683,7 @@ class Triq(TriBase):
             * 2017-10-10 ``@ddalle``: Version 1.0
             * 2018-10-12 ``@serogers``: Version 2.0; subtriangles
             * 2022-03-10 ``@ddalle``: Version 2.1; skip GetNearestTri()
+            * 2026-10-19 ``@ddalle``: Version 2.2; fix points below tri
         """
         # Check options
         k = kw.get("k")
@@ -7043,7 +7715,8 @@ class Triq(TriBase):
         # area of the triangle, but this method scales the weights
         # to account for this
         #
-        # Projected point
+        # Projected point; use signed distance to plane of tri *k*
+        z = np.dot(x - x0, self.e3[k])
         xp = x - z * self.e3[k]
         # Dot products
         dp0 = np.cross(xp-x1, xp-x2)
@@ -7066,6 +7739,101 @@ class Triq(TriBase):
         # Interpolation
         q = w0*q0 + w1*q1 + w2*q2
         return xp, q
+
+    # Get interpolation stencil for several points
+    def GetSurfPointStencil(self, X, **kw):
+        r"""Get weights to interpolate *triq.q* to several surface points
+
+        Each point is projected onto the nearest triangle using
+        :func:`GetNearestTris`, and the weights of the three nodes are
+        computed in the same way as :func:`InterpSurfPoint`.  The
+        stencil only depends on the mesh, so it can be applied to any
+        solution on the same triangulation using
+        :func:`InterpSurfPointStencil`.
+
+        :Call:
+            >>> S = triq.GetSurfPointStencil(X, **kw)
+        :Inputs:
+            *triq*: :class:`cape.tri.Triq`
+                Annotated triangulation interface
+            *X*: :class:`np.ndarray`\ [:class:`float`]
+                Coordinates of test points, *shape*: (*m*, 3)
+            *kw*: :class:`dict`
+                Keyword arguments passed to :func:`Tri.GetNearestTris`
+        :Outputs:
+            *S*: :class:`dict`\ [:class:`np.ndarray`]
+                Interpolation stencil
+            *S["k"]*: :class:`np.ndarray`\ [:class:`int`]
+                Index of nearest triangle (0-based) for each point
+            *S["z"]*: :class:`np.ndarray`\ [:class:`float`]
+                Signed projection distance of each point
+            *S["I"]*: :class:`np.ndarray`\ [:class:`int`]
+                Node indices (0-based), *shape*: (*m*, 3)
+            *S["W"]*: :class:`np.ndarray`\ [:class:`float`]
+                Weight of each node, *shape*: (*m*, 3)
+            *S["x"]*: :class:`np.ndarray`\ [:class:`float`]
+                Points projected onto the surface, *shape*: (*m*, 3)
+        :Versions:
+            * 2026-10-19 ``@ddalle``: Version 1.0
+        """
+        # Ensure 2D array of points
+        X = np.asarray(X, dtype="float")
+        if X.ndim == 1:
+            X = X.reshape((1, 3))
+        # Get the nearest triangle to each point
+        T = self.GetNearestTris(X, n=1, **kw)
+        k = T["k1"]
+        z = T["z1"]
+        # Extract the node numbers
+        I = self.Tris[k] - 1
+        # Get nodal coordinates
+        x0 = self.Nodes[I[:, 0]]
+        x1 = self.Nodes[I[:, 1]]
+        x2 = self.Nodes[I[:, 2]]
+        # Signed distance to plane of each tri
+        e3 = self.e3[k]
+        z = np.sum((X - x0)*e3, axis=1)
+        # Projected points
+        xp = X - z[:, None]*e3
+        # Areas of the sub triangles
+        a0 = np.sqrt(np.sum(np.cross(xp-x1, xp-x2)**2, axis=1))
+        a1 = np.sqrt(np.sum(np.cross(xp-x2, xp-x0)**2, axis=1))
+        a2 = np.sqrt(np.sum(np.cross(xp-x0, xp-x1)**2, axis=1))
+        # Weights scaled by area of the three subtriangles
+        W = np.stack((a0, a1, a2), axis=1)
+        W /= np.sum(W, axis=1)[:, None]
+        # Output
+        return {
+            "k": k,
+            "z": z,
+            "I": I,
+            "W": W,
+            "x": xp,
+        }
+
+    # Apply interpolation stencil
+    def InterpSurfPointStencil(self, S):
+        r"""Interpolate *triq.q* to several points using a stencil
+
+        :Call:
+            >>> X0, Q = triq.InterpSurfPointStencil(S)
+        :Inputs:
+            *triq*: :class:`cape.tri.Triq`
+                Annotated triangulation interface
+            *S*: :class:`dict`\ [:class:`np.ndarray`]
+                Stencil from :func:`GetSurfPointStencil`
+        :Outputs:
+            *X0*: :class:`np.ndarray`\ [:class:`float`]
+                Points projected onto the surface, *shape*: (*m*, 3)
+            *Q*: :class:`np.ndarray`\ [:class:`float`]
+                Interpolated states, *shape*: (*m*, *triq.nq*)
+        :Versions:
+            * 2026-10-19 ``@ddalle``: Version 1.0
+        """
+        # Gather states of each node and apply weights
+        Q = np.einsum("ij,ijk->ik", S["W"], self.q[S["I"]])
+        # Output
+        return S["x"], Q
   # >
 
   # ============
@@ -7625,6 +8393,298 @@ class Triq(TriBase):
   # >
 
 
+# Running average of annotated triangulations
+class TriqAverage(object):
+    r"""Streaming weighted average of several TRIQ snapshots
+
+    Snapshots are added one at a time, and only the running weighted
+    mean (and optionally the running weighted variance) is kept, so the
+    memory required does not depend on the number of snapshots. For
+    binary ``.triq`` files, only the state record of each snapshot after
+    the first is read.
+
+    :Call:
+        >>> avg = TriqAverage(var=False)
+    :Inputs:
+        *var*: ``True`` | {``False``}
+            Whether or not to also accumulate the weighted variance
+    :Outputs:
+        *avg*: :class:`cape.tri.TriqAverage`
+            Running average instance
+    :Attributes:
+        *avg.triq*: ``None`` | :class:`cape.tri.Triq`
+            Triangulation from first snapshot; *avg.triq.q* is the mean
+        *avg.w*: :class:`float`
+            Sum of weights of snapshots added so far
+        *avg.S*: ``None`` | :class:`np.ndarray`\ [:class:`float`]
+            Weighted sum of squared deviations from the mean
+    :Versions:
+        * 2026-10-19 ``@ddalle``: Version 1.0
+    """
+    # Initialization method
+    def __init__(self, var=False):
+        r"""Initialization method
+
+        :Versions:
+            * 2026-10-19 ``@ddalle``: Version 1.0
+        """
+        # Options
+        self.var = var
+        # Accumulators
+        self.triq = None
+        self.w = 0.0
+        self.S = None
+        # Work array for deviations
+        self._dq = None
+
+    # Representation method
+    def __repr__(self):
+        r"""Representation method
+
+        :Versions:
+            * 2026-10-19 ``@ddalle``: Version 1.0
+        """
+        # Check for any snapshots
+        if self.triq is None:
+            return "<TriqAverage(w=0)>"
+        return "<TriqAverage(nNode=%i, nq=%i, w=%s)>" % (
+            self.triq.nNode, self.triq.nq, self.w)
+
+    # Add a snapshot
+    def Add(self, triq, w=None, **kw):
+        r"""Add a snapshot to the running average
+
+        :Call:
+            >>> avg.Add(triq, w=None, **kw)
+            >>> avg.Add(fname, w=None, **kw)
+        :Inputs:
+            *avg*: :class:`cape.tri.TriqAverage`
+                Running average instance
+            *triq*: :class:`cape.tri.Triq`
+                Annotated triangulation
+            *fname*: :class:`str`
+                Name of ``.triq``, ``.plt``, or ``.dat`` file
+            *w*: {``None``} | :class:`float`
+                Weight; default is *triq.n* or *n*
+            *n*: {``1``} | :class:`int`
+                Number of iterations averaged in file
+            *kw*: :class:`dict`
+                Options to :func:`cape.plt.Plt.CreateTriq` for PLT files
+        :Versions:
+            * 2026-10-19 ``@ddalle``: Version 1.0
+        """
+        # Get states of the snapshot
+        if isinstance(triq, Triq):
+            # Use triangulation directly
+            q = triq.q
+            n = triq.n
+            # Copy it if used to store the mean
+            if self.triq is None:
+                triq = triq.Copy()
+                q = triq.q
+        elif self.triq is None:
+            # Read the entire first snapshot
+            triq = self._read_triq(triq, **kw)
+            q = triq.q
+            n = kw.get("n", 1)
+        else:
+            # Read only the states
+            q = self._read_q(triq, **kw)
+            n = kw.get("n", 1)
+        # Default weight
+        if w is None:
+            w = n
+        # Check for first snapshot
+        if self.triq is None:
+            # Use geometry and states as initial mean
+            self.triq = triq
+            self.triq.q = np.asarray(q, dtype="float")
+            self.triq.nq = self.triq.q.shape[1]
+            self.w = float(w)
+            # Initialize variance accumulator
+            if self.var:
+                self.S = np.zeros_like(self.triq.q)
+            return
+        # Check consistency
+        qbar = self.triq.q
+        if q.shape != qbar.shape:
+            raise ValueError(
+                "Snapshot states have shape %s; expected %s"
+                % (q.shape, qbar.shape))
+        # Skip empty weights
+        if w == 0:
+            return
+        # Work array
+        if self._dq is None:
+            self._dq = np.zeros_like(qbar)
+        dq = self._dq
+        # Update total weight
+        self.w += w
+        # Deviation from current mean
+        np.subtract(q, qbar, out=dq)
+        # Update variance using deviations from old and new mean
+        if self.var:
+            # S += w*(q - qold)*(q - qnew)
+            dq *= w
+            self.S += dq * (q - qbar - dq/self.w)
+            dq /= w
+        # Update mean
+        dq *= (w / self.w)
+        qbar += dq
+
+    # Get output
+    def GetTriq(self, std=False):
+        r"""Get annotated triangulation with the averaged states
+
+        :Call:
+            >>> triq = avg.GetTriq(std=False)
+        :Inputs:
+            *avg*: :class:`cape.tri.TriqAverage`
+                Running average instance
+            *std*: ``True`` | {``False``}
+                Use standard deviation instead of mean as states
+        :Outputs:
+            *triq*: :class:`cape.tri.Triq`
+                Annotated triangulation; *triq.n* is total weight
+        :Versions:
+            * 2026-10-19 ``@ddalle``: Version 1.0
+        """
+        # Check for snapshots
+        if self.triq is None:
+            raise ValueError("No snapshots have been averaged")
+        # Output
+        triq = self.triq
+        # Save weight as count if possible
+        if self.w == int(self.w):
+            triq.n = int(self.w)
+        else:
+            triq.n = self.w
+        # Check for standard deviation
+        if std:
+            # Copy the triangulation
+            triq = triq.Copy()
+            triq.q = np.sqrt(self.GetVariance())
+        # Output
+        return triq
+
+    # Get variance
+    def GetVariance(self):
+        r"""Get weighted variance of each state at each node
+
+        :Call:
+            >>> V = avg.GetVariance()
+        :Inputs:
+            *avg*: :class:`cape.tri.TriqAverage`
+                Running average instance
+        :Outputs:
+            *V*: :class:`np.ndarray`\ [:class:`float`]
+                Weighted variance, *shape*: (*nNode*, *nq*)
+        :Versions:
+            * 2026-10-19 ``@ddalle``: Version 1.0
+        """
+        # Check for accumulator
+        if self.S is None:
+            raise ValueError("Variance is not being accumulated")
+        # Output
+        return self.S / self.w
+
+    # Read a full snapshot
+    def _read_triq(self, fname, **kw):
+        # Get file extension
+        ext = fname.split('.')[-1].lower()
+        # Check for Tecplot files
+        if ext in ("plt", "dat"):
+            # Read using Tecplot interface
+            from .plt import Plt
+            # Read file
+            if ext == "plt":
+                plt = Plt(fname)
+            else:
+                plt = Plt(dat=fname)
+            # Convert
+            return plt.CreateTriq(**kw)
+        # Read TRIQ file
+        return Triq(fname, n=kw.get("n", 1))
+
+    # Read the states of a snapshot
+    def _read_q(self, fname, **kw):
+        # Get file type
+        tri = Triq()
+        # Check for Tecplot file
+        if fname.split('.')[-1].lower() in ("plt", "dat"):
+            return self._read_triq(fname, **kw).q
+        # Get TRIQ type
+        tri.GetTriFileType(fname)
+        # Check for ASCII file
+        if tri.filetype == 'ascii':
+            return self._read_triq(fname, **kw).q
+        # Integer type for record markers
+        if tri.byteorder == 'big':
+            fi = '>i4'
+        else:
+            fi = '<i4'
+        # Open file
+        with open(fname, 'rb') as fp:
+            # Read header record
+            r, = np.fromfile(fp, count=1, dtype=fi)
+            H = np.fromfile(fp, count=r//4 + 1, dtype=fi)
+            nNode, nq = H[0], H[2]
+            # Skip the nodes, tris, and component IDs records
+            for j in range(3):
+                r, = np.fromfile(fp, count=1, dtype=fi)
+                fp.seek(r + 4, 1)
+            # Read record marker for states
+            r, = np.fromfile(fp, count=1, dtype=fi)
+            # Number of bytes per float
+            nf = r // (nNode*nq)
+            # Read the states
+            q = np.fromfile(fp, count=nNode*nq, dtype=fi[0] + 'f%i' % nf)
+        # Output
+        return q.reshape((nNode, nq))
+
+
+# Average several TRIQ files
+def AverageTriqFiles(fnames, weights=None, **kw):
+    r"""Calculate the weighted average of several TRIQ or PLT snapshots
+
+    The files are read one at a time using :class:`TriqAverage`.
+
+    :Call:
+        >>> triq = AverageTriqFiles(fnames, weights=None, **kw)
+    :Inputs:
+        *fnames*: :class:`list`\ [:class:`str`]
+            Names of ``.triq``, ``.plt``, or ``.dat`` files, in order
+        *weights*: {``None``} | :class:`list`\ [:class:`float`]
+            Weight for each file; default is ``1`` for each file
+        *var*: ``True`` | {``False``}
+            Also accumulate the weighted variance
+        *std*: ``True`` | {``False``}
+            Return standard deviation instead of mean (implies *var*)
+        *kw*: :class:`dict`
+            Options to :func:`cape.plt.Plt.CreateTriq` for PLT files
+    :Outputs:
+        *triq*: :class:`cape.tri.Triq`
+            Averaged annotated triangulation
+    :Versions:
+        * 2026-10-19 ``@ddalle``: Version 1.0
+    """
+    # Options
+    std = kw.pop("std", False)
+    var = kw.pop("var", std)
+    # Initialize averager
+    avg = TriqAverage(var=var)
+    # Loop through files
+    for j, fname in enumerate(fnames):
+        # Get weight
+        if weights is None:
+            w = None
+        else:
+            w = weights[j]
+        # Add snapshot
+        avg.Add(fname, w=w, **kw)
+    # Output
+    return avg.GetTriq(std=std)
+
 
 # Function to read .tri files
 def ReadTri(fname):
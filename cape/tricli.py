@@ -555,8 +555,8 @@ def steptri2crv(*a, **kw):
     tri = Tri(ftri)
     print("  Reading STEP file: '%s" % fstp)
     stp = STEP(fstp)
-    # Get the edges of the triangles
-    tri.GetEdges()
+    # Get the edge connectivity of the triangles
+    tri.GetHalfEdges()
     # Initialize curves
     X = []
     # Options for initial curve sampling
@@ -811,6 +811,7 @@ def uh3d2tri(*a, **kw):
         * 2014-06-12 ``@ddalle``: Version 1.0
         * 2015-10-09 ``@ddalle``: Version 1.1; ``Config.xml`` and *ytol*
         * 2016-08-18 ``@ddalle``: Version 1.2; Binary output option
+        * 2026-10-19 ``@ddalle``: Version 1.3; use :func:`Tri.SetNodes`
     """
     # Get the input file name
     fuh3d = _get_i(*a, **kw)
@@ -836,22 +837,22 @@ def uh3d2tri(*a, **kw):
     ztol = kw.get('ztol')
     # Apply tolerances
     if xtol is not None:
-        tri.Nodes[abs(tri.Nodes[:,0])<=float(xtol), 0] = 0.0
+        tri.SetNodes(0.0, abs(tri.Nodes[:,0]) <= float(xtol), 0)
     if ytol is not None:
-        tri.Nodes[abs(tri.Nodes[:,1])<=float(ytol), 1] = 0.0
+        tri.SetNodes(0.0, abs(tri.Nodes[:,1]) <= float(ytol), 1)
     if ztol is not None:
-        tri.Nodes[abs(tri.Nodes[:,2])<=float(ztol), 2] = 0.0
+        tri.SetNodes(0.0, abs(tri.Nodes[:,2]) <= float(ztol), 2)
     # Check for nudges
     dx = kw.get('dx')
     dy = kw.get('dy')
     dz = kw.get('dz')
     # Apply nudges
     if dx is not None:
-        tri.Nodes[:,0] += float(dx)
+        tri.SetNodes(tri.Nodes[:,0] + float(dx), j=0)
     if dy is not None:
-        tri.Nodes[:,1] += float(dy)
+        tri.SetNodes(tri.Nodes[:,1] + float(dy), j=1)
     if dz is not None:
-        tri.Nodes[:,2] += float(dz)
+        tri.SetNodes(tri.Nodes[:,2] + float(dz), j=2)
     # Get write options
     tri.Write(ftri, **kw)
     
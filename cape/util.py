@@ -10,6 +10,7 @@ space-or-comma-separated lines for run matrix files.
 """
 
 # Standard library
+import multiprocessing
 import os.path
 import re
 import shutil
@@ -816,6 +817,94 @@ def islist(x):
     return type(x).__name__ in ['list', 'ndarray']
 
 
+# Function applied by worker processes of :func:`pmap`
+_PMAP_FUNC = None
+
+
+# Worker function for :func:`pmap`
+def _pmap_call(a):
+    return _PMAP_FUNC(a)
+
+
+# Apply a function to several inputs in parallel
+def pmap(func, args, nproc=1):
+    r"""Apply a function to a list of inputs using worker processes
+
+    The workers are forked from the current process, so *func* may be
+    any callable (including bound methods and closures) and it sees the
+    state of the parent at the time of the call.  Only the entries of
+    *args* and the return values need to be picklable.  If *nproc* is
+    ``1`` or forking is not available, *func* is applied serially.
+
+    :Call:
+        >>> v = pmap(func, args, nproc=1)
+    :Inputs:
+        *func*: **callable**
+            Function of one argument
+        *args*: :class:`list`
+            List of inputs to *func*
+        *nproc*: {``1``} | :class:`int`
+            Maximum number of worker processes
+    :Outputs:
+        *v*: :class:`list`
+            Outputs of *func* for each entry of *args*, in order
+    :Versions:
+        * 2026-10-19 ``@ddalle``: Version 1.0
+    """
+    global _PMAP_FUNC
+    # Ensure list
+    args = list(args)
+    # Number of workers
+    nproc = min(get_nproc(nproc), len(args))
+    # Get context that shares parent state
+    try:
+        ctx = multiprocessing.get_context("fork")
+    except ValueError:
+        # Forking not available on this system
+        nproc = 1
+    # Serial fallback
+    if nproc <= 1:
+        return [func(a) for a in args]
+    # Save function for workers
+    _PMAP_FUNC = func
+    # Run pool
+    try:
+        with ctx.Pool(nproc) as pool:
+            return pool.map(_pmap_call, args, chunksize=1)
+    finally:
+        _PMAP_FUNC = None
+
+
+# Convert command-line option to number of processes
+def get_nproc(n=None):
+    r"""Interpret a number-of-processes option such as ``-j 4``
+
+    :Call:
+        >>> nproc = get_nproc(n=None)
+    :Inputs:
+        *n*: {``None``} | ``True`` | :class:`int` | :class:`str`
+            Raw option value; ``0`` means use all available CPUs
+    :Outputs:
+        *nproc*: :class:`int`
+            Number of processes, at least ``1``
+    :Versions:
+        * 2026-10-19 ``@ddalle``: Version 1.0
+    """
+    # Check for flag without value
+    if n is None or n is True or n is False:
+        return 1
+    # Convert to integer
+    try:
+        n = int(n)
+    except ValueError:
+        raise ValueError("Invalid number of processes '%s'" % n)
+    # Check for "all"
+    if n == 0:
+        return os.cpu_count() or 1
+    # Output
+    return max(1, n)
+
+
 # Function to automatically get inclusive data limits.
 def get_ylim(ha, ypad=0.05, **kw):
     """Calculate appropriate *y*-limits to include all lines in a plot
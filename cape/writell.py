@@ -23,6 +23,7 @@ import numpy as np
 # CAPE modules
 from . import argread
 from . import text as textutils
+from . import util
 from .attdb import rdb as rdb
 from .attdb import dbll as dbll
 from .cntl import Cntl
@@ -106,27 +107,30 @@ _JSON_FNAMES = [
 
 
 # Write the datakit
-def write_ll_datakit(cntl, comp):
+def write_ll_datakit(cntl, comp, nproc=1):
     r"""Write ``.mat`` file of combined line loads
 
     The output file is in the ``"DataBook"`` folder of *cntl* with a name
     like ``lineload/lineload_%(comp)s.mat``.
 
     :Call:
-        >>> db = genr8_ll_datakit(cntl, comp)
+        >>> db = genr8_ll_datakit(cntl, comp, nproc=1)
     :Inputs:
         *cntl*: :class:`cape.Cntl`
             CAPE control class instance
         *comp*: :class:`str`
             Name of ``"LineLoad"`` component to read using *cntl*
+        *nproc*: {``1``} | :class:`int`
+            Number of processes to use to read case files
     :Outputs:
         *db*: ``None`` | :class:`cape.attdb.dbll.DBLL`
             Line load database read from ``pyfun --ll`` data if possible
     :Versions:
         * 2021-02-10 ``@ddalle``: Version 1.0
+        * 2026-10-19 ``@ddalle``: Version 1.1; add *nproc*
     """
     # Generate the datakit
-    db = genr8_ll_datakit(cntl, comp)
+    db = genr8_ll_datakit(cntl, comp, nproc=nproc)
     # Check for result
     if db is None:
         return
@@ -147,21 +151,28 @@ def write_ll_datakit(cntl, comp):
 
 
 # Function to create datakit from line loads
-def genr8_ll_datakit(cntl, comp):
+def genr8_ll_datakit(cntl, comp, nproc=1):
     r"""Create datakit from run matrix of CAPE line load files
 
+    The case files are read using :func:`read_ll_csv`, optionally in
+    parallel, and each line load column is saved directly into a 2D
+    array with one column per case that has line loads.
+
     :Call:
-        >>> db = genr8_ll_datakit(cntl, comp)
+        >>> db = genr8_ll_datakit(cntl, comp, nproc=1)
     :Inputs:
         *cntl*: :class:`cape.Cntl`
             CAPE control class instance
         *comp*: :class:`str`
             Name of ``"LineLoad"`` component to read using *cntl*
+        *nproc*: {``1``} | :class:`int`
+            Number of processes to use to read case files
     :Outputs:
         *db*: ``None`` | :class:`cape.attdb.dbll.DBLL`
             Line load database read from ``pyfun --ll`` data if possible
     :Versions:
         * 2021-02-10 ``@ddalle``: Version 1.0
+        * 2026-10-19 ``@ddalle``: Version 2.0; bulk numeric reader
     """
     # Status update
     print("Reading databook component '%s'" % comp)
@@ -176,15 +187,13 @@ def genr8_ll_datakit(cntl, comp):
     x = cntl.x
     # Initialize datakit with whole run matrix
     db = dbll.DBLL(Values=x)
-    # Indices of matches
-    matches = []
     # Get entire list of (candidate) runs
     fruns = x.GetFullFolderNames()
     # Number of candidates
     n = len(fruns)
     # Maximum length
     lmax_name = max([len(frun) for frun in fruns])
-    lmax_case = int(np.log10(n-1)) + 1
+    lmax_case = int(np.log10(max(1, n-1))) + 1
     # STDOUT format
     fmt = "index=%%%ii n=%%%ii case=%%-%is" % (lmax_case, lmax_case, lmax_name)
     # Name for line load datat files in databook case folders
@@ -195,57 +204,50 @@ def genr8_ll_datakit(cntl, comp):
     # Absolute seam files
     fsmy = os.path.join(fdb, "lineload", fsmy)
     fsmz = os.path.join(fdb, "lineload", fsmz)
-    # Current index of matched case
-    j = -1
-    # Loop trhough cases
+    # Find case files
+    cases = []
     for i, frun in enumerate(fruns):
-        # Folder for those line loads
-        frundb = os.path.join(fdb, "lineload", frun)
-        # Check if it exists
-        if not os.path.isdir(frundb):
-            continue
         # Path to file
-        flli = os.path.join(frundb, fllcsv)
+        flli = os.path.join(fdb, "lineload", frun, fllcsv)
         # Check if file exists
-        if not os.path.isfile(flli):
+        if os.path.isfile(flli):
+            cases.append((i, flli))
+    # Read them
+    data = util.pmap(_read_ll_csv, [flli for _, flli in cases], nproc)
+    # Indices of matches
+    matches = []
+    # Line load data from each match
+    V = []
+    # Loop through cases
+    for (i, flli), dat in zip(cases, data):
+        # Check for valid file
+        if dat is None:
             continue
-        # Try to read it
-        try:
-            # Found a case
-            dbi = rdb.DataKit(csv=flli)
-        except Exception:
-            # Couldn't read the case
+        # Unpack
+        cols, vi = dat
+        # Check consistency with first match
+        if matches and (cols != llcsvcols or vi.shape != V[0].shape):
+            print("  Skipping '%s'; inconsistent size or columns" % flli)
             continue
+        # Save cols from first match
+        if not matches:
+            llcsvcols = cols
+        # Status update regarding match
+        print(fmt % (i, len(matches), fruns[i]))
         # Update matches
-        j += 1
         matches.append(i)
-        # Status update regarding match
-        print(fmt % (i, j, frun))
-        # Get column names for *db*
-        if j == 0:
-            # Get combined-datakit column names
-            dbcols = genr8_dbcolnames(dbi)
-            # Get line load cols from *dbi*
-            llcols = genr8_llcolnames(dbi)
-        # Save columns
-        for k, col in enumerate(dbi.cols):
-            # Translated column name
-            dbcol = dbcols.get(col, col)
-            # Initialize line load cols in *db* for first match
-            if j == 0:
-                # Get column size from *dbi*
-                # (These should all be equal.)
-                nk = dbi[col].size
-                # Add a 2D array with maximum size
-                db.save_col(dbcol, np.zeros((nk, n)))
-                # Save columns
-            # Save the data
-            db[dbcol][:, i] = dbi[col]
+        V.append(vi)
     # Check for no matches
-    if j < 0:
+    if len(matches) == 0:
         return
+    # Number of matches
+    m = len(matches)
     # Convert matches to array
     I = np.array(matches)
+    # Get combined-datakit column names
+    dbcols = genr8_dbcolnames(llcsvcols)
+    # Get line load cols
+    llcols = genr8_llcolnames(llcsvcols)
     # Trim the *xcols* to only those with matches
     for col in cntl.x.cols:
         # Get values and remove definition
@@ -259,36 +261,28 @@ def genr8_ll_datakit(cntl, comp):
             vo = v[I]
         # Resave column
         db.save_col(col, vo)
-    # Trim the line load columns
-    for col in dbi.cols:
+    # Save the line load columns
+    for k, col in enumerate(llcsvcols):
         # Line load col name
         dbcol = dbcols.get(col, col)
-        # Get data from *db*
-        v = db.burst_col(dbcol)
-        # Check for 1D
-        if v.ndim == 1:
-            # Just save *matches*
-            v = v[I]
-        elif v.ndim == 2:
-            # Get min/max of each *row*
-            vmin = np.min(v, axis=1)
-            vmax = np.max(v, axis=1)
-            # Delta across rows
-            vdiff = np.max(vmax - vmin)
-            # Scaling
-            vabs = max(0.01,
-                max(np.max(np.abs(vmin)), np.max(np.abs(vmax))))
-            # Check for repeated columns
-            if np.max(vdiff) / vabs <= 1e-4:
-                # 1D array; use first column
-                v = v[:, 0]
-            else:
-                # Nontrivial 2D array
-                v = v[:, I]
-        else:
-            # Filter
-            print("Encountered unexpected %iD col '%s'" % (v.ndim, dbcol))
-        # Resave the column
+        # Initialize cuts x cases array
+        v = np.zeros((V[0].shape[0], m))
+        # Copy data from each case
+        for j, vi in enumerate(V):
+            v[:, j] = vi[:, k]
+        # Get min/max of each *row*
+        vmin = np.min(v, axis=1)
+        vmax = np.max(v, axis=1)
+        # Delta across rows
+        vdiff = np.max(vmax - vmin)
+        # Scaling
+        vabs = max(0.01,
+            max(np.max(np.abs(vmin)), np.max(np.abs(vmax))))
+        # Check for repeated columns
+        if np.max(vdiff) / vabs <= 1e-4:
+            # 1D array; use first column
+            v = v[:, 0]
+        # Save the column
         db.save_col(dbcol, v)
     # Check for y=0 seam curves
     if os.path.isfile(fsmy):
@@ -302,6 +296,57 @@ def genr8_ll_datakit(cntl, comp):
     return db
 
 
+# Read a case line load file
+def read_ll_csv(fname):
+    r"""Read a single-case line load file written by CAPE
+
+    These files have one header line like ``# x,CA,CY,CN,CLL,CLM,CLN``
+    followed by rows of numbers, so they can be read much faster than
+    with the general :class:`cape.attdb.rdb.DataKit` CSV reader.
+
+    :Call:
+        >>> cols, v = read_ll_csv(fname)
+    :Inputs:
+        *fname*: :class:`str`
+            Name of ``LineLoad_{comp}.csv`` file
+    :Outputs:
+        *cols*: :class:`list`\ [:class:`str`]
+            Column names from header
+        *v*: :class:`np.ndarray`\ [:class:`float`]
+            Data with one row per cut and one column per *col*
+    :Versions:
+        * 2026-10-19 ``@ddalle``: Version 1.0
+    """
+    # Read the file
+    with open(fname) as fp:
+        # Header
+        line = fp.readline()
+        # Remaining text
+        txt = fp.read()
+    # Get column names
+    cols = [col.strip() for col in line.lstrip("#").split(",")]
+    # Number of columns
+    ncol = len(cols)
+    # Read data
+    v = np.array(txt.replace(",", " ").split(), dtype="float")
+    # Check size
+    if v.size % ncol:
+        raise ValueError(
+            "Line load file '%s' has %i values, not a multiple of %i cols"
+            % (fname, v.size, ncol))
+    # Output
+    return cols, v.reshape((-1, ncol))
+
+
+# Read a line load file, ignoring errors
+def _read_ll_csv(fname):
+    try:
+        return read_ll_csv(fname)
+    except Exception:
+        # Couldn't read the case
+        return None
+
+
 # Get translated column names
 def genr8_dbcolnames(dbi, comp=None):
     r"""Translate column names from one case line load
@@ -309,8 +354,9 @@ def genr8_dbcolnames(dbi, comp=None):
     :Call:
         >>> dbcols = genr8_llcolnames(dbi, comp=None)
     :Inputs:
-        *dbi*: :class:`DataKit`
-            DataKit read from single-case CAPE line load data file
+        *dbi*: :class:`DataKit` | :class:`list`\ [:class:`str`]
+            DataKit read from single-case CAPE line load data file, or
+            its column names
         *comp*: {``None``} | :class:`str`
             Optional prefix for combined line load column names (e.g.
             shift ``"CN"`` to ``"CORE.dCN"`` instead of just ``"dCN"``)
@@ -319,11 +365,12 @@ def genr8_dbcolnames(dbi, comp=None):
             List of prefixed line load column names
     :Versions:
         * 2021-02-10 ``@ddalle``: Version 1.0
+        * 2026-10-19 ``@ddalle``: Version 1.1; allow list of cols
     """
     # Initialize column names
     dbcols = {}
     # Loop through columns
-    for k, col in enumerate(dbi.cols):
+    for k, col in enumerate(getattr(dbi, "cols", dbi)):
         # Prefix column name if necessary
         if k == 0:
            # Use first column ("x") as-is
@@ -353,8 +400,9 @@ def genr8_llcolnames(dbi, comp=None):
     :Call:
         >>> llcols = genr8_llcolnames(dbi, comp=None)
     :Inputs:
-        *dbi*: :class:`DataKit`
-            DataKit read from single-case CAPE line load data file
+        *dbi*: :class:`DataKit` | :class:`list`\ [:class:`str`]
+            DataKit read from single-case CAPE line load data file, or
+            its column names
         *comp*: {``None``} | :class:`str`
             Optional prefix for combined line load column names (e.g.
             shift ``"CN"`` to ``"CORE.dCN"`` instead of just ``"dCN"``)
@@ -363,11 +411,12 @@ def genr8_llcolnames(dbi, comp=None):
             List of prefixed line load column names
     :Versions:
         * 2021-02-10 ``@ddalle``: Version 1.0
+        * 2026-10-19 ``@ddalle``: Version 1.1; allow list of cols
     """
     # Initialize column names
     llcols = []
     # Loop through columns
-    for k, col in enumerate(dbi.cols):
+    for k, col in enumerate(getattr(dbi, "cols", dbi)):
         # Prefix column name if necessary
         if k == 0:
            # Not a line load column
@@ -398,6 +447,7 @@ def main():
         >>> main()
     :Versions:
         * 2021-02-10 ``@ddalle``: Version 1.0
+        * 2026-10-19 ``@ddalle``: Version 1.1; add ``-j`` option
     """
     # Process command-line parameters
     a, kw = argread.readkeys(sys.argv)
@@ -435,6 +485,8 @@ def main():
     # Append nontrivial option to patterns
     if kwll:
         pats.append(kwll)
+    # Number of processes to read files
+    nproc = util.get_nproc(kw.get("j", 1))
     # Loop through candidate line load comps
     for comp in llcomps:
         # Check for pattern submset
@@ -449,5 +501,5 @@ def main():
                 # No pattern match found; go to next *comp*
                 continue
         # Write it
-        write_ll_datakit(cntl, comp)
+        write_ll_datakit(cntl, comp, nproc=nproc)
 
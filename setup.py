@@ -62,6 +62,7 @@ setup(
             "dkit-quickstart=cape.attdb.quickstart:main",
             "dkit-vendorize=cape.attdb.vendorutils:main",
             "dkit-writedb=cape.attdb.writedb:main",
+            "cape-benchmark=cape.benchmark:main",
             "cape-writell=cape.writell:main",
             "cape-step2crv=cape.tricli:main_step2crv",
             "cape-steptri2crv=cape.tricli:main_steptri2crv",
@@ -126,3 +126,42 @@ def test_07_reynolds():
     assert abs(x.GetReynoldsNumber(0) - 23996.4884) <= TOL
 
 
+
+
+# Test 08: cached folder names
+def test_08_namecache():
+    # Create run matrix
+    x = cape.runmatrix.RunMatrix(**TEST_OPTS)
+    # Get all names
+    fruns = x.GetFullFolderNames()
+    # Compare to case-by-case assembly
+    for i, frun in enumerate(fruns):
+        gname = x._AssembleName(x.GroupKeys, x.GroupPrefix, i)
+        fname = x._AssembleName(x.NonGroupKeys, x.prefix, i)
+        assert frun == gname + "/" + fname
+    # Change a value and make sure names are updated
+    x.SetValue("alpha", 0, 2.0)
+    assert x.GetFolderNames(0) == "m1.4a2.0b0.0"
+    # Compiled constraints
+    assert list(x.Filter(["alpha=4", "beta>0"])) == [3]
+    assert list(x.Filter(["alpha=4", "beta>0"])) == [3]
+
+
+# Test 09: sweeps
+def test_09_sweeps():
+    # Create run matrix
+    x = cape.runmatrix.RunMatrix(
+        Keys=["mach", "alpha", "beta"],
+        mach=np.array([0.8, 0.8, 0.9, 0.8, 0.9, 0.905, 0.8]),
+        alpha=np.array([4.0, 0.0, 2.0, 2.0, 0.0, 4.0, 0.0]),
+        beta=np.array([0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 2.0]))
+    # Exact sweeps sorted by alpha
+    J = x.GetSweeps(EqCons=["mach", "beta"], SortVar="alpha")
+    assert [list(I) for I in J] == [[1, 3, 0], [4, 2], [5], [6]]
+    # Tolerance sweeps
+    J = x.GetSweeps(TolCons={"mach": 0.01}, EqCons=["beta"])
+    assert [list(I) for I in J] == [[0, 1, 3], [2, 4, 5], [6]]
+    # Single sweep with specified seed
+    M = np.ones(x.nCase, dtype="bool")
+    I = x.GetSweep(M, i0=2, TolCons={"mach": 0.01})
+    assert list(I) == [2, 4, 5]
@@ -66,3 +66,18 @@ def test_case_timing():
     # Write output file
     case.WriteUserTimeProg(tic, rc, 0, ftime, "cape")
 
+
+
+# Check for changes to settings
+@testutils.run_sandbox(__file__, TEST_FILES)
+def test_case_json_stat():
+    # Get status
+    stat = case.GetCaseJSONStat()
+    assert stat is not None
+    assert case.GetCaseJSONStat() == stat
+    # Rewrite with different contents
+    with open("case.json", "a") as fp:
+        fp.write("\n")
+    assert case.GetCaseJSONStat() != stat
+    # Missing file
+    assert case.GetCaseJSONStat("nofile.json") is None
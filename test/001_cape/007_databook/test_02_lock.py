@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Standard library
+import os
+
+# Third-party
+import testutils
+
+# Local imports
+from cape.cfdx import dbLock
+
+
+# Lock file name
+FLOCK = "lock.aero_comp.csv"
+
+
+# Exclusive and shared locks
+@testutils.run_sandbox(__file__)
+def test_01_lock():
+    # Get lock
+    flock = dbLock.get_lock(FLOCK)
+    # Same object for same file
+    assert dbLock.get_lock(os.path.abspath(FLOCK)) is flock
+    # Skip if kernel-level locks not available
+    if not flock.kernel:
+        return
+    # Obtain exclusive lock
+    assert flock.acquire(label="comp") is True
+    assert flock.mode == "exclusive"
+    assert os.path.isfile(FLOCK)
+    # Shared lock request should keep exclusive lock
+    assert flock.acquire(shared=True) is True
+    flock.release(shared=True)
+    assert flock.mode == "exclusive"
+    # Release it
+    flock.release()
+    assert flock.mode is None
+    assert not os.path.isfile(FLOCK)
+    # Shared lock
+    assert flock.acquire(shared=True) is True
+    assert flock.mode == "shared"
+    flock.release(shared=True)
+    assert flock.mode is None
+    # Last shared holder removes lock file
+    assert not os.path.isfile(FLOCK)
+
+
+# Several shared locks
+@testutils.run_sandbox(__file__)
+def test_02_shared():
+    # Two readers with separate lock file handles
+    flock1 = dbLock.FileLock(os.path.abspath(FLOCK))
+    flock2 = dbLock.FileLock(os.path.abspath(FLOCK))
+    # Skip if kernel-level locks not available
+    if not flock1.kernel:
+        return
+    # Obtain both shared locks
+    assert flock1.acquire(shared=True) is True
+    assert flock2.acquire(shared=True) is True
+    # Exclusive lock not available while reading
+    flock3 = dbLock.FileLock(os.path.abspath(FLOCK))
+    assert flock3.acquire(timeout=0.0) is None
+    # First reader leaves the file for the second
+    flock1.release()
+    assert flock1.mode is None
+    assert os.path.isfile(FLOCK)
+    # Second reader removes it
+    flock2.release()
+    assert not os.path.isfile(FLOCK)
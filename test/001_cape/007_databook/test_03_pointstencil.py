@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Standard library
+import os
+
+# Third-party
+import numpy as np
+import testutils
+
+# Local imports
+from cape import tri
+from cape.cfdx import pointSensor
+
+
+# Points
+POINTS = {
+    "p1": [0.25, 0.40, 0.1],
+    "p2": [0.75, 0.15, -0.2],
+    "p3": [0.50, 0.90, 0.0],
+}
+
+
+# Flat square surface with states
+def make_triq():
+    # Nodes on a 5x5 grid
+    x, y = np.meshgrid(np.linspace(0, 1, 5), np.linspace(0, 1, 5))
+    nodes = np.stack((x.ravel(), y.ravel(), np.zeros(25)), axis=1)
+    # Two tris per square
+    tris = []
+    for j in range(4):
+        for i in range(4):
+            n0 = 5*j + i + 1
+            tris.append([n0, n0 + 1, n0 + 6])
+            tris.append([n0, n0 + 6, n0 + 5])
+    # Create triq
+    triq = tri.Triq()
+    triq.Nodes = nodes
+    triq.Tris = np.array(tris)
+    triq.CompID = np.ones(len(tris), dtype="int")
+    triq.nNode = 25
+    triq.nTri = len(tris)
+    triq.q = np.stack((nodes[:, 0] + 2*nodes[:, 1], nodes[:, 1]**2), axis=1)
+    triq.nq = 2
+    return triq
+
+
+# Options with only point coordinates
+class PointOpts(dict):
+    def get_Point(self, pt):
+        return POINTS[pt]
+
+
+# Point group that reads a fixed solution
+class TriqPointGroup(pointSensor.DBTriqPointGroup):
+    def __init__(self):
+        self.RootDir = os.getcwd()
+        self.opts = PointOpts()
+        self.pts = list(POINTS)
+        self.cols = ["x", "y", "z", "cp", "cf"]
+        self._stencils = {}
+        self._case_points = (None, None)
+        self.nread = 0
+
+    def ReadCaseTriq(self, **kw):
+        self.nread += 1
+        return make_triq(), ["cp", "cf"]
+
+
+# Stencil matches point-by-point interpolation
+@testutils.run_sandbox(__file__)
+def test_01_pointstencil():
+    # Point-by-point results
+    triq = make_triq()
+    # Group
+    DBPG = TriqPointGroup()
+    # Read all points
+    for pt in DBPG.pts:
+        P = DBPG.ReadCasePoint(pt, 0)
+        x0, q = triq.InterpSurfPoint(np.array(POINTS[pt]))
+        assert abs(P["cp"] - q[0]) <= 1e-12
+        assert abs(P["cf"] - q[1]) <= 1e-12
+        assert abs(P["z"]) <= 1e-12
+    # Solution only read once
+    assert DBPG.nread == 1
+    # Stencil saved to disk
+    assert len(os.listdir(".stencilcache")) == 1
+    # New group reuses saved stencil
+    DBPG = TriqPointGroup()
+    P = DBPG.ReadCasePoint("p1", 1)
+    assert abs(P["cp"] - 1.05) <= 1e-12
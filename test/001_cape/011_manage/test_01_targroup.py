@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Standard library
+import os
+import tarfile
+import zipfile
+
+# Third-party
+import testutils
+
+# Local imports
+from cape import manage
+
+
+# Files to create
+TEST_FILES = ("run.01.100", "run.02.200", "input.nml")
+
+
+# Create some files to archive
+def _write_files():
+    for fname in TEST_FILES:
+        with open(fname, 'w') as fp:
+            fp.write("%s\n" % fname)
+
+
+# Create a group and skip it when unchanged
+@testutils.run_sandbox(__file__)
+def test_01_targroup():
+    # Create files
+    _write_files()
+    # Archive a group
+    manage.TarGroup(["tar", "-czf"], "run.tgz", ["run.[0-9]*"])
+    # Check contents
+    with tarfile.open("run.tgz") as tar:
+        fnames = sorted(tar.getnames())
+    assert fnames == ["run.01.100", "run.02.200"]
+    # Check manifest
+    manifest = manage.read_manifest()
+    assert manifest["run.tgz"]["size"] == os.path.getsize("run.tgz")
+    assert manifest["run.tgz"]["sha1"] == manage.sha1sum("run.tgz")
+    # Unchanged group should not be rebuilt
+    os.utime("run.tgz", (0.0, 0.0))
+    manage.reset_glob_cache()
+    manage.TarGroup(["tar", "-czf"], "run.tgz", ["run.[0-9]*"])
+    assert os.path.getmtime("run.tgz") == 0.0
+
+
+# Tar a folder and remove it
+@testutils.run_sandbox(__file__)
+def test_02_tardir():
+    # Create folder
+    os.mkdir("lineload")
+    os.chdir("lineload")
+    _write_files()
+    os.chdir("..")
+    # Archive it
+    manage.TarDir(["tar", "-cf"], "lineload.tar", "lineload")
+    # Folder should be deleted
+    assert not os.path.isdir("lineload")
+    # Restore it
+    manage.Untar(["tar", "-xf"], "lineload.tar")
+    assert sorted(os.listdir("lineload")) == sorted(TEST_FILES)
+
+
+# Update zip archive and restore links outside folder
+@testutils.run_sandbox(__file__)
+def test_03_zip():
+    # Create files
+    _write_files()
+    # Archive them twice, changing one file in between
+    manage.tar_files(["zip"], "run.zip", ["run.01.100", "input.nml"])
+    with open("input.nml", 'w') as fp:
+        fp.write("new\n")
+    manage.tar_files(["zip"], "run.zip", ["input.nml"])
+    # Existing entry should be replaced
+    with zipfile.ZipFile("run.zip") as fz:
+        assert sorted(fz.namelist()) == ["input.nml", "run.01.100"]
+        assert fz.read("input.nml") == b"new\n"
+    # Archive a link to a file in the parent folder
+    os.mkdir("case")
+    os.chdir("case")
+    os.symlink(os.path.join("..", "input.nml"), "input.nml")
+    manage.tar_files(["tar", "-cf"], "links.tar", ["input.nml"])
+    os.remove("input.nml")
+    # Restore it
+    manage.untar_file("links.tar")
+    assert os.readlink("input.nml") == os.path.join("..", "input.nml")
+
+
+# Update tar archive without duplicating members
+@testutils.run_sandbox(__file__)
+def test_04_tarupdate():
+    # Create folder
+    os.mkdir("lineload")
+    os.chdir("lineload")
+    _write_files()
+    os.chdir("..")
+    with open("extra.txt", 'w') as fp:
+        fp.write("extra\n")
+    # Create archive with an extra file
+    manage.tar_files(["tar", "-uf"], "lineload.tar", ["lineload", "extra.txt"])
+    size0 = os.path.getsize("lineload.tar")
+    # Change one file and update several times
+    with open(os.path.join("lineload", "input.nml"), 'w') as fp:
+        fp.write("new\n")
+    for _ in range(3):
+        manage.tar_files(["tar", "-uf"], "lineload.tar", ["lineload"])
+    # Archive should not grow
+    assert os.path.getsize("lineload.tar") == size0
+    # Each member once; extra file kept
+    with tarfile.open("lineload.tar") as tar:
+        fnames = tar.getnames()
+        assert len(fnames) == len(set(fnames))
+        assert "extra.txt" in fnames
+        fp = tar.extractfile("lineload/input.nml")
+        assert fp.read() == b"new\n"
@@ -0,0 +1,31 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Third-party
+import testutils
+
+# Local imports
+from cape import benchmark
+
+
+# Run a few small benchmarks and compare to themselves
+@testutils.run_sandbox(__file__)
+def test_01_benchmark():
+    # Run benchmarks
+    res = benchmark.run_benchmarks(
+        ["pyfun.CaseFM", "tri.GetNearestTris"], size="small", repeat=2)
+    # Check results
+    assert sorted(res["results"]) == ["pyfun.CaseFM", "tri.GetNearestTris"]
+    stats = res["results"]["pyfun.CaseFM"]
+    assert stats["repeat"] == 2
+    assert stats["min"] <= stats["median"] <= stats["max"]
+    # Write and read
+    benchmark.write_results("bench.json", res)
+    base = benchmark.read_results("bench.json")
+    # Compare to itself
+    cmp = benchmark.compare_results(res, base)
+    assert [c[4] for c in cmp] == ["ok", "ok"]
+    # Fake a slower result
+    base["results"]["pyfun.CaseFM"]["median"] = 0.5 * stats["median"]
+    cmp = benchmark.compare_results(res, base, atol=0.0)
+    assert cmp[0][4] == "slower"
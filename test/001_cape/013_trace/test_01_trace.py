@@ -0,0 +1,51 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Standard library
+import json
+
+# Third-party
+import testutils
+
+# Local imports
+from cape.cfdx import trace
+
+
+# Function to trace
+@trace.traced
+def check_case(i):
+    with trace.span("read"):
+        return i
+
+
+# Nested spans
+@testutils.run_sandbox(__file__)
+def test_01_trace():
+    # Nothing recorded when off
+    assert not trace.is_enabled()
+    check_case(0)
+    assert trace.get_records() == []
+    # Turn on
+    trace.enable()
+    with trace.span("SubmitJobs"):
+        for i in range(3):
+            assert check_case(i) == i
+    trace.disable()
+    # Check totals
+    stats = trace.summarize()
+    paths = [s["path"] for s in stats]
+    assert paths == [
+        ("SubmitJobs",),
+        ("SubmitJobs", "check_case"),
+        ("SubmitJobs", "check_case", "read"),
+    ]
+    assert [s["count"] for s in stats] == [1, 3, 3]
+    # Write trace file
+    trace.write_trace("trace.json")
+    with open("trace.json") as fp:
+        data = json.load(fp)
+    assert len(data["traceEvents"]) == 7
+    assert data["traceEvents"][0]["name"] == "SubmitJobs"
+    # Clear
+    trace.reset()
+    assert trace.get_records() == []
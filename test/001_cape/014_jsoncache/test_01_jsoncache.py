@@ -0,0 +1,46 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Standard library
+import os
+
+# Third-party
+import testutils
+
+# Local imports
+from cape.cfdx.options import util
+
+
+# Files
+FINC = "inc.json"
+FTOP = "top.json"
+
+
+# Cached read of JSON file with includes
+@testutils.run_sandbox(__file__)
+def test_01_jsoncache():
+    # Use cache folder inside sandbox
+    os.environ["CAPE_CACHE_DIR"] = os.path.abspath("cache")
+    # Write files
+    with open(FINC, "w") as fp:
+        fp.write('{\n// comment\n "a": 1,\n "b": [1, 2]\n}\n')
+    with open(FTOP, "w") as fp:
+        fp.write('{\n "x": JSONFile("inc.json"),\n "y": 2\n}\n')
+    # Read it
+    d1 = util.loadJSONFile(FTOP)
+    assert d1 == {"x": {"a": 1, "b": [1, 2]}, "y": 2}
+    # Modifying output should not affect cache
+    d1["x"]["b"].append(3)
+    # Read from disk cache
+    util._JSON_CACHE.clear()
+    d2 = util.loadJSONFile(FTOP)
+    assert d2 == {"x": {"a": 1, "b": [1, 2]}, "y": 2}
+    assert len(os.listdir(os.path.join("cache", "json"))) == 1
+    # Change included file, with a different size
+    with open(FINC, "w") as fp:
+        fp.write('{"a": 30}\n')
+    d3 = util.loadJSONFile(FTOP)
+    assert d3 == {"x": {"a": 30}, "y": 2}
+    # Clean up
+    os.environ.pop("CAPE_CACHE_DIR")
+
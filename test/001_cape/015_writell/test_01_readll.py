@@ -0,0 +1,38 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Third-party
+import numpy as np
+import testutils
+
+# Local imports
+from cape import writell
+from cape.attdb import rdb
+
+
+# File name
+FCSV = "LineLoad_core.csv"
+
+
+# Compare fast reader to DataKit
+@testutils.run_sandbox(__file__)
+def test_01_readll():
+    # Create line load data
+    x = np.linspace(0.0, 3.0, 11)
+    v = np.vstack([x] + [np.sin(x + k) for k in range(6)]).T
+    # Write it like CaseLL.WriteCSV()
+    with open(FCSV, "w") as fp:
+        fp.write("# x,CA,CY,CN,CLL,CLM,CLN\n")
+        for row in v:
+            fp.write(",".join("%13.6E" % vj for vj in row) + "\n")
+    # Read it
+    cols, vll = writell.read_ll_csv(FCSV)
+    # Read using DataKit
+    db = rdb.DataKit(csv=FCSV)
+    # Compare
+    assert cols == db.cols
+    assert vll.shape == (11, 7)
+    for k, col in enumerate(cols):
+        assert np.all(vll[:, k] == db[col])
+    # Translated column names
+    assert writell.genr8_llcolnames(cols) == writell.genr8_llcolnames(db)
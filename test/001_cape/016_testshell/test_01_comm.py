@@ -0,0 +1,24 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Local imports
+from cape.testutils import testshell
+
+
+# Command finishing before deadline
+def test_01_comm():
+    # Run quick command with a time limit
+    t, ierr, out, err = testshell.comm(["echo", "cape"], maxtime=10.0)
+    # Check results
+    assert ierr == 0
+    assert out.strip() == b"cape"
+    assert t < 10.0
+
+
+# Command killed at deadline
+def test_02_maxtime():
+    # Run slow command with a short time limit
+    t, ierr, out, err = testshell.comm(["sleep", "10"], maxtime=0.5)
+    # Should be killed right after deadline
+    assert ierr != 0
+    assert 0.5 <= t < 5.0
@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Standard library
+import os
+
+# Third-party
+import testutils
+
+# Local imports
+from cape.cntl import Cntl
+
+
+# Files to copy
+TEST_FILES = (
+    "cape.json",
+    "matrix.csv",
+)
+
+
+# Only changed cases are processed
+@testutils.run_sandbox(__file__, TEST_FILES)
+def test_01_watch():
+    # Read settings
+    cntl = Cntl()
+    # Create history files for first three cases
+    fruns = cntl.x.GetFullFolderNames()
+    for frun in fruns[:3]:
+        os.makedirs(os.path.join(frun, "adapt00"))
+        with open(os.path.join(frun, "adapt00", "history.dat"), "w") as fp:
+            fp.write("1 0.1\n")
+    # Folder without any history
+    os.makedirs(fruns[3])
+    # Cases processed in each pass
+    calls = []
+
+    # Record updates instead of reading histories
+    def update_fm(**kw):
+        calls.append(sorted(kw["I"]))
+        # Add an iteration to second case after first pass
+        if len(calls) == 1:
+            fhist = os.path.join(fruns[1], "adapt00", "history.dat")
+            with open(fhist, "a") as fp:
+                fp.write("2 0.05\n")
+    cntl.UpdateFM = update_fm
+    # Three passes without waiting
+    cntl.WatchDataBook(**{"watch-n": 3, "watch-dt": 0})
+    # First pass has all cases with histories; then only changed case
+    assert calls == [[0, 1, 2], [1]]
+
+
+# All data book types with --db, and failed updates are retried
+@testutils.run_sandbox(__file__, TEST_FILES)
+def test_02_watch_db():
+    # Read settings
+    cntl = Cntl()
+    # Create history files for first two cases
+    fruns = cntl.x.GetFullFolderNames()
+    for frun in fruns[:2]:
+        os.makedirs(frun)
+        with open(os.path.join(frun, "history.dat"), "w") as fp:
+            fp.write("1 0.1\n")
+    # Updaters called in each pass
+    calls = []
+
+    # Create updater that records its calls
+    def make_updater(name, nfail=0):
+        def update(**kw):
+            calls.append((name, sorted(kw["I"])))
+            # Fail the first *nfail* times
+            if len([c for c in calls if c[0] == name]) <= nfail:
+                raise ValueError("Failed to update '%s'" % name)
+        return update
+    cntl.UpdateFM = make_updater("fm")
+    cntl.UpdateLL = make_updater("ll")
+    cntl.UpdateTriqFM = make_updater("triqfm")
+    cntl.UpdateTriqPoint = make_updater("pt", nfail=1)
+    cntl.UpdateCaseProp = make_updater("prop")
+    # Three passes without waiting
+    cntl.WatchDataBook(**{"db": True, "watch-n": 3, "watch-dt": 0})
+    # All updaters run in first pass, and again after *pt* failed
+    names = ["fm", "ll", "triqfm", "pt", "prop"]
+    assert calls == 2 * [(name, [0, 1]) for name in names]
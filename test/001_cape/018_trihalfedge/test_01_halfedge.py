@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+
+# Third-party
+import numpy as np
+import testutils
+
+# Local imports
+import cape.tri as trifile
+
+
+# Nodes and tris of a closed tetrahedron
+NODES = [
+    [0.0, 0.0, 0.0],
+    [1.0, 0.0, 0.0],
+    [0.0, 1.0, 0.0],
+    [0.0, 0.0, 1.0],
+]
+TRIS = [
+    [1, 3, 2],
+    [1, 2, 4],
+    [2, 3, 4],
+    [3, 1, 4],
+]
+
+
+# Neighbor queries on closed and open surfaces
+@testutils.run_testdir(__file__)
+def test_01_halfedge():
+    # Create triangulation
+    tri = trifile.Tri(Nodes=NODES, Tris=TRIS, CompID=[1, 1, 1, 1])
+    # Closed surface
+    assert tri.IsWatertight()
+    assert tri.GetOpenEdges().shape == (0, 3)
+    # Neighbors of all tris
+    K = tri.GetTriNeighbors()
+    assert K.tolist() == [[4, 3, 2], [1, 3, 4], [1, 4, 2], [1, 2, 3]]
+    assert list(tri.FindNeighbors(1)) == [1, 3, 4]
+    # Edge lookup
+    assert tri.FindTriFromEdge(2, 4) == 2
+    assert tri.FindTriFromEdge(4, 2) == 3
+    # Node rings
+    assert list(tri.GetNodeTris(4)) == [1, 2, 3]
+    assert list(tri.GetNodeNeighbors(1)) == [2, 3, 4]
+    assert list(tri.GetTrisFromNodes([4])) == [1, 2, 3]
+    # Remove one tri; tables must be rebuilt
+    tri.Tris = tri.Tris[:3]
+    tri.nTri = 3
+    assert not tri.IsWatertight()
+    assert tri.GetOpenEdges().tolist() == [[1, 3, 1], [4, 1, 2], [3, 4, 3]]
+    assert tri.FindTriFromEdge(1, 4) == 0
@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+
+# Third-party
+import numpy as np
+import testutils
+
+# Local imports
+import cape.tri as trifile
+
+
+# Two unit squares: z=0 (comp 1) and x=2 (comp 3)
+NODES = [
+    [0.0, 0.0, 0.0],
+    [1.0, 0.0, 0.0],
+    [1.0, 1.0, 0.0],
+    [0.0, 1.0, 0.0],
+    [2.0, 0.0, 0.0],
+    [2.0, 1.0, 0.0],
+    [2.0, 1.0, 1.0],
+    [2.0, 0.0, 1.0],
+]
+TRIS = [
+    [1, 2, 3],
+    [5, 6, 7],
+    [1, 3, 4],
+    [5, 7, 8],
+]
+COMPIDS = [1, 3, 1, 3]
+
+
+# Grouped properties of each component
+@testutils.run_testdir(__file__)
+def test_01_compstats():
+    # Create triangulation
+    tri = trifile.Tri(Nodes=NODES, Tris=TRIS, CompID=np.array(COMPIDS))
+    # Get all stats at once
+    stats = tri.GetCompStats()
+    assert list(stats["CompID"]) == [1, 3]
+    assert list(stats["nTri"]) == [2, 2]
+    assert list(stats["nNode"]) == [4, 4]
+    assert np.allclose(stats["Area"], 1.0)
+    assert np.allclose(stats["AreaVector"], [[0, 0, 1], [1, 0, 0]])
+    assert np.allclose(stats["Centroid"], [[0.5, 0.5, 0], [2, 0.5, 0.5]])
+    # Per-component accessors
+    assert list(tri.GetTrisFromCompID(1)) == [0, 2]
+    assert list(tri.GetTrisFromCompID([3, 1])) == [0, 1, 2, 3]
+    assert list(tri.GetNodesFromCompID(3)) == [4, 5, 6, 7]
+    assert tri.GetTrisFromCompID(2).size == 0
+    assert tri.GetCompBBox(2) is None
+    bbox = tri.GetCompBBox(3, pad=0.5)
+    assert np.allclose(bbox, [1.5, 2.5, -0.5, 1.5, -0.5, 1.5])
+    assert np.isclose(tri.GetCompArea(None), 2.0)
+    assert np.isclose(tri.GetCompArea([1, 3], np.array([1.0, 0, 0])), 1.0)
+    assert np.allclose(tri.GetCompCentroid(1), [0.5, 0.5, 0.0])
+    # Moving nodes updates the cached properties
+    tri.Translate([0.0, 0.0, 2.0], compID=1)
+    assert np.allclose(tri.GetCompCentroid(1), [0.5, 0.5, 2.0])
+    assert np.allclose(tri.GetCompBBox(1), [0, 1, 0, 1, 2, 2])
+    # In-place edits need an explicit reset
+    tri.CompID[tri.CompID == 3] = 1
+    tri.Nodes[:, 1] *= 2.0
+    tri.ClearCompStats()
+    assert np.isclose(tri.GetCompArea(1), 4.0)
+    assert tri.GetTrisFromCompID(3).size == 0
+    assert np.allclose(tri.GetCompBBox(1), [0, 2, 0, 2, 0, 2])
+
+
+# Cached properties after adding tris or replacing nodes
+@testutils.run_testdir(__file__)
+def test_02_compstats_add():
+    # Two copies of first square, one moved up to z=5
+    tri = trifile.Tri(Nodes=NODES[:4], Tris=TRIS[::2], CompID=np.ones(2))
+    tri2 = trifile.Tri(Nodes=NODES[:4], Tris=TRIS[::2], CompID=np.ones(2))
+    tri2.SetNodes(5.0, j=2)
+    tri2.CompID[:] = 2
+    # Get properties before adding tris
+    assert np.allclose(tri.GetCompBBox(1), [0, 1, 0, 1, 0, 0])
+    assert np.isclose(tri.GetCompArea(), 1.0)
+    # Add the second square
+    tri.Add(tri2)
+    assert np.allclose(tri.GetCompBBox(2), [0, 1, 0, 1, 5, 5])
+    assert np.allclose(tri.GetCompBBox(), [0, 1, 0, 1, 0, 5])
+    assert np.isclose(tri.GetCompArea(), 2.0)
+    # Replace nodes with a new array
+    tri.Nodes = 2.0 * tri.Nodes
+    assert np.isclose(tri.GetCompArea(1), 4.0)
+    # Move nodes with SetNodes()
+    tri.SetNodes(0.0, tri.Nodes[:,2] > 1.0, 2)
+    assert np.allclose(tri.GetCompBBox(2), [0, 2, 0, 2, 0, 0])
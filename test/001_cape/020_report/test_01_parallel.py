@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+
+# Standard library
+import os
+
+# Third-party
+import testutils
+
+# Local imports
+import cape.cntl
+from cape.cfdx import report
+
+
+# Files to copy
+TEST_FILES = (
+    "cape.json",
+    "matrix.csv",
+)
+
+
+# Render several cases in the same group at once
+@testutils.run_sandbox(__file__, TEST_FILES)
+def test_01_cases():
+    # Read settings
+    cntl = cape.cntl.Cntl()
+    # Pretend all cases have run, without calling the queue
+    cntl.CheckCase = lambda i, **kw: 100
+    cntl.CheckCaseStatus = lambda i, **kw: "DONE"
+    # Report interface
+    rep = report.Report(cntl, "case")
+    # Creating an existing folder is not an error
+    rep.mkdir("report")
+    rep.mkdir("report")
+    # Render all three cases using two workers
+    rep.UpdateCases(nproc=2)
+    # Lines in main document are in case order
+    frun = cntl.x.GetFullFolderNames()
+    assert rep.tex.Section["Cases"][1:-1] == [
+        "\\input{%s/report-case.tex}\n" % fdir for fdir in frun
+    ]
+    # Each case page was written
+    for fdir in frun:
+        assert os.path.isfile(os.path.join(fdir, "report-case.tex"))
@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+
+# Standard library
+import os
+
+# Third-party
+import numpy as np
+import pytest
+import testutils
+
+# Local imports
+import cape.tri as trifile
+import cape.plt as pltfile
+
+
+# Name of file
+PLTFILE = "tetra.plt"
+
+# Nodes and tris of a tetrahedron in two components
+NODES = [
+    [0.0, 0.0, 0.0],
+    [1.0, 0.0, 0.0],
+    [0.0, 1.0, 0.0],
+    [0.0, 0.0, 1.0],
+]
+TRIS = [
+    [1, 3, 2],
+    [1, 2, 4],
+    [2, 3, 4],
+    [3, 1, 4],
+]
+
+
+# Write a PLT file
+def write_plt():
+    # Create triangulation
+    tri = trifile.Tri(Nodes=NODES, Tris=TRIS, CompID=[1, 1, 2, 2])
+    # Convert and write
+    pltfile.Plt(triq=tri).Write(PLTFILE)
+
+
+# Memory-mapped and regular reads give same result
+@testutils.run_sandbox(__file__)
+def test_01_mmap():
+    # Create file
+    write_plt()
+    # Read it both ways
+    plt1 = pltfile.Plt(PLTFILE, mmap=True)
+    plt2 = pltfile.Plt(PLTFILE, mmap=False)
+    # Only first one is mapped
+    assert plt1.fmmap == os.path.abspath(PLTFILE)
+    assert plt2.fmmap is None
+    # Compare
+    assert plt1.Vars == plt2.Vars
+    assert plt1.Zones == plt2.Zones
+    assert plt1.nZone == 2
+    for n in range(plt1.nZone):
+        assert np.all(plt1.q[n] == plt2.q[n])
+        assert np.all(plt1.Tris[n] == plt2.Tris[n])
+    # Rewrite mapped file in place and reread
+    plt1.Write(PLTFILE)
+    plt3 = pltfile.Plt(PLTFILE, mmap=False)
+    for n in range(plt1.nZone):
+        assert np.all(plt3.q[n] == plt2.q[n])
+
+
+# Truncated file is an error, not a crash
+@testutils.run_sandbox(__file__)
+def test_02_truncated():
+    # Create file
+    write_plt()
+    # Read it
+    plt = pltfile.Plt(PLTFILE)
+    # Truncate the file
+    with open(PLTFILE, "r+b") as fp:
+        fp.truncate(os.path.getsize(PLTFILE) // 2)
+    # Copying data from the mapped file should fail cleanly
+    with pytest.raises(ValueError):
+        plt.Unmap()
+    # Reading it again should also fail
+    with pytest.raises(ValueError):
+        pltfile.Plt(PLTFILE)
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+
+# Third-party
+import numpy as np
+import testutils
+
+# Local imports
+import cape.tri as trifile
+
+
+# Nodes and tris of a tetrahedron
+NODES = np.array([
+    [0.0, 0.0, 0.0],
+    [1.0, 0.0, 0.0],
+    [0.0, 1.0, 0.0],
+    [0.0, 0.0, 1.0],
+])
+TRIS = np.array([
+    [1, 3, 2],
+    [1, 2, 4],
+    [2, 3, 4],
+    [3, 1, 4],
+])
+# Weights of each snapshot
+WEIGHTS = [1.0, 2.0, 3.0]
+
+
+# Write several snapshots with random states
+def write_snapshots():
+    # Fixed random states
+    rng = np.random.RandomState(3)
+    Q = rng.rand(len(WEIGHTS), 4, 6)
+    # File names
+    fnames = ["snap%i.triq" % j for j in range(len(WEIGHTS))]
+    # Write each snapshot
+    for fname, q in zip(fnames, Q):
+        triq = trifile.Triq(
+            Nodes=NODES, Tris=TRIS, CompID=np.ones(4, dtype="int"), q=q)
+        triq.Write(fname)
+    # Output
+    return fnames, Q
+
+
+# Streaming average matches direct calculation
+@testutils.run_sandbox(__file__)
+def test_01_average():
+    # Create files
+    fnames, Q = write_snapshots()
+    # Weighted mean and standard deviation
+    qbar = np.average(Q, axis=0, weights=WEIGHTS)
+    qvar = np.average((Q - qbar)**2, axis=0, weights=WEIGHTS)
+    # Streaming calculations
+    triq = trifile.AverageTriqFiles(fnames, WEIGHTS)
+    tstd = trifile.AverageTriqFiles(fnames, WEIGHTS, std=True)
+    # Compare
+    assert triq.nNode == 4
+    assert np.allclose(triq.Nodes, NODES)
+    assert np.allclose(triq.q, qbar)
+    assert np.allclose(tstd.q, np.sqrt(qvar))
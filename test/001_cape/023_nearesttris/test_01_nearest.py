@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+
+# Third-party
+import numpy as np
+import testutils
+
+# Local imports
+import cape.tri as trifile
+
+
+# Nodes and tris of a tetrahedron
+NODES = np.array([
+    [0.0, 0.0, 0.0],
+    [1.0, 0.0, 0.0],
+    [0.0, 1.0, 0.0],
+    [0.0, 0.0, 1.0],
+])
+TRIS = np.array([
+    [1, 3, 2],
+    [1, 2, 4],
+    [2, 3, 4],
+    [3, 1, 4],
+])
+
+
+# Create two tetrahedra with one component per face
+def make_tri():
+    # Second tetrahedron shifted in *x*
+    nodes = np.vstack((NODES, NODES + [1.5, 0.0, 0.0]))
+    tris = np.vstack((TRIS, TRIS + 4))
+    # Triangulation
+    return trifile.Tri(
+        Nodes=nodes, Tris=tris, CompID=np.arange(1, 9))
+
+
+# Batch search matches per-point search
+def test_01_nearest():
+    # Triangulation
+    tri = make_tri()
+    # Random points near the surface
+    rng = np.random.RandomState(5)
+    X = rng.rand(300, 3) * [2.7, 1.2, 1.2] - 0.1
+    # Batch search, with small blocks to test blocking
+    T = tri.GetNearestTris(X, n=2, nbatch=40)
+    # Compare each point
+    for i, x in enumerate(X):
+        # Single-point search
+        Ti = tri.GetNearestTri(x, n=2)
+        # Loop through matches
+        for j in ("1", "2"):
+            # Check for a match
+            if "k" + j not in Ti:
+                assert T["k" + j][i] == -1
+                continue
+            # Compare
+            assert T["k" + j][i] == Ti["k" + j]
+            assert T["c" + j][i] == Ti["c" + j]
+            assert np.isclose(T["d" + j][i], Ti["d" + j])
+            assert np.isclose(T["z" + j][i], Ti["z" + j])
+            assert np.isclose(T["t" + j][i], Ti["t" + j])
@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+
+# Standard library
+import os
+import shutil
+import zlib
+
+# Third-party
+import numpy as np
+import testutils
+
+# Local imports
+import cape.cntl
+import cape.cfdx.dataBook as databook
+
+
+# Files to copy
+TEST_FILES = ("cape.json", "matrix.csv")
+# Coefficients
+COEFFS = ["CA", "CY", "CN", "CLL", "CLM", "CLN"]
+
+
+# Current iteration of case in current folder
+def get_current_iter():
+    # Last case has not run enough iterations
+    if os.path.basename(os.getcwd()) == "m1.1a0.0":
+        return 50
+    return 300
+
+
+# Create iterative history based on current folder
+def read_case_fm(comp):
+    # Seed based on case name
+    seed = zlib.crc32(os.getcwd().encode())
+    rng = np.random.RandomState(seed % 2**31)
+    # Create history
+    fm = databook.CaseFM(comp)
+    fm.i = np.arange(1, 301)
+    for coeff in COEFFS:
+        setattr(fm, coeff, rng.rand(fm.i.size))
+    # Save properties
+    fm.cols = ["i"] + COEFFS
+    fm.coeffs = COEFFS
+    # Output
+    return fm
+
+
+# Create residual history
+def read_case_resid():
+    # Create history
+    hist = databook.CaseResid()
+    hist.i = np.arange(1, 301)
+    hist.nIter = hist.i.size
+    hist.L1Resid = 10.0 ** (-hist.i / 100.0)
+    # Output
+    return hist
+
+
+# Update the data book using *nproc* workers
+def update_databook(nproc):
+    # Read settings
+    cntl = cape.cntl.Cntl()
+    # Create case folders
+    for frun in cntl.x.GetFullFolderNames():
+        os.makedirs(frun, exist_ok=True)
+    # Read data book and use synthetic histories
+    db = databook.DataBook(cntl)
+    db.GetCurrentIter = get_current_iter
+    db.ReadCaseFM = read_case_fm
+    db.ReadCaseResid = read_case_resid
+    # Update
+    db.UpdateDataBook(nproc=nproc)
+    # Output
+    return db["wing"]
+
+
+# Parallel and serial extraction give same data book
+@testutils.run_sandbox(__file__, TEST_FILES)
+def test_01_fmparallel():
+    # Serial update
+    dbc1 = update_databook(1)
+    # Delete data book
+    shutil.rmtree("data")
+    # Parallel update
+    dbc2 = update_databook(3)
+    # All cases but the last one have enough iterations
+    assert dbc1.n == 4
+    assert dbc2.n == 4
+    # Compare
+    for col in ["mach", "alpha", "nIter", "nStats"] + dbc1.DataCols:
+        assert np.allclose(dbc1[col], dbc2[col])
+    # Reread the written data book
+    cntl = cape.cntl.Cntl()
+    db = databook.DataBook(cntl)
+    db.ReadDBComp("wing", check=False, lock=False)
+    assert np.allclose(db["wing"]["CN"], dbc2["CN"])
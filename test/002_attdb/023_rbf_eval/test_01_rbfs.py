@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+
+# Third-party modules
+import numpy as np
+import testutils
+
+# Local imports
+import cape.attdb.rdb as rdb
+
+
+# Test tolerance
+TOL = 1e-9
+# Output cols
+COLS = ["CA", "CY", "CN"]
+# Input args
+ARGS = ["mach", "alpha", "beta"]
+
+
+# Wrapper for RBF with only public attributes
+class PublicRbf(object):
+    def __init__(self, rbf):
+        # Save RBF and public attributes
+        self.rbf = rbf
+        self.xi = rbf.xi
+        self.nodes = rbf.nodes
+        self.norm = rbf.norm
+        self.function = rbf.function
+        self.epsilon = rbf.epsilon
+
+    def __call__(self, *x):
+        return self.rbf(*x)
+
+
+# Create simple database
+def make_db(seed=1):
+    # Fixed random data
+    rng = np.random.RandomState(seed)
+    # Conditions
+    mach = np.repeat([0.5, 0.8, 1.1, 1.4], 40)
+    alph = np.tile(np.linspace(-4.0, 10.0, 40), 4)
+    beta = 4.0 * rng.rand(160) - 2.0
+    # Initialize
+    db = rdb.DataKit()
+    db.save_col("mach", mach)
+    db.save_col("alpha", alph)
+    db.save_col("beta", beta)
+    # Outputs
+    for col in COLS:
+        db.save_col(col, np.sin(alph/5)*mach + 0.1*beta*rng.rand(160))
+    # Slice break points
+    db.create_bkpts(["mach"])
+    return db
+
+
+# Compare to one col at a time
+@testutils.run_testdir(__file__)
+def test_01_rcall_rbfs():
+    # Create database
+    db = make_db()
+    # Test points
+    rng = np.random.RandomState(2)
+    mach = 0.5 + 0.9*rng.rand(20)
+    alph = 10.0*rng.rand(20) - 2.0
+    beta = 2.0*rng.rand(20) - 1.0
+    # Loop through methods
+    for method in ("rbf", "rbf-linear", "rbf-map"):
+        db.make_responses(COLS, method, ARGS)
+        # Evaluate all cols
+        V = db.rcall_rbfs(COLS, mach, alph, beta)
+        # Compare to each col
+        for (col, v) in zip(COLS, V):
+            assert v.shape == mach.shape
+            # Evaluate one col at all points
+            assert np.max(np.abs(db(col, mach, alph, beta) - v)) <= TOL
+            # Compare to calling scipy RBFs directly
+            for j in range(mach.size):
+                # Direct evaluation
+                if method == "rbf":
+                    vj = db.get_rbf(col)(mach[j], alph[j], beta[j])
+                elif method == "rbf-linear":
+                    i0, i1, f = db.get_bkpt_index("mach", mach[j])
+                    v0 = db.get_rbf(col, i0)(alph[j], beta[j])
+                    v1 = db.get_rbf(col, i1)(alph[j], beta[j])
+                    vj = (1 - f)*v0 + f*v1
+                else:
+                    vj = db(col, mach[j], alph[j], beta[j])
+                assert abs(v[j] - vj) <= TOL
+
+
+# Chunked evaluation
+def test_02_eval_rbfs():
+    # Create database
+    db = make_db()
+    db.make_responses(COLS, "rbf", ARGS)
+    # Test points
+    x = [np.full(11, 0.9), np.linspace(-2, 8, 11), np.zeros(11)]
+    # Evaluate in tiny chunks
+    Y = rdb.eval_rbfs([db.get_rbf(col) for col in COLS], x, nmax=5)
+    # Compare
+    for (col, y) in zip(COLS, Y):
+        assert np.max(np.abs(y - db.get_rbf(col)(*x))) <= TOL
+
+
+# Fallback if scipy private methods are missing
+def test_03_eval_rbfs_public():
+    # Create database
+    db = make_db()
+    db.make_responses(COLS, "rbf", ARGS)
+    # RBFs without private methods
+    rbfs = [PublicRbf(db.get_rbf(col)) for col in COLS]
+    # Test points
+    x = [np.full(11, 0.9), np.linspace(-2, 8, 11), np.zeros(11)]
+    # Evaluate in tiny chunks
+    Y = rdb.eval_rbfs(rbfs, x, nmax=5)
+    # Compare
+    for (col, y) in zip(COLS, Y):
+        assert np.max(np.abs(y - db.get_rbf(col)(*x))) <= TOL
+
+
+# Differences of two databases with RBF responses
+@testutils.run_testdir(__file__)
+def test_04_rdiff():
+    # Create two databases
+    db1 = make_db(1)
+    db2 = make_db(3)
+    db1.make_responses(COLS, "rbf-linear", ARGS)
+    db2.make_responses(COLS, "rbf-linear", ARGS)
+    # Differences at points of *db1*
+    ddb = db1.genr8_rdiff(db2, COLS)
+    # Test points
+    A = [ddb[arg] for arg in ARGS]
+    # Compare to each col
+    for col in COLS:
+        # Evaluate one point at a time
+        v = np.array([
+            db2(col, *xj) - db1(col, *xj) for xj in zip(*A)])
+        assert np.max(np.abs(ddb[col] - v)) <= TOL
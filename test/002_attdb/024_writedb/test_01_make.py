@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+
+# Standard library
+import os
+
+# Third-party modules
+import testutils
+
+# Local imports
+from cape.attdb import writedb
+
+
+# Template for datakit modules
+MOD_TEMPLATE = r'''
+import os
+from cape.attdb import datakitloader
+
+DATAKIT_LOADER = datakitloader.DataKitLoader(
+    __name__, __file__,
+    MODULE_NAME_REGEX_LIST=[r"dkpkg\.db(?P<n>[0-9]+)"],
+    DB_NAME_TEMPLATE_LIST=["DB-%%(n)03i"],
+    DB_NAME_REGEX_LIST=[r"DB-(?P<n>[0-9]+)"],
+    MODULE_NAME_TEMPLATE_LIST=["dkpkg.db%%(n)03i"])
+REQUIREMENTS = %s
+
+
+def write_db(f=False, **kw):
+    fdir = os.path.dirname(__file__)
+    fout = os.path.join(fdir, "db", "csv", "datakit.csv")
+    if os.path.isfile(fout) and not f:
+        return
+    os.makedirs(os.path.dirname(fout), exist_ok=True)
+    with open(os.path.join(fdir, "rawdata", "data.csv")) as fp:
+        txt = fp.read()
+    with open(fout, "w") as fp:
+        fp.write(txt)
+'''
+
+
+# Create package with three datakits
+def make_pkg():
+    # Top-level package
+    os.mkdir("dkpkg")
+    open(os.path.join("dkpkg", "__init__.py"), "w").close()
+    # Datakits; third one requires first two
+    reqs = {1: [], 2: [], 3: ["DB-001", "DB-002"]}
+    for n, req in reqs.items():
+        # Create folders
+        fdir = os.path.join("dkpkg", "db%03i" % n)
+        os.makedirs(os.path.join(fdir, "rawdata"))
+        # Write module
+        with open(os.path.join(fdir, "__init__.py"), "w") as fp:
+            fp.write(MOD_TEMPLATE % repr(req))
+        # Write raw data
+        with open(os.path.join(fdir, "rawdata", "data.csv"), "w") as fp:
+            fp.write("mach,CN\n%i,0.5\n" % n)
+
+
+# Only rewrite modules with changed inputs
+@testutils.run_sandbox(__file__)
+def test_01_make():
+    # Create datakit modules
+    make_pkg()
+    # Options
+    kw = dict(prefix="dkpkg", make=True, j=2)
+    # Write all three
+    status = writedb.write_dbs("dkpkg.db003", **kw)
+    assert [status["DB-%03i" % n][0] for n in (1, 2, 3)] == ["rebuilt"] * 3
+    # Nothing changed
+    status = writedb.write_dbs("dkpkg.db003", **kw)
+    assert [status["DB-%03i" % n][0] for n in (1, 2, 3)] == ["skipped"] * 3
+    # Change raw data of second datakit
+    fcsv = os.path.join("dkpkg", "db002", "rawdata", "data.csv")
+    with open(fcsv, "a") as fp:
+        fp.write("3,0.7\n")
+    # Should rebuild second datakit and the one that requires it
+    status = writedb.write_dbs("dkpkg.db003", **kw)
+    assert status["DB-001"][0] == "skipped"
+    assert status["DB-002"] == ("rebuilt", "changed file rawdata/data.csv")
+    assert status["DB-003"] == ("rebuilt", "requirement DB-002 changed")
@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+
+# Standard library
+import os
+import sys
+
+# Third-party modules
+import pytest
+import testutils
+
+# Local imports
+from cape.attdb import writedb
+
+
+# Template for datakit modules
+MOD_TEMPLATE = r'''
+from cape.attdb import datakitloader
+
+DATAKIT_LOADER = datakitloader.DataKitLoader(
+    __name__, __file__,
+    MODULE_NAME_REGEX_LIST=[r"dkfail\.db(?P<n>[0-9]+)"],
+    DB_NAME_TEMPLATE_LIST=["DBF-%%(n)03i"],
+    DB_NAME_REGEX_LIST=[r"DBF-(?P<n>[0-9]+)"],
+    MODULE_NAME_TEMPLATE_LIST=["dkfail.db%%(n)03i"])
+REQUIREMENTS = []
+
+
+def write_db(f=False, **kw):
+    if %s:
+        raise RuntimeError("bad raw data")
+'''
+
+
+# Create package with one good and one bad datakit
+def make_pkg():
+    # Top-level package
+    os.mkdir("dkfail")
+    open(os.path.join("dkfail", "__init__.py"), "w").close()
+    # Datakits; first one fails
+    for n in (1, 2):
+        # Create folders
+        fdir = os.path.join("dkfail", "db%03i" % n)
+        os.makedirs(os.path.join(fdir, "rawdata"))
+        # Write module
+        with open(os.path.join(fdir, "__init__.py"), "w") as fp:
+            fp.write(MOD_TEMPLATE % repr(n == 1))
+
+
+# Failed writes give nonzero exit status
+@testutils.run_sandbox(__file__)
+def test_01_fail():
+    # Create datakit modules
+    make_pkg()
+    # Serial mode stops on first error
+    sys.argv = ["dkit-writedb", "dkfail.db00", "--prefix", "dkfail"]
+    with pytest.raises(RuntimeError):
+        writedb.main()
+    # Parallel mode writes the others, then exits with an error
+    sys.argv = ["dkit-writedb", "dkfail.db00", "--prefix", "dkfail", "-j", "2"]
+    with pytest.raises(SystemExit) as e:
+        writedb.main()
+    assert e.value.code == 1
+    # Check status of each module
+    status = writedb.write_dbs("dkfail.db00", prefix="dkfail", j=2)
+    assert status["DBF-001"][0] == "failed"
+    assert status["DBF-002"][0] == "written"
@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+
+# Third-party
+import testutils
+
+# Local imports
+from cape.cfdx import bin as cbin
+from cape.tnakit import fileutils
+
+
+# Lines of test file
+LINES = ["iter %i  resid %.3e\n" % (i, 10.0**-i) for i in range(40)]
+
+
+# Write test file
+def write_file(fname, lines):
+    with open(fname, 'w') as fp:
+        fp.write("".join(lines))
+
+
+# Read files backwards
+@testutils.run_sandbox(__file__)
+def test_01_reverse():
+    # Write file, including one without final newline
+    write_file("hist.dat", LINES)
+    write_file("nonl.dat", LINES[:-1] + ["last"])
+    # Read backwards with small blocks
+    lines = list(fileutils.readlines_reverse("hist.dat", nblock=7))
+    assert lines == LINES[::-1]
+    # Read file w/o trailing newline
+    lines = list(fileutils.readlines_reverse("nonl.dat", nblock=16))
+    assert lines == ["last"] + LINES[-2::-1]
+    # Tail and head
+    assert fileutils.tail("hist.dat", 3) == LINES[-3:]
+    assert fileutils.tail("hist.dat", 100) == LINES
+    assert fileutils.head("hist.dat", 2) == LINES[:2]
+    # Tail of open file
+    with open("hist.dat") as fp:
+        assert fileutils.tail(fp, 2) == LINES[-2:]
+
+
+# Search files
+@testutils.run_sandbox(__file__)
+def test_02_grep():
+    # Write file
+    write_file("hist.dat", LINES)
+    # Search for lines
+    lines = fileutils.grep("iter 3[0-9]? ", "hist.dat")
+    assert lines == [line.rstrip("\n") for line in LINES if
+                     line.startswith("iter 3")]
+    # Last matching line
+    assert fileutils.grep_last("iter 1", "hist.dat") == LINES[19].rstrip()
+    assert fileutils.grep_last("nomatch", "hist.dat") is None
+
+
+# Wrappers used by case modules
+@testutils.run_sandbox(__file__)
+def test_03_bin():
+    # Write file
+    write_file("hist.dat", LINES)
+    # Text outputs
+    assert cbin.tail("hist.dat", 2) == "".join(LINES[-2:])
+    assert cbin.head("hist.dat", 2) == "".join(LINES[:2])
+    # List of lines ending with empty string, like ``egrep``
+    assert cbin.grep("iter 2 ", "hist.dat") == [LINES[2].rstrip(), '']
+    # Missing files
+    assert cbin.tail("nofile.dat") == ''
+    assert cbin.head("nofile.dat") == ''
+    assert cbin.grep("iter", "nofile.dat") == ['']
@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+
+# Third-party imports
+import testutils
+
+# Local imports
+import cape.pycart.cntl
+
+
+# List of file globs to copy into sandbox
+TEST_FILES = (
+    "pyCart.json",
+    "matrix.csv",
+    "Config.xml",
+    "bullet.tri",
+)
+
+
+# Prepare one case's surface
+def prepare_tri(cntl, i):
+    # Revert to initial surface
+    cntl.tri = cntl.tri0.Copy()
+    # Apply translations, moving *P1* too
+    cntl.PrepareTri(i)
+
+
+# Key does not depend on which case was prepared before
+@testutils.run_sandbox(__file__, TEST_FILES)
+def test_01_trikey():
+    # Read settings and surface
+    cntl = cape.pycart.cntl.Cntl()
+    cntl.ReadTri()
+    # Key for case 2 before any case is prepared
+    key2 = cntl.GetTriCacheKey(2)
+    # Prepare cases in different orders
+    prepare_tri(cntl, 0)
+    key2a = cntl.GetTriCacheKey(2)
+    prepare_tri(cntl, 1)
+    key2b = cntl.GetTriCacheKey(2)
+    # Key is the same in every order
+    assert key2 == key2a == key2b
+    # Same transformation as case 0
+    assert cntl.GetTriCacheKey(0) == key2
+    # Different translation
+    assert cntl.GetTriCacheKey(1) != key2
@@ -0,0 +1,97 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Third-party
+import numpy as np
+import testutils
+
+# Local imports
+from cape.pyover import plot3d
+
+
+# Grid dimensions
+DIMS = ((4, 3, 5), (2, 6, 3))
+# Number of states
+NQ = 6
+
+
+# Write a Fortran record
+def write_record(f, *V):
+    nr = sum(v.nbytes for v in V)
+    np.array([nr], dtype="<i4").tofile(f)
+    for v in V:
+        v.tofile(f)
+    np.array([nr], dtype="<i4").tofile(f)
+
+
+# Write multiple-grid q and x files
+def write_files():
+    # Dimensions record
+    D = np.array([d for dim in DIMS for d in dim], dtype="<i4")
+    Q = []
+    with open("q.vol", "wb") as fq, open("x.vol", "wb") as fx:
+        write_record(fq, np.array([len(DIMS)], dtype="<i4"))
+        write_record(fx, np.array([len(DIMS)], dtype="<i4"))
+        write_record(fq, np.hstack((D, [NQ, 0])).astype("<i4"))
+        write_record(fx, D)
+        for (ig, (jd, kd, ld)) in enumerate(DIMS):
+            npt = jd*kd*ld
+            # Header: 7 floats, IGAM, 8 floats
+            H = np.arange(7.0) + ig
+            write_record(
+                fq, H, np.array([1], dtype="<i4"), np.arange(8.0))
+            # States and coordinates
+            V = np.arange(NQ*npt, dtype="<f8").reshape((NQ, ld, kd, jd))
+            V += 1000*ig
+            write_record(fq, V)
+            X = V[:3].copy()
+            IB = np.arange(npt, dtype="<i4").reshape((ld, kd, jd))
+            write_record(fx, X, IB)
+            Q.append((V, X, IB))
+    return Q
+
+
+# Extract subsets
+@testutils.run_sandbox(__file__)
+def test_01_splitmq():
+    # Create input files
+    Q = write_files()
+    # Create input files for splitmq and splitmx
+    subs = (
+        "    1,        1,    -1,     1,        1,    -1,     1,"
+        "        1,     2,     1,\n"
+        "    2,        2,     2,     1,        1,    -1,     2,"
+        "        1,    -1,     1,\n")
+    with open("splitmq.i", "w") as f:
+        f.write("q.vol\nq.save\n" + subs)
+    with open("splitmx.i", "w") as f:
+        f.write("x.vol\ngrid.in\n" + subs)
+    # Extract
+    plot3d.Splitmq("splitmq.i")
+    plot3d.Splitmq("splitmx.i", "splitmx.o")
+    # Read output
+    pq = plot3d.P3DIndex("q.save")
+    px = plot3d.P3DIndex("grid.in")
+    # Check dimensions
+    assert pq.kind == "q"
+    assert px.kind == "x"
+    assert pq.NQ == NQ
+    assert pq.dims.tolist() == [[4, 3, 2], [1, 3, 3]]
+    assert px.dims.tolist() == [[4, 3, 2], [1, 3, 3]]
+    # Check values
+    V0, _ = pq.GetGridArrays(1)
+    V1, _ = pq.GetGridArrays(2)
+    assert np.all(V0 == Q[0][0][:, 0:2])
+    assert np.all(V1 == Q[1][0][:, :, ::2, 1:2])
+    X1, IB1 = px.GetGridArrays(2)
+    assert np.all(X1 == Q[1][1][:, :, ::2, 1:2])
+    assert np.all(IB1 == Q[1][2][:, ::2, 1:2])
+    # Headers are copied from source grid
+    p0 = plot3d.P3DIndex("q.vol")
+    pos0, nr0 = p0.HeaderRecords[1]
+    pos1, nr1 = pq.HeaderRecords[1]
+    assert p0.buf[pos0:pos0+nr0] == pq.buf[pos1:pos1+nr1]
+    del V0, V1, X1, IB1
+    p0.close()
+    pq.close()
+    px.close()
@@ -0,0 +1,58 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Standard library
+import os
+
+# Third-party
+import testutils
+
+# Local imports
+from cape.pyover import lineLoad
+
+
+# Reuse mixsur output for same grid
+@testutils.run_sandbox(__file__)
+def test_01_surfmap():
+    # Inputs
+    with open("grid.in", "wb") as f:
+        f.write(b"grid")
+    with open("mixsur.i", "w") as f:
+        f.write("mixsur inputs\n")
+    # Get key
+    key = lineLoad.GetSurfMapKey("grid.in", "mixsur.i", "mixsur")
+    fdir = lineLoad.GetSurfMapCacheDir(os.getcwd(), key)
+    # Nothing cached yet
+    assert not lineLoad.LinkSurfMapCache(fdir, lineLoad.MIXSUR_FILES)
+    # Incomplete output is not saved
+    for fname in lineLoad.MIXSUR_FILES[:-1]:
+        with open(fname, "w") as f:
+            f.write(fname)
+    lineLoad.SaveSurfMapCache(fdir, lineLoad.MIXSUR_FILES)
+    assert not os.path.isdir(fdir)
+    # Save complete output
+    with open(lineLoad.MIXSUR_FILES[-1], "w") as f:
+        f.write("ptv")
+    lineLoad.SaveSurfMapCache(fdir, lineLoad.MIXSUR_FILES)
+    assert os.path.isdir(fdir)
+    # Use it in another folder
+    os.mkdir("case2")
+    os.chdir("case2")
+    assert lineLoad.LinkSurfMapCache(fdir, lineLoad.MIXSUR_FILES)
+    with open("grid.ptv") as f:
+        assert f.read() == "ptv"
+    # Rewriting the file in the case must not change the cache
+    with open("grid.ptv", "w") as f:
+        f.write("new")
+    with open(os.path.join(fdir, "grid.ptv")) as f:
+        assert f.read() == "ptv"
+    # Same for the folder that saved the cache
+    os.chdir("..")
+    with open("grid.ptv", "w") as f:
+        f.write("new")
+    with open(os.path.join(fdir, "grid.ptv")) as f:
+        assert f.read() == "ptv"
+    # Different grid gives different key
+    with open("grid.in", "wb") as f:
+        f.write(b"grid2")
+    assert lineLoad.GetSurfMapKey("grid.in", "mixsur.i", "mixsur") != key